@@ -848,6 +848,51 @@ def migration(
     asyncio.run(_migration(test=test, fix=fix))
 
 
+@app.command()
+def worker(
+    concurrency: int | None = typer.Option(
+        None, help="Number of runs executed at the same time.", envvar="LANGFLOW_WORKER_CONCURRENCY", min=1
+    ),
+    env_file: Path | None = typer.Option(None, help="Path to the .env file containing environment variables."),
+    log_level: str = typer.Option("info", help="Logging level.", envvar="LANGFLOW_LOG_LEVEL"),
+) -> None:
+    """Run an execution worker for flow builds and webhook runs enqueued by API servers.
+
+    Start the API servers with LANGFLOW_EXECUTION_MODE=worker so that they enqueue runs instead of executing them.
+    """
+    if env_file:
+        load_dotenv(env_file, override=True)
+    os.environ["LANGFLOW_EXECUTION_MODE"] = "worker"
+    configure(log_level=log_level)
+    asyncio.run(_run_worker(concurrency))
+
+
+async def _run_worker(concurrency: int | None) -> None:
+    from langflow.services.deps import get_queue_service
+    from langflow.services.task.execution import ExecutionWorker, get_run_broker
+    from langflow.services.utils import teardown_services
+
+    await initialize_services()
+    queue_service = get_queue_service()
+    if not queue_service.is_started():
+        queue_service.start()
+    execution_worker = ExecutionWorker(
+        get_run_broker(),
+        queue_service,
+        concurrency=concurrency or get_settings_service().settings.worker_concurrency,
+    )
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        with suppress(NotImplementedError):
+            loop.add_signal_handler(signum, stop.set)
+    try:
+        await execution_worker.run(stop)
+    finally:
+        await get_run_broker().close()
+        await teardown_services()
+
+
 @app.command()
 def api_key(
     log_level: str = typer.Option("error", help="Logging level."),
@@ -0,0 +1,34 @@
+"""add column 'summary' to flow
+
+Revision ID: 4c2e8f1a9b37
+Revises: add_schedule_table
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from langflow.utils import migration
+
+# revision identifiers, used by Alembic.
+revision: str = "4c2e8f1a9b37"
+down_revision: str | None = "add_schedule_table"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if not migration.column_exists(table_name="flow", column_name="summary", conn=conn):
+            # Existing flows get their summary the next time they are saved.
+            batch_op.add_column(sa.Column("summary", sa.JSON(), nullable=True))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    with op.batch_alter_table("flow", schema=None) as batch_op:
+        if migration.column_exists(table_name="flow", column_name="summary", conn=conn):
+            batch_op.drop_column("summary")
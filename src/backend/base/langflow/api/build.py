@@ -3,19 +3,23 @@ import json
 import time
 import traceback
 import uuid
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
+from functools import partial
 
 from fastapi import BackgroundTasks, HTTPException, Response
 from lfx.graph.graph.base import Graph
+from lfx.graph.graph.fingerprint import aget_variable_values, compute_vertex_fingerprints
 from lfx.graph.utils import log_vertex_build
 from lfx.log.logger import logger
 from lfx.schema.schema import InputValueRequest
 from sqlmodel import select
 
 from langflow.api.disconnect import DisconnectHandlerStreamingResponse
+from langflow.api.event_framing import EventFramer, next_event_batch
 from langflow.api.utils import (
     CurrentActiveUser,
     EventDeliveryType,
+    EventFraming,
     build_graph_from_data,
     build_graph_from_db,
     format_elapsed_time,
@@ -29,8 +33,10 @@ from langflow.exceptions.component import ComponentBuildError
 from langflow.schema.message import ErrorMessage
 from langflow.schema.schema import OutputValue
 from langflow.services.database.models.flow.model import Flow
-from langflow.services.deps import get_chat_service, get_telemetry_service, session_scope
+from langflow.services.deps import get_chat_service, get_settings_service, get_telemetry_service, session_scope
 from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.job_queue.streams import RemoteJobTask, StreamQueue
+from langflow.services.task.execution import enqueue_build, worker_mode_enabled
 from langflow.services.telemetry.schema import ComponentInputsPayload, ComponentPayload, PlaygroundPayload
 
 
@@ -69,13 +75,37 @@ async def start_flow_build(
     current_user: CurrentActiveUser,
     queue_service: JobQueueService,
     flow_name: str | None = None,
+    incremental: bool = False,
 ) -> str:
     """Start the flow build process by setting up the queue and starting the build task.
 
+    With ``execution_mode="worker"`` the build is enqueued for a ``langflow worker`` process instead.
+    With ``incremental`` unchanged vertices reuse their last result (see ``generate_flow_events``).
+
     Returns:
         the job_id.
     """
     job_id = str(uuid.uuid4())
+    if worker_mode_enabled():
+        try:
+            await enqueue_build(
+                job_id=job_id,
+                flow_id=flow_id,
+                inputs=inputs,
+                data=data,
+                files=files,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                log_builds=log_builds,
+                user_id=current_user.id,
+                flow_name=flow_name,
+                queue_service=queue_service,
+                incremental=incremental,
+            )
+        except Exception as e:
+            await logger.aexception("Failed to enqueue the build for an execution worker")
+            raise HTTPException(status_code=500, detail=str(e)) from e
+        return job_id
     try:
         _, event_manager = queue_service.create_queue(job_id)
         task_coro = generate_flow_events(
@@ -90,6 +120,7 @@ async def start_flow_build(
             log_builds=log_builds,
             current_user=current_user,
             flow_name=flow_name,
+            incremental=incremental,
         )
         queue_service.start_job(job_id, task_coro)
     except Exception as e:
@@ -103,18 +134,37 @@ async def get_flow_events_response(
     job_id: str,
     queue_service: JobQueueService,
     event_delivery: EventDeliveryType,
+    offset: int | None = None,
+    framing: EventFraming = EventFraming.NDJSON,
+    reference_url: Callable[[int], str] | None = None,
 ):
-    """Get events for a specific build job, either as a stream or single event."""
+    """Get events for a specific build job, either as a stream or single event.
+
+    With a distributed job queue backend, ``offset`` replays the events that follow the first ``offset`` events
+    of the job, so a client that reconnects (possibly to another worker) does not miss any. Streams are written
+    in ``framing``; when ``reference_url`` is given, large events are streamed as references to that URL.
+    """
     try:
-        main_queue, event_manager, event_task, _ = queue_service.get_queue_data(job_id)
+        main_queue, event_manager, event_task, _ = await queue_service.aget_queue_data(job_id, after=offset)
         if event_delivery in (EventDeliveryType.STREAMING, EventDeliveryType.DIRECT):
             if event_task is None:
                 await logger.aerror(f"No event task found for job {job_id}")
                 raise HTTPException(status_code=404, detail="No event task found for job")
+            settings = get_settings_service().settings
+            framer = EventFramer(
+                framing,
+                chunk_size=settings.build_events_chunk_size,
+                reference_threshold=settings.build_events_reference_threshold,
+                reference_url=reference_url,
+                store_reference=partial(queue_service.store_event_payload, job_id),
+            )
             return await create_flow_response(
                 queue=main_queue,
                 event_manager=event_manager,
                 event_task=event_task,
+                framer=framer,
+                # An SSE client that can replay the stream reconnects instead of abandoning the build
+                cancel_on_disconnect=not (framing == EventFraming.SSE and isinstance(main_queue, StreamQueue)),
             )
 
         # Polling mode - get all available events
@@ -143,6 +193,15 @@ async def get_flow_events_response(
                     event_manager.on_end(data={})
                 else:
                     events.append(value.decode("utf-8"))
+                    # Streamed queues read events in batches; return the rest of the batch as well
+                    while not main_queue.empty():
+                        _, value, _ = await main_queue.get()
+                        if value is None:
+                            if event_task is not None:
+                                event_task.cancel()
+                            event_manager.on_end(data={})
+                            break
+                        events.append(value.decode("utf-8"))
 
             # Return as NDJSON format - each line is a complete JSON object
             content = "\n".join([event for event in events if event is not None])
@@ -165,33 +224,59 @@ async def get_flow_events_response(
 
 
 async def create_flow_response(
-    queue: asyncio.Queue,
+    queue: asyncio.Queue | StreamQueue,
     event_manager: EventManager,
-    event_task: asyncio.Task,
+    event_task: asyncio.Task | RemoteJobTask,
+    *,
+    framer: EventFramer | None = None,
+    cancel_on_disconnect: bool = True,
 ) -> DisconnectHandlerStreamingResponse:
-    """Create a streaming response for the flow build process."""
+    """Create a streaming response for the flow build process.
+
+    Events are written in batches framed by ``framer``. Unless ``cancel_on_disconnect`` is False, the build is
+    cancelled when the client disconnects.
+    """
+    settings = get_settings_service().settings
+    framer = framer or EventFramer(chunk_size=settings.build_events_chunk_size)
 
-    async def consume_and_yield() -> AsyncIterator[str]:
+    async def consume_and_yield() -> AsyncIterator[bytes]:
+        started = time.time()
+        event_count = 0
+        longest_wait = 0.0
         while True:
             try:
-                event_id, value, put_time = await queue.get()
-                if value is None:
-                    break
-                get_time = time.time()
-                yield value.decode("utf-8")
-                await logger.adebug(f"Event {event_id} consumed in {get_time - put_time:.4f}s")
+                events, ended = await next_event_batch(
+                    queue,
+                    max_bytes=framer.chunk_size,
+                    window=settings.build_events_coalesce_window,
+                )
             except Exception as exc:  # noqa: BLE001
                 await logger.aexception(f"Error consuming event: {exc}")
                 break
+            if events:
+                get_time = time.time()
+                event_count += len(events)
+                longest_wait = max(longest_wait, get_time - events[0][2])
+                for write in framer.frame(events):
+                    yield write
+            if ended:
+                break
+        await logger.adebug(
+            f"Streamed {event_count} events in {time.time() - started:.2f}s (longest time in queue {longest_wait:.4f}s)"
+        )
 
     def on_disconnect() -> None:
+        if not cancel_on_disconnect:
+            logger.debug("Client disconnected; the build keeps running so the client can resume")
+            return
         logger.debug("Client disconnected, closing tasks")
         event_task.cancel()
         event_manager.on_end(data={})
 
     return DisconnectHandlerStreamingResponse(
         consume_and_yield(),
-        media_type="application/x-ndjson",
+        media_type=framer.media_type,
+        headers={"Cache-Control": "no-cache"} if framer.framing == EventFraming.SSE else None,
         on_disconnect=on_disconnect,
     )
 
@@ -209,6 +294,7 @@ async def generate_flow_events(
     log_builds: bool,
     current_user: CurrentActiveUser,
     flow_name: str | None = None,
+    incremental: bool = False,
 ) -> None:
     """Generate events for flow building process.
 
@@ -216,11 +302,16 @@ async def generate_flow_events(
     - Building and validating the graph
     - Processing vertices
     - Handling errors and cleanup
+
+    With ``incremental`` every vertex is fingerprinted (``compute_vertex_fingerprints``), and a vertex whose
+    fingerprint matches an earlier build in the same session reuses that build's result. Only vertices that
+    changed, and the vertices downstream of them, run again.
     """
     chat_service = get_chat_service()
     telemetry_service = get_telemetry_service()
     if not inputs:
         inputs = InputValueRequest(session=str(flow_id))
+    fingerprints: dict[str, str | None] = {}
 
     async def build_graph_and_get_order() -> tuple[list[str], list[str], Graph]:
         start_time = time.perf_counter()
@@ -235,6 +326,16 @@ async def generate_flow_events(
 
             graph.set_run_id(run_id)
             first_layer = sort_vertices(graph)
+            if incremental:
+                fingerprints.update(
+                    compute_vertex_fingerprints(
+                        graph,
+                        # The request time differs on every build and does not affect any result
+                        inputs_dict=inputs.model_dump(exclude={"client_request_time"}),
+                        files=files,
+                        variables=await aget_variable_values(graph, current_user.id),
+                    )
+                )
 
             for vertex_id in first_layer:
                 graph.run_manager.add_to_vertices_being_run(vertex_id)
@@ -329,6 +430,7 @@ async def generate_flow_events(
                     get_cache=chat_service.get_cache,
                     set_cache=chat_service.set_cache,
                     event_manager=event_manager,
+                    fingerprint=fingerprints.get(vertex_id),
                 )
                 result_dict = vertex_build_result.result_dict
                 params = vertex_build_result.params
@@ -550,7 +652,13 @@ async def cancel_flow_build(
         asyncio.CancelledError: If the task cancellation failed
     """
     # Get the event task and event manager for the job
-    _, _, event_task, _ = queue_service.get_queue_data(job_id)
+    _, _, event_task, _ = await queue_service.aget_queue_data(job_id)
+
+    if isinstance(event_task, RemoteJobTask):
+        # The build runs on another worker, which cancels it once it sees the request.
+        await event_task.request_cancel()
+        await logger.ainfo(f"Requested cancellation of flow build for job_id {job_id} on its worker")
+        return True
 
     if event_task is None:
         await logger.awarning(f"No event task found for job_id {job_id}")
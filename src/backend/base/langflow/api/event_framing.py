@@ -0,0 +1,158 @@
+"""Framing of streamed build events.
+
+A build puts one JSON event, followed by a blank line, on its job queue for every event. Streaming responses
+for ``/build/{job_id}/events`` do not write these one by one:
+
+- Every event already queued behind the one that was awaited (and, with ``build_events_coalesce_window``, those
+  arriving shortly after it) is coalesced into one write of up to ``build_events_chunk_size`` bytes, and larger
+  events are split into writes of that size.
+- With ``framing=sse`` events are sent as server-sent events. The ``id`` of each message is the sequence number
+  of its last event, so a client that reconnects with ``Last-Event-ID`` resumes after it (replay needs a
+  ``job_queue_backend`` other than ``memory``). A message holds one event per ``data:`` line. An event larger
+  than the chunk size is sent as ``chunk`` messages followed by a ``chunk_end`` message carrying its ``id``,
+  whose data concatenate to the event.
+- With references enabled, events larger than ``build_events_reference_threshold`` are replaced by
+  ``{"event": ..., "ref": ..., "size": ...}``, and the event itself is served from ``ref``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import TYPE_CHECKING
+
+from lfx.events.event_manager import event_sequence
+
+from langflow.api.utils import EventFraming
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from langflow.services.job_queue.streams import StreamQueue
+
+# (event id, JSON event followed by a blank line, put time); a ``None`` event marks the end of the stream.
+QueueItem = tuple[str | None, bytes | None, float]
+
+
+async def next_event_batch(
+    queue: asyncio.Queue | StreamQueue, *, max_bytes: int, window: float = 0.0
+) -> tuple[list[QueueItem], bool]:
+    """Wait for the next event, then take the events queued behind it until they add up to ``max_bytes``.
+
+    When the queue runs empty, waits ``window`` seconds once for more events.
+
+    Returns:
+        The events, and whether the end of the stream was reached.
+    """
+    item = await queue.get()
+    if item[1] is None:
+        return [], True
+    batch = [item]
+    size = len(item[1])
+    waited = window <= 0
+    while size < max_bytes:
+        if queue.empty():
+            if waited:
+                break
+            waited = True
+            await asyncio.sleep(window)
+            continue
+        item = await queue.get()
+        if item[1] is None:
+            return batch, True
+        batch.append(item)
+        size += len(item[1])
+    return batch, False
+
+
+def _split(data: bytes, size: int) -> list[bytes]:
+    view = memoryview(data)
+    return [bytes(view[start : start + size]) for start in range(0, len(data), size)]
+
+
+class EventFramer:
+    """Turns batches of queued build events into the writes of a streaming response."""
+
+    def __init__(
+        self,
+        framing: EventFraming = EventFraming.NDJSON,
+        *,
+        chunk_size: int = 65536,
+        reference_threshold: int | None = None,
+        reference_url: Callable[[int], str] | None = None,
+        store_reference: Callable[[int, bytes], None] | None = None,
+    ) -> None:
+        """Create a framer.
+
+        Args:
+            framing: Wire format of the stream.
+            chunk_size: Largest write, in bytes, made for a single event.
+            reference_threshold: Size, in bytes, above which events are sent by reference. None sends every
+                event inline.
+            reference_url: Returns the URL an event is served from, given its sequence number.
+            store_reference: Keeps an event sent by reference, given its sequence number and JSON.
+        """
+        self.framing = framing
+        self.chunk_size = max(chunk_size, 1)
+        self.reference_threshold = reference_threshold if reference_url and store_reference else None
+        self.reference_url = reference_url
+        self.store_reference = store_reference
+
+    @property
+    def media_type(self) -> str:
+        return "text/event-stream" if self.framing == EventFraming.SSE else "application/x-ndjson"
+
+    def _by_reference(self, event_id: str | None, sequence: int, payload: bytes) -> bytes:
+        self.store_reference(sequence, payload)
+        event_type = event_id.rpartition("-")[0] if event_id else None
+        reference = {"event": event_type, "ref": self.reference_url(sequence), "size": len(payload)}
+        return json.dumps(reference).encode("utf-8")
+
+    def frame(self, events: list[QueueItem]) -> list[bytes]:
+        """Return the writes for a batch of events, in order."""
+        writes: list[bytes] = []
+        pending: list[bytes] = []
+        last_sequence: int | None = None
+
+        def flush() -> None:
+            nonlocal last_sequence
+            if not pending:
+                return
+            if self.framing == EventFraming.SSE:
+                if last_sequence is not None:
+                    pending.append(b"id: %d\n" % last_sequence)
+                pending.append(b"\n")
+            writes.append(b"".join(pending))
+            pending.clear()
+            last_sequence = None
+
+        for event_id, value, _ in events:
+            sequence = event_sequence(event_id)
+            payload = value.rstrip(b"\n")
+            if (
+                self.reference_threshold is not None
+                and sequence is not None
+                and len(payload) > self.reference_threshold
+            ):
+                payload = self._by_reference(event_id, sequence, payload)
+
+            if len(payload) <= self.chunk_size:
+                if self.framing == EventFraming.SSE:
+                    pending.append(b"data: " + payload + b"\n")
+                    if sequence is not None:
+                        last_sequence = sequence
+                else:
+                    pending.append(payload + b"\n\n")
+                continue
+
+            flush()
+            parts = _split(payload, self.chunk_size)
+            if self.framing == EventFraming.SSE:
+                writes.extend(b"event: chunk\ndata: " + part + b"\n\n" for part in parts[:-1])
+                id_line = b"" if sequence is None else b"id: %d\n" % sequence
+                writes.append(b"event: chunk_end\n" + id_line + b"data: " + parts[-1] + b"\n\n")
+            else:
+                parts[-1] += b"\n\n"
+                writes.extend(parts)
+        flush()
+        return writes
@@ -13,7 +13,9 @@ from langflow.api.utils.core import (
     CurrentActiveMCPUser,
     CurrentActiveUser,
     DbSession,
+    DbSessionReadOnly,
     EventDeliveryType,
+    EventFraming,
     ValidatedFileName,
     build_and_cache_graph_from_data,
     build_graph_from_data,
@@ -50,8 +52,10 @@ __all__ = [
     # Type annotations
     "CurrentActiveUser",
     "DbSession",
+    "DbSessionReadOnly",
     # Enums
     "EventDeliveryType",
+    "EventFraming",
     "ValidatedFileName",
     "build_and_cache_graph_from_data",
     "build_graph_from_data",
@@ -64,6 +64,11 @@ class EventDeliveryType(str, Enum):
     POLLING = "polling"
 
 
+class EventFraming(str, Enum):
+    NDJSON = "ndjson"
+    SSE = "sse"
+
+
 def has_api_terms(word: str):
     return "api" in word and ("key" in word or ("token" in word and "tokens" not in word))
 
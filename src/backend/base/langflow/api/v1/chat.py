@@ -6,7 +6,7 @@ import traceback
 import uuid
 from typing import TYPE_CHECKING, Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Body, Depends, HTTPException, Request, status
+from fastapi import APIRouter, BackgroundTasks, Body, Depends, Header, HTTPException, Query, Request, Response, status
 from fastapi.responses import StreamingResponse
 from lfx.graph.graph.base import Graph
 from lfx.graph.utils import log_vertex_build
@@ -20,6 +20,7 @@ from langflow.api.utils import (
     CurrentActiveUser,
     DbSession,
     EventDeliveryType,
+    EventFraming,
     build_and_cache_graph_from_data,
     build_graph_from_db,
     format_elapsed_time,
@@ -145,6 +146,7 @@ async def build_flow(
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     flow_name: str | None = None,
     event_delivery: EventDeliveryType = EventDeliveryType.POLLING,
+    incremental: bool = False,
 ):
     """Build and process a flow, returning a job ID for event polling.
 
@@ -164,6 +166,7 @@ async def build_flow(
         queue_service: Queue service for job management
         flow_name: Optional name for the flow
         event_delivery: Optional event delivery type - default is streaming
+        incremental: Whether to reuse the results of vertices that did not change since the last build
 
     Returns:
         Dict with job_id that can be used to poll for build status
@@ -186,6 +189,7 @@ async def build_flow(
         current_user=current_user,
         queue_service=queue_service,
         flow_name=flow_name,
+        incremental=incremental,
     )
 
     # This is required to support FE tests - we need to be able to set the event delivery to direct
@@ -201,21 +205,51 @@ async def build_flow(
 @router.get("/build/{job_id}/events", dependencies=[Depends(get_current_active_user)])
 async def get_build_events(
     job_id: str,
+    request: Request,
     queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
     *,
     event_delivery: EventDeliveryType = EventDeliveryType.STREAMING,
+    offset: Annotated[int | None, Query(ge=0)] = None,
+    framing: EventFraming = EventFraming.NDJSON,
+    references: bool = False,
+    last_event_id: Annotated[str | None, Header()] = None,
 ):
     """Get events for a specific build job.
 
-    Requires authentication to prevent unauthorized access to build events.
+    Requires authentication to prevent unauthorized access to build events. With a distributed job queue
+    backend, pass the number of events already received as ``offset`` to resume after a reconnect; with
+    ``framing=sse`` the ``Last-Event-ID`` header does the same. With ``references``, streamed events larger than
+    ``build_events_reference_threshold`` are sent as references to ``/build/{job_id}/events/{sequence}``.
     """
+    if offset is None and last_event_id and last_event_id.isdigit():
+        offset = int(last_event_id)
+
+    def reference_url(sequence: int) -> str:
+        return request.url_for("get_build_event", job_id=job_id, sequence=str(sequence)).path
+
     return await get_flow_events_response(
         job_id=job_id,
         queue_service=queue_service,
         event_delivery=event_delivery,
+        offset=offset,
+        framing=framing,
+        reference_url=reference_url if references else None,
     )
 
 
+@router.get("/build/{job_id}/events/{sequence}", dependencies=[Depends(get_current_active_user)])
+async def get_build_event(
+    job_id: str,
+    sequence: int,
+    queue_service: Annotated[JobQueueService, Depends(get_queue_service)],
+) -> Response:
+    """Get an event of a build job that was streamed by reference."""
+    payload = await queue_service.aget_event_payload(job_id, sequence)
+    if payload is None:
+        raise HTTPException(status_code=404, detail=f"Event {sequence} of job {job_id} not found")
+    return Response(content=payload.rstrip(b"\n"), media_type="application/json")
+
+
 @router.post(
     "/build/{job_id}/cancel",
     response_model=CancelFlowResponse,
@@ -41,6 +41,7 @@ from langflow.events.event_manager import create_stream_tokens_event_manager
 from langflow.exceptions.api import APIException, InvalidChatInputError
 from langflow.exceptions.serialization import SerializationError
 from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+from langflow.interface.catalog import get_component_catalog
 from langflow.interface.initialize.loading import update_params_with_load_from_db_fields
 from langflow.processing.process import process_tweaks, run_graph_internal
 from langflow.schema.graph import Tweaks
@@ -50,8 +51,8 @@ from langflow.services.database.models.flow.model import Flow, FlowRead
 from langflow.services.database.models.flow.utils import get_all_webhook_components_in_flow
 from langflow.services.database.models.user.model import User, UserRead
 from langflow.services.deps import get_session_service, get_settings_service, get_telemetry_service
+from langflow.services.task.execution import enqueue_webhook_run, worker_mode_enabled
 from langflow.services.telemetry.schema import RunPayload
-from langflow.utils.compression import compress_response
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -84,22 +85,49 @@ async def parse_input_request_from_body(http_request: Request) -> SimplifiedAPIR
 
 
 @router.get("/all", dependencies=[Depends(get_current_active_user)])
-async def get_all():
+async def get_all(request: Request):
     """Retrieve all component types with compression for better performance.
 
-    Returns a compressed response containing all available component types.
+    The catalog is encoded and compressed once per registry version and carries an ETag; a request whose
+    ``If-None-Match`` holds the current ETag gets an empty 304 response.
     """
     from langflow.interface.components import get_and_cache_all_types_dict
 
     try:
         all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
-        # Return compressed response using our utility function
-        return compress_response(all_types)
+        payload = await get_component_catalog().full(all_types)
+        return payload.response(request)
 
     except Exception as exc:
         raise HTTPException(status_code=500, detail=str(exc)) from exc
 
 
+@router.get("/all/manifest", dependencies=[Depends(get_current_active_user)])
+async def get_all_manifest() -> dict:
+    """ETags of the whole component catalog and of each of its categories.
+
+    Clients that hold a copy of the catalog fetch only the categories whose ETag changed from
+    ``/all/{category}``, and drop the categories that are no longer listed.
+    """
+    from langflow.interface.components import get_and_cache_all_types_dict
+
+    all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
+    return await get_component_catalog().manifest(all_types)
+
+
+@router.get("/all/{category}", dependencies=[Depends(get_current_active_user)])
+async def get_all_category(category: str, request: Request):
+    """Retrieve the component types of one category, with the same caching as ``/all``."""
+    from langflow.interface.components import get_and_cache_all_types_dict
+
+    all_types = await get_and_cache_all_types_dict(settings_service=get_settings_service())
+    try:
+        payload = await get_component_catalog().category(all_types, category)
+    except KeyError as exc:
+        raise HTTPException(status_code=404, detail=f"Category {category} not found") from exc
+    return payload.response(request)
+
+
 def validate_input_and_tweaks(input_request: SimplifiedAPIRequest) -> None:
     # If the input_value is not None and the input_type is "chat"
     # then we need to check the tweaks if the ChatInput component is present
@@ -260,9 +288,12 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
     Notes:
         - Events are tuples of (event_id, value, put_time)
         - Breaks the loop when receiving a None value, signaling completion
-        - Tracks and logs timing metrics for queue time and client processing time
+        - Tracks timing metrics for queue time and client processing time, logged once the stream ends
         - Notifies client consumption via client_consumed_queue
     """
+    event_count = 0
+    queue_time = 0.0
+    client_time = 0.0
     while True:
         event_id, value, put_time = await queue.get()
         if value is None:
@@ -271,11 +302,11 @@ async def consume_and_yield(queue: asyncio.Queue, client_consumed_queue: asyncio
         yield value
         get_time_yield = time.time()
         client_consumed_queue.put_nowait(event_id)
-        await logger.adebug(
-            f"consumed event {event_id} "
-            f"(time in queue, {get_time - put_time:.4f}, "
-            f"client {get_time_yield - get_time:.4f})"
-        )
+        event_count += 1
+        queue_time += get_time - put_time
+        client_time += get_time_yield - get_time
+    if event_count:
+        await logger.adebug(f"consumed {event_count} events (time in queue {queue_time:.4f}, client {client_time:.4f})")
 
 
 async def run_flow_generator(
@@ -664,6 +695,14 @@ async def webhook_run_flow(
 
         await logger.adebug("Starting background task")
         run_id = str(uuid4())
+        if worker_mode_enabled():
+            await enqueue_webhook_run(
+                flow_id=flow.id,
+                input_request=input_request,
+                user_id=webhook_user.id if webhook_user else None,
+                run_id=run_id,
+            )
+            return {"message": "Task queued for an execution worker", "status": "in progress"}
         background_tasks.add_task(
             simple_run_flow_task,
             flow=flow,
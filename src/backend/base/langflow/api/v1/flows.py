@@ -21,7 +21,14 @@ from lfx.log import logger
 from sqlmodel import and_, col, select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
-from langflow.api.utils import CurrentActiveUser, DbSession, cascade_delete_flow, remove_api_keys, validate_is_component
+from langflow.api.utils import (
+    CurrentActiveUser,
+    DbSession,
+    DbSessionReadOnly,
+    cascade_delete_flow,
+    remove_api_keys,
+    validate_is_component,
+)
 from langflow.api.v1.schemas import FlowListCreate
 from langflow.helpers.user import get_user_by_flow_id_or_endpoint_name
 from langflow.initial_setup.constants import STARTER_FOLDER_NAME
@@ -33,6 +40,7 @@ from langflow.services.database.models.flow.model import (
     FlowRead,
     FlowUpdate,
 )
+from langflow.services.database.models.flow.queries import flow_header_from_row, select_flow_headers
 from langflow.services.database.models.flow.utils import get_webhook_component_in_flow
 from langflow.services.database.models.folder.constants import DEFAULT_FOLDER_NAME
 from langflow.services.database.models.folder.model import Folder
@@ -287,7 +295,7 @@ async def create_flow(
 async def read_flows(
     *,
     current_user: CurrentActiveUser,
-    session: DbSession,
+    session: DbSessionReadOnly,
     remove_example_flows: bool = False,
     components_only: bool = False,
     get_all: bool = True,
@@ -346,6 +354,14 @@ async def read_flows(
         if components_only:
             stmt = stmt.where(Flow.is_component == True)  # noqa: E712
 
+        if get_all and header_flows:
+            # Headers are built from the projected columns, so the graph of flows is never loaded
+            header_stmt = select_flow_headers().where(stmt.whereclause)
+            flow_headers = [flow_header_from_row(row) for row in (await session.exec(header_stmt)).all()]
+            if components_only:
+                flow_headers = [flow for flow in flow_headers if flow.is_component]
+            return compress_response(flow_headers)
+
         if get_all:
             flows = (await session.exec(stmt)).all()
             flows = validate_is_component(flows)
@@ -353,11 +369,6 @@ async def read_flows(
                 flows = [flow for flow in flows if flow.is_component]
             if remove_example_flows and starter_folder_id:
                 flows = [flow for flow in flows if flow.folder_id != starter_folder_id]
-            if header_flows:
-                # Convert to FlowHeader objects and compress the response
-                flow_headers = [FlowHeader.model_validate(flow, from_attributes=True) for flow in flows]
-                return compress_response(flow_headers)
-
             # Convert to FlowRead while session is still active to avoid detached instance errors
             flow_reads = [FlowRead.model_validate(flow, from_attributes=True) for flow in flows]
             return compress_response(flow_reads)
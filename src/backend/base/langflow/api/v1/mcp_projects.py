@@ -27,7 +27,6 @@ from mcp import types
 from mcp.server import NotificationOptions, Server
 from mcp.server.sse import SseServerTransport
 from mcp.server.streamable_http_manager import StreamableHTTPSessionManager
-from sqlalchemy.orm import selectinload
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 
@@ -223,18 +222,22 @@ async def _build_project_tools_response(
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
                 raise HTTPException(status_code=404, detail="Project not found")
 
             # Query flows in the project
-            flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+            flows_query = select(
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.mcp_enabled,
+                Flow.user_id,
+            ).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
 
             # Optionally filter for MCP-enabled flows only
             if mcp_enabled:
@@ -484,11 +487,7 @@ async def update_project_mcp_settings(
         async with session_scope() as session:
             # Fetch the project first to verify it exists and belongs to the current user
             project = (
-                await session.exec(
-                    select(Folder)
-                    .options(selectinload(Folder.flows))
-                    .where(Folder.id == project_id, Folder.user_id == current_user.id)
-                )
+                await session.exec(select(Folder).where(Folder.id == project_id, Folder.user_id == current_user.id))
             ).first()
 
             if not project:
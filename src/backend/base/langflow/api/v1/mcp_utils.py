@@ -22,10 +22,10 @@ from sqlmodel import select
 
 from langflow.api.v1.endpoints import simple_run_flow
 from langflow.api.v1.schemas import SimplifiedAPIRequest
-from langflow.helpers.flow import json_schema_from_flow
 from langflow.schema.message import Message
 from langflow.services.database.models import Flow
 from langflow.services.database.models.file.model import File as UserFile
+from langflow.services.database.models.flow.queries import data_without_summary, flow_input_schema
 from langflow.services.database.models.user.model import User
 from langflow.services.deps import get_settings_service, get_storage_service, session_scope
 
@@ -101,7 +101,9 @@ async def handle_list_resources(project_id=None):
             current_user = None
         async with session_scope() as session:
             # Build query based on whether project_id is provided
-            flows_query = select(Flow).where(Flow.folder_id == project_id) if project_id else select(Flow)
+            flows_query = select(Flow.id, Flow.name)
+            if project_id:
+                flows_query = flows_query.where(Flow.folder_id == project_id)
 
             flows = (await session.exec(flows_query)).all()
 
@@ -329,15 +331,23 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
     tools = []
     try:
         async with session_scope() as session:
+            # The graph is only loaded for flows saved before their input schema was summarized
+            flows_query = select(
+                Flow.id,
+                Flow.name,
+                Flow.description,
+                Flow.action_name,
+                Flow.action_description,
+                Flow.user_id,
+                Flow.summary,
+                data_without_summary(),
+            )
             # Build query based on parameters
             if project_id:
                 # Filter flows by project and optionally by MCP enabled status
-                flows_query = select(Flow).where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
+                flows_query = flows_query.where(Flow.folder_id == project_id, Flow.is_component == False)  # noqa: E712
                 if mcp_enabled_only:
                     flows_query = flows_query.where(Flow.mcp_enabled == True)  # noqa: E712
-            else:
-                # Get all flows
-                flows_query = select(Flow)
 
             flows = (await session.exec(flows_query)).all()
 
@@ -377,7 +387,7 @@ async def handle_list_tools(project_id=None, *, mcp_enabled_only=False):
                     tool = types.Tool(
                         name=name,
                         description=description,
-                        inputSchema=json_schema_from_flow(flow),
+                        inputSchema=flow_input_schema(flow),
                     )
                     tools.append(tool)
                     existing_names.add(name)
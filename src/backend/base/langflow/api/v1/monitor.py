@@ -4,12 +4,14 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlmodel import apaginate
+from lfx.base.models.response_cache import get_llm_response_cache
+from lfx.utils.executors import get_executor_metrics
 from sqlalchemy import delete
 from sqlmodel import col, select
 
-from langflow.api.utils import DbSession, custom_params
+from langflow.api.utils import DbSession, DbSessionReadOnly, custom_params
 from langflow.schema.message import MessageResponse
-from langflow.services.auth.utils import get_current_active_user
+from langflow.services.auth.utils import get_current_active_superuser, get_current_active_user
 from langflow.services.database.models.flow.model import Flow
 from langflow.services.database.models.message.model import MessageRead, MessageTable, MessageUpdate
 from langflow.services.database.models.transactions.crud import transform_transaction_table_for_logs
@@ -20,12 +22,13 @@ from langflow.services.database.models.vertex_builds.crud import (
     get_vertex_builds_by_flow_id,
 )
 from langflow.services.database.models.vertex_builds.model import VertexBuildMapModel
+from langflow.services.task.execution import get_run_broker, worker_mode_enabled
 
 router = APIRouter(prefix="/monitor", tags=["Monitor"])
 
 
 @router.get("/builds", dependencies=[Depends(get_current_active_user)])
-async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSession) -> VertexBuildMapModel:
+async def get_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSessionReadOnly) -> VertexBuildMapModel:
     try:
         vertex_builds = await get_vertex_builds_by_flow_id(session, flow_id)
         return VertexBuildMapModel.from_list_of_dicts(vertex_builds)
@@ -41,9 +44,52 @@ async def delete_vertex_builds(flow_id: Annotated[UUID, Query()], session: DbSes
         raise HTTPException(status_code=500, detail=str(e)) from e
 
 
+@router.get("/llm_cache", dependencies=[Depends(get_current_active_user)])
+async def get_llm_cache_stats() -> dict:
+    """Hit ratio and model latency saved by the language model response cache of this worker."""
+    return get_llm_response_cache().stats()
+
+
+@router.delete("/llm_cache", status_code=204)
+async def invalidate_llm_cache(
+    session: DbSession,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    flow_id: Annotated[UUID | None, Query()] = None,
+) -> None:
+    """Drop the cached answers of one of the user's flows, or of every flow for a superuser."""
+    if flow_id is None:
+        await get_current_active_superuser(current_user)
+    else:
+        flow = await session.get(Flow, flow_id)
+        if flow is None or flow.user_id != current_user.id:
+            raise HTTPException(status_code=404, detail="Flow not found")
+    await get_llm_response_cache().invalidate(str(flow_id) if flow_id else None)
+
+
+@router.get("/executors", dependencies=[Depends(get_current_active_user)])
+async def get_executors() -> dict:
+    """Queue depth, activity and wait time of each executor pool of this worker that has been used so far."""
+    return get_executor_metrics()
+
+
+@router.get("/workers", dependencies=[Depends(get_current_active_user)])
+async def get_execution_workers() -> dict:
+    """Live execution workers, the runs each is executing and the runs waiting for one."""
+    if not worker_mode_enabled():
+        return {"execution_mode": "inline", "workers": [], "pending": 0, "available": 0}
+    broker = get_run_broker()
+    workers = await broker.workers()
+    return {
+        "execution_mode": "worker",
+        "workers": workers,
+        "pending": await broker.pending(),
+        "available": sum(worker.get("available", 0) for worker in workers),
+    }
+
+
 @router.get("/messages/sessions")
 async def get_message_sessions(
-    session: DbSession,
+    session: DbSessionReadOnly,
     current_user: Annotated[User, Depends(get_current_active_user)],
     flow_id: Annotated[UUID | None, Query()] = None,
 ) -> list[str]:
@@ -65,7 +111,7 @@ async def get_message_sessions(
 
 @router.get("/messages")
 async def get_messages(
-    session: DbSession,
+    session: DbSessionReadOnly,
     current_user: Annotated[User, Depends(get_current_active_user)],
     flow_id: Annotated[UUID | None, Query()] = None,
     session_id: Annotated[str | None, Query()] = None,
@@ -191,7 +237,7 @@ async def delete_messages_session(
 @router.get("/transactions", dependencies=[Depends(get_current_active_user)])
 async def get_transactions(
     flow_id: Annotated[UUID, Query()],
-    session: DbSession,
+    session: DbSessionReadOnly,
     params: Annotated[Params | None, Depends(custom_params)],
 ) -> Page[TransactionLogsResponse]:
     try:
@@ -7,7 +7,7 @@ from fastapi import APIRouter, HTTPException
 from lfx.base.models.unified_models import get_model_provider_variable_mapping, validate_model_provider_key
 from sqlalchemy.exc import NoResultFound
 
-from langflow.api.utils import CurrentActiveUser, DbSession
+from langflow.api.utils import CurrentActiveUser, DbSession, DbSessionReadOnly
 from langflow.api.v1.models import (
     DISABLED_MODELS_VAR,
     ENABLED_MODELS_VAR,
@@ -145,7 +145,7 @@ async def create_variable(
 @router.get("/", response_model=list[VariableRead], status_code=200)
 async def read_variables(
     *,
-    session: DbSession,
+    session: DbSessionReadOnly,
     current_user: CurrentActiveUser,
 ):
     """Read all variables."""
@@ -4,13 +4,13 @@ from typing import TYPE_CHECKING, Any, cast
 from uuid import UUID
 
 from fastapi import HTTPException
-from lfx.log.logger import logger
 from pydantic.v1 import BaseModel, Field, create_model
 from sqlalchemy.orm import aliased
 from sqlmodel import asc, desc, select
 
 from langflow.schema.schema import INPUT_FIELD_NAME
 from langflow.services.database.models.flow.model import Flow, FlowRead
+from langflow.services.database.models.flow.summary import input_schema_from_nodes
 from langflow.services.deps import get_settings_service, session_scope
 
 if TYPE_CHECKING:
@@ -33,13 +33,26 @@ SORT_DISPATCHER = {
 }
 
 
-async def list_flows(*, user_id: str | None = None) -> list[Data]:
+async def list_flows(*, user_id: str | None = None, include_data: bool = True) -> list[Data]:
+    """List the flows of a user.
+
+    With ``include_data=False`` the ``data`` column (the graph) is not loaded and is ``None`` in every result.
+    """
     if not user_id:
         msg = "Session is invalid"
         raise ValueError(msg)
     try:
         async with session_scope() as session:
             uuid_user_id = UUID(user_id) if isinstance(user_id, str) else user_id
+            if not include_data:
+                stmt = (
+                    select(Flow.id, Flow.name, Flow.description, Flow.updated_at, Flow.folder_id)
+                    .where(Flow.user_id == uuid_user_id)
+                    .where(Flow.is_component == False)  # noqa: E712
+                )
+                rows = (await session.exec(stmt)).all()
+                return [Data(data={**row._mapping, "data": None}) for row in rows]  # noqa: SLF001
+
             stmt = select(Flow).where(Flow.user_id == uuid_user_id).where(Flow.is_component == False)  # noqa: E712
             flows = (await session.exec(stmt)).all()
 
@@ -446,35 +459,4 @@ def json_schema_from_flow(flow: Flow) -> dict:
 
     graph = Graph.from_payload(flow_data)
     input_nodes = [vertex for vertex in graph.vertices if vertex.is_input]
-
-    properties = {}
-    required = []
-    for node in input_nodes:
-        node_data = node.data["node"]
-        template = node_data["template"]
-
-        for field_name, field_data in template.items():
-            if field_data != "Component" and field_data.get("show", False) and not field_data.get("advanced", False):
-                field_type = field_data.get("type", "string")
-                properties[field_name] = {
-                    "type": field_type,
-                    "description": field_data.get("info", f"Input for {field_name}"),
-                }
-                # Update field_type in properties after determining the JSON Schema type
-                if field_type == "str":
-                    field_type = "string"
-                elif field_type == "int":
-                    field_type = "integer"
-                elif field_type == "float":
-                    field_type = "number"
-                elif field_type == "bool":
-                    field_type = "boolean"
-                else:
-                    logger.warning(f"Unknown field type: {field_type} defaulting to string")
-                    field_type = "string"
-                properties[field_name]["type"] = field_type
-
-                if field_data.get("required", False):
-                    required.append(field_name)
-
-    return {"type": "object", "properties": properties, "required": required}
+    return input_schema_from_nodes([node.data for node in input_nodes])
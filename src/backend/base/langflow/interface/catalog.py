@@ -0,0 +1,90 @@
+"""Precompressed component catalog served by ``/all``.
+
+Encoding and compressing the whole component registry takes long enough that doing it for every editor page
+load shows up in profiles. ``ComponentCatalog`` keeps the encoded JSON of every category and the compressed
+payloads built from it, and only rebuilds what changed according to the registry's versions
+(``lfx.interface.components.component_cache``). A change to one category re-encodes that category only; the
+full catalog is assembled from the cached category encodings.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+from lfx.interface.components import component_cache
+
+from langflow.utils.compression import PrecompressedPayload, encode_json
+
+
+class ComponentCatalog:
+    def __init__(self) -> None:
+        self._category_json: dict[str, tuple[int, bytes]] = {}
+        self._category_payloads: dict[str, tuple[int, PrecompressedPayload]] = {}
+        self._full: tuple[int, PrecompressedPayload] | None = None
+        self._lock = asyncio.Lock()
+
+    def _encode_category(self, name: str, components: dict[str, Any]) -> bytes:
+        version = component_cache.category_version(name)
+        cached = self._category_json.get(name)
+        if cached is None or cached[0] != version:
+            cached = (version, encode_json(components))
+            self._category_json[name] = cached
+        return cached[1]
+
+    def _build_full(self, all_types: dict[str, Any]) -> PrecompressedPayload:
+        for name in set(self._category_json) - set(all_types):
+            del self._category_json[name]
+        parts = [
+            json.dumps(name).encode() + b": " + self._encode_category(name, components)
+            for name, components in all_types.items()
+        ]
+        return PrecompressedPayload.from_json(b"{" + b", ".join(parts) + b"}")
+
+    async def full(self, all_types: dict[str, Any]) -> PrecompressedPayload:
+        """Return the whole catalog, rebuilt only when the registry changed since it was last built."""
+        version = component_cache.version
+        if self._full is None or self._full[0] != version:
+            async with self._lock:
+                if self._full is None or self._full[0] != version:
+                    payload = await asyncio.to_thread(self._build_full, all_types)
+                    self._full = (version, payload)
+        return self._full[1]
+
+    async def category(self, all_types: dict[str, Any], name: str) -> PrecompressedPayload:
+        """Return one category of the catalog.
+
+        Raises:
+            KeyError: If there is no such category.
+        """
+        components = all_types[name]
+        version = component_cache.category_version(name)
+        cached = self._category_payloads.get(name)
+        if cached is None or cached[0] != version:
+            payload = await asyncio.to_thread(
+                lambda: PrecompressedPayload.from_json(self._encode_category(name, components))
+            )
+            cached = (version, payload)
+            self._category_payloads[name] = cached
+        return cached[1]
+
+    async def manifest(self, all_types: dict[str, Any]) -> dict[str, Any]:
+        """Return the ETag of the whole catalog and of each category.
+
+        A client that already holds the catalog compares the category ETags with those it has and fetches
+        only the categories that changed.
+        """
+        full = await self.full(all_types)
+        categories = {name: (await self.category(all_types, name)).etag for name in all_types}
+        return {"etag": full.etag, "categories": categories}
+
+
+_catalog: ComponentCatalog | None = None
+
+
+def get_component_catalog() -> ComponentCatalog:
+    global _catalog  # noqa: PLW0603
+    if _catalog is None:
+        _catalog = ComponentCatalog()
+    return _catalog
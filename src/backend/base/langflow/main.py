@@ -21,6 +21,7 @@ from fastapi_pagination import add_pagination
 from filelock import FileLock
 from lfx.interface.utils import setup_llm_caching
 from lfx.log.logger import configure, logger
+from lfx.utils.executors import shutdown_executors
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
 from pydantic import PydanticDeprecatedSince20
 from pydantic_core import PydanticSerializationError
@@ -400,6 +401,12 @@ def get_lifespan(*, fix_migration=False, version=None):
                     except asyncio.TimeoutError:
                         await logger.awarning("Teardown services timed out after 30s.")
 
+                    # Stop the io/cpu/process executor pools after the services that may still use them.
+                    try:
+                        await asyncio.wait_for(asyncio.to_thread(shutdown_executors), timeout=10)
+                    except asyncio.TimeoutError:
+                        await logger.awarning("Executor pool shutdown timed out after 10s.")
+
                 # Step 3: Clearing Temporary Files
                 with shutdown_progress.step(3):
                     temp_dir_cleanups = [asyncio.to_thread(temp_dir.cleanup) for temp_dir in temp_dirs]
@@ -12,10 +12,11 @@ from fastapi import HTTPException, status
 from lfx.log.logger import logger
 from pydantic import BaseModel, ValidationInfo, field_serializer, field_validator
 from sqlalchemy import Enum as SQLEnum
-from sqlalchemy import Text, UniqueConstraint, text
+from sqlalchemy import Text, UniqueConstraint, event, inspect, text
 from sqlmodel import JSON, Column, Field, Relationship, SQLModel
 
 from langflow.schema.data import Data
+from langflow.services.database.models.flow.summary import summarize_flow_data
 
 if TYPE_CHECKING:
     from langflow.services.database.models.folder.model import Folder
@@ -193,6 +194,7 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     locked: bool | None = Field(default=False, nullable=True)
     folder_id: UUID | None = Field(default=None, foreign_key="folder.id", nullable=True, index=True)
     fs_path: str | None = Field(default=None, nullable=True)
+    summary: dict | None = Field(default=None, sa_column=Column(JSON(none_as_null=True), nullable=True))
     folder: Optional["Folder"] = Relationship(back_populates="flows")
 
     def to_data(self):
@@ -213,6 +215,19 @@ class Flow(FlowBase, table=True):  # type: ignore[call-arg]
     )
 
 
+@event.listens_for(Flow, "before_insert")
+@event.listens_for(Flow, "before_update")
+def _update_flow_summary(_mapper, _connection, target: Flow) -> None:
+    """Recompute ``summary`` whenever ``data`` changes, and fill it in for flows saved before it existed."""
+    state = inspect(target)
+    if "data" in state.unloaded:
+        # Loading a deferred column here would need I/O in the middle of a flush.
+        return
+    missing = "summary" not in state.unloaded and target.summary is None and bool(target.data)
+    if missing or state.attrs.data.history.has_changes():
+        target.summary = summarize_flow_data(target.data)
+
+
 class FlowCreate(FlowBase):
     user_id: UUID | None = None
     folder_id: UUID | None = None
@@ -244,6 +259,7 @@ class FlowHeader(BaseModel):
     mcp_enabled: bool | None = Field(None, description="Flag indicating whether the flow is exposed in the MCP server")
     action_name: str | None = Field(None, description="The name of the action associated with the flow")
     action_description: str | None = Field(None, description="The description of the action associated with the flow")
+    summary: dict | None = Field(None, description="Node count, component types and input/output schema of the flow")
 
     @field_validator("data", mode="before")
     @classmethod
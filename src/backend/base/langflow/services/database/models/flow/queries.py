@@ -0,0 +1,79 @@
+"""Flow queries that select only the columns their caller needs.
+
+``select(Flow)`` loads every column, including ``data``, which holds the whole graph and is by far the largest
+column of the table. Listing and header queries select named columns instead. The rows they return expose
+those columns as attributes, so code that only reads names, ids, descriptions and flags works on them as it
+did on ``Flow`` objects.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import case, null, or_
+from sqlmodel import select
+
+from langflow.services.database.models.flow.model import Flow, FlowHeader
+
+if TYPE_CHECKING:
+    from sqlalchemy import Row
+    from sqlmodel.sql.expression import Select
+
+FLOW_HEADER_COLUMNS = (
+    Flow.id,
+    Flow.name,
+    Flow.folder_id,
+    Flow.is_component,
+    Flow.endpoint_name,
+    Flow.description,
+    Flow.access_type,
+    Flow.tags,
+    Flow.mcp_enabled,
+    Flow.action_name,
+    Flow.action_description,
+    Flow.summary,
+)
+
+
+def data_for_components():
+    """``data`` of components, whose headers include it, and of flows not yet known to be one or the other."""
+    return case(
+        (or_(Flow.is_component.is_(True), Flow.is_component.is_(None)), Flow.data),  # type: ignore[union-attr]
+        else_=null(),
+    ).label("data")
+
+
+def data_without_summary():
+    """``data`` of flows saved before summaries existed, whose input schema has to be read from the graph."""
+    return case((Flow.summary.is_(None), Flow.data), else_=null()).label("data")  # type: ignore[union-attr]
+
+
+def select_flow_headers() -> Select:
+    """Select the columns of ``FlowHeader``, with ``data`` only where the header includes it."""
+    return select(*FLOW_HEADER_COLUMNS, Flow.user_id, data_for_components())
+
+
+def flow_header_from_row(row: Row) -> FlowHeader:
+    """Build a ``FlowHeader`` from a ``select_flow_headers`` row.
+
+    ``is_component`` is inferred like ``validate_is_component`` does when the flow does not record it.
+    """
+    values: dict[str, Any] = dict(row._mapping)  # noqa: SLF001
+    if values["is_component"] is None and values.get("data"):
+        is_component = values["data"].get("is_component")
+        values["is_component"] = is_component if is_component is not None else len(values["data"].get("nodes", [])) == 1
+    return FlowHeader.model_validate(values)
+
+
+def flow_input_schema(row: Any) -> dict:
+    """Return the JSON schema of a flow's inputs, from its summary when it has one, or else from its graph."""
+    from langflow.helpers.flow import json_schema_from_flow
+
+    summary = getattr(row, "summary", None)
+    if not summary:
+        return json_schema_from_flow(row)
+    if summary.get("input_schema") is None:
+        # The graph could not be built when the flow was saved.
+        msg = f"The inputs of flow {row.id} could not be determined"
+        raise ValueError(msg)
+    return summary["input_schema"]
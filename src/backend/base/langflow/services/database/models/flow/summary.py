@@ -0,0 +1,94 @@
+"""Compact description of a flow's graph, stored next to ``Flow.data``.
+
+Listing endpoints and MCP tool listings need a flow's size, its component types and the schema of its inputs,
+but not the (often multi-megabyte) ``data`` column. ``summarize_flow_data`` extracts those once, when the flow
+is saved, into ``Flow.summary``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+SUMMARY_VERSION = 1
+
+_JSON_SCHEMA_TYPES = {"str": "string", "int": "integer", "float": "number", "bool": "boolean"}
+
+
+def _node_types(node: dict[str, Any]) -> list[str]:
+    return [node.get("id", "").split("-")[0], node.get("data", {}).get("type", "")]
+
+
+def _is_interface_node(node: dict[str, Any], names: list[str], flag: str) -> bool:
+    if node.get("data", {}).get("node", {}).get(flag):
+        return True
+    types = _node_types(node)
+    return any(name in types for name in names)
+
+
+def input_schema_from_nodes(input_nodes: list[dict[str, Any]]) -> dict[str, Any]:
+    """Build the JSON schema of a flow's inputs from the ``data`` of its input vertices.
+
+    Every visible, non-advanced template field becomes a property, as in ``json_schema_from_flow``.
+    """
+    from lfx.log.logger import logger
+
+    properties: dict[str, Any] = {}
+    required: list[str] = []
+    for node_data in input_nodes:
+        for field_name, field_data in node_data["node"]["template"].items():
+            if field_data == "Component" or not isinstance(field_data, dict):
+                continue
+            if not field_data.get("show", False) or field_data.get("advanced", False):
+                continue
+            field_type = field_data.get("type", "string")
+            if field_type not in _JSON_SCHEMA_TYPES:
+                logger.warning(f"Unknown field type: {field_type} defaulting to string")
+            properties[field_name] = {
+                "type": _JSON_SCHEMA_TYPES.get(field_type, "string"),
+                "description": field_data.get("info", f"Input for {field_name}"),
+            }
+            if field_data.get("required", False):
+                required.append(field_name)
+    return {"type": "object", "properties": properties, "required": required}
+
+
+def summarize_flow_data(data: dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the node count, component types and input/output schema of a flow's graph."""
+    from lfx.graph.schema import INPUT_COMPONENTS, OUTPUT_COMPONENTS
+
+    if not data or not isinstance(data.get("nodes"), list):
+        return None
+    nodes = [node for node in data["nodes"] if isinstance(node, dict)]
+    inputs = [node for node in nodes if _is_interface_node(node, INPUT_COMPONENTS, "is_input")]
+    outputs = [node for node in nodes if _is_interface_node(node, OUTPUT_COMPONENTS, "is_output")]
+    # Grouped components are flattened when the graph is built, so their inputs are only known from the graph.
+    grouped = any(node.get("data", {}).get("node", {}).get("flow") for node in nodes)
+    try:
+        if grouped:
+            from lfx.graph.graph.base import Graph
+
+            graph = Graph.from_payload(data)
+            input_schema = input_schema_from_nodes([vertex.data for vertex in graph.vertices if vertex.is_input])
+        else:
+            input_schema = input_schema_from_nodes([node["data"] for node in inputs])
+    except Exception:  # noqa: BLE001
+        # Readers fall back to building the graph from ``data``.
+        input_schema = None
+
+    def describe(node: dict[str, Any]) -> dict[str, Any]:
+        node_data = node.get("data", {})
+        return {
+            "id": node.get("id"),
+            "type": node_data.get("type"),
+            "display_name": node_data.get("node", {}).get("display_name"),
+        }
+
+    return {
+        "version": SUMMARY_VERSION,
+        "node_count": len(nodes),
+        "edge_count": len(data.get("edges") or []),
+        "component_types": sorted({node.get("data", {}).get("type") or "" for node in nodes} - {""}),
+        "inputs": [describe(node) for node in inputs],
+        "outputs": [describe(node) for node in outputs],
+        "input_schema": input_schema,
+    }
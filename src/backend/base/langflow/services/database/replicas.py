@@ -0,0 +1,146 @@
+"""Read replica routing for read-only database sessions.
+
+Replicas are only used by the API endpoints that list data, through the ``DbSessionReadOnly`` dependency. A
+replica serves reads while it answers its health check and its replication lag is within
+``database_replica_max_lag``; otherwise reads fall back to the primary. Reads are not sticky, so a read may not
+see a write made moments earlier on the primary. Flow execution therefore always reads from the primary.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from lfx.log.logger import logger
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+# Seconds since the last replayed transaction, or 0 when the replica has replayed everything it received
+# (an idle primary would otherwise look like a lagging replica). NULL when replication has not started.
+POSTGRES_LAG_QUERY = """
+SELECT CASE
+    WHEN NOT pg_is_in_recovery() OR pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+    ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())
+END
+"""
+
+REPLICA_CHECK_TIMEOUT = 2.0
+"""Seconds to wait for a replica health check before treating the replica as unavailable."""
+
+
+@dataclass(eq=False)
+class Replica:
+    url: str
+    engine: AsyncEngine
+    session_maker: async_sessionmaker
+    lag: float | None = None
+    healthy: bool = False
+    checked_at: float | None = None
+
+    @property
+    def name(self) -> str:
+        return make_url(self.url).render_as_string(hide_password=True)
+
+
+@dataclass(eq=False)
+class ReplicaPool:
+    """Round-robins read-only sessions over the replicas that are healthy and within the lag limit.
+
+    Each replica is checked on first use and then every ``check_interval`` seconds. Later checks run in the
+    background, so a slow or unreachable replica never delays a read by more than the first check.
+    """
+
+    replicas: list[Replica]
+    max_lag: float
+    check_interval: float
+    check_timeout: float = REPLICA_CHECK_TIMEOUT
+    _next: int = field(default=0, init=False)
+    _lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False)
+    _refresh_task: asyncio.Task | None = field(default=None, init=False)
+
+    async def choose(self) -> Replica | None:
+        """Return the replica to serve the next read, or None to read from the primary."""
+        if any(replica.checked_at is None for replica in self.replicas):
+            await self.refresh()
+        elif self._refresh_task is None and self._stale():
+            self._refresh_task = asyncio.create_task(self._background_refresh())
+
+        available = [replica for replica in self.replicas if replica.healthy]
+        if not available:
+            return None
+        replica = available[self._next % len(available)]
+        self._next += 1
+        return replica
+
+    def mark_unavailable(self, replica: Replica) -> None:
+        """Stop routing reads to a replica that failed mid-session until its next check succeeds."""
+        if replica.healthy:
+            logger.warning(f"Database replica {replica.name} failed; reading from the primary until it recovers")
+        replica.healthy = False
+        replica.checked_at = time.monotonic()
+
+    def _stale(self) -> list[Replica]:
+        now = time.monotonic()
+        return [
+            replica
+            for replica in self.replicas
+            if replica.checked_at is None or now - replica.checked_at >= self.check_interval
+        ]
+
+    async def refresh(self) -> None:
+        """Check every replica whose last check is older than ``check_interval``."""
+        async with self._lock:
+            stale = self._stale()
+            if stale:
+                await asyncio.gather(*(self._check(replica) for replica in stale))
+
+    async def _background_refresh(self) -> None:
+        try:
+            await self.refresh()
+        finally:
+            self._refresh_task = None
+
+    async def _check(self, replica: Replica) -> None:
+        try:
+            lag = await asyncio.wait_for(self._measure_lag(replica), timeout=self.check_timeout)
+        except Exception as exc:  # noqa: BLE001
+            await logger.adebug(f"Database replica {replica.name} health check failed: {exc}")
+            lag = None
+
+        healthy = lag is not None and lag <= self.max_lag
+        if healthy != replica.healthy:
+            if healthy:
+                await logger.ainfo(f"Database replica {replica.name} is serving reads (lag {lag:.2f}s)")
+            elif lag is None:
+                await logger.awarning(f"Database replica {replica.name} is unavailable; reading from the primary")
+            else:
+                await logger.awarning(
+                    f"Database replica {replica.name} lags {lag:.2f}s behind the primary "
+                    f"(max {self.max_lag}s); reading from the primary"
+                )
+        replica.lag = lag
+        replica.healthy = healthy
+        replica.checked_at = time.monotonic()
+
+    @staticmethod
+    async def _measure_lag(replica: Replica) -> float | None:
+        async with replica.engine.connect() as connection:
+            if connection.dialect.name == "postgresql":
+                lag = (await connection.execute(text(POSTGRES_LAG_QUERY))).scalar()
+                return None if lag is None else float(lag)
+            await connection.execute(text("SELECT 1"))
+            return 0.0
+
+    def stats(self) -> list[dict]:
+        return [{"replica": replica.name, "healthy": replica.healthy, "lag": replica.lag} for replica in self.replicas]
+
+    async def dispose(self) -> None:
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        for replica in self.replicas:
+            await replica.engine.dispose()
@@ -19,7 +19,7 @@ from lfx.services.deps import session_scope
 from sqlalchemy import event, inspect
 from sqlalchemy.dialects import sqlite as dialect_sqlite
 from sqlalchemy.engine import Engine
-from sqlalchemy.exc import OperationalError
+from sqlalchemy.exc import InterfaceError, OperationalError
 from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlmodel import SQLModel, select, text
 from sqlmodel.ext.asyncio.session import AsyncSession as SQLModelAsyncSession
@@ -29,6 +29,7 @@ from langflow.initial_setup.constants import STARTER_FOLDER_NAME
 from langflow.services.base import Service
 from langflow.services.database import models
 from langflow.services.database.models.user.crud import get_user_by_username
+from langflow.services.database.replicas import Replica, ReplicaPool
 from langflow.services.database.session import NoopSession
 from langflow.services.database.utils import Result, TableResults
 from langflow.services.deps import get_settings_service
@@ -72,6 +73,7 @@ class DatabaseService(Service):
             class_=SQLModelAsyncSession,  # SQLModel's AsyncSession with exec() support
             expire_on_commit=False,
         )
+        self.replica_pool = self._create_replica_pool()
 
         # Check if Alembic should log to stdout or a file.
         # If file, check if the provided path is absolute, cross-platform.
@@ -103,10 +105,33 @@ class DatabaseService(Service):
             class_=SQLModelAsyncSession,
             expire_on_commit=False,
         )
+        self.replica_pool = self._create_replica_pool()
+
+    def _create_replica_pool(self) -> ReplicaPool | None:
+        """Create engines for the configured read replicas, or return None when there are none."""
+        settings = self.settings_service.settings
+        replicas = []
+        for url in settings.database_replica_urls:
+            replica_url = self._sanitize_url(url)
+            engine = self._create_engine(replica_url)
+            session_maker = async_sessionmaker(engine, class_=SQLModelAsyncSession, expire_on_commit=False)
+            replicas.append(Replica(url=replica_url, engine=engine, session_maker=session_maker))
+        if not replicas:
+            return None
+        return ReplicaPool(
+            replicas,
+            max_lag=settings.database_replica_max_lag,
+            check_interval=settings.database_replica_check_interval,
+        )
 
     def _sanitize_database_url(self):
         """Create the engine for the database."""
-        url_components = self.database_url.split("://", maxsplit=1)
+        self.database_url = self._sanitize_url(self.database_url)
+
+    @staticmethod
+    def _sanitize_url(database_url: str) -> str:
+        """Convert a database URL to use the async driver for its dialect."""
+        url_components = database_url.split("://", maxsplit=1)
 
         driver = url_components[0]
 
@@ -121,7 +146,7 @@ class DatabaseService(Service):
                 )
             driver = "postgresql+psycopg"
 
-        self.database_url = f"{driver}://{url_components[1]}"
+        return f"{driver}://{url_components[1]}"
 
     def _build_connection_kwargs(self):
         """Build connection kwargs by merging deprecated settings with db_connection_settings.
@@ -143,7 +168,7 @@ class DatabaseService(Service):
 
         return connection_kwargs
 
-    def _create_engine(self) -> AsyncEngine:
+    def _create_engine(self, database_url: str | None = None) -> AsyncEngine:
         # Get connection settings from config, with defaults if not specified
         # if the user specifies an empty dict, we allow it.
         kwargs = self._build_connection_kwargs()
@@ -158,9 +183,10 @@ class DatabaseService(Service):
                 logger.error(f"Invalid poolclass '{poolclass_key}' specified. Using default pool class.")
                 kwargs.pop("poolclass", None)
 
+        database_url = database_url or self.database_url
         return create_async_engine(
-            self.database_url,
-            connect_args=self._get_connect_args(),
+            database_url,
+            connect_args=self._get_connect_args(database_url),
             **kwargs,
         )
 
@@ -169,21 +195,22 @@ class DatabaseService(Service):
         """Create the engine for the database with retry logic."""
         return self._create_engine()
 
-    def _get_connect_args(self):
+    def _get_connect_args(self, database_url: str | None = None):
         settings = self.settings_service.settings
+        database_url = database_url or settings.database_url
 
         if settings.db_driver_connection_settings is not None:
             return settings.db_driver_connection_settings
 
-        if settings.database_url and settings.database_url.startswith("sqlite"):
+        if database_url and database_url.startswith("sqlite"):
             return {
                 "check_same_thread": False,
                 "timeout": settings.db_connect_timeout,
             }
         # For PostgreSQL with asyncpg, use server_settings instead of options
-        if settings.database_url and settings.database_url.startswith(("postgresql", "postgres")):
+        if database_url and database_url.startswith(("postgresql", "postgres")):
             # asyncpg doesn't support 'options' parameter, use server_settings instead
-            if "asyncpg" in settings.database_url:
+            if "asyncpg" in database_url:
                 return {"server_settings": {"timezone": "utc"}}
             else:
                 return {"options": "-c timezone=utc"}
@@ -226,6 +253,28 @@ class DatabaseService(Service):
             async with self.async_session_maker() as session:
                 yield session
 
+    @asynccontextmanager
+    async def _with_readonly_session(self):
+        """Internal method to create a read-only session. DO NOT USE DIRECTLY.
+
+        Use the DbSessionReadOnly dependency instead. The session comes from a healthy read replica when
+        database_replica_urls is set, and from the primary otherwise.
+        """
+        replica = None
+        if self.replica_pool is not None and not self.settings_service.settings.use_noop_database:
+            replica = await self.replica_pool.choose()
+        if replica is None:
+            async with self._with_session() as session:
+                yield session
+            return
+
+        async with replica.session_maker() as session:
+            try:
+                yield session
+            except (InterfaceError, OperationalError):
+                self.replica_pool.mark_unavailable(replica)
+                raise
+
     async def assign_orphaned_flows_to_superuser(self) -> None:
         """Assign orphaned flows to the default superuser when auto login is enabled."""
         settings_service = get_settings_service()
@@ -516,3 +565,5 @@ class DatabaseService(Service):
         except Exception:  # noqa: BLE001
             await logger.aexception("Error tearing down database")
         await self.engine.dispose()
+        if self.replica_pool is not None:
+            await self.replica_pool.dispose()
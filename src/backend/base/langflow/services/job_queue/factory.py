@@ -1,11 +1,22 @@
-from langflow.services.base import Service
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from typing_extensions import override
+
 from langflow.services.factory import ServiceFactory
 from langflow.services.job_queue.service import JobQueueService
+from langflow.services.job_queue.streams import create_stream_backend
+
+if TYPE_CHECKING:
+    from lfx.services.settings.service import SettingsService
 
 
 class JobQueueServiceFactory(ServiceFactory):
     def __init__(self):
         super().__init__(JobQueueService)
 
-    def create(self) -> Service:
-        return JobQueueService()
+    @override
+    def create(self, settings_service: SettingsService):
+        settings = settings_service.settings
+        return JobQueueService(create_stream_backend(settings), max_lag=settings.job_queue_max_lag)
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from collections import OrderedDict
 
 from lfx.log.logger import logger
 
 from langflow.events.event_manager import EventManager
 from langflow.services.base import Service
+from langflow.services.job_queue.streams import CREATED_FIELD, EventStreamBackend, RemoteJobTask, StreamQueue
+
+# Upper bound on the build event payloads kept in this process for clients that stream events by reference
+MAX_EVENT_PAYLOAD_BYTES = 128 * 1024 * 1024
 
 
 class JobQueueNotFoundError(Exception):
@@ -26,6 +32,10 @@ class JobQueueService(Service):
       - Safely clean up resources by cancelling active tasks and emptying queues.
       - Automatically perform periodic cleanup of inactive or completed job queues.
 
+    With an ``EventStreamBackend`` (see ``langflow.services.job_queue.streams``), each job's queue is a
+    ``StreamQueue`` that writes to a shared stream instead of an ``asyncio.Queue``, so ``aget_queue_data`` can
+    serve jobs started on other workers and replay their events from an offset.
+
     The cleanup process follows a two-phase approach:
       1. When a task is cancelled or fails, it is marked for cleanup by setting a timestamp
       2. The actual cleanup only occurs after CLEANUP_GRACE_PERIOD seconds have elapsed
@@ -61,13 +71,24 @@ class JobQueueService(Service):
 
     name = "job_queue_service"
 
-    def __init__(self) -> None:
+    def __init__(self, backend: EventStreamBackend | None = None, *, max_lag: int = 10_000) -> None:
         """Initialize the JobQueueService.
 
         Sets up the internal registry for job queues, initializes the cleanup task, and sets the service state
         to active.
+
+        Args:
+            backend (EventStreamBackend | None): Shared event stream storage. Without one, job queues are
+                per-process ``asyncio.Queue`` instances.
+            max_lag (int): Number of events consumers may fall behind a streamed job before its writes are held.
         """
-        self._queues: dict[str, tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]] = {}
+        self._queues: dict[
+            str, tuple[asyncio.Queue | StreamQueue, EventManager, asyncio.Task | None, float | None]
+        ] = {}
+        self._backend = backend
+        self.max_lag = max_lag
+        self._event_payloads: OrderedDict[tuple[str, int], bytes] = OrderedDict()
+        self._event_payload_bytes = 0
         self._cleanup_task: asyncio.Task | None = None
         self._closed = False
         self.ready = False
@@ -117,16 +138,20 @@ class JobQueueService(Service):
         # Clean up each registered job queue.
         for job_id in list(self._queues.keys()):
             await self.cleanup_job(job_id)
+        if self._backend is not None:
+            await self._backend.close()
         await logger.adebug("JobQueueService stopped: all job queues have been cleaned up.")
 
     async def teardown(self) -> None:
         await self.stop()
 
-    def create_queue(self, job_id: str) -> tuple[asyncio.Queue, EventManager]:
+    def create_queue(self, job_id: str, *, after: int = 0) -> tuple[asyncio.Queue | StreamQueue, EventManager]:
         """Create and register a new queue along with its corresponding event manager for a job.
 
         Args:
             job_id (str): Unique identifier for the job.
+            after (int): Number of entries already in the job's stream, for a job that is run again after its
+                worker stopped. Events are numbered from ``after + 1``.
 
         Returns:
             tuple[asyncio.Queue, EventManager]: A tuple containing:
@@ -142,8 +167,19 @@ class JobQueueService(Service):
             msg = f"Queue for job_id {job_id} already exists"
             raise ValueError(msg)
 
-        main_queue: asyncio.Queue = asyncio.Queue()
-        event_manager: EventManager = self._create_default_event_manager(main_queue)
+        main_queue: asyncio.Queue | StreamQueue
+        if self._backend is not None:
+            main_queue = StreamQueue(
+                self._backend,
+                job_id,
+                max_lag=self.max_lag,
+                on_cancel=lambda: self._cancel_task(job_id),
+                start=after,
+            )
+            main_queue.announce()
+        else:
+            main_queue = asyncio.Queue()
+        event_manager: EventManager = self._create_default_event_manager(main_queue, first_sequence=after + 1)
 
         # Register the queue without an active task.
         self._queues[job_id] = (main_queue, event_manager, None, None)
@@ -184,7 +220,9 @@ class JobQueueService(Service):
         self._queues[job_id] = (main_queue, event_manager, task, None)
         logger.debug(f"New task started for job_id {job_id}")
 
-    def get_queue_data(self, job_id: str) -> tuple[asyncio.Queue, EventManager, asyncio.Task | None, float | None]:
+    def get_queue_data(
+        self, job_id: str
+    ) -> tuple[asyncio.Queue | StreamQueue, EventManager, asyncio.Task | None, float | None]:
         """Retrieve the complete data structure associated with a job's queue.
 
         Args:
@@ -208,6 +246,93 @@ class JobQueueService(Service):
         except KeyError as exc:
             raise JobQueueNotFoundError(job_id) from exc
 
+    async def aget_queue_data(
+        self, job_id: str, after: int | None = None
+    ) -> tuple[asyncio.Queue | StreamQueue, EventManager, asyncio.Task | RemoteJobTask | None, float | None]:
+        """Like ``get_queue_data``, but also finds jobs running on other workers when a stream backend is set.
+
+        Args:
+            job_id (str): Unique identifier for the job.
+            after (int | None): With a stream backend, read the events that follow the first ``after`` events
+                instead of continuing from the last event handed out.
+
+        Raises:
+            JobQueueNotFoundError: If the job_id is not found.
+            RuntimeError: If the service is closed.
+        """
+        if self._closed:
+            msg = f"Queue service is closed for job_id: {job_id}"
+            raise RuntimeError(msg)
+
+        if job_id in self._queues:
+            main_queue, event_manager, task, cleanup_time = self._queues[job_id]
+            if after is not None and isinstance(main_queue, StreamQueue):
+                main_queue = StreamQueue(main_queue.backend, job_id, writable=False, after=after)
+            return main_queue, event_manager, task, cleanup_time
+
+        if self._backend is None or not await self._backend.exists(job_id):
+            raise JobQueueNotFoundError(job_id)
+        # The job runs on another worker: read its stream, and never write to it from here.
+        main_queue = StreamQueue(self._backend, job_id, writable=False, after=after)
+        return main_queue, self._create_default_event_manager(main_queue), RemoteJobTask(self._backend, job_id), None
+
+    @property
+    def backend(self) -> EventStreamBackend | None:
+        """The shared event stream storage, or None when job queues are per-process."""
+        return self._backend
+
+    async def register_remote_job(self, job_id: str) -> None:
+        """Make a job that another process will run visible to ``aget_queue_data`` before its first event.
+
+        Raises:
+            RuntimeError: If the service has no stream backend, so other processes could not stream the job.
+        """
+        if self._backend is None:
+            msg = "Jobs can only run in other processes with a shared job queue backend"
+            raise RuntimeError(msg)
+        await self._backend.set_meta(job_id, CREATED_FIELD, repr(time.time()))
+
+    def store_event_payload(self, job_id: str, sequence: int, payload: bytes) -> None:
+        """Keep an event that was streamed by reference until its job is cleaned up.
+
+        The oldest payloads are dropped once they take more than ``MAX_EVENT_PAYLOAD_BYTES``.
+        """
+        key = (job_id, sequence)
+        if key in self._event_payloads:
+            return
+        self._event_payloads[key] = payload
+        self._event_payload_bytes += len(payload)
+        while self._event_payload_bytes > MAX_EVENT_PAYLOAD_BYTES and len(self._event_payloads) > 1:
+            _, evicted = self._event_payloads.popitem(last=False)
+            self._event_payload_bytes -= len(evicted)
+
+    async def aget_event_payload(self, job_id: str, sequence: int) -> bytes | None:
+        """Return event number ``sequence`` of a job, as stored by ``store_event_payload`` or in the job's stream.
+
+        Events are numbered by the job's ``EventManager``, which is the only writer of the stream, so the event
+        number is also its entry number there.
+        """
+        payload = self._event_payloads.get((job_id, sequence))
+        if payload is None and self._backend is not None:
+            entries = await self._backend.read(job_id, sequence - 1, count=1)
+            if entries and entries[0][0] == sequence:
+                payload = entries[0][2]
+        return payload
+
+    def _drop_event_payloads(self, job_id: str) -> None:
+        for key in [key for key in self._event_payloads if key[0] == job_id]:
+            self._event_payload_bytes -= len(self._event_payloads.pop(key))
+
+    def is_local_job(self, job_id: str) -> bool:
+        """Return whether the job was started by this worker."""
+        return job_id in self._queues
+
+    def _cancel_task(self, job_id: str) -> None:
+        if job_id in self._queues:
+            task = self._queues[job_id][2]
+            if task and not task.done():
+                task.cancel()
+
     async def cleanup_job(self, job_id: str) -> None:
         """Clean up and release resources for a specific job.
 
@@ -237,6 +362,10 @@ class JobQueueService(Service):
                 await logger.aerror(f"Error in task for job_id {job_id}: {exc}")
             await logger.adebug(f"Task cancellation complete for job_id {job_id}")
 
+        if isinstance(main_queue, StreamQueue):
+            # Write out pending events and end the stream so readers on other workers stop waiting.
+            await main_queue.close()
+
         # Clear the queue since we just cancelled the task or it has completed
         items_cleared = 0
         while not main_queue.empty():
@@ -249,6 +378,7 @@ class JobQueueService(Service):
         await logger.adebug(f"Removed {items_cleared} items from queue for job_id {job_id}")
         # Remove the job entry from the registry
         self._queues.pop(job_id, None)
+        self._drop_event_payloads(job_id)
         await logger.adebug(f"Cleanup successful for job_id {job_id}: resources have been released.")
 
     async def _periodic_cleanup(self) -> None:
@@ -302,16 +432,19 @@ class JobQueueService(Service):
                         await logger.adebug(f"Cleaning up job_id {job_id} after grace period")
                         await self.cleanup_job(job_id)
 
-    def _create_default_event_manager(self, queue: asyncio.Queue) -> EventManager:
+    def _create_default_event_manager(
+        self, queue: asyncio.Queue | StreamQueue, *, first_sequence: int = 1
+    ) -> EventManager:
         """Creates the default event manager with predefined events.
 
         Args:
-            queue (asyncio.Queue): The queue to be associated with the event manager.
+            queue (asyncio.Queue | StreamQueue): The queue to be associated with the event manager.
+            first_sequence (int): Sequence number of the first event sent.
 
         Returns:
             EventManager: The configured EventManager instance.
         """
-        manager = EventManager(queue)
+        manager = EventManager(queue, first_sequence=first_sequence)
         # Registering predefined events
         event_names_types = [
             ("on_token", "token"),
@@ -0,0 +1,688 @@
+"""Distributed event streams for build jobs.
+
+By default every job's events live in an ``asyncio.Queue`` owned by the worker that started the build, so
+``/build/{job_id}/events`` only works on that worker. With a stream backend, events are appended to a
+per-job stream instead (Redis Streams in production, ``FileStreamBackend`` for processes sharing one machine,
+``InMemoryStreamBackend`` as a single-process stand-in with the same semantics), and any worker can read them:
+
+- Entries are numbered ``1, 2, 3, ...`` in the order they were produced, so a reconnecting client can
+  resume from the number of events it has already received (``offset``) and the rest is replayed.
+- ``StreamQueue`` keeps the ``asyncio.Queue`` interface used by ``EventManager`` and the build endpoints.
+  ``put_nowait`` only appends to a local outbox; a background pump writes the outbox to the backend in
+  batches. When consumers lag more than ``max_lag`` entries behind, the pump holds further writes until they
+  catch up (or ``backpressure_timeout`` passes). The outbox holds at most ``max_lag`` entries: beyond that
+  ``put_nowait`` raises ``asyncio.QueueFull`` and ``await put(...)`` waits for the outbox to drain.
+- A failed write is retried with backoff. When the retries run out the stream fails: the job is cancelled and
+  further writes raise ``EventStreamError``.
+- The number of the last entry handed to a consumer is kept next to the stream, so successive polling
+  requests continue where the previous one stopped, even on different workers. It is written at most every
+  ``commit_interval`` seconds, and whenever a reader has handed out everything it read.
+- Cancelling a job owned by another worker sets a flag that the owner's pump picks up.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import bisect
+import contextlib
+import os
+import shutil
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from lfx.services.settings.base import Settings
+
+# (sequence number, event id, payload, put time); a ``None`` payload marks the end of the stream.
+StreamEntry = tuple[int, str | None, bytes | None, float]
+
+CONSUMED_FIELD = "consumed"
+CANCEL_FIELD = "cancel"
+CREATED_FIELD = "created"
+
+APPEND_RETRIES = 5
+APPEND_RETRY_DELAY = 0.1
+"""Seconds before the first retry of a failed write; each further retry waits twice as long."""
+
+
+class EventStreamError(Exception):
+    """Raised when a job's events can no longer be written to its stream."""
+
+
+class EventStreamBackend(ABC):
+    """Storage for append-only, per-job event streams."""
+
+    @abstractmethod
+    async def append(self, job_id: str, entries: list[StreamEntry]) -> None:
+        """Append entries, whose sequence numbers must be increasing, to the job's stream."""
+
+    @abstractmethod
+    async def read(self, job_id: str, after: int, *, count: int = 100, block: float | None = None) -> list[StreamEntry]:
+        """Return up to ``count`` entries numbered above ``after``, waiting up to ``block`` seconds for one."""
+
+    @abstractmethod
+    async def exists(self, job_id: str) -> bool:
+        """Return whether the job's stream or its metadata exists (and has not expired)."""
+
+    @abstractmethod
+    async def get_meta(self, job_id: str, field: str) -> str | None:
+        """Return a metadata field stored next to the stream."""
+
+    @abstractmethod
+    async def set_meta(self, job_id: str, field: str, value: str) -> None:
+        """Store a metadata field next to the stream."""
+
+    @abstractmethod
+    async def last_sequence(self, job_id: str) -> int:
+        """Return the number of the job's last entry, or 0 when its stream is empty."""
+
+    @abstractmethod
+    async def delete(self, job_id: str) -> None:
+        """Drop the job's stream and metadata."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections held by the backend."""
+
+
+class InMemoryStreamBackend(EventStreamBackend):
+    """Process-local stand-in for ``RedisStreamBackend``, with the same ordering, blocking and expiry rules."""
+
+    def __init__(self, ttl_seconds: float = 3600) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._streams: dict[str, list[StreamEntry]] = {}
+        self._meta: dict[str, dict[str, str]] = {}
+        self._expires_at: dict[str, float] = {}
+        self._appended: asyncio.Condition | None = None
+
+    @property
+    def _condition(self) -> asyncio.Condition:
+        if self._appended is None:
+            self._appended = asyncio.Condition()
+        return self._appended
+
+    def _touch(self, job_id: str) -> None:
+        self._expires_at[job_id] = time.monotonic() + self.ttl_seconds
+
+    def _expire(self, job_id: str) -> None:
+        expires_at = self._expires_at.get(job_id)
+        if expires_at is not None and expires_at < time.monotonic():
+            self._streams.pop(job_id, None)
+            self._meta.pop(job_id, None)
+            self._expires_at.pop(job_id, None)
+
+    async def append(self, job_id: str, entries: list[StreamEntry]) -> None:
+        self._expire(job_id)
+        stream = self._streams.setdefault(job_id, [])
+        for entry in entries:
+            if stream and entry[0] <= stream[-1][0]:
+                msg = f"Stream entry {entry[0]} for job {job_id} is not above {stream[-1][0]}"
+                raise ValueError(msg)
+            stream.append(entry)
+        self._touch(job_id)
+        async with self._condition:
+            self._condition.notify_all()
+
+    def _entries_after(self, job_id: str, after: int, count: int) -> list[StreamEntry]:
+        self._expire(job_id)
+        stream = self._streams.get(job_id, [])
+        start = bisect.bisect_right(stream, after, key=lambda entry: entry[0])
+        return stream[start : start + count]
+
+    async def read(self, job_id: str, after: int, *, count: int = 100, block: float | None = None) -> list[StreamEntry]:
+        entries = self._entries_after(job_id, after, count)
+        if entries or not block:
+            return entries
+        async with self._condition:
+            try:
+                await asyncio.wait_for(
+                    self._condition.wait_for(lambda: bool(self._entries_after(job_id, after, 1))), timeout=block
+                )
+            except asyncio.TimeoutError:
+                return []
+        return self._entries_after(job_id, after, count)
+
+    async def exists(self, job_id: str) -> bool:
+        self._expire(job_id)
+        return job_id in self._streams or job_id in self._meta
+
+    async def get_meta(self, job_id: str, field: str) -> str | None:
+        self._expire(job_id)
+        return self._meta.get(job_id, {}).get(field)
+
+    async def set_meta(self, job_id: str, field: str, value: str) -> None:
+        self._meta.setdefault(job_id, {})[field] = value
+        self._touch(job_id)
+
+    async def last_sequence(self, job_id: str) -> int:
+        self._expire(job_id)
+        stream = self._streams.get(job_id)
+        return stream[-1][0] if stream else 0
+
+    async def delete(self, job_id: str) -> None:
+        self._streams.pop(job_id, None)
+        self._meta.pop(job_id, None)
+        self._expires_at.pop(job_id, None)
+
+
+class FileStreamBackend(EventStreamBackend):
+    """Streams kept as files in a local directory, shared by every process on the machine.
+
+    Each job gets a directory holding ``events.ndjson`` (one JSON line per entry; entry ``n`` is line ``n``)
+    and one file per metadata field, replaced atomically so that writers of different fields never race. Only
+    the process that owns a job appends to its stream. Readers remember the byte offset of the lines they have
+    seen, for the ``max_cached_jobs`` jobs read most recently, and only read what was appended since. A job
+    expires ``ttl_seconds`` after it was last written. Files are read and written in a thread, so a slow disk
+    does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        ttl_seconds: float = 3600,
+        poll_interval: float = 0.05,
+        max_cached_jobs: int = 256,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ttl_seconds = ttl_seconds
+        self.poll_interval = poll_interval
+        self.max_cached_jobs = max_cached_jobs
+        # job id -> (entries parsed so far, byte offset right after the last complete line), least recent first
+        self._entries: OrderedDict[str, tuple[list[StreamEntry], int]] = OrderedDict()
+
+    def _job_dir(self, job_id: str) -> Path:
+        if not job_id or "/" in job_id or "\\" in job_id or job_id.startswith("."):
+            msg = f"Invalid job id: {job_id!r}"
+            raise ValueError(msg)
+        return self.directory / job_id
+
+    def _expire(self, job_dir: Path) -> bool:
+        """Remove the job's directory if it expired; returns whether the job still exists."""
+        try:
+            modified = max(path.stat().st_mtime for path in [job_dir, *job_dir.iterdir()])
+        except (FileNotFoundError, ValueError):
+            return False
+        if modified + self.ttl_seconds < time.time():
+            shutil.rmtree(job_dir, ignore_errors=True)
+            return False
+        return True
+
+    async def append(self, job_id: str, entries: list[StreamEntry]) -> None:
+        job_dir = self._job_dir(job_id)
+        lines = [
+            orjson.dumps({"n": sequence, "id": event_id, "v": None if value is None else value.decode(), "t": put_time})
+            + b"\n"
+            for sequence, event_id, value, put_time in entries
+        ]
+        await asyncio.to_thread(_append_lines, job_dir, lines)
+
+    async def _entries_after(self, job_id: str, after: int, count: int) -> list[StreamEntry]:
+        path = self._job_dir(job_id) / "events.ndjson"
+        known, position = self._entries.get(job_id, ([], 0))
+        new_entries, read = await asyncio.to_thread(_read_entries, path, position)
+        # Another read of the same job may have parsed these lines while this one waited for the file
+        if self._entries.get(job_id, ([], 0))[1] == position:
+            known.extend(new_entries)
+            self._entries[job_id] = (known, position + read)
+        elif job_id in self._entries:
+            known = self._entries[job_id][0]
+        if job_id in self._entries:
+            self._entries.move_to_end(job_id)
+            while len(self._entries) > self.max_cached_jobs:
+                self._entries.popitem(last=False)
+        start = bisect.bisect_right(known, after, key=lambda entry: entry[0])
+        return known[start : start + count]
+
+    async def read(self, job_id: str, after: int, *, count: int = 100, block: float | None = None) -> list[StreamEntry]:
+        deadline = time.monotonic() + (block or 0)
+        while True:
+            entries = await self._entries_after(job_id, after, count)
+            if entries or time.monotonic() >= deadline:
+                return entries
+            await asyncio.sleep(self.poll_interval)
+
+    async def exists(self, job_id: str) -> bool:
+        if await asyncio.to_thread(self._expire, self._job_dir(job_id)):
+            return True
+        self._entries.pop(job_id, None)
+        return False
+
+    async def get_meta(self, job_id: str, field: str) -> str | None:
+        try:
+            return await asyncio.to_thread((self._job_dir(job_id) / f"{field}.meta").read_text)
+        except FileNotFoundError:
+            return None
+
+    async def set_meta(self, job_id: str, field: str, value: str) -> None:
+        await asyncio.to_thread(_write_meta, self._job_dir(job_id), field, value)
+
+    async def last_sequence(self, job_id: str) -> int:
+        await self._entries_after(job_id, 0, 0)
+        known, _ = self._entries.get(job_id, ([], 0))
+        return known[-1][0] if known else 0
+
+    async def delete(self, job_id: str) -> None:
+        await asyncio.to_thread(shutil.rmtree, self._job_dir(job_id), ignore_errors=True)
+        self._entries.pop(job_id, None)
+
+
+def _append_lines(job_dir: Path, lines: list[bytes]) -> None:
+    job_dir.mkdir(exist_ok=True)
+    with (job_dir / "events.ndjson").open("ab") as stream:
+        stream.write(b"".join(lines))
+
+
+def _read_entries(path: Path, position: int) -> tuple[list[StreamEntry], int]:
+    """Parse the complete lines written after byte ``position``; returns them and how many bytes they took."""
+    try:
+        with path.open("rb") as stream:
+            stream.seek(position)
+            data = stream.read()
+    except FileNotFoundError:
+        return [], 0
+    complete = data.rfind(b"\n") + 1
+    entries: list[StreamEntry] = []
+    for line in data[:complete].splitlines():
+        item = orjson.loads(line)
+        value = item["v"]
+        entries.append((item["n"], item["id"], None if value is None else value.encode(), item["t"]))
+    return entries, complete
+
+
+def _write_meta(job_dir: Path, field: str, value: str) -> None:
+    job_dir.mkdir(exist_ok=True)
+    temporary = job_dir / f".{field}.{os.getpid()}.tmp"
+    temporary.write_text(value)
+    temporary.replace(job_dir / f"{field}.meta")
+
+
+class RedisStreamBackend(EventStreamBackend):
+    """Redis Streams backend. Entry ``n`` of a job is stored under the explicit stream id ``0-n``."""
+
+    def __init__(
+        self,
+        *,
+        url: str | None = None,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        ttl_seconds: int = 3600,
+        key_prefix: str = "langflow:job:",
+    ) -> None:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        self._client = StrictRedis.from_url(url) if url else StrictRedis(host=host, port=port, db=db)
+        self.ttl_seconds = ttl_seconds
+        self.key_prefix = key_prefix
+
+    def _stream_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}:events"
+
+    def _meta_key(self, job_id: str) -> str:
+        return f"{self.key_prefix}{job_id}:meta"
+
+    async def append(self, job_id: str, entries: list[StreamEntry]) -> None:
+        stream_key = self._stream_key(job_id)
+        pipe = self._client.pipeline(transaction=False)
+        for sequence, event_id, value, put_time in entries:
+            fields = {
+                "id": event_id or "",
+                "v": value or b"",
+                "t": repr(put_time),
+                "end": "1" if value is None else "0",
+            }
+            pipe.xadd(stream_key, fields, id=f"0-{sequence}")
+        pipe.expire(stream_key, self.ttl_seconds)
+        pipe.expire(self._meta_key(job_id), self.ttl_seconds)
+        await pipe.execute()
+
+    async def read(self, job_id: str, after: int, *, count: int = 100, block: float | None = None) -> list[StreamEntry]:
+        response = await self._client.xread(
+            {self._stream_key(job_id): f"0-{after}"},
+            count=count,
+            block=max(1, int(block * 1000)) if block else None,
+        )
+        entries: list[StreamEntry] = []
+        for _key, items in response or []:
+            for entry_id, fields in items:
+                sequence = int(entry_id.split(b"-")[1] if isinstance(entry_id, bytes) else entry_id.split("-")[1])
+                end = fields[b"end"] == b"1"
+                event_id = fields[b"id"].decode() or None
+                entries.append((sequence, event_id, None if end else fields[b"v"], float(fields[b"t"])))
+        return entries
+
+    async def exists(self, job_id: str) -> bool:
+        return bool(await self._client.exists(self._stream_key(job_id), self._meta_key(job_id)))
+
+    async def get_meta(self, job_id: str, field: str) -> str | None:
+        value = await self._client.hget(self._meta_key(job_id), field)
+        return value.decode() if isinstance(value, bytes) else value
+
+    async def set_meta(self, job_id: str, field: str, value: str) -> None:
+        meta_key = self._meta_key(job_id)
+        pipe = self._client.pipeline(transaction=False)
+        pipe.hset(meta_key, field, value)
+        pipe.expire(meta_key, self.ttl_seconds)
+        await pipe.execute()
+
+    async def last_sequence(self, job_id: str) -> int:
+        items = await self._client.xrevrange(self._stream_key(job_id), count=1)
+        if not items:
+            return 0
+        entry_id = items[0][0]
+        return int(entry_id.split(b"-")[1] if isinstance(entry_id, bytes) else entry_id.split("-")[1])
+
+    async def delete(self, job_id: str) -> None:
+        await self._client.delete(self._stream_key(job_id), self._meta_key(job_id))
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class StreamQueue:
+    """An ``asyncio.Queue``-compatible view of a job's event stream.
+
+    The worker that runs the job writes through ``put_nowait``/``put``. Any worker can read through
+    ``get``/``get_nowait``/``empty``. Readers created with ``after=None`` share the job's stored position;
+    readers created with an explicit ``after`` replay from that entry and do not move the shared position.
+    Queues created with ``writable=False`` silently drop writes, so readers on other workers never produce
+    entries of their own. A writer created with ``start`` numbers its entries from ``start + 1``, to continue a
+    stream that already holds ``start`` entries.
+    """
+
+    def __init__(
+        self,
+        backend: EventStreamBackend,
+        job_id: str,
+        *,
+        writable: bool = True,
+        after: int | None = None,
+        max_lag: int = 10_000,
+        backpressure_timeout: float = 30.0,
+        batch_size: int = 500,
+        commit_interval: float = 0.5,
+        on_cancel: Callable[[], Any] | None = None,
+        start: int = 0,
+    ) -> None:
+        self.backend = backend
+        self.job_id = job_id
+        self.writable = writable
+        self.max_lag = max_lag
+        self.backpressure_timeout = backpressure_timeout
+        self.batch_size = batch_size
+        self.commit_interval = commit_interval
+        self.on_cancel = on_cancel
+        self._replay = after is not None
+        self._cursor: int | None = after
+        self._committed: int | None = after
+        self._committed_at = float("-inf")
+        self._error: BaseException | None = None
+        self._full_warned = False
+        self._buffer: deque[StreamEntry] = deque()
+        self._outbox: deque[tuple[str | None, bytes | None, float]] = deque()
+        self._pending_meta: dict[str, str] = {}
+        self._written = start
+        self._consumed = 0
+        self._ended = False
+        self._wakeup = asyncio.Event()
+        self._drained = asyncio.Event()
+        self._drained.set()
+        self._pump: asyncio.Task | None = None
+
+    # Writing
+
+    def _wake_pump(self) -> None:
+        self._drained.clear()
+        self._wakeup.set()
+        if self._pump is None or self._pump.done():
+            self._pump = asyncio.create_task(self._run_pump(), name=f"job-stream-{self.job_id}")
+
+    def announce(self) -> None:
+        """Register the job in the backend so other workers can find it before its first event."""
+        if self.writable:
+            self._pending_meta[CREATED_FIELD] = repr(time.time())
+            self._wake_pump()
+
+    def put_nowait(self, item: tuple[str | None, bytes | None, float]) -> None:
+        """Append an entry to the outbox.
+
+        Raises:
+            EventStreamError: If the stream failed.
+            asyncio.QueueFull: If the outbox already holds ``max_lag`` entries.
+        """
+        if not self.writable:
+            logger.debug(f"Dropping event written to read-only stream of job {self.job_id}")
+            return
+        if self._error is not None:
+            msg = f"The event stream of job {self.job_id} failed"
+            raise EventStreamError(msg) from self._error
+        if self._ended:
+            return
+        # The end of the stream is always accepted, so a full outbox never leaves a stream without an end
+        if len(self._outbox) >= self.max_lag and item[1] is not None:
+            if not self._full_warned:
+                self._full_warned = True
+                logger.warning(f"Event stream of job {self.job_id} has {self.max_lag} unwritten events; dropping")
+            raise asyncio.QueueFull
+        self._outbox.append(item)
+        self._wake_pump()
+
+    async def put(self, item: tuple[str | None, bytes | None, float]) -> None:
+        """Append an entry, waiting while the outbox is full, and wait until it has been written to the backend."""
+        while len(self._outbox) >= self.max_lag and self._error is None:
+            await self._drained.wait()
+        self.put_nowait(item)
+        await self.flush()
+
+    async def flush(self) -> None:
+        if self._pump is not None and not self._pump.done():
+            await self._drained.wait()
+        if self._error is not None:
+            msg = f"The event stream of job {self.job_id} failed"
+            raise EventStreamError(msg) from self._error
+
+    async def close(self) -> None:
+        """Write what is left in the outbox, end the stream if it was not ended, and stop the pump."""
+        if self.writable and not self._ended and self._written and self._error is None:
+            self.put_nowait((None, None, time.time()))
+        with contextlib.suppress(EventStreamError):
+            await self.flush()
+        if self._pump is not None:
+            self._pump.cancel()
+            await asyncio.gather(self._pump, return_exceptions=True)
+            self._pump = None
+
+    async def _allowance(self) -> int:
+        """Return how many entries may be written now, waiting while consumers are ``max_lag`` entries behind."""
+        if self._written + self.batch_size <= self._consumed + self.max_lag:
+            return self.batch_size
+        deadline = time.monotonic() + self.backpressure_timeout
+        while True:
+            self._consumed = int(await self.backend.get_meta(self.job_id, CONSUMED_FIELD) or 0)
+            allowance = self._consumed + self.max_lag - self._written
+            if allowance > 0:
+                return min(allowance, self.batch_size)
+            if time.monotonic() >= deadline:
+                await logger.awarning(
+                    f"Consumers of job {self.job_id} are {self.max_lag} events behind; writing anyway"
+                )
+                return self.batch_size
+            await asyncio.sleep(0.05)
+
+    async def _check_cancelled(self) -> bool:
+        if self.on_cancel is None or not await self.backend.get_meta(self.job_id, CANCEL_FIELD):
+            return False
+        await logger.ainfo(f"Job {self.job_id} was cancelled from another worker")
+        self.on_cancel()
+        return True
+
+    async def _run_pump(self) -> None:
+        while True:
+            while self._pending_meta:
+                field, value = self._pending_meta.popitem()
+                await self.backend.set_meta(self.job_id, field, value)
+            if not self._outbox:
+                self._drained.set()
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=1.0)
+                except asyncio.TimeoutError:
+                    if await self._check_cancelled() or self._ended:
+                        return
+                continue
+            allowance = await self._allowance()
+            batch: list[StreamEntry] = []
+            while self._outbox and len(batch) < allowance:
+                event_id, value, put_time = self._outbox.popleft()
+                self._written += 1
+                batch.append((self._written, event_id, value, put_time))
+                if value is None:
+                    self._ended = True
+                    self._outbox.clear()
+            try:
+                await self._append(batch)
+            except Exception as exc:  # noqa: BLE001
+                await logger.aerror(
+                    f"Could not write {len(batch)} events of job {self.job_id}; failing its stream: {exc}"
+                )
+                self._fail(exc)
+                return
+            if await self._check_cancelled():
+                self._drained.set()
+                return
+
+    async def _append(self, batch: list[StreamEntry]) -> None:
+        """Append a batch, retrying with backoff; raises the last error when the retries run out."""
+        delay = APPEND_RETRY_DELAY
+        for attempt in range(APPEND_RETRIES + 1):
+            try:
+                await self.backend.append(self.job_id, batch)
+            except Exception as exc:
+                if attempt == APPEND_RETRIES:
+                    raise
+                await logger.awarning(f"Could not write events of job {self.job_id}, retrying in {delay}s: {exc}")
+                await asyncio.sleep(delay)
+                delay *= 2
+                # A failed write may have stored part of the batch; retry only what is missing
+                stored = await self.backend.read(self.job_id, batch[0][0] - 1, count=len(batch))
+                if stored:
+                    batch = [entry for entry in batch if entry[0] > stored[-1][0]]
+                if not batch:
+                    return
+            else:
+                return
+
+    def _fail(self, exc: BaseException) -> None:
+        self._error = exc
+        self._ended = True
+        self._outbox.clear()
+        self._drained.set()
+        if self.on_cancel is not None:
+            self.on_cancel()
+
+    # Reading
+
+    async def _fill(self, block: float | None) -> None:
+        if self._cursor is None:
+            self._cursor = int(await self.backend.get_meta(self.job_id, CONSUMED_FIELD) or 0)
+            self._committed = self._cursor
+        await self._commit()
+        self._buffer.extend(await self.backend.read(self.job_id, self._cursor, block=block))
+
+    async def _commit(self) -> None:
+        """Store the position of this reader for the next one, unless it replays or already stored it."""
+        if self._replay or self._cursor is None or self._cursor == self._committed:
+            return
+        await self.backend.set_meta(self.job_id, CONSUMED_FIELD, str(self._cursor))
+        self._committed = self._cursor
+        self._committed_at = time.monotonic()
+
+    async def _advance(self, entry: StreamEntry) -> tuple[str | None, bytes | None, float]:
+        self._cursor = entry[0]
+        if not self._buffer or time.monotonic() - self._committed_at >= self.commit_interval:
+            await self._commit()
+        return entry[1], entry[2], entry[3]
+
+    async def get(self) -> tuple[str | None, bytes | None, float]:
+        while not self._buffer:
+            await self._fill(block=1.0)
+            if not self._buffer and not await self.backend.exists(self.job_id):
+                # The stream expired or was deleted: treat it as ended.
+                return None, None, time.time()
+        return await self._advance(self._buffer.popleft())
+
+    def get_nowait(self) -> tuple[str | None, bytes | None, float]:
+        if not self._buffer:
+            raise asyncio.QueueEmpty
+        entry = self._buffer.popleft()
+        self._cursor = entry[0]
+        return entry[1], entry[2], entry[3]
+
+    def empty(self) -> bool:
+        return not self._buffer
+
+    def qsize(self) -> int:
+        return len(self._buffer)
+
+    @property
+    def offset(self) -> int:
+        """Number of the last entry handed out by this reader."""
+        return self._cursor or 0
+
+
+class RemoteJobTask:
+    """Stands in for the ``asyncio.Task`` of a job that runs on another worker."""
+
+    def __init__(self, backend: EventStreamBackend, job_id: str) -> None:
+        self.backend = backend
+        self.job_id = job_id
+        self._cancel_requested = False
+        self._request: asyncio.Task | None = None
+
+    async def request_cancel(self) -> None:
+        self._cancel_requested = True
+        await self.backend.set_meta(self.job_id, CANCEL_FIELD, "1")
+
+    def cancel(self) -> bool:
+        if not self._cancel_requested:
+            self._request = asyncio.create_task(self.request_cancel())
+        self._cancel_requested = True
+        return True
+
+    def cancelled(self) -> bool:
+        return self._cancel_requested
+
+    def done(self) -> bool:
+        return self._cancel_requested
+
+    def exception(self) -> BaseException | None:
+        return None
+
+
+def create_stream_backend(settings: Settings) -> EventStreamBackend | None:
+    """Return the event stream backend selected by ``job_queue_backend``, or None for per-process queues."""
+    backend = settings.job_queue_backend
+    if backend == "memory" and settings.execution_mode == "worker":
+        # Runs execute in other processes, so their events cannot stay in this one.
+        backend = "local"
+    if backend == "local":
+        directory = Path(settings.config_dir or ".") / "job_streams"
+        return FileStreamBackend(directory, ttl_seconds=settings.job_queue_stream_ttl)
+    if backend == "redis":
+        return RedisStreamBackend(
+            url=settings.job_queue_redis_url or settings.redis_url,
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+            ttl_seconds=settings.job_queue_stream_ttl,
+        )
+    return None
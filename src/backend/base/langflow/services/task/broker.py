@@ -0,0 +1,244 @@
+"""Brokers that hand flow runs from API processes to ``langflow worker`` processes.
+
+With ``execution_mode="worker"``, API processes do not execute builds or webhook runs themselves: they
+``enqueue`` a JSON-serializable run description and return. Execution workers ``claim`` runs, execute them and
+report their capacity with ``heartbeat``; ``workers()`` lists the live workers and the capacity each has left.
+
+``LocalRunBroker`` keeps runs in a spool directory, so a single machine needs no other service: a run is a JSON
+file in ``pending/`` that a worker claims by atomically renaming it into ``running/``, so each run goes to
+exactly one worker. ``RedisRunBroker`` does the same with Redis lists for workers spread over several machines.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from lfx.services.settings.base import Settings
+
+HEARTBEAT_INTERVAL = 5.0
+# A worker whose last heartbeat is older than this is considered gone, and the runs it claimed are requeued.
+WORKER_TIMEOUT = 3 * HEARTBEAT_INTERVAL
+
+
+class RunBroker(ABC):
+    """Queue of flow runs shared by API processes and execution workers."""
+
+    @abstractmethod
+    async def enqueue(self, run: dict[str, Any]) -> None:
+        """Add a run; ``run["job_id"]`` identifies it."""
+
+    @abstractmethod
+    async def claim(self, worker_id: str, *, timeout: float = 1.0) -> dict[str, Any] | None:
+        """Take the oldest pending run for ``worker_id``, waiting up to ``timeout`` seconds for one."""
+
+    @abstractmethod
+    async def complete(self, worker_id: str, run: dict[str, Any]) -> None:
+        """Forget a run claimed by ``worker_id`` once it has finished, successfully or not."""
+
+    @abstractmethod
+    async def heartbeat(self, worker_id: str, status: dict[str, Any]) -> None:
+        """Publish that ``worker_id`` is alive, with its capacity (``concurrency``, ``active``, ...)."""
+
+    @abstractmethod
+    async def remove_worker(self, worker_id: str) -> None:
+        """Withdraw a worker that is shutting down."""
+
+    @abstractmethod
+    async def workers(self) -> list[dict[str, Any]]:
+        """Return the status last published by every live worker."""
+
+    @abstractmethod
+    async def pending(self) -> int:
+        """Return the number of runs waiting for a worker."""
+
+    @abstractmethod
+    async def requeue_orphans(self) -> int:
+        """Put runs claimed by workers that stopped sending heartbeats back in the queue; returns how many."""
+
+    async def close(self) -> None:  # noqa: B027
+        """Release connections held by the broker."""
+
+
+class LocalRunBroker(RunBroker):
+    """Spool-directory broker for API processes and workers that share a machine."""
+
+    def __init__(self, directory: str | Path, poll_interval: float = 0.1) -> None:
+        self.directory = Path(directory)
+        self.poll_interval = poll_interval
+        self._pending = self.directory / "pending"
+        self._running = self.directory / "running"
+        self._workers = self.directory / "workers"
+        for path in (self._pending, self._running, self._workers):
+            path.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        temporary.write_bytes(data)
+        temporary.replace(path)
+
+    async def enqueue(self, run: dict[str, Any]) -> None:
+        # Names sort in enqueue order, so workers claim the oldest run first.
+        name = f"{time.time_ns():020d}-{run['job_id']}.json"
+        self._write_atomic(self._pending / name, orjson.dumps(run))
+
+    def _claim_one(self, worker_id: str) -> dict[str, Any] | None:
+        for path in sorted(self._pending.glob("*.json")):
+            claimed = self._running / f"{worker_id}--{path.name}"
+            try:
+                path.rename(claimed)
+            except FileNotFoundError:
+                # Another worker claimed it first.
+                continue
+            try:
+                run = orjson.loads(claimed.read_bytes())
+            except orjson.JSONDecodeError:
+                logger.error(f"Dropping unreadable run {path.name}")
+                claimed.unlink(missing_ok=True)
+                continue
+            run["_claim"] = claimed.name
+            return run
+        return None
+
+    async def claim(self, worker_id: str, *, timeout: float = 1.0) -> dict[str, Any] | None:
+        deadline = time.monotonic() + timeout
+        while True:
+            run = self._claim_one(worker_id)
+            if run is not None or time.monotonic() >= deadline:
+                return run
+            await asyncio.sleep(self.poll_interval)
+
+    async def complete(self, worker_id: str, run: dict[str, Any]) -> None:  # noqa: ARG002
+        (self._running / run["_claim"]).unlink(missing_ok=True)
+
+    async def heartbeat(self, worker_id: str, status: dict[str, Any]) -> None:
+        payload = {**status, "worker_id": worker_id, "updated_at": time.time()}
+        self._write_atomic(self._workers / f"{worker_id}.json", orjson.dumps(payload))
+
+    async def remove_worker(self, worker_id: str) -> None:
+        (self._workers / f"{worker_id}.json").unlink(missing_ok=True)
+
+    async def workers(self) -> list[dict[str, Any]]:
+        alive = []
+        for path in sorted(self._workers.glob("*.json")):
+            try:
+                status = orjson.loads(path.read_bytes())
+            except (FileNotFoundError, orjson.JSONDecodeError):
+                continue
+            if status.get("updated_at", 0) + WORKER_TIMEOUT >= time.time():
+                alive.append(status)
+        return alive
+
+    async def pending(self) -> int:
+        return sum(1 for _ in self._pending.glob("*.json"))
+
+    async def requeue_orphans(self) -> int:
+        alive = {status["worker_id"] for status in await self.workers()}
+        requeued = 0
+        for path in self._running.glob("*.json"):
+            worker_id, _, name = path.name.partition("--")
+            if worker_id in alive:
+                continue
+            with contextlib.suppress(FileNotFoundError):
+                path.rename(self._pending / name)
+                requeued += 1
+        for path in self._workers.glob("*.json"):
+            if path.stem not in alive:
+                path.unlink(missing_ok=True)
+        return requeued
+
+
+class RedisRunBroker(RunBroker):
+    """Redis broker: runs wait in a list and move atomically to a per-worker list when claimed."""
+
+    def __init__(
+        self,
+        *,
+        url: str | None = None,
+        host: str = "localhost",
+        port: int = 6379,
+        db: int = 0,
+        key_prefix: str = "langflow:runs:",
+    ) -> None:
+        # Redis is a main dependency, no need to import check
+        from redis.asyncio import StrictRedis
+
+        self._client = StrictRedis.from_url(url) if url else StrictRedis(host=host, port=port, db=db)
+        self.key_prefix = key_prefix
+
+    @property
+    def _pending_key(self) -> str:
+        return f"{self.key_prefix}pending"
+
+    def _running_key(self, worker_id: str) -> str:
+        return f"{self.key_prefix}running:{worker_id}"
+
+    def _worker_key(self, worker_id: str) -> str:
+        return f"{self.key_prefix}worker:{worker_id}"
+
+    async def enqueue(self, run: dict[str, Any]) -> None:
+        await self._client.lpush(self._pending_key, orjson.dumps(run))
+
+    async def claim(self, worker_id: str, *, timeout: float = 1.0) -> dict[str, Any] | None:
+        raw = await self._client.blmove(
+            self._pending_key, self._running_key(worker_id), max(timeout, 0.01), src="RIGHT", dest="LEFT"
+        )
+        if raw is None:
+            return None
+        run = orjson.loads(raw)
+        run["_claim"] = raw.decode() if isinstance(raw, bytes) else raw
+        return run
+
+    async def complete(self, worker_id: str, run: dict[str, Any]) -> None:
+        await self._client.lrem(self._running_key(worker_id), 1, run["_claim"])
+
+    async def heartbeat(self, worker_id: str, status: dict[str, Any]) -> None:
+        payload = {**status, "worker_id": worker_id, "updated_at": time.time()}
+        await self._client.set(self._worker_key(worker_id), orjson.dumps(payload), ex=int(WORKER_TIMEOUT))
+
+    async def remove_worker(self, worker_id: str) -> None:
+        await self._client.delete(self._worker_key(worker_id))
+
+    async def workers(self) -> list[dict[str, Any]]:
+        keys = [key async for key in self._client.scan_iter(match=self._worker_key("*"))]
+        values = await self._client.mget(keys) if keys else []
+        return [orjson.loads(value) for value in values if value]
+
+    async def pending(self) -> int:
+        return await self._client.llen(self._pending_key)
+
+    async def requeue_orphans(self) -> int:
+        alive = {status["worker_id"] for status in await self.workers()}
+        requeued = 0
+        async for key in self._client.scan_iter(match=self._running_key("*")):
+            name = key.decode() if isinstance(key, bytes) else key
+            if name.removeprefix(self._running_key("")) in alive:
+                continue
+            while await self._client.lmove(name, self._pending_key, src="RIGHT", dest="RIGHT") is not None:
+                requeued += 1
+        return requeued
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+def create_run_broker(settings: Settings) -> RunBroker:
+    """Return the broker selected by ``worker_broker``."""
+    if settings.worker_broker == "redis":
+        return RedisRunBroker(
+            url=settings.job_queue_redis_url or settings.redis_url,
+            host=settings.redis_host,
+            port=settings.redis_port,
+            db=settings.redis_db,
+        )
+    return LocalRunBroker(Path(settings.config_dir or ".") / "runs")
@@ -0,0 +1,304 @@
+"""Execution workers: run flow builds and webhook runs outside the API processes.
+
+With ``execution_mode="worker"``, ``start_flow_build`` and the webhook endpoint call ``enqueue_build`` and
+``enqueue_webhook_run`` instead of executing the flow in the API worker's event loop, so a slow flow no longer
+holds an API worker, and API and execution capacity scale separately. ``langflow worker`` starts an
+``ExecutionWorker``, which claims runs from the ``RunBroker`` (see ``langflow.services.task.broker``) and
+executes up to ``concurrency`` of them at once.
+
+A build's events are written to the job's stream in the shared ``job_queue_backend``, exactly as when the
+build runs in another API worker, so ``/build/{job_id}/events`` and cancellation work unchanged: the API
+registers the job's stream before enqueuing it and the worker owns the stream while it runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import os
+import socket
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from lfx.log.logger import logger
+
+from langflow.services.job_queue.streams import CANCEL_FIELD
+from langflow.services.task.broker import HEARTBEAT_INTERVAL, RunBroker, create_run_broker
+
+if TYPE_CHECKING:
+    from lfx.events.event_manager import EventManager
+    from lfx.schema.schema import InputValueRequest
+
+    from langflow.api.v1.schemas import FlowDataRequest, SimplifiedAPIRequest
+    from langflow.services.job_queue.service import JobQueueService
+
+BUILD_RUN = "build"
+WEBHOOK_RUN = "webhook"
+
+_broker: RunBroker | None = None
+
+
+def get_run_broker() -> RunBroker:
+    """Return this process's broker, created from the ``worker_broker`` setting on first use."""
+    global _broker  # noqa: PLW0603
+    if _broker is None:
+        from langflow.services.deps import get_settings_service
+
+        _broker = create_run_broker(get_settings_service().settings)
+    return _broker
+
+
+def worker_mode_enabled() -> bool:
+    from langflow.services.deps import get_settings_service
+
+    return get_settings_service().settings.execution_mode == "worker"
+
+
+async def enqueue_build(
+    *,
+    job_id: str,
+    flow_id: uuid.UUID,
+    inputs: InputValueRequest | None,
+    data: FlowDataRequest | None,
+    files: list[str] | None,
+    stop_component_id: str | None,
+    start_component_id: str | None,
+    log_builds: bool,
+    user_id: uuid.UUID | str,
+    flow_name: str | None,
+    queue_service: JobQueueService,
+    incremental: bool = False,
+) -> None:
+    """Register the build's event stream and hand the build to an execution worker."""
+    await queue_service.register_remote_job(job_id)
+    await get_run_broker().enqueue(
+        {
+            "kind": BUILD_RUN,
+            "job_id": job_id,
+            "enqueued_at": time.time(),
+            "flow_id": str(flow_id),
+            "inputs": inputs.model_dump(mode="json") if inputs else None,
+            "data": data.model_dump(mode="json") if data else None,
+            "files": files,
+            "stop_component_id": stop_component_id,
+            "start_component_id": start_component_id,
+            "log_builds": log_builds,
+            "user_id": str(user_id),
+            "flow_name": flow_name,
+            "incremental": incremental,
+        }
+    )
+
+
+async def enqueue_webhook_run(
+    *, flow_id: uuid.UUID | str, input_request: SimplifiedAPIRequest, user_id: uuid.UUID | str | None, run_id: str
+) -> None:
+    """Hand a webhook run to an execution worker."""
+    await get_run_broker().enqueue(
+        {
+            "kind": WEBHOOK_RUN,
+            "job_id": run_id,
+            "enqueued_at": time.time(),
+            "flow_id": str(flow_id),
+            "input_request": input_request.model_dump(mode="json"),
+            "user_id": str(user_id) if user_id else None,
+        }
+    )
+
+
+async def _load_user(user_id: str | None):
+    from langflow.services.database.models.user.crud import get_user_by_id
+    from langflow.services.database.models.user.model import UserRead
+    from langflow.services.deps import session_scope
+
+    if not user_id:
+        return None
+    async with session_scope() as session:
+        user = await get_user_by_id(session, user_id)
+        if user is None:
+            msg = f"User {user_id} not found"
+            raise ValueError(msg)
+        return UserRead.model_validate(user, from_attributes=True)
+
+
+class ExecutionWorker:
+    """Claims runs from a broker and executes up to ``concurrency`` of them at the same time."""
+
+    def __init__(
+        self,
+        broker: RunBroker,
+        queue_service: JobQueueService,
+        *,
+        concurrency: int = 4,
+        worker_id: str | None = None,
+        heartbeat_interval: float = HEARTBEAT_INTERVAL,
+    ) -> None:
+        if concurrency < 1:
+            msg = f"Worker concurrency must be at least 1, got {concurrency}"
+            raise ValueError(msg)
+        self.broker = broker
+        self.queue_service = queue_service
+        self.concurrency = concurrency
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = heartbeat_interval
+        self.started_at = time.time()
+        self.completed = 0
+        self.failed = 0
+        self._slots = asyncio.Semaphore(concurrency)
+        self._active: dict[str, asyncio.Task] = {}
+
+    def status(self) -> dict[str, Any]:
+        return {
+            "hostname": socket.gethostname(),
+            "pid": os.getpid(),
+            "concurrency": self.concurrency,
+            "active": len(self._active),
+            "available": self.concurrency - len(self._active),
+            "completed": self.completed,
+            "failed": self.failed,
+            "started_at": self.started_at,
+        }
+
+    async def _heartbeat(self) -> None:
+        """Publish this worker's status and requeue the runs of stopped workers, every ``heartbeat_interval``."""
+        while True:
+            try:
+                await self.broker.heartbeat(self.worker_id, self.status())
+            except Exception as exc:  # noqa: BLE001
+                await logger.awarning(f"Worker {self.worker_id} could not send a heartbeat: {exc}")
+            try:
+                requeued = await self.broker.requeue_orphans()
+            except Exception as exc:  # noqa: BLE001
+                await logger.awarning(f"Worker {self.worker_id} could not requeue runs of stopped workers: {exc}")
+            else:
+                if requeued:
+                    await logger.ainfo(f"Requeued {requeued} runs left behind by stopped workers")
+            await asyncio.sleep(self.heartbeat_interval)
+
+    async def run(self, stop: asyncio.Event | None = None) -> None:
+        """Claim and execute runs until ``stop`` is set, then wait for the runs in progress."""
+        stop = stop or asyncio.Event()
+        heartbeat = asyncio.create_task(self._heartbeat(), name=f"worker-heartbeat-{self.worker_id}")
+        await logger.ainfo(f"Execution worker {self.worker_id} started with concurrency {self.concurrency}")
+        try:
+            while not stop.is_set():
+                await self._slots.acquire()
+                try:
+                    run = await self.broker.claim(self.worker_id, timeout=1.0)
+                except Exception:
+                    self._slots.release()
+                    raise
+                if run is None:
+                    self._slots.release()
+                    continue
+                job_id = run["job_id"]
+                self._active[job_id] = asyncio.create_task(self._execute(run), name=f"run-{job_id}")
+            if self._active:
+                await logger.ainfo(f"Waiting for {len(self._active)} runs to finish")
+                await asyncio.gather(*self._active.values(), return_exceptions=True)
+        finally:
+            heartbeat.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await heartbeat
+            await self.broker.remove_worker(self.worker_id)
+
+    async def _execute(self, run: dict[str, Any]) -> None:
+        job_id = run["job_id"]
+        await logger.adebug(f"Worker {self.worker_id} runs {run['kind']} job {job_id}")
+        try:
+            if run["kind"] == BUILD_RUN:
+                await self._run_build(run)
+            elif run["kind"] == WEBHOOK_RUN:
+                await self._run_webhook(run)
+            else:
+                msg = f"Unknown run kind: {run['kind']}"
+                raise ValueError(msg)
+            self.completed += 1
+        except Exception:  # noqa: BLE001
+            self.failed += 1
+            await logger.aexception(f"Run {job_id} failed")
+        finally:
+            self._active.pop(job_id, None)
+            self._slots.release()
+            await self.broker.complete(self.worker_id, run)
+
+    async def _open_stream(self, job_id: str) -> EventManager | None:
+        """Create the queue a build writes its events to, or return None when the build must not run.
+
+        A build requeued after its worker stopped continues the stream of its first attempt, so clients that
+        already read part of it keep reading and event ids keep increasing.
+        """
+        backend = self.queue_service.backend
+        if backend is None:
+            return self.queue_service.create_queue(job_id)[1]
+        last = await backend.last_sequence(job_id)
+        if last:
+            (entry,) = await backend.read(job_id, last - 1, count=1)
+            if entry[2] is None:
+                await logger.ainfo(f"Build {job_id} already ended its event stream; not running it again")
+                return None
+            await logger.ainfo(f"Build {job_id} is run again after {last} events of an earlier attempt")
+        if await backend.get_meta(job_id, CANCEL_FIELD):
+            await logger.ainfo(f"Build {job_id} was cancelled before it started")
+            await backend.append(job_id, [(last + 1, None, None, time.time())])
+            return None
+        return self.queue_service.create_queue(job_id, after=last)[1]
+
+    async def _run_build(self, run: dict[str, Any]) -> None:
+        from fastapi import BackgroundTasks
+        from lfx.schema.schema import InputValueRequest
+
+        from langflow.api.build import generate_flow_events
+        from langflow.api.v1.schemas import FlowDataRequest
+
+        job_id = run["job_id"]
+        current_user = await _load_user(run["user_id"])
+        event_manager = await self._open_stream(job_id)
+        if event_manager is None:
+            return
+        background_tasks = BackgroundTasks()
+        task = None
+        try:
+            self.queue_service.start_job(
+                job_id,
+                generate_flow_events(
+                    flow_id=uuid.UUID(run["flow_id"]),
+                    background_tasks=background_tasks,
+                    event_manager=event_manager,
+                    inputs=InputValueRequest.model_validate(run["inputs"]) if run["inputs"] else None,
+                    data=FlowDataRequest.model_validate(run["data"]) if run["data"] else None,
+                    files=run["files"],
+                    stop_component_id=run["stop_component_id"],
+                    start_component_id=run["start_component_id"],
+                    log_builds=run["log_builds"],
+                    current_user=current_user,
+                    flow_name=run["flow_name"],
+                    incremental=run.get("incremental", False),
+                ),
+            )
+            task = self.queue_service.get_queue_data(job_id)[2]
+            if task is not None:
+                await asyncio.wait([task])
+            # Telemetry and build logs, which the API would run after sending its response.
+            await background_tasks()
+        finally:
+            await self.queue_service.cleanup_job(job_id)
+        if task is not None and not task.cancelled() and (exc := task.exception()):
+            raise exc
+
+    async def _run_webhook(self, run: dict[str, Any]) -> None:
+        from langflow.api.v1.endpoints import simple_run_flow_task
+        from langflow.api.v1.schemas import SimplifiedAPIRequest
+        from langflow.helpers.flow import get_flow_by_id_or_endpoint_name
+        from langflow.services.deps import get_telemetry_service
+
+        flow = await get_flow_by_id_or_endpoint_name(run["flow_id"])
+        await simple_run_flow_task(
+            flow=flow,
+            input_request=SimplifiedAPIRequest.model_validate(run["input_request"]),
+            api_key_user=await _load_user(run["user_id"]),
+            telemetry_service=get_telemetry_service(),
+            start_time=time.perf_counter() - (time.time() - run["enqueued_at"]),
+            run_id=run["job_id"],
+        )
@@ -1,6 +1,6 @@
 from typing import Any
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, EmailStr, Field, PrivateAttr
 
 # Maximum URL length for telemetry GET requests (Scarf pixel tracking)
 # Scarf supports up to 2KB (2048 bytes) for query parameters
@@ -9,6 +9,19 @@ MAX_TELEMETRY_URL_SIZE = 2048
 
 class BasePayload(BaseModel):
     client_type: str | None = Field(default=None, serialization_alias="clientType")
+    _sample_rate: float | None = PrivateAttr(default=None)
+
+    @property
+    def sample_rate(self) -> float | None:
+        """Fraction of this event type that is sent, so counts can be weighted back up; None when not sampled.
+
+        Sent as the ``sampleRate`` parameter but kept out of the payload's fields.
+        """
+        return self._sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, value: float | None) -> None:
+        self._sample_rate = value
 
 
 class RunPayload(BasePayload):
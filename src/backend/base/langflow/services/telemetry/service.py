@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import hashlib
 import os
 import platform
+import random
 import traceback
+from collections import Counter
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING
 
@@ -25,6 +28,7 @@ from langflow.services.telemetry.schema import (
     ShutdownPayload,
     VersionPayload,
 )
+from langflow.services.telemetry.spool import TelemetrySpool
 from langflow.utils.version import get_version_info
 
 if TYPE_CHECKING:
@@ -33,13 +37,34 @@ if TYPE_CHECKING:
 
 
 class TelemetryService(Service):
+    """Uploads telemetry events from a bounded queue at a bounded rate.
+
+    The worker uploads at most ``telemetry_batch_size`` events every ``telemetry_flush_interval`` seconds, so
+    outbound requests stay constant however many flows run. Events that arrive while the queue is full, or
+    that cannot reach the server, go to the optional on-disk spool or are dropped and counted in
+    ``dropped_events``. ``telemetry_sample_rates`` keeps only a fraction of chatty event types.
+    """
+
     name = "telemetry_service"
 
     def __init__(self, settings_service: SettingsService):
         super().__init__()
         self.settings_service = settings_service
-        self.base_url = settings_service.settings.telemetry_base_url
-        self.telemetry_queue: asyncio.Queue = asyncio.Queue()
+        settings = settings_service.settings
+        self.base_url = settings.telemetry_base_url
+        self.telemetry_queue: asyncio.Queue = asyncio.Queue(maxsize=settings.telemetry_queue_size)
+        self.batch_size = max(settings.telemetry_batch_size, 1)
+        self.flush_interval = settings.telemetry_flush_interval
+        self.sample_rates = settings.telemetry_sample_rates
+        self.spool = (
+            TelemetrySpool(settings.telemetry_spool_path, settings.telemetry_spool_max_events)
+            if settings.telemetry_spool_path
+            else None
+        )
+        self.dropped_events: Counter[str] = Counter()
+        self.sampled_out_events: Counter[str] = Counter()
+        self._reported_drops = 0
+        self._stop_requested = asyncio.Event()
         self.client = httpx.AsyncClient(timeout=10.0)  # Set a reasonable timeout
         self.running = False
         self._stopping = False
@@ -65,37 +90,116 @@ class TelemetryService(Service):
 
     async def telemetry_worker(self) -> None:
         while self.running:
-            func, payload, path = await self.telemetry_queue.get()
+            batch = await self._next_batch()
+            try:
+                await self._upload(batch)
+            finally:
+                for _ in batch:
+                    self.telemetry_queue.task_done()
+            await self._report_drops()
+            # Pace the uploads; events arriving meanwhile wait in the queue for the next batch
+            if not self._stopping:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._stop_requested.wait(), timeout=self.flush_interval)
+
+    async def _next_batch(self) -> list[tuple]:
+        """Wait for an event and take up to a batch of the queued ones.
+
+        With events in the spool the wait is bounded by the flush interval, so the spool drains while idle.
+        """
+        timeout = self.flush_interval if self.spool is not None and len(self.spool) else None
+        try:
+            batch = [await asyncio.wait_for(self.telemetry_queue.get(), timeout=timeout)]
+        except asyncio.TimeoutError:
+            return []
+        while len(batch) < self.batch_size:
             try:
-                await func(payload, path)
+                batch.append(self.telemetry_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _upload(self, batch: list[tuple]) -> None:
+        unreachable: list[dict] = []
+        for func, payload, path in batch:
+            try:
+                if not await func(payload, path):
+                    unreachable.append({"path": path, "params": self._payload_params(payload)})
             except Exception:  # noqa: BLE001
                 await logger.aerror("Error sending telemetry data")
-            finally:
-                self.telemetry_queue.task_done()
 
-    async def send_telemetry_data(self, payload: BaseModel, path: str | None = None) -> None:
-        if self.do_not_track:
-            await logger.adebug("Telemetry tracking is disabled.")
+        if self.spool is not None and not unreachable and len(self.spool):
+            # The server is reachable: use the rest of this upload's budget on spooled events
+            spooled = await asyncio.to_thread(self.spool.pop, self.batch_size - len(batch))
+            for index, record in enumerate(spooled):
+                if not await self._send(record["path"], record["params"]):
+                    unreachable.extend(spooled[index:])
+                    break
+        await self._spool(unreachable)
+
+    async def _spool(self, records: list[dict]) -> None:
+        if not records:
             return
+        if self.spool is None:
+            kept = 0
+        else:
+            try:
+                kept = await asyncio.to_thread(self.spool.append, records)
+            except OSError as err:
+                await logger.aerror(f"Could not write to the telemetry spool: {err}")
+                kept = 0
+        self.dropped_events.update(record["path"] for record in records[kept:])
+
+    async def _report_drops(self) -> None:
+        dropped = self.dropped_events.total()
+        if dropped > self._reported_drops:
+            await logger.awarning(f"Dropped {dropped - self._reported_drops} telemetry events ({dropped} in total)")
+            self._reported_drops = dropped
+
+    def stats(self) -> dict:
+        """Counts of queued, spooled, dropped and sampled-out events, the last two by event type."""
+        return {
+            "queued": self.telemetry_queue.qsize(),
+            "spooled": len(self.spool) if self.spool is not None else 0,
+            "dropped": dict(self.dropped_events),
+            "sampled_out": dict(self.sampled_out_events),
+        }
 
+    def _payload_params(self, payload: BaseModel) -> dict:
         if payload.client_type is None:
             payload.client_type = self.client_type
+        payload_dict = payload.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
+        if payload.sample_rate is not None:
+            payload_dict["sampleRate"] = payload.sample_rate
+
+        # Add common fields to all payloads except VersionPayload
+        if not isinstance(payload, VersionPayload):
+            payload_dict.update(self.common_telemetry_fields)
+        # Add timestamp dynamically
+        if "timestamp" not in payload_dict:
+            payload_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
+        return payload_dict
+
+    async def send_telemetry_data(self, payload: BaseModel, path: str | None = None) -> bool:
+        """Send one event; returns False only when the server could not be reached and a retry may succeed."""
+        if self.do_not_track:
+            await logger.adebug("Telemetry tracking is disabled.")
+            return True
+
+        try:
+            payload_dict = self._payload_params(payload)
+        except Exception as err:  # noqa: BLE001
+            await logger.aerror(f"Unexpected error occurred: {err}.")
+            return True
+        return await self._send(path, payload_dict)
 
+    async def _send(self, path: str | None, params: dict) -> bool:
         url = f"{self.base_url}"
         if path:
             url = f"{url}/{path}"
 
         try:
-            payload_dict = payload.model_dump(by_alias=True, exclude_none=True, exclude_unset=True)
-
-            # Add common fields to all payloads except VersionPayload
-            if not isinstance(payload, VersionPayload):
-                payload_dict.update(self.common_telemetry_fields)
-            # Add timestamp dynamically
-            if "timestamp" not in payload_dict:
-                payload_dict["timestamp"] = datetime.now(timezone.utc).isoformat()
-
-            response = await self.client.get(url, params=payload_dict)
+            response = await self.client.get(url, params=params)
             if response.status_code != httpx.codes.OK:
                 await logger.aerror(f"Failed to send telemetry data: {response.status_code} {response.text}")
             else:
@@ -104,20 +208,45 @@ class TelemetryService(Service):
             await logger.aerror(f"HTTP error occurred: {err}.")
         except httpx.RequestError as err:
             await logger.aerror(f"Request error occurred: {err}.")
+            return False
         except Exception as err:  # noqa: BLE001
             await logger.aerror(f"Unexpected error occurred: {err}.")
+        return True
 
     async def log_package_run(self, payload: RunPayload) -> None:
         await self._queue_event((self.send_telemetry_data, payload, "run"))
 
     async def log_package_shutdown(self) -> None:
         payload = ShutdownPayload(time_running=(datetime.now(timezone.utc) - self._start_time).seconds)
-        await self._queue_event(payload)
+        await self._queue_event((self.send_telemetry_data, payload, "shutdown"))
 
     async def _queue_event(self, payload) -> None:
         if self.do_not_track or self._stopping:
             return
-        await self.telemetry_queue.put(payload)
+        _func, event_payload, path = payload
+        sample_rate = self.sample_rates.get(path, 1.0) if path else 1.0
+        if sample_rate < 1:
+            if not self._sampled(event_payload, sample_rate):
+                self.sampled_out_events[path] += 1
+                return
+            event_payload.sample_rate = sample_rate
+        try:
+            self.telemetry_queue.put_nowait(payload)
+        except asyncio.QueueFull:
+            if self.spool is None:
+                self.dropped_events[path] += 1
+            else:
+                await self._spool([{"path": path, "params": self._payload_params(event_payload)}])
+
+    @staticmethod
+    def _sampled(payload: BaseModel, sample_rate: float) -> bool:
+        # Events of one component run (the component event and every chunk of its inputs) are kept or
+        # dropped together, so the chunks can still be joined
+        run_id = getattr(payload, "component_run_id", None)
+        if run_id is None:
+            return random.random() < sample_rate  # noqa: S311
+        digest = hashlib.sha256(run_id.encode()).digest()
+        return int.from_bytes(digest[:8], "big") / 2**64 < sample_rate
 
     def _get_langflow_desktop(self) -> bool:
         # Coerce to bool, could be 1, 0, True, False, "1", "0", "True", "False"
@@ -245,6 +374,7 @@ class TelemetryService(Service):
             return
         try:
             self._stopping = True
+            self._stop_requested.set()
             # flush all the remaining events and then stop
             await self.flush()
             self.running = False
@@ -0,0 +1,71 @@
+"""On-disk spool for telemetry events that could not be uploaded.
+
+Installations without network access would otherwise lose every event, and a full upload queue would drop
+them. When ``telemetry_spool_path`` is set, such events are appended to a JSON Lines file instead and uploaded
+later, oldest first, within the uploader's usual rate limit.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from typing import Any
+
+from lfx.log.logger import logger
+
+
+class TelemetrySpool:
+    """A bounded JSON Lines file of ``{"path": ..., "params": {...}}`` records.
+
+    The methods do blocking file I/O; call them from a worker thread.
+    """
+
+    def __init__(self, path: str | Path, max_events: int) -> None:
+        self.path = Path(path)
+        self.max_events = max_events
+        self._lock = threading.Lock()
+        self._size = len(self._read())
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _read(self) -> list[dict[str, Any]]:
+        try:
+            lines = self.path.read_text(encoding="utf-8").splitlines()
+        except FileNotFoundError:
+            return []
+        records = []
+        for line in lines:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                logger.debug(f"Skipping a corrupt line in telemetry spool {self.path}")
+        return records
+
+    def _write(self, records: list[dict[str, Any]]) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp_path.write_text("".join(json.dumps(record) + "\n" for record in records), encoding="utf-8")
+        tmp_path.replace(self.path)
+        self._size = len(records)
+
+    def append(self, records: list[dict[str, Any]]) -> int:
+        """Append as many records as fit under ``max_events`` and return how many were kept."""
+        with self._lock:
+            kept = records[: max(self.max_events - self._size, 0)]
+            if kept:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                with self.path.open("a", encoding="utf-8") as file:
+                    file.writelines(json.dumps(record) + "\n" for record in kept)
+                self._size += len(kept)
+            return len(kept)
+
+    def pop(self, count: int) -> list[dict[str, Any]]:
+        """Remove and return up to ``count`` of the oldest records."""
+        with self._lock:
+            if count <= 0 or not self._size:
+                return []
+            records = self._read()
+            self._write(records[count:])
+            return records[:count]
@@ -1,10 +1,20 @@
 import gzip
+import hashlib
 import json
+from dataclasses import dataclass, field
 from typing import Any
 
-from fastapi import Response
+from fastapi import Request, Response
 from fastapi.encoders import jsonable_encoder
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
 
 def compress_response(data: Any) -> Response:
     """Compress data and return it as a FastAPI Response with appropriate headers."""
@@ -17,3 +27,75 @@ def compress_response(data: Any) -> Response:
         media_type="application/json",
         headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding", "Content-Length": str(len(compressed_data))},
     )
+
+
+def encode_json(data: Any) -> bytes:
+    """Encode data the way ``compress_response`` does, without compressing it."""
+    return json.dumps(jsonable_encoder(data)).encode("utf-8")
+
+
+def _accepted_encodings(header: str) -> set[str]:
+    accepted = set()
+    for item in header.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if params and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    base = etag.strip('"')
+    for candidate in if_none_match.split(","):
+        tag = candidate.strip().removeprefix("W/").strip('"')
+        # Representations in every encoding share the ETag of the uncompressed payload, plus a suffix.
+        if tag.split("-", 1)[0] == base:
+            return True
+    return False
+
+
+@dataclass(frozen=True)
+class PrecompressedPayload:
+    """A JSON payload encoded and compressed once, then served as many times as needed.
+
+    The ETag is derived from the encoded JSON, so it is the same in every API worker that holds the same data.
+    """
+
+    etag: str
+    identity: bytes
+    encodings: dict[str, bytes] = field(default_factory=dict)
+
+    @classmethod
+    def from_json(cls, json_data: bytes) -> "PrecompressedPayload":
+        encodings = {"gzip": gzip.compress(json_data, compresslevel=GZIP_LEVEL)}
+        if brotli is not None:
+            encodings["br"] = brotli.compress(json_data, quality=BROTLI_QUALITY)
+        etag = f'"{hashlib.sha256(json_data).hexdigest()[:32]}"'
+        return cls(etag=etag, identity=json_data, encodings=encodings)
+
+    @classmethod
+    def from_data(cls, data: Any) -> "PrecompressedPayload":
+        return cls.from_json(encode_json(data))
+
+    def response(self, request: Request) -> Response:
+        """Return a 304 when the client has this version, or else the smallest encoding the client accepts."""
+        headers = {"Vary": "Accept-Encoding", "Cache-Control": "private, no-cache"}
+        if _etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers={**headers, "ETag": self.etag})
+        accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+        for coding in ("br", "gzip"):
+            if coding in self.encodings and (coding in accepted or "*" in accepted):
+                return Response(
+                    content=self.encodings[coding],
+                    media_type="application/json",
+                    headers={**headers, "ETag": f'{self.etag[:-1]}-{coding}"', "Content-Encoding": coding},
+                )
+        return Response(content=self.identity, media_type="application/json", headers={**headers, "ETag": self.etag})
@@ -79,6 +79,12 @@ def mock_settings_service():
     settings_service.settings.telemetry_base_url = "https://api.scarf.sh/v1/pixel"
     settings_service.settings.do_not_track = False
     settings_service.settings.prometheus_enabled = False
+    settings_service.settings.telemetry_queue_size = 1000
+    settings_service.settings.telemetry_batch_size = 20
+    settings_service.settings.telemetry_flush_interval = 10.0
+    settings_service.settings.telemetry_sample_rates = {}
+    settings_service.settings.telemetry_spool_path = None
+    settings_service.settings.telemetry_spool_max_events = 10000
     settings_service.auth_settings.AUTO_LOGIN = False
 
     return settings_service
@@ -0,0 +1,211 @@
+"""Tests for coalescing, chunking and SSE framing of streamed build events."""
+
+import asyncio
+import json
+import time
+
+from langflow.api.event_framing import EventFramer, next_event_batch
+from langflow.api.utils import EventFraming
+from langflow.services.job_queue.service import JobQueueService
+from langflow.services.job_queue.streams import InMemoryStreamBackend
+from lfx.events.event_manager import EventManager
+
+
+def _event(sequence: int, data, event_type: str = "token") -> tuple[str, bytes, float]:
+    value = json.dumps({"event": event_type, "data": data}) + "\n\n"
+    return f"{event_type}-{sequence}", value.encode(), time.time()
+
+
+def _sse_messages(stream: bytes) -> list[dict]:
+    """Parse server-sent events the way a browser's EventSource does."""
+    messages = []
+    for block in stream.decode().split("\n\n"):
+        if not block:
+            continue
+        message: dict = {"event": "message", "data": []}
+        for line in block.split("\n"):
+            field, _, value = line.partition(": ")
+            if field == "data":
+                message["data"].append(value)
+            else:
+                message[field] = value
+        message["data"] = "\n".join(message["data"])
+        messages.append(message)
+    return messages
+
+
+def _sse_events(stream: bytes) -> tuple[list[dict], str | None]:
+    """Return the events of an SSE stream (reassembling chunked ones) and the last event id."""
+    events, chunks, last_id = [], [], None
+    for message in _sse_messages(stream):
+        last_id = message.get("id", last_id)
+        if message["event"] == "chunk":
+            chunks.append(message["data"])
+        elif message["event"] == "chunk_end":
+            events.append(json.loads("".join([*chunks, message["data"]])))
+            chunks = []
+        else:
+            events.extend(json.loads(line) for line in message["data"].split("\n"))
+    return events, last_id
+
+
+class TestNextEventBatch:
+    async def test_coalesces_queued_events(self):
+        queue = asyncio.Queue()
+        for sequence in range(1, 6):
+            queue.put_nowait(_event(sequence, "x"))
+
+        events, ended = await next_event_batch(queue, max_bytes=10_000)
+
+        assert [event_id for event_id, _, _ in events] == [f"token-{i}" for i in range(1, 6)]
+        assert not ended
+
+    async def test_stops_at_max_bytes(self):
+        queue = asyncio.Queue()
+        for sequence in range(1, 6):
+            queue.put_nowait(_event(sequence, "x" * 100))
+
+        events, _ = await next_event_batch(queue, max_bytes=250)
+
+        assert len(events) == 2
+        assert queue.qsize() == 3
+
+    async def test_reports_end_of_stream(self):
+        queue = asyncio.Queue()
+        queue.put_nowait(_event(1, "x"))
+        queue.put_nowait((None, None, time.time()))
+
+        events, ended = await next_event_batch(queue, max_bytes=10_000)
+
+        assert len(events) == 1
+        assert ended
+
+    async def test_window_waits_for_more_events(self):
+        queue = asyncio.Queue()
+        queue.put_nowait(_event(1, "x"))
+        asyncio.get_running_loop().call_later(0.01, queue.put_nowait, _event(2, "y"))
+
+        events, _ = await next_event_batch(queue, max_bytes=10_000, window=0.1)
+
+        assert len(events) == 2
+
+
+class TestNdjsonFraming:
+    def test_small_events_are_written_together(self):
+        events = [_event(sequence, "x") for sequence in range(1, 4)]
+
+        writes = EventFramer(chunk_size=1024).frame(events)
+
+        assert writes == [b"".join(value for _, value, _ in events)]
+
+    def test_large_events_are_split_into_chunks(self):
+        events = [_event(1, "small"), _event(2, "x" * 1000), _event(3, "small")]
+
+        writes = EventFramer(chunk_size=256).frame(events)
+
+        assert len(writes) > 3
+        assert all(len(write) <= 256 + 2 for write in writes)
+        lines = [line for line in b"".join(writes).decode().split("\n") if line]
+        assert [json.loads(line)["data"] for line in lines] == ["small", "x" * 1000, "small"]
+
+
+class TestSseFraming:
+    def test_coalesced_message_carries_the_last_sequence(self):
+        events = [_event(sequence, sequence) for sequence in range(1, 4)]
+
+        writes = EventFramer(EventFraming.SSE, chunk_size=1024).frame(events)
+
+        assert len(writes) == 1
+        (message,) = _sse_messages(writes[0])
+        assert message["id"] == "3"
+        assert [json.loads(line)["data"] for line in message["data"].split("\n")] == [1, 2, 3]
+
+    def test_large_events_are_chunked_and_reassembled(self):
+        events = [_event(1, "small"), _event(2, "x" * 1000, "end_vertex"), _event(3, "small")]
+
+        writes = EventFramer(EventFraming.SSE, chunk_size=256).frame(events)
+        received, last_id = _sse_events(b"".join(writes))
+
+        assert [event["data"] for event in received] == ["small", "x" * 1000, "small"]
+        assert last_id == "3"
+        messages = _sse_messages(b"".join(writes))
+        assert all("id" not in message for message in messages if message["event"] == "chunk")
+        assert next(message for message in messages if message["event"] == "chunk_end")["id"] == "2"
+
+    def test_large_events_are_sent_by_reference(self):
+        stored = {}
+        framer = EventFramer(
+            EventFraming.SSE,
+            chunk_size=256,
+            reference_threshold=512,
+            reference_url=lambda sequence: f"/events/{sequence}",
+            store_reference=stored.__setitem__,
+        )
+
+        writes = framer.frame([_event(1, "small"), _event(2, "x" * 1000, "end_vertex")])
+        received, last_id = _sse_events(b"".join(writes))
+
+        assert received[0]["data"] == "small"
+        assert received[1]["event"] == "end_vertex"
+        assert received[1]["ref"] == "/events/2"
+        assert json.loads(stored[2])["data"] == "x" * 1000
+        assert received[1]["size"] == len(stored[2])
+        assert last_id == "2"
+
+
+async def _stream(queue, framer: EventFramer, *, limit: int | None = None) -> bytes:
+    stream = b""
+    batches = 0
+    while limit is None or batches < limit:
+        events, ended = await next_event_batch(queue, max_bytes=framer.chunk_size)
+        stream += b"".join(framer.frame(events))
+        batches += 1
+        if ended:
+            break
+    return stream
+
+
+async def test_sse_stream_resumes_after_last_event_id():
+    backend = InMemoryStreamBackend()
+    owner, other = JobQueueService(backend), JobQueueService(backend)
+    try:
+        queue, _ = owner.create_queue("job-1")
+        manager = EventManager(queue)
+        for number in range(10):
+            manager.send_event(event_type="token", data=number)
+            await queue.flush()
+        await queue.put((None, None, time.time()))
+
+        framer = EventFramer(EventFraming.SSE, chunk_size=40)
+        reader, _, _, _ = await other.aget_queue_data("job-1", after=0)
+        first, last_id = _sse_events(await _stream(reader, framer, limit=2))
+        resumed_reader, _, _, _ = await other.aget_queue_data("job-1", after=int(last_id))
+        rest, _ = _sse_events(await _stream(resumed_reader, framer))
+
+        assert 0 < len(first) < 10
+        assert [event["data"] for event in first + rest] == list(range(10))
+    finally:
+        await owner.stop()
+        await other.stop()
+
+
+async def test_referenced_events_are_served_from_any_worker():
+    backend = InMemoryStreamBackend()
+    owner, other = JobQueueService(backend), JobQueueService(backend)
+    try:
+        queue, _ = owner.create_queue("job-1")
+        manager = EventManager(queue)
+        manager.send_event(event_type="token", data="a")
+        manager.send_event(event_type="end_vertex", data="x" * 100)
+        await queue.flush()
+        owner.store_event_payload("job-1", 2, b"stored")
+
+        assert await owner.aget_event_payload("job-1", 2) == b"stored"
+        assert json.loads(await other.aget_event_payload("job-1", 2))["data"] == "x" * 100
+        assert await other.aget_event_payload("job-1", 3) is None
+
+        await owner.cleanup_job("job-1")
+        assert owner._event_payloads == {}
+    finally:
+        await owner.stop()
+        await other.stop()
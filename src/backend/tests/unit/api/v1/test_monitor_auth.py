@@ -81,3 +81,48 @@ async def test_delete_messages_session_with_valid_auth(client: AsyncClient, logg
     response = await client.delete("api/v1/monitor/messages/session/test-session", headers=logged_in_headers)
     # Should return 204 No Content
     assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_invalidate_all_llm_cache_requires_superuser(client: AsyncClient, logged_in_headers):
+    """Test that DELETE /monitor/llm_cache without a flow is refused to regular users."""
+    response = await client.delete("api/v1/monitor/llm_cache", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+async def test_invalidate_all_llm_cache_as_superuser(client: AsyncClient, logged_in_headers_super_user):
+    """Test that a superuser can drop the LLM response cache of every flow."""
+    response = await client.delete("api/v1/monitor/llm_cache", headers=logged_in_headers_super_user)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+async def test_invalidate_llm_cache_of_own_flow(client: AsyncClient, flow, logged_in_headers):
+    """Test that DELETE /monitor/llm_cache?flow_id= works for the flow's owner."""
+    response = await client.delete(f"api/v1/monitor/llm_cache?flow_id={flow.id}", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+
+
+async def test_invalidate_llm_cache_of_another_users_flow(client: AsyncClient, flow, user_two_api_key):
+    """Test that DELETE /monitor/llm_cache?flow_id= is refused for a flow the user does not own."""
+    response = await client.delete(
+        f"api/v1/monitor/llm_cache?flow_id={flow.id}", headers={"x-api-key": user_two_api_key}
+    )
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+async def test_get_executors_requires_auth(client: AsyncClient):
+    """Test that GET /monitor/executors requires authentication."""
+    response = await client.get("api/v1/monitor/executors")
+    # Langflow returns 403 for missing/invalid authentication
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.usefixtures("active_user")
+async def test_get_executors_with_valid_auth(client: AsyncClient, logged_in_headers):
+    """Test that GET /monitor/executors reports the executor pools with valid authentication."""
+    from lfx.utils.executors import run_in_executor
+
+    await run_in_executor("io", sum, [1, 2])
+    response = await client.get("api/v1/monitor/executors", headers=logged_in_headers)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["io"]["completed"] >= 1
@@ -9,8 +9,9 @@ import pytest
 import respx
 from httpx import Response
 from lfx.components.data_source.api_request import APIRequestComponent
-from lfx.schema import Data
+from lfx.schema import Data, DataFrame
 from lfx.schema.dotdict import dotdict
+from lfx.utils.http_client_pool import get_http_client
 
 from tests.base import ComponentTestBaseWithoutClient
 
@@ -563,3 +564,68 @@ class TestAPIRequestSSRFProtection:
             result = await component.make_api_request()
             assert isinstance(result, Data)
             assert result.data["source"] == "https://example.com"
+
+
+class TestAPIRequestSharedClientAndBatch:
+    """Test connection reuse and batch mode of the API Request component."""
+
+    @pytest.fixture
+    def default_kwargs(self):
+        """Return the default kwargs for the component."""
+        return {
+            "url_input": "https://example.com/api/test",
+            "method": "GET",
+            "headers": [],
+            "body": [],
+            "timeout": 30,
+            "follow_redirects": False,
+            "save_to_file": False,
+            "include_httpx_metadata": False,
+            "mode": "URL",
+            "curl_input": "",
+            "query_params": {},
+        }
+
+    @pytest.fixture
+    async def component(self, default_kwargs):
+        """Return a component instance."""
+        return APIRequestComponent(**default_kwargs)
+
+    async def test_make_api_request_uses_shared_client(self, component):
+        url = "https://example.com/api/test"
+        with respx.mock:
+            respx.get(url).mock(return_value=Response(200, json={"key": "value"}))
+            await component.make_api_request()
+            client = get_http_client(follow_redirects=False, timeout=30)
+            await component.make_api_request()
+
+        assert not client.is_closed
+        assert get_http_client(follow_redirects=False, timeout=30) is client
+
+    async def test_make_batch_requests(self, component):
+        component.batch_requests = DataFrame(
+            [
+                {"url": "https://example.com/api/one"},
+                {"url": "https://example.com/api/two", "method": "POST", "body": '{"name": "two"}'},
+                {"url": "not a url"},
+            ]
+        )
+        component.max_concurrency = 2
+
+        with respx.mock:
+            respx.get("https://example.com/api/one").mock(return_value=Response(200, json={"id": 1}))
+            post_route = respx.post("https://example.com/api/two").mock(return_value=Response(201, json={"id": 2}))
+
+            result = await component.make_batch_requests()
+
+        assert isinstance(result, DataFrame)
+        assert list(result["source"]) == ["https://example.com/api/one", "https://example.com/api/two", "not a url"]
+        assert result.iloc[0]["result"] == {"id": 1}
+        assert result.iloc[1]["status_code"] == 201
+        assert post_route.calls.last.request.content == b'{"name":"two"}'
+        assert "Invalid URL" in result.iloc[2]["error"]
+
+    async def test_make_batch_requests_requires_url_column(self, component):
+        component.batch_requests = DataFrame([{"address": "https://example.com"}])
+        with pytest.raises(ValueError, match="'url' column"):
+            await component.make_batch_requests()
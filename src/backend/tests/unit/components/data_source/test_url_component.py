@@ -1,11 +1,48 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import Mock, patch
 
 import pytest
 from lfx.components.data_source.url import URLComponent
 from lfx.schema import DataFrame
+from lfx.schema.message import Message
 
 from tests.base import ComponentTestBaseWithoutClient
 
+PAGES = {
+    "/": "<html><head><title>Home</title></head><body><a href='/a'>A</a><a href='/b'>B</a></body></html>",
+    "/a": "<html><head><title>A</title></head><body>page a</body></html>",
+    "/b": "<html><head><title>B</title></head><body>page b</body></html>",
+}
+
+
+class _PageHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = PAGES.get(self.path)
+        if body is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def site_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _PageHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
 
 class TestURLComponent(ComponentTestBaseWithoutClient):
     @pytest.fixture
@@ -40,7 +77,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         with patch("langchain_community.document_loaders.RecursiveUrlLoader.load") as mock:
             yield mock
 
-    def test_url_component_basic_functionality(self, mock_recursive_loader):
+    async def test_url_component_basic_functionality(self, mock_recursive_loader):
         """Test basic URLComponent functionality."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"], "max_depth": 2})
@@ -57,7 +94,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert isinstance(data_frame, DataFrame)
         assert len(data_frame) == 1
 
@@ -69,7 +106,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == "text/html"
         assert row["language"] == "en"
 
-    def test_url_component_multiple_urls(self, mock_recursive_loader):
+    async def test_url_component_multiple_urls(self, mock_recursive_loader):
         """Test URLComponent with multiple URL inputs."""
         # Setup component with multiple URLs
         component = URLComponent()
@@ -104,7 +141,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         mock_recursive_loader.return_value = mock_docs
 
         # Execute component
-        result = component.fetch_content()
+        result = await component.fetch_content()
 
         # Verify results
         assert isinstance(result, DataFrame)
@@ -124,7 +161,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert second_row["title"] == "Second Page"
         assert second_row["description"] == "Second Description"
 
-    def test_url_component_format_options(self, mock_recursive_loader):
+    async def test_url_component_format_options(self, mock_recursive_loader):
         """Test URLComponent with different format options."""
         component = URLComponent()
 
@@ -142,7 +179,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "extracted text"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
@@ -160,11 +197,11 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
                 },
             )
         ]
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         assert data_frame.iloc[0]["text"] == "<html>raw html</html>"
         assert data_frame.iloc[0]["content_type"] == "text/html"
 
-    def test_url_component_missing_metadata(self, mock_recursive_loader):
+    async def test_url_component_missing_metadata(self, mock_recursive_loader):
         """Test URLComponent with missing metadata fields."""
         component = URLComponent()
         component.set_attributes({"urls": ["https://example.com"]})
@@ -175,7 +212,7 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         )
         mock_recursive_loader.return_value = [mock_doc]
 
-        data_frame = component.fetch_content()
+        data_frame = await component.fetch_content()
         row = data_frame.iloc[0]
         assert row["text"] == "test content"
         assert row["url"] == "https://example.com"
@@ -184,26 +221,26 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         assert row["content_type"] == ""  # Default empty string
         assert row["language"] == ""  # Default empty string
 
-    def test_url_component_error_handling(self, mock_recursive_loader):
+    async def test_url_component_error_handling(self, mock_recursive_loader):
         """Test error handling in URLComponent."""
         component = URLComponent()
 
         # Test empty URLs
         component.set_attributes({"urls": []})
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test request exception
         component.set_attributes({"urls": ["https://example.com"]})
         mock_recursive_loader.side_effect = Exception("Connection error")
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
         # Test no documents found
         mock_recursive_loader.side_effect = None
         mock_recursive_loader.return_value = []
         with pytest.raises(ValueError, match="Error loading documents:"):
-            component.fetch_content()
+            await component.fetch_content()
 
     def test_url_component_ensure_url(self):
         """Test URLComponent's ensure_url method."""
@@ -227,3 +264,53 @@ class TestURLComponent(ComponentTestBaseWithoutClient):
         # Test invalid URL
         with pytest.raises(ValueError, match="Invalid URL"):
             component.ensure_url("not a url")
+
+    def _concurrent_component(self, url: str, **kwargs) -> URLComponent:
+        component = URLComponent()
+        component.set_attributes(
+            {
+                "urls": [url],
+                "max_depth": 2,
+                "concurrent_fetching": True,
+                "use_async": False,
+                "max_concurrency": 4,
+                "use_http_cache": False,
+                **kwargs,
+            }
+        )
+        return component
+
+    async def test_concurrent_fetching_crawls_linked_pages(self, site_url):
+        data_frame = await self._concurrent_component(site_url).fetch_content()
+
+        assert sorted(data_frame["title"]) == ["A", "B", "Home"]
+        assert sorted(data_frame["url"]) == [site_url, f"{site_url}a", f"{site_url}b"]
+
+    def test_concurrent_fetching_ignores_use_async(self, site_url):
+        component = self._concurrent_component(site_url, use_async=False)
+
+        assert component._create_crawler().max_concurrency == 4
+
+    async def test_raw_content_streams_pages_to_chat(self, site_url, monkeypatch):
+        component = self._concurrent_component(site_url)
+        component._vertex = Mock(is_output=False, is_input=False, graph=Mock(session_id="session"))
+        streamed = []
+
+        async def send_message(message):
+            streamed.extend([chunk.content async for chunk in message.text])
+            return Message(text="".join(streamed))
+
+        monkeypatch.setattr(component, "is_connected_to_chat_output", lambda: True)
+        monkeypatch.setattr(component, "send_message", send_message)
+
+        message = await component.fetch_content_as_message()
+
+        assert len(streamed) == 3
+        assert message.text == "".join(streamed)
+        assert sorted(row["title"] for row in message.data["data"]) == ["A", "B", "Home"]
+
+    async def test_raw_content_without_chat_output_collects_pages(self, site_url):
+        message = await self._concurrent_component(site_url).fetch_content_as_message()
+
+        assert "page a" in message.text
+        assert len(message.data["data"]) == 3
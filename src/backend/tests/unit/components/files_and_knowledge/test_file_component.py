@@ -1,5 +1,8 @@
+import asyncio
 import json
 import tempfile
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -116,8 +119,8 @@ class TestFileComponentDynamicOutputs:
         assert result["advanced_mode"]["show"] is False
         assert result["advanced_mode"]["value"] is False
 
-    @patch("subprocess.run")
-    def test_process_docling_subprocess_success(self, mock_subprocess):
+    @patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool")
+    def test_process_docling_subprocess_success(self, mock_get_pool):
         """Test successful Docling subprocess execution."""
         component = FileComponent()
         component.markdown = False
@@ -132,16 +135,67 @@ class TestFileComponentDynamicOutputs:
             ],
             "meta": {"file_path": "test.pdf"},
         }
+        mock_get_pool.return_value.convert.return_value = mock_result
+
+        result = component._process_docling_in_subprocess("test.pdf")
+
+        assert result is not None
+        assert result.data["doc"] == mock_result["doc"]
+        assert result.data["file_path"] == "test.pdf"
+        mock_get_pool.return_value.convert.assert_called_once()
+
+    @patch("subprocess.run")
+    @patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool", return_value=None)
+    def test_process_docling_without_worker_pool(self, mock_get_pool, mock_subprocess):
+        """Test that a disabled worker pool falls back to one process per file."""
+        component = FileComponent()
+        component.markdown = True
         mock_subprocess.return_value = MagicMock(
-            stdout=json.dumps(mock_result).encode("utf-8"),
+            stdout=json.dumps({"ok": True, "mode": "markdown", "text": "# Title", "meta": {}}).encode("utf-8"),
             stderr=b"",
         )
 
         result = component._process_docling_in_subprocess("test.pdf")
 
-        assert result is not None
-        assert result.data["doc"] == mock_result["doc"]
+        assert result.text == "# Title"
         assert result.data["file_path"] == "test.pdf"
+        mock_get_pool.assert_called_once()
+        mock_subprocess.assert_called_once()
+
+    @patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool")
+    async def test_docling_files_convert_concurrently_without_blocking_the_loop(self, mock_get_pool):
+        """Test that files are converted one per pooled worker at a time while the event loop stays free."""
+        component = FileComponent()
+        component.markdown = True
+        lock = threading.Lock()
+        running = peak = 0
+
+        def convert(args):
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.1)
+            with lock:
+                running -= 1
+            return {"ok": True, "mode": "markdown", "text": args["file_path"], "meta": {}}
+
+        mock_get_pool.return_value = MagicMock(max_workers=2, convert=convert)
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        ticker = asyncio.create_task(tick())
+        results = await component._aprocess_docling_files([f"file-{number}.pdf" for number in range(4)])
+        ticker.cancel()
+
+        assert [result.text for result in results] == [f"file-{number}.pdf" for number in range(4)]
+        assert peak == 2
+        assert ticks > 5
 
     def test_dynamic_outputs_have_tool_mode_enabled(self):
         """Test that all dynamically created outputs have tool_mode=True."""
@@ -17,6 +17,13 @@ from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 
 
+@pytest.fixture(autouse=True)
+def _without_docling_worker_pool():
+    """Convert each file in its own subprocess, which these tests mock through subprocess.run."""
+    with patch("lfx.components.files_and_knowledge.file.get_docling_worker_pool", return_value=None):
+        yield
+
+
 class TestDoclingEmptyTextExtraction:
     """Tests for handling images/documents with no extractable text."""
 
@@ -83,10 +83,11 @@ class TestFlowToolComponent(ComponentTestBaseWithClient):
             Data(data={"name": "Flow 3"}),
         ]
 
-        with patch.object(component, "alist_flows", return_value=mock_flows):
+        with patch.object(component, "alist_flows", return_value=mock_flows) as mock_alist_flows:
             result = await component.get_flow_names()
 
             assert result == ["Flow 1", "Flow 2", "Flow 3"]
+            mock_alist_flows.assert_called_once_with(include_data=False)
 
     @pytest.mark.asyncio
     async def test_get_flow_names_empty_list(self, component_class, default_kwargs):
@@ -102,16 +103,24 @@ class TestFlowToolComponent(ComponentTestBaseWithClient):
         """Test get_flow method when flow is found."""
         component = await self.component_setup(component_class, default_kwargs)
         mock_flows = [
-            Data(data={"name": "Flow 1"}),
-            Data(data={"name": "Target Flow"}),
-            Data(data={"name": "Flow 3"}),
+            Data(data={"id": "id-1", "name": "Flow 1", "data": None}),
+            Data(data={"id": "id-2", "name": "Target Flow", "data": None}),
+            Data(data={"id": "id-3", "name": "Flow 3", "data": None}),
         ]
+        target_flow = Data(data={"id": "id-2", "name": "Target Flow", "data": {"nodes": [], "edges": []}})
 
-        with patch.object(component, "alist_flows", return_value=mock_flows):
+        with (
+            patch.object(component, "alist_flows", return_value=mock_flows) as mock_alist_flows,
+            patch(
+                "lfx.components.flow_controls.flow_tool.get_flow_by_id_or_name", return_value=target_flow
+            ) as mock_get_flow,
+        ):
             result = await component.get_flow("Target Flow")
 
-            assert result == mock_flows[1]
+            assert result == target_flow
             assert result.data["name"] == "Target Flow"
+            mock_alist_flows.assert_called_once_with(include_data=False)
+            mock_get_flow.assert_called_once_with(user_id=str(component.user_id), flow_id="id-2")
 
     @pytest.mark.asyncio
     async def test_get_flow_not_found(self, component_class, default_kwargs):
@@ -182,16 +182,10 @@ class TestEventManager:
 
         assert len(queue.data) == 1
         event_id, str_data, timestamp = queue.data[0]
-        # event_id follows this pattern: f"{event_type}-{uuid.uuid4()}"
-        event_type_from_id = event_id.split("-")[0]
+        # event_id follows this pattern: f"{event_type}-{sequence}", numbering events from 1
+        event_type_from_id, _, sequence = event_id.rpartition("-")
         assert event_type_from_id == "test_type"
-        uuid_from_id = event_id.split(event_type_from_id)[1]
-        assert isinstance(uuid_from_id, str)
-        # assert that the uuid_from_id is a valid uuid
-        try:
-            uuid.UUID(uuid_from_id)
-        except ValueError:
-            pytest.fail(f"Invalid UUID: {uuid_from_id}")
+        assert sequence == "1"
         assert isinstance(str_data, bytes)
         assert isinstance(timestamp, float)
 
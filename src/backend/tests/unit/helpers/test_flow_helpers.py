@@ -46,6 +46,27 @@ class TestListFlows:
             assert result[0].data["name"] == "Flow 1"
             assert result[1].data["name"] == "Flow 2"
 
+    @pytest.mark.asyncio
+    async def test_list_flows_without_data_selects_columns(self):
+        """Test that list_flows does not load the flow graph when include_data is False."""
+        mock_row = MagicMock()
+        mock_row._mapping = {"id": str(uuid4()), "name": "Flow 1", "description": None}
+
+        with patch("langflow.helpers.flow.session_scope") as mock_session_scope:
+            mock_session = MagicMock()
+            mock_result = MagicMock()
+            mock_result.all = MagicMock(return_value=[mock_row])
+            mock_session.exec = AsyncMock(return_value=mock_result)
+            mock_session_scope.return_value.__aenter__ = AsyncMock(return_value=mock_session)
+            mock_session_scope.return_value.__aexit__ = AsyncMock()
+
+            result = await list_flows(user_id=str(uuid4()), include_data=False)
+
+            statement = mock_session.exec.call_args.args[0]
+            assert "data" not in [column.name for column in statement.selected_columns]
+            assert result[0].data["name"] == "Flow 1"
+            assert result[0].data["data"] is None
+
 
 class TestListFlowsByFlowFolder:
     """Test list_flows_by_flow_folder function in backend."""
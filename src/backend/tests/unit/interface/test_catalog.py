@@ -0,0 +1,56 @@
+import gzip
+import json
+
+import pytest
+from langflow.interface.catalog import ComponentCatalog
+from lfx.interface.components import component_cache
+
+
+@pytest.fixture
+def registry():
+    previous = component_cache.all_types_dict
+    component_cache.all_types_dict = {
+        "inputs": {"ChatInput": {"display_name": "Chat Input"}},
+        "models": {"OpenAI": {"display_name": "OpenAI"}},
+    }
+    yield component_cache.all_types_dict
+    component_cache.all_types_dict = previous
+
+
+async def test_full_catalog_matches_the_registry(registry):
+    payload = await ComponentCatalog().full(registry)
+
+    assert json.loads(payload.identity) == registry
+    assert json.loads(gzip.decompress(payload.encodings["gzip"])) == registry
+
+
+async def test_catalog_is_rebuilt_only_after_a_change(registry):
+    catalog = ComponentCatalog()
+    first = await catalog.full(registry)
+    assert await catalog.full(registry) is first
+
+    registry["models"]["Anthropic"] = {"display_name": "Anthropic"}
+    component_cache.mark_changed("models")
+    second = await catalog.full(registry)
+
+    assert second.etag != first.etag
+    assert "Anthropic" in json.loads(second.identity)["models"]
+
+
+async def test_manifest_reports_which_categories_changed(registry):
+    catalog = ComponentCatalog()
+    before = await catalog.manifest(registry)
+
+    registry["models"]["Anthropic"] = {"display_name": "Anthropic"}
+    component_cache.mark_changed("models")
+    after = await catalog.manifest(registry)
+
+    assert after["categories"]["inputs"] == before["categories"]["inputs"]
+    assert after["categories"]["models"] != before["categories"]["models"]
+    assert after["etag"] != before["etag"]
+    assert json.loads((await catalog.category(registry, "models")).identity) == registry["models"]
+
+
+async def test_unknown_category(registry):
+    with pytest.raises(KeyError):
+        await ComponentCatalog().category(registry, "missing")
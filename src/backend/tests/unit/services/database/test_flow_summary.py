@@ -0,0 +1,112 @@
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+from langflow.services.database.models.flow.queries import flow_header_from_row, flow_input_schema
+from langflow.services.database.models.flow.summary import SUMMARY_VERSION, summarize_flow_data
+
+
+def _node(node_id: str, node_type: str, template: dict | None = None) -> dict:
+    return {
+        "id": node_id,
+        "data": {"type": node_type, "node": {"display_name": node_type, "template": template or {}}},
+    }
+
+
+@pytest.fixture
+def flow_data():
+    chat_input = _node(
+        "ChatInput-abc",
+        "ChatInput",
+        {
+            "input_value": {"type": "str", "show": True, "info": "The message", "required": True},
+            "sender": {"type": "str", "show": True, "advanced": True},
+            "hidden": {"type": "int", "show": False},
+            "_type": "Component",
+        },
+    )
+    return {
+        "nodes": [chat_input, _node("OpenAIModel-def", "OpenAIModel"), _node("ChatOutput-ghi", "ChatOutput")],
+        "edges": [{"source": "ChatInput-abc", "target": "OpenAIModel-def"}],
+    }
+
+
+class _Row(SimpleNamespace):
+    @property
+    def _mapping(self):
+        return vars(self)
+
+
+class TestSummarizeFlowData:
+    def test_counts_and_component_types(self, flow_data):
+        summary = summarize_flow_data(flow_data)
+
+        assert summary["version"] == SUMMARY_VERSION
+        assert summary["node_count"] == 3
+        assert summary["edge_count"] == 1
+        assert summary["component_types"] == ["ChatInput", "ChatOutput", "OpenAIModel"]
+        assert [node["id"] for node in summary["inputs"]] == ["ChatInput-abc"]
+        assert [node["id"] for node in summary["outputs"]] == ["ChatOutput-ghi"]
+
+    def test_input_schema_has_visible_fields(self, flow_data):
+        summary = summarize_flow_data(flow_data)
+
+        assert summary["input_schema"] == {
+            "type": "object",
+            "properties": {"input_value": {"type": "string", "description": "The message"}},
+            "required": ["input_value"],
+        }
+
+    @pytest.mark.parametrize("data", [None, {}, {"nodes": "not a list"}])
+    def test_no_graph_has_no_summary(self, data):
+        assert summarize_flow_data(data) is None
+
+
+class TestFlowHeaderFromRow:
+    def _row(self, **values):
+        defaults = dict.fromkeys(
+            [
+                "folder_id",
+                "endpoint_name",
+                "description",
+                "access_type",
+                "tags",
+                "mcp_enabled",
+                "action_name",
+                "action_description",
+                "summary",
+                "user_id",
+            ]
+        )
+        return _Row(**{"id": uuid4(), "name": "Flow", **defaults, **values})
+
+    def test_flow_header_has_no_data(self):
+        header = flow_header_from_row(self._row(is_component=False, data=None))
+
+        assert header.is_component is False
+        assert header.data is None
+
+    def test_component_header_keeps_data(self):
+        data = {"nodes": [{"id": "a"}], "edges": []}
+        header = flow_header_from_row(self._row(is_component=True, data=data))
+
+        assert header.data == data
+
+    def test_infers_is_component_from_data(self, flow_data):
+        header = flow_header_from_row(self._row(is_component=None, data=flow_data))
+
+        assert header.is_component is False
+        assert header.data is None
+
+
+class TestFlowInputSchema:
+    def test_reads_schema_from_summary(self, flow_data):
+        row = _Row(id=uuid4(), summary=summarize_flow_data(flow_data), data=None)
+
+        assert flow_input_schema(row)["required"] == ["input_value"]
+
+    def test_summary_without_schema_raises(self):
+        row = _Row(id=uuid4(), summary={"version": SUMMARY_VERSION, "input_schema": None}, data=None)
+
+        with pytest.raises(ValueError, match="could not be determined"):
+            flow_input_schema(row)
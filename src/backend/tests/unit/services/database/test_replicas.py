@@ -0,0 +1,142 @@
+"""Tests for routing read-only sessions to database read replicas."""
+
+import sqlite3
+from unittest.mock import MagicMock
+
+import pytest
+from langflow.services.database.replicas import ReplicaPool
+from langflow.services.database.service import DatabaseService
+from sqlmodel import text
+
+
+def _make_database(path, name: str) -> str:
+    with sqlite3.connect(path) as connection:
+        connection.execute("CREATE TABLE origin (name TEXT)")
+        connection.execute("INSERT INTO origin VALUES (?)", (name,))
+    return f"sqlite:///{path}"
+
+
+def _settings_service(database_url: str, replica_urls: list[str], **overrides):
+    settings_service = MagicMock()
+    settings = settings_service.settings
+    settings.database_url = database_url
+    settings.database_connection_retry = False
+    settings.db_connection_settings = {}
+    settings.model_fields_set = set()
+    settings.db_driver_connection_settings = None
+    settings.db_connect_timeout = 30
+    settings.sqlite_pragmas = {}
+    settings.alembic_log_to_stdout = True
+    settings.use_noop_database = False
+    settings.database_replica_urls = replica_urls
+    settings.database_replica_max_lag = 1.0
+    settings.database_replica_check_interval = 60.0
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    return settings_service
+
+
+@pytest.fixture
+def primary_url(tmp_path):
+    return _make_database(tmp_path / "primary.db", "primary")
+
+
+@pytest.fixture
+async def make_service():
+    services = []
+
+    def make(database_url: str, replica_urls: list[str], **overrides) -> DatabaseService:
+        service = DatabaseService(_settings_service(database_url, replica_urls, **overrides))
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        await service.engine.dispose()
+        if service.replica_pool is not None:
+            await service.replica_pool.dispose()
+
+
+async def _read_origin(service: DatabaseService) -> str:
+    async with service._with_readonly_session() as session:
+        return (await session.exec(text("SELECT name FROM origin"))).scalar_one()
+
+
+async def test_without_replicas_reads_use_the_primary(make_service, primary_url):
+    service = make_service(primary_url, [])
+
+    assert service.replica_pool is None
+    assert await _read_origin(service) == "primary"
+
+
+async def test_reads_are_served_by_a_healthy_replica(make_service, primary_url, tmp_path):
+    replica_url = _make_database(tmp_path / "replica.db", "replica")
+    service = make_service(primary_url, [replica_url])
+
+    assert await _read_origin(service) == "replica"
+    async with service._with_session() as session:
+        assert (await session.exec(text("SELECT name FROM origin"))).scalar_one() == "primary"
+
+
+async def test_reads_round_robin_over_replicas(make_service, primary_url, tmp_path):
+    replica_urls = [_make_database(tmp_path / f"replica{i}.db", f"replica{i}") for i in range(2)]
+    service = make_service(primary_url, replica_urls)
+
+    assert [await _read_origin(service) for _ in range(4)] == ["replica0", "replica1", "replica0", "replica1"]
+
+
+async def test_unreachable_replica_falls_back_to_the_primary(make_service, primary_url, tmp_path):
+    service = make_service(primary_url, [f"sqlite:///{tmp_path / 'missing' / 'replica.db'}"])
+
+    assert await _read_origin(service) == "primary"
+    assert service.replica_pool.stats()[0]["healthy"] is False
+
+
+async def test_lagging_replica_falls_back_until_it_catches_up(make_service, primary_url, tmp_path, monkeypatch):
+    replica_url = _make_database(tmp_path / "replica.db", "replica")
+    service = make_service(primary_url, [replica_url], database_replica_max_lag=1.0)
+    lag = 5.0
+
+    async def measure_lag(_replica):
+        return lag
+
+    monkeypatch.setattr(ReplicaPool, "_measure_lag", staticmethod(measure_lag))
+
+    assert await _read_origin(service) == "primary"
+    assert service.replica_pool.stats()[0]["lag"] == 5.0
+
+    lag = 0.5
+    service.replica_pool.check_interval = 0.0
+    await service.replica_pool.refresh()
+
+    assert await _read_origin(service) == "replica"
+
+
+async def test_noop_database_ignores_replicas(make_service, primary_url, tmp_path):
+    from langflow.services.database.session import NoopSession
+
+    replica_url = _make_database(tmp_path / "replica.db", "replica")
+    service = make_service(primary_url, [replica_url], use_noop_database=True)
+
+    async with service._with_readonly_session() as session:
+        assert isinstance(session, NoopSession)
+
+
+async def test_only_api_listing_sessions_use_replicas(make_service, primary_url, tmp_path, monkeypatch):
+    from lfx.services import deps
+
+    replica_url = _make_database(tmp_path / "replica.db", "replica")
+    service = make_service(primary_url, [replica_url])
+    monkeypatch.setattr(deps, "get_db_service", lambda: service)
+
+    async with deps.session_scope_readonly() as session:
+        assert (await session.exec(text("SELECT name FROM origin"))).scalar_one() == "primary"
+    async with deps.session_scope() as session:
+        assert (await session.exec(text("SELECT name FROM origin"))).scalar_one() == "primary"
+
+    sessions = deps.injectable_session_scope_readonly()
+    session = await anext(sessions)
+    try:
+        assert (await session.exec(text("SELECT name FROM origin"))).scalar_one() == "replica"
+    finally:
+        await sessions.aclose()
@@ -0,0 +1,227 @@
+import asyncio
+import time
+
+import pytest
+from langflow.services.job_queue import streams
+from langflow.services.job_queue.service import JobQueueNotFoundError, JobQueueService
+from langflow.services.job_queue.streams import EventStreamError, InMemoryStreamBackend, RemoteJobTask, StreamQueue
+
+
+def _event(number: int) -> tuple[str, bytes, float]:
+    return f"token-{number}", f'{{"event": "token", "data": {number}}}\n\n'.encode(), time.time()
+
+
+async def _produce(queue: StreamQueue, count: int) -> None:
+    for number in range(count):
+        queue.put_nowait(_event(number))
+    await queue.put((None, None, time.time()))
+
+
+async def _consume(queue) -> list[str]:
+    received = []
+    while True:
+        event_id, value, _ = await queue.get()
+        if value is None:
+            return received
+        received.append(event_id)
+
+
+@pytest.fixture
+async def services():
+    """Two job queue services sharing one stream backend, like two workers sharing Redis."""
+    backend = InMemoryStreamBackend()
+    owner, other = JobQueueService(backend), JobQueueService(backend)
+    yield owner, other
+    await owner.stop()
+    await other.stop()
+
+
+async def test_events_are_served_by_another_worker(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    await _produce(queue, 5)
+
+    remote_queue, _, task, _ = await other.aget_queue_data("job-1")
+
+    assert isinstance(task, RemoteJobTask)
+    assert await _consume(remote_queue) == [f"token-{number}" for number in range(5)]
+
+
+async def test_polling_continues_where_the_last_reader_stopped(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    await _produce(queue, 4)
+
+    first, _, _, _ = await other.aget_queue_data("job-1")
+    assert (await first.get())[0] == "token-0"
+    second, _, _, _ = await other.aget_queue_data("job-1")
+
+    assert await _consume(second) == ["token-1", "token-2", "token-3"]
+
+
+async def test_replay_from_offset(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    await _produce(queue, 6)
+    await _consume((await other.aget_queue_data("job-1"))[0])
+
+    replay, _, _, _ = await other.aget_queue_data("job-1", after=3)
+
+    assert await _consume(replay) == ["token-3", "token-4", "token-5"]
+    assert replay.offset == 7
+
+
+async def test_remote_reader_waits_for_new_events(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    queue.put_nowait(_event(0))
+    await queue.flush()
+    remote_queue, _, _, _ = await other.aget_queue_data("job-1")
+
+    consumer = asyncio.create_task(_consume(remote_queue))
+    await asyncio.sleep(0.05)
+    await _produce(queue, 0)
+
+    assert await asyncio.wait_for(consumer, 5) == ["token-0"]
+
+
+async def test_readers_on_other_workers_do_not_write(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    await _produce(queue, 1)
+
+    _, event_manager, _, _ = await other.aget_queue_data("job-1")
+    event_manager.on_end(data={})
+
+    replay, _, _, _ = await other.aget_queue_data("job-1", after=0)
+    assert await _consume(replay) == ["token-0"]
+
+
+async def test_unknown_job_is_not_found(services):
+    _, other = services
+    with pytest.raises(JobQueueNotFoundError):
+        await other.aget_queue_data("missing")
+
+
+async def test_cancel_from_another_worker(services):
+    owner, other = services
+    queue, _ = owner.create_queue("job-1")
+    await queue.flush()
+    owner.start_job("job-1", asyncio.sleep(60))
+    _, _, task, _ = owner.get_queue_data("job-1")
+
+    _, _, remote_task, _ = await other.aget_queue_data("job-1")
+    await remote_task.request_cancel()
+
+    await asyncio.wait([task], timeout=5)
+    assert task.cancelled()
+
+
+async def test_writes_are_held_while_consumers_lag():
+    backend = InMemoryStreamBackend()
+    queue = StreamQueue(backend, "job-1", max_lag=10, backpressure_timeout=5, batch_size=5)
+
+    async def produce():
+        for number in range(30):
+            await queue.put(_event(number))
+
+    producer = asyncio.create_task(produce())
+    await asyncio.sleep(0.2)
+
+    assert len(await backend.read("job-1", 0, count=100)) == 10
+
+    reader = StreamQueue(backend, "job-1", writable=False)
+    received = [(await reader.get())[0] for _ in range(30)]
+
+    assert received == [f"token-{number}" for number in range(30)]
+    await producer
+    await queue.close()
+
+
+async def test_full_outbox_rejects_events_without_waiting():
+    queue = StreamQueue(InMemoryStreamBackend(), "job-1", max_lag=3, backpressure_timeout=0.1)
+    for number in range(3):
+        queue.put_nowait(_event(number))
+
+    with pytest.raises(asyncio.QueueFull):
+        queue.put_nowait(_event(3))
+    queue.put_nowait((None, None, time.time()))
+    await queue.close()
+
+
+class FlakyBackend(InMemoryStreamBackend):
+    """Fails the first ``failures`` appends, after storing the first entry of the batch when ``partial``."""
+
+    def __init__(self, failures: int, *, partial: bool = True) -> None:
+        super().__init__()
+        self.failures = failures
+        self.partial = partial
+
+    async def append(self, job_id, entries):
+        if self.failures:
+            self.failures -= 1
+            if self.partial:
+                await super().append(job_id, entries[:1])
+            msg = "connection lost"
+            raise ConnectionError(msg)
+        await super().append(job_id, entries)
+
+
+async def test_failed_writes_are_retried(monkeypatch):
+    monkeypatch.setattr(streams, "APPEND_RETRY_DELAY", 0.01)
+    backend = FlakyBackend(failures=2)
+    queue = StreamQueue(backend, "job-1")
+    await _produce(queue, 5)
+
+    reader = StreamQueue(backend, "job-1", writable=False)
+
+    assert await _consume(reader) == [f"token-{number}" for number in range(5)]
+
+
+async def test_stream_fails_when_retries_run_out(monkeypatch):
+    monkeypatch.setattr(streams, "APPEND_RETRY_DELAY", 0.01)
+    cancelled = []
+    queue = StreamQueue(FlakyBackend(failures=100, partial=False), "job-1", on_cancel=lambda: cancelled.append(True))
+
+    with pytest.raises(EventStreamError):
+        await queue.put(_event(0))
+    with pytest.raises(EventStreamError):
+        queue.put_nowait(_event(1))
+    assert cancelled == [True]
+    await queue.close()
+
+
+async def test_reader_position_is_stored_in_batches():
+    backend = InMemoryStreamBackend()
+    queue = StreamQueue(backend, "job-1")
+    await _produce(queue, 50)
+    writes = []
+    set_meta = backend.set_meta
+
+    async def record_set_meta(job_id, field, value):
+        writes.append(field)
+        await set_meta(job_id, field, value)
+
+    backend.set_meta = record_set_meta
+    reader = StreamQueue(backend, "job-1", writable=False, commit_interval=60)
+    await _consume(reader)
+
+    assert 0 < writes.count("consumed") < 5
+    assert await backend.get_meta("job-1", "consumed") == "51"
+
+
+async def test_streams_expire():
+    backend = InMemoryStreamBackend(ttl_seconds=0.05)
+    await backend.append("job-1", [(1, "token-0", b"x", time.time())])
+    await asyncio.sleep(0.1)
+
+    assert not await backend.exists("job-1")
+
+
+async def test_without_backend_queues_stay_local():
+    service = JobQueueService()
+    queue, _ = service.create_queue("job-1")
+
+    assert isinstance(queue, asyncio.Queue)
+    with pytest.raises(JobQueueNotFoundError):
+        await JobQueueService().aget_queue_data("job-1")
@@ -0,0 +1,214 @@
+import asyncio
+import time
+
+import pytest
+from langflow.services.job_queue.service import JobQueueService
+from langflow.services.job_queue.streams import FileStreamBackend, StreamQueue
+from langflow.services.task import broker as broker_module
+from langflow.services.task.broker import LocalRunBroker
+from langflow.services.task.execution import ExecutionWorker
+
+
+class SleepingWorker(ExecutionWorker):
+    """Executes build runs by streaming a few events, without a database or a flow."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.running = 0
+        self.peak = 0
+
+    async def _run_build(self, run):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            event_manager = await self._open_stream(run["job_id"])
+            if event_manager is None:
+                return
+            queue = event_manager.queue
+            for number in range(3):
+                queue.put_nowait((f"token-{number}", f'{{"n": {number}}}'.encode(), time.time()))
+                await asyncio.sleep(0.05)
+            await queue.put((None, None, time.time()))
+        finally:
+            self.running -= 1
+            await self.queue_service.cleanup_job(run["job_id"])
+
+
+async def _read_all(queue: StreamQueue) -> list[str]:
+    received = []
+    while True:
+        event_id, value, _ = await queue.get()
+        if value is None:
+            return received
+        received.append(event_id)
+
+
+class TestLocalRunBroker:
+    async def test_each_run_is_claimed_once_in_order(self, tmp_path):
+        brokers = [LocalRunBroker(tmp_path), LocalRunBroker(tmp_path)]
+        for number in range(6):
+            await brokers[0].enqueue({"kind": "build", "job_id": f"job-{number}"})
+
+        claimed = [await brokers[number % 2].claim(f"worker-{number % 2}", timeout=0) for number in range(7)]
+
+        assert [run["job_id"] for run in claimed[:6]] == [f"job-{number}" for number in range(6)]
+        assert claimed[6] is None
+        assert await brokers[0].pending() == 0
+
+    async def test_runs_of_stopped_workers_are_requeued(self, tmp_path, monkeypatch):
+        broker = LocalRunBroker(tmp_path)
+        await broker.enqueue({"kind": "build", "job_id": "job-1"})
+        await broker.heartbeat("worker-1", {"concurrency": 2, "available": 1})
+        assert (await broker.claim("worker-1", timeout=0))["job_id"] == "job-1"
+
+        assert await broker.requeue_orphans() == 0
+        monkeypatch.setattr(broker_module, "WORKER_TIMEOUT", -1)
+        assert await broker.workers() == []
+        assert await broker.requeue_orphans() == 1
+        assert (await broker.claim("worker-2", timeout=0))["job_id"] == "job-1"
+
+    async def test_completed_runs_are_forgotten(self, tmp_path):
+        broker = LocalRunBroker(tmp_path)
+        await broker.enqueue({"kind": "build", "job_id": "job-1"})
+        run = await broker.claim("worker-1", timeout=0)
+
+        await broker.complete("worker-1", run)
+
+        assert await broker.requeue_orphans() == 0
+
+
+class TestFileStreamBackend:
+    async def test_events_cross_backend_instances(self, tmp_path):
+        """Two backends on one directory behave like an API process and a worker process."""
+        worker_side, api_side = FileStreamBackend(tmp_path), FileStreamBackend(tmp_path, poll_interval=0.01)
+        writer = StreamQueue(worker_side, "job-1")
+        writer.announce()
+        for number in range(250):
+            writer.put_nowait((f"token-{number}", b"{}", time.time()))
+        await writer.put((None, None, time.time()))
+
+        assert await api_side.exists("job-1")
+        assert await _read_all(StreamQueue(api_side, "job-1", writable=False)) == [
+            f"token-{number}" for number in range(250)
+        ]
+        replay = StreamQueue(api_side, "job-1", writable=False, after=249)
+        assert await _read_all(replay) == ["token-249"]
+        await writer.close()
+
+    async def test_partial_lines_are_not_read(self, tmp_path):
+        backend = FileStreamBackend(tmp_path)
+        await backend.append("job-1", [(1, "a", b"1", 0.0)])
+        with (tmp_path / "job-1" / "events.ndjson").open("ab") as stream:
+            stream.write(b'{"n": 2, "id": "b"')
+
+        assert [entry[1] for entry in await backend.read("job-1", 0)] == ["a"]
+
+    async def test_expired_jobs_are_removed(self, tmp_path):
+        backend = FileStreamBackend(tmp_path, ttl_seconds=-1)
+        await backend.set_meta("job-1", "created", "1")
+
+        assert await backend.exists("job-1") is False
+        assert not (tmp_path / "job-1").exists()
+
+    async def test_offsets_are_cached_for_recent_jobs_only(self, tmp_path):
+        backend = FileStreamBackend(tmp_path, max_cached_jobs=2)
+        for number in range(3):
+            await backend.append(f"job-{number}", [(1, "a", b"1", 0.0), (2, "b", b"2", 0.0)])
+            assert len(await backend.read(f"job-{number}", 0)) == 2
+
+        assert list(backend._entries) == ["job-1", "job-2"]
+        assert [entry[1] for entry in await backend.read("job-0", 1)] == ["b"]
+        assert await backend.last_sequence("job-0") == 2
+        assert await backend.last_sequence("job-3") == 0
+
+    async def test_job_ids_cannot_escape_the_directory(self, tmp_path):
+        with pytest.raises(ValueError, match="Invalid job id"):
+            await FileStreamBackend(tmp_path).exists("../etc")
+
+
+class TestExecutionWorker:
+    async def test_worker_executes_enqueued_builds_within_its_concurrency(self, tmp_path):
+        streams = FileStreamBackend(tmp_path / "streams", poll_interval=0.01)
+        api_queue_service = JobQueueService(streams)
+        broker = LocalRunBroker(tmp_path / "runs", poll_interval=0.01)
+        execution_worker = SleepingWorker(
+            broker, JobQueueService(FileStreamBackend(tmp_path / "streams")), concurrency=2, heartbeat_interval=0.05
+        )
+        for number in range(5):
+            await api_queue_service.register_remote_job(f"job-{number}")
+            await broker.enqueue({"kind": "build", "job_id": f"job-{number}"})
+
+        stop = asyncio.Event()
+        running = asyncio.create_task(execution_worker.run(stop))
+        events = []
+        for number in range(5):
+            queue, _, _, _ = await api_queue_service.aget_queue_data(f"job-{number}")
+            events.append(await _read_all(queue))
+        workers = await broker.workers()
+        stop.set()
+        await running
+
+        assert events == [["token-0", "token-1", "token-2"]] * 5
+        assert execution_worker.peak == 2
+        assert execution_worker.completed == 5
+        assert workers[0]["concurrency"] == 2
+        assert await broker.workers() == []
+
+    async def test_unknown_runs_fail_without_stopping_the_worker(self, tmp_path):
+        broker = LocalRunBroker(tmp_path, poll_interval=0.01)
+        execution_worker = SleepingWorker(broker, JobQueueService(FileStreamBackend(tmp_path / "streams")))
+        await broker.enqueue({"kind": "unknown", "job_id": "job-1"})
+
+        stop = asyncio.Event()
+        running = asyncio.create_task(execution_worker.run(stop))
+        for _ in range(500):
+            if execution_worker.failed:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await running
+
+        assert execution_worker.failed == 1
+        assert await broker.requeue_orphans() == 0
+
+    async def test_runs_of_workers_that_stop_later_are_requeued(self, tmp_path):
+        broker = LocalRunBroker(tmp_path / "runs", poll_interval=0.01)
+        execution_worker = SleepingWorker(
+            broker, JobQueueService(FileStreamBackend(tmp_path / "streams")), heartbeat_interval=0.01
+        )
+        stop = asyncio.Event()
+        running = asyncio.create_task(execution_worker.run(stop))
+        await asyncio.sleep(0.05)
+
+        # A worker that claimed a run but never sent a heartbeat, as if it stopped right away
+        await broker.enqueue({"kind": "build", "job_id": "job-1"})
+        assert await broker.claim("gone", timeout=0) is not None
+        for _ in range(500):
+            if execution_worker.completed:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await running
+
+        assert execution_worker.completed == 1
+
+    async def test_requeued_builds_continue_their_stream(self, tmp_path):
+        streams = FileStreamBackend(tmp_path / "streams", poll_interval=0.01)
+        queue_service = JobQueueService(streams)
+        execution_worker = ExecutionWorker(LocalRunBroker(tmp_path / "runs"), queue_service)
+        await streams.append("job-1", [(1, "token-1", b"{}", 0.0), (2, "token-2", b"{}", 0.0)])
+
+        event_manager = await execution_worker._open_stream("job-1")
+        event_manager.send_event(event_type="token", data="again")
+        await event_manager.queue.put((None, None, time.time()))
+        await queue_service.cleanup_job("job-1")
+
+        entries = await streams.read("job-1", 0)
+        assert [(sequence, event_id) for sequence, event_id, _, _ in entries] == [
+            (1, "token-1"),
+            (2, "token-2"),
+            (3, "token-3"),
+            (4, None),
+        ]
+        assert await execution_worker._open_stream("job-1") is None
+        await queue_service.stop()
@@ -0,0 +1,203 @@
+"""Tests for the bounded, batched telemetry uploader."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+from langflow.services.telemetry.schema import ComponentInputsPayload, RunPayload
+from langflow.services.telemetry.service import TelemetryService
+from langflow.services.telemetry.spool import TelemetrySpool
+
+
+class TelemetryServer:
+    """Local stand-in for the telemetry endpoint that records every request."""
+
+    def __init__(self):
+        self.requests: list[httpx.Request] = []
+        self.online = True
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        if not self.online:
+            msg = "telemetry server is offline"
+            raise httpx.ConnectError(msg, request=request)
+        self.requests.append(request)
+        return httpx.Response(200)
+
+
+def _settings_service(**overrides):
+    settings_service = MagicMock()
+    settings = settings_service.settings
+    settings.telemetry_base_url = "https://telemetry.example.com"
+    settings.do_not_track = False
+    settings.prometheus_enabled = False
+    settings.telemetry_queue_size = 1000
+    settings.telemetry_batch_size = 10
+    settings.telemetry_flush_interval = 60.0
+    settings.telemetry_sample_rates = {}
+    settings.telemetry_spool_path = None
+    settings.telemetry_spool_max_events = 100
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    settings_service.auth_settings.AUTO_LOGIN = False
+    return settings_service
+
+
+@pytest.fixture
+def server():
+    return TelemetryServer()
+
+
+@pytest.fixture
+def make_service(server):
+    services = []
+
+    def make(**overrides) -> TelemetryService:
+        service = TelemetryService(_settings_service(**overrides))
+        service.client = httpx.AsyncClient(transport=httpx.MockTransport(server.handler))
+        services.append(service)
+        return service
+
+    yield make
+    for service in services:
+        service.running = False
+        if service.worker_task:
+            service.worker_task.cancel()
+
+
+def _run(run_id: int = 0) -> RunPayload:
+    return RunPayload(run_seconds=1, run_success=True, run_id=f"run-{run_id}")
+
+
+async def _wait_for(condition, timeout: float = 2.0) -> None:
+    for _ in range(int(timeout / 0.01)):
+        if condition():
+            return
+        await asyncio.sleep(0.01)
+    msg = "condition not met in time"
+    raise AssertionError(msg)
+
+
+class TestBoundedQueue:
+    async def test_full_queue_drops_and_counts(self, make_service):
+        service = make_service(telemetry_queue_size=3)
+
+        for i in range(5):
+            await service.log_package_run(_run(i))
+
+        assert service.telemetry_queue.qsize() == 3
+        assert service.stats()["dropped"] == {"run": 2}
+
+    async def test_full_queue_spools_to_disk(self, make_service, tmp_path):
+        service = make_service(telemetry_queue_size=3, telemetry_spool_path=str(tmp_path / "spool.jsonl"))
+
+        for i in range(5):
+            await service.log_package_run(_run(i))
+
+        assert service.stats()["spooled"] == 2
+        assert service.stats()["dropped"] == {}
+        spooled = service.spool.pop(2)
+        assert [record["params"]["runId"] for record in spooled] == ["run-3", "run-4"]
+        assert all(record["path"] == "run" for record in spooled)
+
+
+class TestBatching:
+    async def test_uploads_one_batch_per_interval(self, make_service, server):
+        service = make_service(telemetry_batch_size=10, telemetry_flush_interval=60.0)
+        for i in range(25):
+            await service.log_package_run(_run(i))
+
+        service.running = True
+        service.worker_task = asyncio.create_task(service.telemetry_worker())
+        await _wait_for(lambda: len(server.requests) == 10)
+        await asyncio.sleep(0.1)
+
+        assert len(server.requests) == 10
+        assert service.telemetry_queue.qsize() == 15
+
+    async def test_stop_flushes_remaining_events(self, make_service, server):
+        service = make_service(telemetry_batch_size=10, telemetry_flush_interval=60.0)
+        for i in range(25):
+            await service.log_package_run(_run(i))
+        service.running = True
+        service.worker_task = asyncio.create_task(service.telemetry_worker())
+        await _wait_for(lambda: len(server.requests) == 10)
+
+        await asyncio.wait_for(service.stop(), timeout=2.0)
+
+        assert [request.url.params["runId"] for request in server.requests] == [f"run-{i}" for i in range(25)]
+        assert all(request.url.path == "/run" for request in server.requests)
+
+
+class TestSpooling:
+    async def test_offline_events_are_spooled_and_uploaded_later(self, make_service, server, tmp_path):
+        server.online = False
+        service = make_service(telemetry_flush_interval=0.05, telemetry_spool_path=str(tmp_path / "spool.jsonl"))
+        service.running = True
+        service.worker_task = asyncio.create_task(service.telemetry_worker())
+
+        for i in range(3):
+            await service.log_package_run(_run(i))
+        await _wait_for(lambda: service.stats()["spooled"] == 3)
+
+        server.online = True
+        await _wait_for(lambda: len(server.requests) == 3)
+
+        assert sorted(request.url.params["runId"] for request in server.requests) == ["run-0", "run-1", "run-2"]
+        assert service.stats()["spooled"] == 0
+
+    async def test_offline_events_are_dropped_without_spool(self, make_service, server):
+        server.online = False
+        service = make_service(telemetry_flush_interval=0.05)
+        service.running = True
+        service.worker_task = asyncio.create_task(service.telemetry_worker())
+
+        await service.log_package_run(_run())
+        await _wait_for(lambda: service.stats()["dropped"] == {"run": 1})
+
+    def test_spool_is_bounded_and_fifo(self, tmp_path):
+        spool = TelemetrySpool(tmp_path / "spool.jsonl", max_events=3)
+
+        kept = spool.append([{"path": "run", "params": {"i": i}} for i in range(5)])
+
+        assert kept == 3
+        assert [record["params"]["i"] for record in spool.pop(2)] == [0, 1]
+        assert len(TelemetrySpool(tmp_path / "spool.jsonl", max_events=3)) == 1
+
+
+class TestSampling:
+    async def test_sampled_out_events_are_counted(self, make_service):
+        service = make_service(telemetry_sample_rates={"run": 0.0})
+
+        await service.log_package_run(_run())
+
+        assert service.telemetry_queue.empty()
+        assert service.stats()["sampled_out"] == {"run": 1}
+
+    async def test_kept_events_carry_sample_rate(self, make_service, monkeypatch):
+        monkeypatch.setattr("langflow.services.telemetry.service.random.random", lambda: 0.0)
+        service = make_service(telemetry_sample_rates={"run": 0.25})
+
+        await service.log_package_run(_run())
+
+        _func, payload, _path = service.telemetry_queue.get_nowait()
+        assert service._payload_params(payload)["sampleRate"] == 0.25
+
+    async def test_component_input_chunks_are_sampled_together(self, make_service):
+        service = make_service(telemetry_sample_rates={"component_inputs": 0.5})
+        for i in range(20):
+            payload = ComponentInputsPayload(
+                component_run_id=f"component-run-{i}",
+                component_id="component",
+                component_name="Component",
+                component_inputs={f"input_{j}": "x" * 100 for j in range(50)},
+            )
+            await service.log_package_component_inputs(payload)
+
+        queued: dict[str, list[int]] = {}
+        while not service.telemetry_queue.empty():
+            _func, chunk, _path = service.telemetry_queue.get_nowait()
+            queued.setdefault(chunk.component_run_id, []).append(chunk.chunk_index)
+
+        assert 0 < len(queued) < 20
+        assert all(indexes == list(range(len(indexes))) and len(indexes) > 1 for indexes in queued.values())
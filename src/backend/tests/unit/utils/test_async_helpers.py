@@ -87,18 +87,12 @@ class TestRunUntilComplete:
             assert result == "no_loop"
 
     @patch("asyncio.get_running_loop")
-    @patch("concurrent.futures.ThreadPoolExecutor")
-    def test_run_until_complete_with_running_loop_path(self, mock_executor_class, mock_get_running_loop):
-        """Test run_until_complete when event loop is already running."""
+    @patch("lfx.utils.async_helpers._portal.call")
+    def test_run_until_complete_with_running_loop_path(self, mock_portal_call, mock_get_running_loop):
+        """Test run_until_complete hands the coroutine to the shared portal when a loop is running."""
         # Mock that there is a running loop
         mock_get_running_loop.return_value = Mock()
-
-        # Mock the ThreadPoolExecutor and future
-        mock_executor = Mock()
-        mock_future = Mock()
-        mock_future.result.return_value = "thread_result"
-        mock_executor.submit.return_value = mock_future
-        mock_executor_class.return_value.__enter__.return_value = mock_executor
+        mock_portal_call.return_value = "thread_result"
 
         async def simple_coro():
             return "thread_result"
@@ -108,12 +102,10 @@ class TestRunUntilComplete:
             result = run_until_complete(coro)
         finally:
             # Close the coroutine to avoid "coroutine was never awaited" warning
-            # since the mocked executor doesn't actually run it
+            # since the mocked portal doesn't actually run it
             coro.close()
 
-        # Verify ThreadPoolExecutor was used
-        mock_executor_class.assert_called_once()
-        mock_executor.submit.assert_called_once()
+        mock_portal_call.assert_called_once_with(coro)
         assert result == "thread_result"
 
     @patch("asyncio.get_running_loop")
@@ -142,10 +134,13 @@ class TestRunUntilComplete:
             # since the mocked executor doesn't actually run it
             coro.close()
 
+    @patch("lfx.utils.async_helpers._portal.is_portal_thread", return_value=True)
     @patch("asyncio.get_running_loop")
     @patch("concurrent.futures.ThreadPoolExecutor")
     @patch("asyncio.new_event_loop")
-    def test_run_until_complete_new_loop_cleanup(self, mock_new_loop, mock_executor_class, mock_get_running_loop):
+    def test_run_until_complete_new_loop_cleanup(
+        self, mock_new_loop, mock_executor_class, mock_get_running_loop, mock_is_portal_thread
+    ):
         """Test that new event loop is properly cleaned up."""
         mock_get_running_loop.return_value = Mock()
         # Event loop setup for thread execution
@@ -174,12 +169,14 @@ class TestRunUntilComplete:
         # Verify the loop operations happened in the thread
         assert result == "cleanup_test"
         mock_executor.submit.assert_called_once()
+        mock_is_portal_thread.assert_called_once()
 
+    @patch("lfx.utils.async_helpers._portal.is_portal_thread", return_value=True)
     @patch("asyncio.get_running_loop")
     @patch("concurrent.futures.ThreadPoolExecutor")
     @patch("asyncio.new_event_loop")
     def test_run_until_complete_new_loop_exception_cleanup(
-        self, mock_new_loop, mock_executor_class, mock_get_running_loop
+        self, mock_new_loop, mock_executor_class, mock_get_running_loop, mock_is_portal_thread
     ):
         """Test that event loop is cleaned up even when exception occurs."""
         mock_get_running_loop.return_value = Mock()
@@ -210,3 +207,4 @@ class TestRunUntilComplete:
 
         # Verify executor was still called
         mock_executor.submit.assert_called_once()
+        mock_is_portal_thread.assert_called_once()
@@ -4,7 +4,7 @@ from datetime import date, datetime, timezone
 from unittest.mock import patch
 
 from fastapi import Response
-from langflow.utils.compression import compress_response
+from langflow.utils.compression import PrecompressedPayload, compress_response
 
 
 class TestCompressResponse:
@@ -286,3 +286,45 @@ class TestCompressResponse:
         except (TypeError, ValueError):
             # Expected behavior if jsonable_encoder can't handle the object
             pass
+
+
+def _request(**headers):
+    from starlette.requests import Request
+
+    raw_headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "headers": raw_headers})
+
+
+class TestPrecompressedPayload:
+    """Test cases for PrecompressedPayload."""
+
+    def test_gzip_is_served_when_accepted(self):
+        payload = PrecompressedPayload.from_data({"components": ["a", "b"]})
+
+        response = payload.response(_request(accept_encoding="gzip, deflate"))
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.body)) == {"components": ["a", "b"]}
+        assert response.headers["ETag"] == payload.etag[:-1] + '-gzip"'
+
+    def test_identity_is_served_without_accept_encoding(self):
+        payload = PrecompressedPayload.from_data({"a": 1})
+
+        response = payload.response(_request(accept_encoding="gzip;q=0"))
+
+        assert "Content-Encoding" not in response.headers
+        assert json.loads(response.body) == {"a": 1}
+
+    def test_not_modified_for_any_encoding_of_the_current_etag(self):
+        payload = PrecompressedPayload.from_data({"a": 1})
+        gzip_etag = payload.response(_request(accept_encoding="gzip")).headers["ETag"]
+
+        response = payload.response(_request(if_none_match=gzip_etag, accept_encoding="gzip"))
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert payload.response(_request(if_none_match='"stale"')).status_code == 200
+
+    def test_etag_depends_only_on_the_content(self):
+        assert PrecompressedPayload.from_data({"a": 1}).etag == PrecompressedPayload.from_data({"a": 1}).etag
+        assert PrecompressedPayload.from_data({"a": 1}).etag != PrecompressedPayload.from_data({"a": 2}).etag
@@ -123,6 +123,32 @@ def run_command_wrapper(
         show_default=True,
         help="Include detailed timing information in output",
     ),
+    batch: str | None = typer.Option(
+        None,
+        "--batch",
+        help="JSONL file with one input per line; runs the graph once per input and writes JSONL results",
+    ),
+    output: str | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="File to write batch results to (default: stdout)",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        min=1,
+        help="Number of batch inputs to run at the same time",
+    ),
+    ordered: bool = typer.Option(
+        default=True,
+        help="Write batch results in input order (--ordered) or as they complete (--no-ordered)",
+    ),
+    resume: bool = typer.Option(
+        default=False,
+        show_default=True,
+        help="Skip batch inputs already written to --output and append the rest",
+    ),
 ) -> None:
     """Run a flow directly (lazy-loaded)."""
     from pathlib import Path
@@ -144,6 +170,11 @@ def run_command_wrapper(
         verbose_detailed=verbose_detailed,
         verbose_full=verbose_full,
         timing=timing,
+        batch=Path(batch) if batch else None,
+        output=Path(output) if output else None,
+        concurrency=concurrency,
+        ordered=ordered,
+        resume=resume,
     )
 
 
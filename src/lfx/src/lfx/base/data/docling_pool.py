@@ -0,0 +1,515 @@
+"""Pool of long-lived Docling worker processes used by the File component's advanced mode.
+
+Each conversion used to start a fresh ``python -c`` process, which re-imported Docling and reloaded its
+models for every file. Workers here stay alive between files and keep one ``DocumentConverter`` per
+pipeline/OCR configuration, so only the first file pays the start-up cost. Workers talk JSON lines over
+stdin/stdout, are recycled after ``max_tasks_per_child`` files to bound memory growth, and are killed when
+a file exceeds ``task_timeout``. A new worker loads its converter before it is handed a file, bounded by
+``startup_timeout``, so start-up never counts against ``task_timeout``. At most ``max_queue`` requests wait
+for a free worker, for at most ``queue_timeout`` seconds; further requests fail fast instead of piling up.
+``get_docling_pool_metrics`` reports the pool's counters without starting it.
+"""
+
+from __future__ import annotations
+
+import atexit
+import collections
+import json
+import queue
+import subprocess
+import sys
+import textwrap
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from lfx.log.logger import logger
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_TASKS_PER_CHILD = 50
+DEFAULT_TASK_TIMEOUT = 600.0
+DEFAULT_STARTUP_TIMEOUT = 600.0
+DEFAULT_MAX_QUEUE = 32
+DEFAULT_QUEUE_TIMEOUT = 300.0
+
+# Script run by each worker. It also works one-shot: given a single request line and EOF it converts
+# that file and exits.
+DOCLING_WORKER_SCRIPT = textwrap.dedent(
+    r"""
+
+    import json, sys
+
+    def try_imports():
+        try:
+            from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
+            from docling.document_converter import DocumentConverter  # type: ignore
+            from docling_core.types.doc import ImageRefMode  # type: ignore
+            return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
+        except Exception as e:
+            raise e
+
+    def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
+        # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
+        if pipeline == "standard":
+            try:
+                from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
+                from docling.document_converter import PdfFormatOption  # type: ignore
+
+                pipe = PdfPipelineOptions()
+                pipe.do_ocr = False
+
+                if ocr_engine:
+                    try:
+                        from docling.models.factories import get_ocr_factory  # type: ignore
+                        pipe.do_ocr = True
+                        fac = get_ocr_factory(allow_external_plugins=False)
+                        pipe.ocr_options = fac.create_options(kind=ocr_engine)
+                    except Exception:
+                        # If OCR setup fails, disable it
+                        pipe.do_ocr = False
+
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
+
+                return DocumentConverter(format_options=fmt)
+            except Exception:
+                return DocumentConverter()
+
+        # --- Vision-Language Model (VLM) pipeline ---
+        if pipeline == "vlm":
+            try:
+                from docling.datamodel.pipeline_options import VlmPipelineOptions
+                from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
+                from docling.document_converter import PdfFormatOption
+                from docling.pipeline.vlm_pipeline import VlmPipeline
+
+                vl_pipe = VlmPipelineOptions(
+                    vlm_options=GRANITEDOCLING_TRANSFORMERS,
+                )
+
+                if sys.platform == "darwin":
+                    try:
+                        import mlx_vlm
+                        vl_pipe.vlm_options = GRANITEDOCLING_MLX
+                    except ImportError as e:
+                        raise e
+
+                # VLM paths generally don't need OCR; keep OCR off by default here.
+                fmt = {}
+                if hasattr(input_format, "PDF"):
+                    fmt[getattr(input_format, "PDF")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+                if hasattr(input_format, "IMAGE"):
+                    fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
+                    pipeline_cls=VlmPipeline,
+                    pipeline_options=vl_pipe
+                )
+
+                return DocumentConverter(format_options=fmt)
+            except Exception as e:
+                raise e
+
+        # --- Fallback: default converter with no special options ---
+        return DocumentConverter()
+
+    def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
+        try:
+            mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
+            return document.export_to_markdown(
+                image_mode=mode,
+                image_placeholder=img_ph,
+                page_break_placeholder=pg_ph,
+            )
+        except Exception:
+            try:
+                return document.export_to_text()
+            except Exception:
+                return str(document)
+
+    def to_rows(doc_dict):
+        rows = []
+        for t in doc_dict.get("texts", []):
+            prov = t.get("prov") or []
+            page_no = None
+            if prov and isinstance(prov, list) and isinstance(prov[0], dict):
+                page_no = prov[0].get("page_no")
+            rows.append({
+                "page_no": page_no,
+                "label": t.get("label"),
+                "text": t.get("text"),
+                "level": t.get("level"),
+            })
+        return rows
+
+    _CONVERTERS = {}
+
+
+    def get_converter(pipeline, ocr_engine):
+        # Workers serve many files, so keep one converter (and its loaded models) per configuration.
+        key = (pipeline, ocr_engine)
+        if key not in _CONVERTERS:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            _CONVERTERS[key] = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
+        return _CONVERTERS[key]
+
+    def convert(cfg):
+        file_path = cfg["file_path"]
+        markdown = cfg["markdown"]
+        image_mode = cfg["image_mode"]
+        img_ph = cfg["md_image_placeholder"]
+        pg_ph = cfg["md_page_break_placeholder"]
+        pipeline = cfg["pipeline"]
+        ocr_engine = cfg.get("ocr_engine")
+        meta = {"file_path": file_path}
+
+        try:
+            ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
+            converter = get_converter(pipeline, ocr_engine)
+            try:
+                res = converter.convert(file_path)
+            except Exception as e:
+                return {"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}
+
+            ok = False
+            if hasattr(res, "status"):
+                try:
+                    ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
+                except Exception:
+                    ok = (str(res.status).lower() == "success")
+            if not ok and hasattr(res, "document"):
+                ok = getattr(res, "document", None) is not None
+            if not ok:
+                return {"ok": False, "error": "Docling conversion failed", "meta": meta}
+
+            doc = getattr(res, "document", None)
+            if doc is None:
+                return {"ok": False, "error": "Docling produced no document", "meta": meta}
+
+            if markdown:
+                text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
+                return {"ok": True, "mode": "markdown", "text": text, "meta": meta}
+
+            # structured
+            try:
+                doc_dict = doc.export_to_dict()
+            except Exception as e:
+                return {"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}
+
+            rows = to_rows(doc_dict)
+            return {"ok": True, "mode": "structured", "doc": rows, "meta": meta}
+        except Exception as e:
+            return {"ok": False, "error": f"Docling processing error: {e}", "meta": {"file_path": file_path}}
+
+    def warm_up(cfg):
+        # Load Docling and the converter for this configuration before the first file arrives. Failures are
+        # left for the first conversion to report.
+        try:
+            get_converter(cfg["pipeline"], cfg.get("ocr_engine"))
+        except Exception:
+            pass
+        return {"ready": True}
+
+    def main():
+        # One JSON request per stdin line, one JSON result per stdout line. Anything Docling prints goes
+        # to stderr so it cannot corrupt the protocol.
+        out = sys.stdout
+        sys.stdout = sys.stderr
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            cfg = json.loads(line)
+            result = warm_up(cfg["warm_up"]) if "warm_up" in cfg else convert(cfg)
+            out.write(json.dumps(result) + "\n")
+            out.flush()
+
+    if __name__ == "__main__":
+        main()
+    """
+)
+
+
+def docling_config_key(args: dict[str, Any]) -> tuple[str, str | None]:
+    """Return the converter configuration a request needs, which decides which worker can take it."""
+    return str(args.get("pipeline")), args.get("ocr_engine")
+
+
+def run_docling_once(args: dict[str, Any]) -> dict[str, Any]:
+    """Convert a single file in a throwaway process (the behaviour when the pool is disabled)."""
+    proc = subprocess.run(  # noqa: S603
+        [sys.executable, "-u", "-c", DOCLING_WORKER_SCRIPT],
+        input=(json.dumps(args) + "\n").encode("utf-8"),
+        capture_output=True,
+        check=False,
+    )
+    if not proc.stdout:
+        err_msg = proc.stderr.decode("utf-8", errors="replace") if proc.stderr else "no output from child process"
+        return {"ok": False, "error": f"Docling subprocess error: {err_msg}"}
+    try:
+        return json.loads(proc.stdout.decode("utf-8"))
+    except ValueError as e:
+        err_msg = proc.stderr.decode("utf-8", errors="replace") if proc.stderr else ""
+        return {"ok": False, "error": f"Invalid JSON from Docling subprocess: {e}. stderr={err_msg}"}
+
+
+class _Worker:
+    """One worker process plus the threads draining its stdout and stderr."""
+
+    def __init__(self, config_key: tuple[str, str | None]) -> None:
+        self.config_key = config_key
+        self.tasks_done = 0
+        self.ready = False
+        self.proc = subprocess.Popen(  # noqa: S603
+            [sys.executable, "-u", "-c", DOCLING_WORKER_SCRIPT],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        self.lines: queue.Queue[str | None] = queue.Queue()
+        self.stderr_tail: collections.deque[str] = collections.deque(maxlen=50)
+        threading.Thread(target=self._read_stdout, daemon=True).start()
+        threading.Thread(target=self._read_stderr, daemon=True).start()
+
+    def _read_stdout(self) -> None:
+        for line in self.proc.stdout:
+            self.lines.put(line)
+        self.lines.put(None)
+
+    def _read_stderr(self) -> None:
+        for line in self.proc.stderr:
+            self.stderr_tail.append(line)
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.poll() is None
+
+    def _send(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        self.proc.stdin.write(json.dumps(payload) + "\n")
+        self.proc.stdin.flush()
+        line = self.lines.get(timeout=timeout) if timeout > 0 else self.lines.get()
+        if line is None:
+            stderr = "".join(self.stderr_tail)[-2000:] or "no output from child process"
+            msg = f"Docling worker exited with code {self.proc.wait()}: {stderr}"
+            raise RuntimeError(msg)
+        return json.loads(line)
+
+    def warm_up(self, timeout: float) -> None:
+        """Wait for the worker to import Docling and load its converter. Raises ``RuntimeError``."""
+        pipeline, ocr_engine = self.config_key
+        try:
+            self._send({"warm_up": {"pipeline": pipeline, "ocr_engine": ocr_engine}}, timeout)
+        except queue.Empty:
+            msg = f"Docling worker did not start within {timeout:g} seconds"
+            raise RuntimeError(msg) from None
+        self.ready = True
+
+    def request(self, args: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Send one request and wait for its result. Raises ``queue.Empty`` on timeout or ``RuntimeError``."""
+        result = self._send(args, timeout)
+        self.tasks_done += 1
+        return result
+
+    def stop(self) -> None:
+        if self.alive:
+            self.proc.kill()
+        self.proc.wait()
+
+
+@dataclass
+class DoclingPoolMetrics:
+    """Counters describing the Docling worker pool.
+
+    ``rejected`` counts requests refused because the queue was full or no worker became free in time.
+    """
+
+    workers: int = 0
+    idle: int = 0
+    queued: int = 0
+    completed: int = 0
+    failed: int = 0
+    timeouts: int = 0
+    rejected: int = 0
+    workers_started: int = 0
+    total_seconds: float = 0.0
+    _started_at: float = field(default_factory=time.monotonic, repr=False)
+
+    def to_dict(self) -> dict[str, Any]:
+        processed = self.completed + self.failed
+        uptime = time.monotonic() - self._started_at
+        return {
+            "workers": self.workers,
+            "idle": self.idle,
+            "queued": self.queued,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timeouts": self.timeouts,
+            "rejected": self.rejected,
+            "workers_started": self.workers_started,
+            "avg_seconds_per_file": self.total_seconds / processed if processed else 0.0,
+            "files_per_minute": processed * 60 / uptime if uptime else 0.0,
+        }
+
+
+class DoclingWorkerPool:
+    """Hands Docling conversions to warm worker processes, at most ``max_workers`` at a time."""
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_tasks_per_child: int = DEFAULT_MAX_TASKS_PER_CHILD,
+        task_timeout: float = DEFAULT_TASK_TIMEOUT,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        queue_timeout: float = DEFAULT_QUEUE_TIMEOUT,
+    ) -> None:
+        self.max_workers = max(1, max_workers)
+        self.max_tasks_per_child = max_tasks_per_child
+        self.task_timeout = task_timeout
+        self.startup_timeout = startup_timeout
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._idle: list[_Worker] = []
+        self._busy = 0
+        self._waiting = 0
+        self._condition = threading.Condition()
+        self._metrics = DoclingPoolMetrics()
+
+    def _acquire(self, config_key: tuple[str, str | None]) -> _Worker:
+        with self._condition:
+            if self._busy >= self.max_workers and self._waiting >= self.max_queue:
+                self._metrics.rejected += 1
+                msg = f"Docling worker queue is full ({self.max_queue} files waiting)"
+                raise RuntimeError(msg)
+            deadline = time.monotonic() + self.queue_timeout
+            self._waiting += 1
+            try:
+                while self._busy >= self.max_workers:
+                    remaining = deadline - time.monotonic()
+                    if self.queue_timeout > 0 and remaining <= 0:
+                        self._metrics.rejected += 1
+                        msg = f"No Docling worker became free within {self.queue_timeout:g} seconds"
+                        raise RuntimeError(msg)
+                    self._condition.wait(remaining if self.queue_timeout > 0 else None)
+            finally:
+                self._waiting -= 1
+            self._busy += 1
+            # Prefer a warm worker for this configuration; otherwise retire an idle one to stay in budget.
+            for worker in self._idle:
+                if worker.config_key == config_key and worker.alive:
+                    self._idle.remove(worker)
+                    return worker
+            stale = [worker for worker in self._idle if not worker.alive]
+            while self._idle and len(self._idle) + self._busy > self.max_workers:
+                stale.append(self._idle.pop(0))
+            self._idle = [worker for worker in self._idle if worker not in stale]
+        for worker in stale:
+            worker.stop()
+        try:
+            worker = _Worker(config_key)
+        except BaseException:
+            self._release(None)
+            raise
+        with self._condition:
+            self._metrics.workers_started += 1
+        return worker
+
+    def _release(self, worker: _Worker | None) -> None:
+        with self._condition:
+            self._busy -= 1
+            if worker is not None:
+                self._idle.append(worker)
+            self._condition.notify()
+
+    def convert(self, args: dict[str, Any]) -> dict[str, Any]:
+        """Convert one file and return the worker's JSON result (``{"ok": ..., ...}``). Blocks the caller."""
+        try:
+            worker = self._acquire(docling_config_key(args))
+        except RuntimeError as e:
+            return {"ok": False, "error": str(e)}
+
+        started_at = time.monotonic()
+        keep = False
+        try:
+            if not worker.ready:
+                worker.warm_up(self.startup_timeout)
+            result = worker.request(args, self.task_timeout)
+            keep = worker.alive and (self.max_tasks_per_child <= 0 or worker.tasks_done < self.max_tasks_per_child)
+        except queue.Empty:
+            with self._condition:
+                self._metrics.timeouts += 1
+            result = {"ok": False, "error": f"Docling timed out after {self.task_timeout:g} seconds"}
+        except (OSError, RuntimeError, ValueError) as e:
+            result = {"ok": False, "error": f"Docling subprocess error: {e}"}
+        finally:
+            elapsed = time.monotonic() - started_at
+            if not keep:
+                worker.stop()
+            self._release(worker if keep else None)
+
+        with self._condition:
+            self._metrics.total_seconds += elapsed
+            if result.get("ok"):
+                self._metrics.completed += 1
+            else:
+                self._metrics.failed += 1
+        return result
+
+    def metrics(self) -> dict[str, Any]:
+        with self._condition:
+            self._metrics.workers = len(self._idle) + self._busy
+            self._metrics.idle = len(self._idle)
+            self._metrics.queued = self._waiting
+            return self._metrics.to_dict()
+
+    def shutdown(self) -> None:
+        """Stop idle workers. Busy workers are stopped when their current file finishes."""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for worker in idle:
+            worker.stop()
+
+
+_pool: DoclingWorkerPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_docling_worker_pool() -> DoclingWorkerPool | None:
+    """Return the process-wide pool, or None when ``docling_worker_pool_size`` is 0."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from lfx.services.deps import get_settings_service
+
+                settings_service = get_settings_service()
+                if settings_service is None:
+                    _pool = DoclingWorkerPool()
+                else:
+                    settings = settings_service.settings
+                    if settings.docling_worker_pool_size <= 0:
+                        return None
+                    _pool = DoclingWorkerPool(
+                        max_workers=settings.docling_worker_pool_size,
+                        max_tasks_per_child=settings.docling_worker_max_tasks,
+                        task_timeout=settings.docling_task_timeout,
+                        startup_timeout=settings.docling_worker_startup_timeout,
+                        max_queue=settings.docling_max_queue,
+                        queue_timeout=settings.docling_queue_timeout,
+                    )
+                atexit.register(_pool.shutdown)
+                logger.debug(f"Started Docling worker pool with {_pool.max_workers} workers")
+    return _pool
+
+
+def get_docling_pool_metrics() -> dict[str, Any] | None:
+    """Return the metrics of the process-wide pool, or None when it has not been started."""
+    pool = _pool
+    return pool.metrics() if pool is not None else None
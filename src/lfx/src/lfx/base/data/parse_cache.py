@@ -0,0 +1,214 @@
+"""Content-addressed cache of parsed documents.
+
+Parsing a PDF, DOCX or Docling document is far more expensive than hashing its bytes, and the same file
+is often parsed again on every flow run or by several workers. Results are stored under a key built from
+the SHA-256 of the file content, the parser name, the installed versions of the parser's packages and the
+parser options, so a renamed or re-uploaded copy of the same file still hits while any change to the bytes,
+options or parser version misses. The cache is off unless ``parse_cache_enabled`` is set. Entries are JSON files in
+``<config_dir>/parse_cache`` (next to the storage service data), written atomically so several processes
+can share the directory, and the least recently used entries are evicted once the directory grows past
+``max_bytes``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import importlib.metadata as md
+import os
+import tempfile
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Bump when the shape of cached values changes so stale entries are ignored.
+PARSE_CACHE_VERSION = 2
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+_CHUNK_SIZE = 1024 * 1024
+
+# Distributions whose code produces each parser's output. Their versions are part of the cache key, so an
+# upgrade parses files again instead of serving results of the previous version.
+PARSER_DISTRIBUTIONS: dict[str, tuple[str, ...]] = {
+    "docling": ("lfx", "docling", "docling-core"),
+    "text_file": ("lfx", "pypdf", "python-docx", "chardet", "pyyaml"),
+}
+
+
+def hash_bytes(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def hash_file(file_path: str | Path) -> str:
+    """SHA-256 of a file's content, read in chunks."""
+    digest = hashlib.sha256()
+    with Path(file_path).open("rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@lru_cache(maxsize=32)
+def parser_versions(parser: str) -> dict[str, str | None]:
+    """Installed versions of the distributions behind ``parser``; None for those not installed."""
+    versions: dict[str, str | None] = {}
+    for distribution in PARSER_DISTRIBUTIONS.get(parser, ()):
+        try:
+            versions[distribution] = md.version(distribution)
+        except md.PackageNotFoundError:
+            versions[distribution] = None
+    return versions
+
+
+def _is_json_native(value: Any) -> bool:
+    """True if ``value`` reads back from JSON unchanged (YAML, for example, can produce dates)."""
+    if value is None or isinstance(value, str | int | float | bool):
+        return True
+    if isinstance(value, list):
+        return all(_is_json_native(item) for item in value)
+    if isinstance(value, dict):
+        return all(isinstance(key, str) and _is_json_native(item) for key, item in value.items())
+    return False
+
+
+class ParsedDocumentCache:
+    """Size-bounded on-disk cache of parser outputs keyed by content hash, parser, parser version and options."""
+
+    def __init__(self, cache_dir: str | Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._approx_size = sum(path.stat().st_size for path in self.cache_dir.glob("*.json"))
+
+    @staticmethod
+    def make_key(content_hash: str, parser: str, options: dict[str, Any] | None = None) -> str:
+        payload = orjson.dumps(
+            [PARSE_CACHE_VERSION, content_hash, parser, parser_versions(parser), options or {}],
+            option=orjson.OPT_SORT_KEYS,
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Any | None:
+        """Return the cached value for ``key``, or None on a miss."""
+        path = self._path(key)
+        try:
+            value = orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            value = None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.debug(f"Ignoring unreadable parse cache entry {path.name}: {e}")
+            value = None
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        # Touch the entry so eviction drops the least recently used files first.
+        with contextlib.suppress(OSError):
+            os.utime(path)
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        if not _is_json_native(value):
+            logger.debug("Not caching parse result that does not round-trip through JSON")
+            return
+        payload = orjson.dumps(value)
+        if len(payload) > self.max_bytes:
+            return
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            Path(tmp_name).replace(self._path(key))
+        except OSError as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            logger.debug(f"Could not write parse cache entry: {e}")
+            return
+        with self._lock:
+            self._approx_size += len(payload)
+            over_limit = self._approx_size > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> None:
+        """Delete least recently used entries until the cache is below 90% of ``max_bytes``."""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = int(self.max_bytes * 0.9)
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        with self._lock:
+            self._approx_size = total
+            self.evictions += evicted
+
+    def get_or_parse(self, key: str, parse: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, calling ``parse`` and storing its result on a miss."""
+        value = self.get(key)
+        if value is None:
+            value = parse()
+            self.set(key, value)
+        return value
+
+    def stats(self) -> dict[str, int | float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "size_bytes": self._approx_size,
+            }
+
+
+_cache: ParsedDocumentCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_parse_cache() -> ParsedDocumentCache | None:
+    """Return the process-wide parse cache, or None unless ``parse_cache_enabled`` is set."""
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+        if settings_service is None or settings_service.settings.parse_cache_enabled is not True:
+            return None
+        settings = settings_service.settings
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = ParsedDocumentCache(
+                        Path(settings.config_dir) / "parse_cache",
+                        max_bytes=settings.parse_cache_max_size_mb * 1024 * 1024,
+                    )
+                except OSError as e:
+                    logger.warning(f"Parsed document cache disabled: {e}")
+                    return None
+    return _cache
@@ -0,0 +1,107 @@
+"""Page-sharded PDF text extraction.
+
+``page.extract_text()`` is pure-Python and CPU bound, so large PDFs used to be extracted one page after
+another on a single core. Here the page range is split into shards that run on the shared ``"process"``
+executor pool. Every worker memory-maps the file instead of receiving a copy of its bytes, and shards are
+submitted through a bounded window so at most a few shards of text are buffered while pages are yielded
+back in document order. Small documents, and machines with a single worker, are extracted in-process,
+where a worker round trip would cost more than it saves.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import tempfile
+from collections import deque
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from pypdf import PdfReader
+
+from lfx.log.logger import logger
+from lfx.utils.executors import get_executor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from concurrent.futures import Future
+
+# Documents with fewer pages are extracted in the calling process.
+PARALLEL_MIN_PAGES = 16
+PAGES_PER_SHARD = 8
+
+
+@contextmanager
+def _open_pdf(file_path: str | Path) -> Iterator[PdfReader]:
+    with Path(file_path).open("rb") as f:
+        try:
+            stream = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped; let PdfReader report the error on the plain file.
+            yield PdfReader(f)
+            return
+        with stream:
+            yield PdfReader(stream)
+
+
+def _extract_page_range(file_path: str, start: int, stop: int) -> list[str]:
+    """Extract the text of pages ``start`` to ``stop`` (exclusive). Runs in a worker process."""
+    with _open_pdf(file_path) as reader:
+        return [reader.pages[index].extract_text() for index in range(start, stop)]
+
+
+def iter_pdf_pages(
+    file_path: str | Path,
+    *,
+    parallel: bool = True,
+    pages_per_shard: int = PAGES_PER_SHARD,
+    min_pages: int = PARALLEL_MIN_PAGES,
+) -> Iterator[str]:
+    """Yield the text of each page of a local PDF, in page order."""
+    file_path = str(file_path)
+    pool = get_executor("process")
+    with _open_pdf(file_path) as reader:
+        page_count = len(reader.pages)
+        # Each shard re-opens the document, which only pays off when shards actually run side by side.
+        if not parallel or page_count < min_pages or pool.max_workers < 2:  # noqa: PLR2004
+            for page in reader.pages:
+                yield page.extract_text()
+            return
+
+    shards = deque(range(0, page_count, max(1, pages_per_shard)))
+    # Keep every worker busy plus one shard queued behind each, without buffering the whole document.
+    window = pool.max_workers * 2
+    pending: deque[Future[list[str]]] = deque()
+    try:
+        while shards or pending:
+            while shards and len(pending) < window:
+                start = shards.popleft()
+                stop = min(start + pages_per_shard, page_count)
+                pending.append(pool.executor.submit(_extract_page_range, file_path, start, stop))
+            yield from pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def parse_pdf_file(file_path: str | Path, *, parallel: bool = True) -> str:
+    """Extract the text of a local PDF, joining pages with blank lines."""
+    return "\n\n".join(iter_pdf_pages(file_path, parallel=parallel))
+
+
+def parse_pdf_bytes(content: bytes, *, parallel: bool = True) -> str:
+    """Extract the text of an in-memory PDF.
+
+    The bytes are spilled to a temporary file so workers can map it rather than each receiving a copy.
+    """
+    fd, temp_path = tempfile.mkstemp(suffix=".pdf")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        return parse_pdf_file(temp_path, parallel=parallel)
+    finally:
+        try:
+            Path(temp_path).unlink()
+        except OSError as e:
+            logger.debug(f"Could not remove temporary PDF {temp_path}: {e}")
@@ -0,0 +1,303 @@
+"""Concurrent, cache-aware web crawler used by the URL component.
+
+Pages are fetched with a single pooled ``httpx.AsyncClient`` under a global concurrency limit and a
+per-host limit. Responses that carry an ``ETag`` or ``Last-Modified`` validator are stored in an on-disk
+cache and revalidated with conditional requests on the next crawl, so unchanged pages cost a 304.
+Pages are yielded as soon as they are fetched, in completion order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from dataclasses import asdict, dataclass
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import urldefrag, urljoin, urlparse
+
+import chardet
+import httpx
+from platformdirs import user_cache_dir
+
+from lfx.log.logger import logger
+from lfx.utils.executors import run_in_executor
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Callable, Iterable
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MAX_PER_HOST = 4
+EXCLUDED_CONTENT_TYPES = ("text/css",)
+
+
+@dataclass
+class CrawledPage:
+    """A fetched page and the metadata extracted from it."""
+
+    url: str
+    content: str
+    depth: int
+    status_code: int = 200
+    content_type: str = ""
+    title: str = ""
+    description: str = ""
+    language: str = ""
+    from_cache: bool = False
+
+
+@dataclass
+class CachedResponse:
+    """A stored response body together with its HTTP validators."""
+
+    url: str
+    body: str
+    content_type: str = ""
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+class HTTPResponseCache:
+    """On-disk cache of response bodies keyed by URL, revalidated with conditional requests.
+
+    Each entry is a single JSON file written atomically, so several workers can share the same
+    directory.
+    """
+
+    def __init__(self, cache_dir: str | Path | None = None) -> None:
+        self.cache_dir = Path(cache_dir) if cache_dir else Path(user_cache_dir("langflow")) / "url_cache"
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, url: str) -> Path:
+        return self.cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+
+    def get(self, url: str) -> CachedResponse | None:
+        try:
+            return CachedResponse(**json.loads(self._path(url).read_text(encoding="utf-8")))
+        except FileNotFoundError:
+            return None
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable cache entry for {url}: {e}")
+            return None
+
+    def set(self, entry: CachedResponse) -> None:
+        path = self._path(entry.url)
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(asdict(entry), f)
+            Path(tmp_name).replace(path)
+        except OSError as e:
+            Path(tmp_name).unlink(missing_ok=True)
+            logger.debug(f"Could not write cache entry for {entry.url}: {e}")
+
+
+class _PageParser(HTMLParser):
+    """Collects links, title, description and language from an HTML document."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.links: list[str] = []
+        self.title = ""
+        self.description = ""
+        self.language = ""
+        self._in_title = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        attributes = {key: value or "" for key, value in attrs}
+        if tag == "a" and attributes.get("href"):
+            self.links.append(attributes["href"])
+        elif tag == "title":
+            self._in_title = True
+        elif tag == "html":
+            self.language = attributes.get("lang", "")
+        elif tag == "meta" and attributes.get("name", "").lower() == "description":
+            self.description = attributes.get("content", "")
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title:
+            self.title += data
+
+
+def _detect_encoding(content: bytes) -> str:
+    return chardet.detect(content[:65536])["encoding"] or "utf-8"
+
+
+def _parse_page(html: str, extractor: Callable[[str], str]) -> tuple[str, _PageParser]:
+    parser = _PageParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception as e:  # noqa: BLE001
+        logger.debug(f"Could not parse HTML for link extraction: {e}")
+    return extractor(html), parser
+
+
+class AsyncUrlCrawler:
+    """Crawls one or more root URLs concurrently, following links up to ``max_depth``.
+
+    Depth follows ``RecursiveUrlLoader``: depth 1 fetches only the root pages, depth 2 adds the pages
+    they link to, and so on. With ``prevent_outside`` only links under the root URL are followed.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_depth: int = 1,
+        prevent_outside: bool = True,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_per_host: int = DEFAULT_MAX_PER_HOST,
+        timeout: float = 30,
+        headers: dict[str, str] | None = None,
+        extractor: Callable[[str], str] | None = None,
+        cache: HTTPResponseCache | None = None,
+        check_response_status: bool = False,
+        continue_on_failure: bool = True,
+        filter_text_html: bool = True,
+        autoset_encoding: bool = True,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        self.max_depth = max(1, max_depth)
+        self.prevent_outside = prevent_outside
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+        self.headers = headers or {}
+        self.extractor = extractor or (lambda html: html)
+        self.cache = cache
+        self.check_response_status = check_response_status
+        self.continue_on_failure = continue_on_failure
+        self.filter_text_html = filter_text_html
+        self.autoset_encoding = autoset_encoding
+        self._client = client
+        self._host_semaphores: dict[str, asyncio.Semaphore] = {}
+
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_per_host)
+        return self._host_semaphores[host]
+
+    def _child_urls(self, page_url: str, base_url: str, links: Iterable[str]) -> list[str]:
+        children = []
+        for link in links:
+            child, _ = urldefrag(urljoin(page_url, link.strip()))
+            if urlparse(child).scheme not in {"http", "https"}:
+                continue
+            if self.prevent_outside and not child.startswith(base_url):
+                continue
+            children.append(child)
+        return children
+
+    async def _fetch(self, client: httpx.AsyncClient, url: str) -> tuple[httpx.Response, CachedResponse | None]:
+        cached = await run_in_executor("io", self.cache.get, url) if self.cache else None
+        headers = {}
+        if cached is not None:
+            if cached.etag:
+                headers["If-None-Match"] = cached.etag
+            if cached.last_modified:
+                headers["If-Modified-Since"] = cached.last_modified
+        response = await client.get(url, headers=headers)
+        return response, cached
+
+    async def _visit(
+        self,
+        client: httpx.AsyncClient,
+        global_semaphore: asyncio.Semaphore,
+        url: str,
+        depth: int,
+    ) -> tuple[CrawledPage | None, list[str]]:
+        async with global_semaphore, self._host_semaphore(url):
+            response, cached = await self._fetch(client, url)
+
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            html, content_type, from_cache = cached.body, cached.content_type, True
+        else:
+            if self.check_response_status:
+                response.raise_for_status()
+            html = response.text
+            content_type = response.headers.get("content-type", "")
+            from_cache = False
+            etag, last_modified = response.headers.get("etag"), response.headers.get("last-modified")
+            if self.cache and response.is_success and (etag or last_modified):
+                entry = CachedResponse(
+                    url=url, body=html, content_type=content_type, etag=etag, last_modified=last_modified
+                )
+                await run_in_executor("io", self.cache.set, entry)
+
+        if self.filter_text_html and content_type.split(";")[0].strip() in EXCLUDED_CONTENT_TYPES:
+            return None, []
+
+        content, parser = await run_in_executor("cpu", _parse_page, html, self.extractor)
+        page = CrawledPage(
+            url=url,
+            content=content,
+            depth=depth,
+            status_code=response.status_code,
+            content_type=content_type,
+            title=parser.title.strip(),
+            description=parser.description,
+            language=parser.language,
+            from_cache=from_cache,
+        )
+        return page, parser.links
+
+    async def crawl(self, urls: Iterable[str]) -> AsyncIterator[CrawledPage]:
+        """Crawl ``urls`` and yield pages as they arrive."""
+        client = self._client or httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            default_encoding=_detect_encoding if self.autoset_encoding else "utf-8",
+            limits=httpx.Limits(max_connections=self.max_concurrency, max_keepalive_connections=self.max_concurrency),
+        )
+        global_semaphore = asyncio.Semaphore(self.max_concurrency)
+        results: asyncio.Queue[tuple[CrawledPage | None, BaseException | None]] = asyncio.Queue()
+        pending: set[asyncio.Task] = set()
+        visited: set[str] = set()
+
+        def schedule(url: str, depth: int, base_url: str) -> None:
+            if url in visited:
+                return
+            visited.add(url)
+            task = asyncio.create_task(run(url, depth, base_url))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+
+        async def run(url: str, depth: int, base_url: str) -> None:
+            try:
+                page, links = await self._visit(client, global_semaphore, url, depth)
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Failed to fetch {url}: {e}")
+                await results.put((None, None if self.continue_on_failure else e))
+                return
+            if depth + 1 < self.max_depth:
+                for child in self._child_urls(url, base_url, links):
+                    schedule(child, depth + 1, base_url)
+            await results.put((page, None))
+
+        try:
+            for url in urls:
+                schedule(url, 0, url)
+            # Every task queues exactly one result, after scheduling its children, so the crawl is
+            # finished once there is a result for every visited URL.
+            completed = 0
+            while completed < len(visited):
+                page, error = await results.get()
+                completed += 1
+                if error is not None:
+                    raise error
+                if page is not None:
+                    yield page
+        finally:
+            for task in pending:
+                task.cancel()
+            if self._client is None:
+                await client.aclose()
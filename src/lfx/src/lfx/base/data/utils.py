@@ -6,16 +6,19 @@ from concurrent import futures
 from io import BytesIO
 from pathlib import Path
 
+import anyio
 import chardet
 import orjson
 import yaml
 from defusedxml import ElementTree
-from pypdf import PdfReader
 
+from lfx.base.data.parse_cache import get_parse_cache, hash_bytes
+from lfx.base.data.pdf_extract import parse_pdf_bytes, parse_pdf_file
 from lfx.base.data.storage_utils import read_file_bytes
 from lfx.schema.data import Data
 from lfx.services.deps import get_settings_service
 from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import run_in_executor
 
 # Types of files that can be read simply by file.read()
 # and have 100% to be completely readable
@@ -143,6 +146,31 @@ def partition_file_to_data(file_path: str, *, silent_errors: bool) -> Data | Non
     return Data(text=text, data=metadata)
 
 
+# Encoding detection only looks at the start of the file; chardet's cost grows with the input size.
+ENCODING_SAMPLE_SIZE = 64 * 1024
+
+
+def _detect_encoding(raw_data: bytes) -> str | None:
+    encoding = chardet.detect(raw_data[:ENCODING_SAMPLE_SIZE])["encoding"]
+    # ASCII in the sample says nothing about the rest of the file, and UTF-8 is a superset of it.
+    if encoding in {"Windows-1252", "Windows-1254", "MacRoman", "ascii"}:
+        encoding = "utf-8"
+    return encoding
+
+
+def decode_text(raw_data: bytes) -> str:
+    """Decode file bytes, detecting the encoding from a sample and falling back to the whole file."""
+    try:
+        return raw_data.decode(_detect_encoding(raw_data) or "utf-8")
+    except UnicodeDecodeError:
+        if len(raw_data) <= ENCODING_SAMPLE_SIZE:
+            raise
+    encoding = chardet.detect(raw_data)["encoding"]
+    if encoding in {"Windows-1252", "Windows-1254", "MacRoman"}:
+        encoding = "utf-8"
+    return raw_data.decode(encoding or "utf-8")
+
+
 def read_text_file(file_path: str) -> str:
     """Read a text file with automatic encoding detection.
 
@@ -152,15 +180,7 @@ def read_text_file(file_path: str) -> str:
     Returns:
         str: The file content as text
     """
-    file_path_ = Path(file_path)
-    raw_data = file_path_.read_bytes()
-    result = chardet.detect(raw_data)
-    encoding = result["encoding"]
-
-    if encoding in {"Windows-1252", "Windows-1254", "MacRoman"}:
-        encoding = "utf-8"
-
-    return file_path_.read_text(encoding=encoding)
+    return decode_text(Path(file_path).read_bytes())
 
 
 async def read_text_file_async(file_path: str) -> str:
@@ -177,14 +197,8 @@ async def read_text_file_async(file_path: str) -> str:
     # Use storage-aware read to get bytes
     raw_data = await read_file_bytes(file_path)
 
-    # Auto-detect encoding
-    result = chardet.detect(raw_data)
-    encoding = result.get("encoding")
-
-    # If encoding detection fails (e.g., binary file), default to utf-8
-    if not encoding or encoding in {"Windows-1252", "Windows-1254", "MacRoman"}:
-        encoding = "utf-8"
-
+    # Auto-detect encoding. If detection fails (e.g., binary file), default to utf-8
+    encoding = _detect_encoding(raw_data) or "utf-8"
     return raw_data.decode(encoding, errors="replace")
 
 
@@ -248,16 +262,15 @@ async def read_docx_file_async(file_path: str) -> str:
 
 
 def parse_pdf_to_text(file_path: str) -> str:
-    from pypdf import PdfReader
-
-    with Path(file_path).open("rb") as f, PdfReader(f) as reader:
-        return "\n\n".join([page.extract_text() for page in reader.pages])
+    """Extract text from a local PDF. Large documents are split across the process pool by page."""
+    return parse_pdf_file(file_path)
 
 
 async def parse_pdf_to_text_async(file_path: str) -> str:
     """Parse a PDF file to extract text (async, storage-aware).
 
-    Uses storage-aware file reading to support both local and S3 storage.
+    Uses storage-aware file reading to support both local and S3 storage. Extraction runs off the event
+    loop; local files are memory-mapped by the extraction workers instead of being read into memory.
 
     Args:
         file_path: Path to the PDF file (S3 key format "flow_id/filename" or local path)
@@ -265,9 +278,11 @@ async def parse_pdf_to_text_async(file_path: str) -> str:
     Returns:
         str: Extracted text from all pages
     """
+    settings = get_settings_service().settings
+    if settings.storage_type == "local" and await anyio.Path(file_path).is_file():
+        return await run_in_executor("io", parse_pdf_file, file_path)
     content = await read_file_bytes(file_path)
-    with BytesIO(content) as f, PdfReader(f) as reader:
-        return "\n\n".join([page.extract_text() for page in reader.pages])
+    return await run_in_executor("io", parse_pdf_bytes, content)
 
 
 def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | None:
@@ -284,14 +299,13 @@ def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | No
         return run_until_complete(parse_text_file_to_data_async(file_path, silent_errors=silent_errors))
 
     try:
-        if file_path.endswith(".pdf"):
-            text = parse_pdf_to_text(file_path)
-        elif file_path.endswith(".docx"):
-            text = read_docx_file(file_path)
+        cache = get_parse_cache()
+        if cache is None:
+            text = _parse_local_file(file_path)
         else:
-            text = read_text_file(file_path)
-
-        text = parse_structured_text(text, file_path)
+            content = Path(file_path).read_bytes()
+            key = cache.make_key(hash_bytes(content), "text_file", _parse_options(file_path))
+            text = cache.get_or_parse(key, lambda: _parse_file_content(content, file_path))
     except Exception as e:
         if not silent_errors:
             msg = f"Error loading file {file_path}: {e}"
@@ -301,25 +315,65 @@ def parse_text_file_to_data(file_path: str, *, silent_errors: bool) -> Data | No
     return Data(data={"file_path": file_path, "text": text})
 
 
+def _parse_options(file_path: str) -> dict:
+    # The extension picks both the parser and how parse_structured_text treats the result.
+    return {"suffix": Path(file_path).suffix.lower()}
+
+
+def _parse_local_file(file_path: str) -> str | dict | list:
+    if file_path.endswith(".pdf"):
+        text = parse_pdf_to_text(file_path)
+    elif file_path.endswith(".docx"):
+        text = read_docx_file(file_path)
+    else:
+        text = read_text_file(file_path)
+    return parse_structured_text(text, file_path)
+
+
+def _parse_file_content(content: bytes, file_path: str) -> str | dict | list:
+    # Both the sync and the async path parse through here when the cache is on, so an entry never depends on
+    # which of them wrote it.
+    if file_path.endswith(".pdf"):
+        text = parse_pdf_bytes(content)
+    elif file_path.endswith(".docx"):
+        from docx import Document
+
+        doc = Document(BytesIO(content))
+        text = "\n\n".join([p.text for p in doc.paragraphs])
+    else:
+        text = decode_text(content)
+    return parse_structured_text(text, file_path)
+
+
 async def parse_text_file_to_data_async(file_path: str, *, silent_errors: bool) -> Data | None:
     """Parse a text file to Data (async version, supports storage service).
 
     This version properly handles storage service files:
     - For text/JSON/YAML/XML: reads bytes directly (no temp file)
-    - For PDF: reads bytes directly via BytesIO (no temp file)
+    - For PDF: extracts pages in parallel from the local file, or from a temp copy of the bytes
     - For DOCX: downloads to temp file (python-docx requires file path)
     """
     try:
-        if file_path.endswith(".pdf"):
-            text = await parse_pdf_to_text_async(file_path)
-        elif file_path.endswith(".docx"):
-            text = await read_docx_file_async(file_path)
+        cache = get_parse_cache()
+        if cache is None:
+            if file_path.endswith(".pdf"):
+                text = await parse_pdf_to_text_async(file_path)
+            elif file_path.endswith(".docx"):
+                text = await read_docx_file_async(file_path)
+            else:
+                # Text files - read directly, no temp file needed
+                text = await read_text_file_async(file_path)
+
+            # Parse structured formats (JSON, YAML, XML)
+            text = parse_structured_text(text, file_path)
         else:
-            # Text files - read directly, no temp file needed
-            text = await read_text_file_async(file_path)
-
-        # Parse structured formats (JSON, YAML, XML)
-        text = parse_structured_text(text, file_path)
+            # Fetch the bytes once: they are both the cache key and, on a miss, the parser input.
+            content = await read_file_bytes(file_path)
+            key = cache.make_key(hash_bytes(content), "text_file", _parse_options(file_path))
+            text = await run_in_executor("io", cache.get, key)
+            if text is None:
+                text = await run_in_executor("cpu", _parse_file_content, content, file_path)
+                await run_in_executor("io", cache.set, key, text)
 
         return Data(data={"file_path": file_path, "text": text})
 
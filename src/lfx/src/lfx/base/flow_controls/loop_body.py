@@ -0,0 +1,244 @@
+"""Run the body of a Loop component once per item, concurrently.
+
+In its default mode the Loop component emits one item per pass through the cyclic scheduler, so every item waits
+for the previous one to travel around the whole cycle. ``LoopBody`` instead extracts the vertices that sit between
+the loop's item output and its feedback input, and runs that sub-graph in a fresh, isolated ``Graph`` for each item.
+Values flowing into the body from outside the loop (a language model, a prompt, ...) are resolved once in the parent
+graph and injected into every per-item graph, and component classes are reused from the parent graph rather than
+compiled again for every item.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from collections import defaultdict, deque
+from typing import TYPE_CHECKING, Any
+
+from lfx.graph.graph.base import Graph
+from lfx.interface.initialize.loading import get_params
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from lfx.custom.custom_component.component import Component
+    from lfx.events.event_manager import EventManager
+    from lfx.graph.edge.base import CycleEdge
+    from lfx.graph.vertex.base import Vertex
+
+
+class LoopBodyGraph(Graph):
+    """A per-item copy of a loop body that instantiates components from already compiled classes."""
+
+    def __init__(self, *args, component_classes: dict[str, type[Component]] | None = None, **kwargs) -> None:
+        self.component_classes = component_classes or {}
+        super().__init__(*args, **kwargs)
+
+    def _instantiate_components_in_vertices(self) -> None:
+        for vertex in self.vertices:
+            component_class = self.component_classes.get(vertex.id)
+            if component_class is None:
+                vertex.instantiate_component(self.user_id)
+                continue
+            custom_params = get_params(vertex.params)
+            custom_params.pop("code", None)
+            vertex.custom_component = component_class(
+                _user_id=self.user_id,
+                _parameters=custom_params,
+                _vertex=vertex,
+                _tracing_service=None,
+                _id=vertex.id,
+            )
+
+    @property
+    def tracing_service(self):
+        # Items are traced as part of the parent run, not as hundreds of runs of their own.
+        return None
+
+    async def run_body(self, *, fallback_to_env_vars: bool = False, event_manager: EventManager | None = None) -> None:
+        """Build every vertex layer by layer, without the run cache used by the parent graph."""
+        to_process = deque(self.sort_vertices())
+        lock = asyncio.Lock()
+        while to_process:
+            tasks = [
+                asyncio.create_task(
+                    self.build_vertex(
+                        vertex_id=vertex_id,
+                        user_id=self.user_id,
+                        inputs_dict={},
+                        fallback_to_env_vars=fallback_to_env_vars,
+                        event_manager=event_manager,
+                    ),
+                    name=f"{vertex_id} Run 0",
+                )
+                for vertex_id in to_process
+            ]
+            to_process.clear()
+            to_process.extend(await self._execute_tasks(tasks, lock=lock))
+
+
+def _reachable(start: list[str], neighbours: dict[str, list[str]], stop: str) -> set[str]:
+    seen: set[str] = set()
+    queue = deque(vertex_id for vertex_id in start if vertex_id != stop)
+    while queue:
+        vertex_id = queue.popleft()
+        if vertex_id in seen:
+            continue
+        seen.add(vertex_id)
+        queue.extend(child for child in neighbours.get(vertex_id, []) if child != stop and child not in seen)
+    return seen
+
+
+class LoopBody:
+    """The vertices of ``graph`` on a path from a loop's item output back to its feedback input.
+
+    Vertices that hang off the item output without leading back to the loop are not part of the body and do not
+    run in parallel mode.
+    """
+
+    def __init__(self, graph: Graph, loop_vertex_id: str, item_output: str = "item") -> None:
+        self.graph = graph
+        self.loop_vertex_id = loop_vertex_id
+        loop_vertex = graph.get_vertex(loop_vertex_id)
+
+        feedback = next((edge for edge in loop_vertex.incoming_edges if edge.target_param == item_output), None)
+        if feedback is None:
+            msg = f"Nothing is connected back to the '{item_output}' input of {loop_vertex.display_name}."
+            raise ValueError(msg)
+        self.result_vertex_id = feedback.source_id
+        self.result_output = feedback.source_handle.name
+
+        item_edges = [
+            edge
+            for edge in loop_vertex.outgoing_edges
+            if edge.source_handle is not None and edge.source_handle.name == item_output
+        ]
+        downstream = _reachable([edge.target_id for edge in item_edges], graph.successor_map, loop_vertex_id)
+        upstream = _reachable([self.result_vertex_id], graph.predecessor_map, loop_vertex_id)
+        self.vertex_ids = [vertex.id for vertex in graph.vertices if vertex.id in downstream & upstream]
+        body = set(self.vertex_ids)
+
+        self.item_targets = [(edge.target_id, edge.target_param) for edge in item_edges if edge.target_id in body]
+        self.external_edges: list[CycleEdge] = []
+        self.edges: list[dict] = []
+        for edge in graph.edges:
+            if edge.target_id not in body:
+                continue
+            if edge.source_id in body:
+                self.edges.append(edge.to_data())
+            elif edge.source_id != loop_vertex_id:
+                self.external_edges.append(edge)
+
+        self.nodes = [graph.get_vertex(vertex_id).full_data for vertex_id in self.vertex_ids]
+        self.component_classes = {
+            vertex_id: type(graph.get_vertex(vertex_id).custom_component)
+            for vertex_id in self.vertex_ids
+            if graph.get_vertex(vertex_id).custom_component is not None
+        }
+        self._external_values: dict[str, dict[str, list[Any]]] | None = None
+
+    async def resolve_external_inputs(self, event_manager: EventManager | None = None) -> None:
+        """Build (if needed) every vertex outside the loop that feeds the body, once for all items."""
+        values: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+        for edge in self.external_edges:
+            source = self.graph.get_vertex(edge.source_id)
+            target = self.graph.get_vertex(edge.target_id)
+            if not source.built:
+                await source.build(user_id=self.graph.user_id, event_manager=event_manager)
+            value = await source.get_result(target, target_handle_name=edge.target_param)
+            values[edge.target_id][edge.target_param].append(value)
+        self._external_values = values
+
+    def _create_graph(self) -> LoopBodyGraph:
+        graph = LoopBodyGraph(
+            flow_id=self.graph.flow_id,
+            flow_name=self.graph.flow_name,
+            user_id=self.graph.user_id,
+            context=dict(self.graph.context),
+            component_classes=self.component_classes,
+        )
+        graph.add_nodes_and_edges(copy.deepcopy(self.nodes), copy.deepcopy(self.edges))
+        if self.graph.session_id:
+            graph.session_id = self.graph.session_id
+        return graph
+
+    @staticmethod
+    def _set_inputs(vertex: Vertex, inputs: dict[str, list[Any]]) -> None:
+        template = vertex.data["node"]["template"]
+        params: dict[str, Any] = {}
+        for name, values in inputs.items():
+            if isinstance(template.get(name), dict) and template[name].get("list"):
+                params[name] = [item for value in values for item in (value if isinstance(value, list) else [value])]
+            else:
+                params[name] = values[-1]
+        vertex.update_raw_params(params, overwrite=True)
+
+    async def run(
+        self,
+        item: Any,
+        *,
+        fallback_to_env_vars: bool = False,
+        event_manager: EventManager | None = None,
+    ) -> Any:
+        """Run the body for a single item and return what it feeds back into the loop."""
+        if self._external_values is None:
+            await self.resolve_external_inputs(event_manager)
+        graph = self._create_graph()
+        inputs: dict[str, dict[str, list[Any]]] = defaultdict(lambda: defaultdict(list))
+        for vertex_id, params in (self._external_values or {}).items():
+            for name, values in params.items():
+                inputs[vertex_id][name].extend(values)
+        for vertex_id, name in self.item_targets:
+            inputs[vertex_id][name].append(item)
+        for vertex_id, params in inputs.items():
+            self._set_inputs(graph.get_vertex(vertex_id), params)
+
+        await graph.run_body(fallback_to_env_vars=fallback_to_env_vars, event_manager=event_manager)
+        result_vertex = graph.get_vertex(self.result_vertex_id)
+        if not result_vertex.built:
+            return None
+        return result_vertex.results.get(self.result_output)
+
+    async def map(
+        self,
+        items: Sequence[Any],
+        *,
+        max_concurrency: int,
+        fail_fast: bool = True,
+        on_progress: Callable[[int, int, int], None] | None = None,
+        event_manager: EventManager | None = None,
+    ) -> list[Any]:
+        """Run the body for every item with at most ``max_concurrency`` items in flight.
+
+        Results are returned in input order. With ``fail_fast`` the first error cancels the remaining items and is
+        raised; otherwise the exception takes the place of the item's result, as with
+        ``asyncio.gather(return_exceptions=True)``. ``on_progress`` receives ``(completed, total, failed)``.
+        """
+        await self.resolve_external_inputs(event_manager)
+        results: list[Any] = [None] * len(items)
+        pending = iter(range(len(items)))
+        completed = failed = 0
+
+        async def worker() -> None:
+            nonlocal completed, failed
+            for index in pending:
+                try:
+                    results[index] = await self.run(items[index], event_manager=event_manager)
+                except Exception as exc:
+                    if fail_fast:
+                        raise
+                    results[index] = exc
+                    failed += 1
+                completed += 1
+                if on_progress is not None:
+                    on_progress(completed, len(items), failed)
+
+        workers = [asyncio.create_task(worker()) for _ in range(max(1, min(max_concurrency, len(items))))]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+        return results
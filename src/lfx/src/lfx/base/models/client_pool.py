@@ -0,0 +1,172 @@
+"""Process-wide pool of instantiated language model clients.
+
+Building a chat model (``ChatOpenAI``, ``ChatAnthropic`` ...) creates a new SDK client and HTTP connection
+pool each time, so a flow that builds the same model on every run pays connection setup on every call.
+``get_llm`` borrows instances from this pool instead. Entries are keyed by the model class and every
+constructor argument except the per-call settings (``temperature`` and ``streaming``); credentials only
+appear in the key as a SHA-256 digest, so a rotated API key gets a fresh client while the stale one ages
+out. Instances are also kept per event loop, because the async HTTP clients inside an SDK client cannot be
+shared between loops. Per-call settings are applied to a copy of the pooled instance that is validated again
+(so model validators see the new values) and shares the underlying SDK clients, leaving the pooled instance
+untouched.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel
+
+from lfx.log.logger import logger
+
+DEFAULT_MAX_SIZE = 32
+DEFAULT_TTL_SECONDS = 3600.0
+PER_CALL_PARAMS = frozenset({"temperature", "streaming"})
+
+
+def _fingerprint(value: Any) -> Any:
+    """Return a hashable stand-in for a constructor argument."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _fingerprint(item)) for key, item in value.items()))
+    if isinstance(value, list | tuple | set):
+        return tuple(_fingerprint(item) for item in value)
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+def _credential_digest(value: Any) -> str:
+    if hasattr(value, "get_secret_value"):
+        value = value.get_secret_value()
+    return hashlib.sha256(str(value).encode()).hexdigest()
+
+
+class LLMClientPool:
+    """LRU pool of model instances with a time-to-live.
+
+    A ``max_size`` of ``0`` disables pooling and every call constructs a new instance.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE, ttl_seconds: float = DEFAULT_TTL_SECONDS) -> None:
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        # Instances built outside an event loop, and those built on each running loop
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        self._loop_entries: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, OrderedDict[tuple, tuple[float, Any]]
+        ] = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(model_class: type, kwargs: dict[str, Any], credential_params: set[str]) -> tuple:
+        """Build the pool key for ``model_class(**kwargs)`` without keeping raw credentials."""
+        items = []
+        for name, value in sorted(kwargs.items()):
+            if name in PER_CALL_PARAMS:
+                continue
+            if name in credential_params and value is not None:
+                items.append((name, _credential_digest(value)))
+            else:
+                items.append((name, _fingerprint(value)))
+        return (model_class, tuple(items))
+
+    def _current_entries(self) -> OrderedDict[tuple, tuple[float, Any]]:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return self._entries
+        return self._loop_entries.setdefault(loop, OrderedDict())
+
+    def get(self, model_class: type, kwargs: dict[str, Any], credential_params: set[str] | None = None) -> Any:
+        """Return an instance equivalent to ``model_class(**kwargs)``, reusing a pooled client when possible."""
+        # Only Pydantic models (every LangChain chat model) can be copied cheaply with new per-call settings.
+        if self.max_size <= 0 or not (isinstance(model_class, type) and issubclass(model_class, BaseModel)):
+            return model_class(**kwargs)
+
+        key = self.make_key(model_class, kwargs, credential_params or set())
+        now = time.monotonic()
+        with self._lock:
+            entries = self._current_entries()
+            entry = entries.get(key)
+            if entry is not None and now - entry[0] > self.ttl_seconds:
+                del entries[key]
+                entry = None
+            if entry is not None:
+                entries.move_to_end(key)
+                self.hits += 1
+                base = entry[1]
+
+        if entry is None:
+            base = model_class(**kwargs)
+            with self._lock:
+                self.misses += 1
+                entries[key] = (now, base)
+                entries.move_to_end(key)
+                while len(entries) > self.max_size:
+                    entries.popitem(last=False)
+
+        return self._apply_per_call_params(base, kwargs)
+
+    @staticmethod
+    def _apply_per_call_params(base: Any, kwargs: dict[str, Any]) -> Any:
+        fields = type(base).model_fields
+        # Always hand out a copy so callers can never mutate the pooled instance. Validating the copy runs the
+        # model's validators on the per-call values; the SDK clients stored in its fields are passed through.
+        values = {field.alias or name: getattr(base, name) for name, field in fields.items()}
+        values.update(
+            {fields[name].alias or name: kwargs[name] for name in PER_CALL_PARAMS & kwargs.keys() & fields.keys()}
+        )
+        try:
+            copy = type(base).model_validate(values)
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Could not copy pooled {type(base).__name__}, creating a new instance: {e}")
+            return type(base)(**kwargs)
+        # Clients cached outside the fields (``cached_property``) are shared too.
+        for name, value in base.__dict__.items():
+            copy.__dict__.setdefault(name, value)
+        return copy
+
+    def invalidate(self) -> None:
+        """Drop every pooled instance."""
+        with self._lock:
+            self._entries.clear()
+            self._loop_entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            size = len(self._entries) + sum(len(entries) for entries in self._loop_entries.values())
+            return {"size": size, "hits": self.hits, "misses": self.misses}
+
+
+_pool: LLMClientPool | None = None
+_pool_lock = threading.Lock()
+
+
+def get_llm_client_pool() -> LLMClientPool:
+    """Return the process-wide pool, sized from the ``llm_client_pool_*`` settings."""
+    global _pool  # noqa: PLW0603
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                max_size, ttl_seconds = DEFAULT_MAX_SIZE, DEFAULT_TTL_SECONDS
+                try:
+                    from lfx.services.deps import get_settings_service
+
+                    settings_service = get_settings_service()
+                    if settings_service:
+                        max_size = settings_service.settings.llm_client_pool_size
+                        ttl_seconds = settings_service.settings.llm_client_pool_ttl
+                except Exception as e:  # noqa: BLE001
+                    logger.debug(f"Using default LLM client pool settings: {e}")
+                _pool = LLMClientPool(max_size=max_size, ttl_seconds=ttl_seconds)
+    return _pool
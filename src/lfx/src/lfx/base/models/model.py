@@ -1,17 +1,20 @@
 import importlib
 import json
+import time
 import warnings
 from abc import abstractmethod
 
-from langchain_core.language_models import BaseChatModel
+from langchain_core.language_models import BaseChatModel, BaseLanguageModel
 from langchain_core.language_models.llms import LLM
 from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, SystemMessage
 from langchain_core.output_parsers import BaseOutputParser
 
 from lfx.base.constants import STREAM_INFO_TEXT
+from lfx.base.models.response_cache import content_text, get_llm_response_cache
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing import LanguageModel
 from lfx.inputs.inputs import BoolInput, InputTypes, MessageInput, MultilineInput
+from lfx.log.logger import logger
 from lfx.schema.message import Message
 from lfx.template.field.base import Output
 from lfx.utils.constants import MESSAGE_SENDER_AI
@@ -47,6 +50,14 @@ class LCModelComponent(Component):
             advanced=False,
         ),
         BoolInput(name="stream", display_name="Stream", info=STREAM_INFO_TEXT, advanced=True),
+        BoolInput(
+            name="cache_response",
+            display_name="Cache Responses",
+            info="Reuse the previous answer when the model is sent exactly the same messages with the same settings "
+            "within this flow. Can also be enabled for a whole flow with the 'llm_response_cache' run context key.",
+            value=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -210,6 +221,8 @@ class LCModelComponent(Component):
             ValueError: If the input message is empty or if there's an error during model invocation
         """
         messages: list[BaseMessage] = []
+        model = runnable
+        prompt = None
         if not input_value and not system_message:
             msg = "The message you want to send to the model is empty."
             raise ValueError(msg)
@@ -242,6 +255,10 @@ class LCModelComponent(Component):
             if hasattr(self, "output_parser") and self.output_parser is not None:
                 runnable |= self.output_parser
 
+            cache_key = await self._get_response_cache_key(model, messages, prompt)
+            if cache_key is not None and (cached := await get_llm_response_cache().get(cache_key)) is not None:
+                return await self._replay_cached_response(cached, stream=stream)
+
             runnable = runnable.with_config(
                 {
                     "run_name": self.display_name,
@@ -249,11 +266,17 @@ class LCModelComponent(Component):
                     "callbacks": self.get_langchain_callbacks(),
                 }
             )
+            started = time.perf_counter()
+            chunks: list[str] = []
             if stream:
-                lf_message, result = await self._handle_stream(runnable, inputs)
+                lf_message, result = await self._handle_stream(runnable, inputs, chunks=chunks)
             else:
                 message = await runnable.ainvoke(inputs)
                 result = message.content if hasattr(message, "content") else message
+            if cache_key is not None and isinstance(result, str) and result:
+                await get_llm_response_cache().set(
+                    cache_key, result, chunks=chunks or None, latency=time.perf_counter() - started
+                )
             if isinstance(message, AIMessage):
                 status_message = self.build_status_message(message)
                 self.status = status_message
@@ -268,40 +291,85 @@ class LCModelComponent(Component):
             raise
         return lf_message or Message(text=result)
 
-    async def _handle_stream(self, runnable, inputs):
+    async def _handle_stream(self, runnable, inputs, chunks: list[str] | None = None):
         """Handle streaming responses from the language model.
 
         Args:
             runnable: The language model configured for streaming
             inputs: The inputs to send to the model
+            chunks: If given, the text of every streamed chunk is appended to it
 
         Returns:
             tuple: (Message object if connected to chat output, model result)
         """
         lf_message = None
         if self.is_connected_to_chat_output():
-            # Add a Message
-            if hasattr(self, "graph"):
-                session_id = self.graph.session_id
-            elif hasattr(self, "_session_id"):
-                session_id = self._session_id
-            else:
-                session_id = None
-            model_message = Message(
-                text=runnable.astream(inputs),
-                sender=MESSAGE_SENDER_AI,
-                sender_name="AI",
-                properties={"icon": self.icon, "state": "partial"},
-                session_id=session_id,
-            )
-            model_message.properties.source = self._build_source(self._id, self.display_name, self)
-            lf_message = await self.send_message(model_message)
+            stream = runnable.astream(inputs)
+            if chunks is not None:
+                stream = self._record_chunks(stream, chunks)
+            lf_message = await self._send_streamed_message(stream)
             result = lf_message.text or ""
         else:
             message = await runnable.ainvoke(inputs)
             result = message.content if hasattr(message, "content") else message
         return lf_message, result
 
+    async def _send_streamed_message(self, stream) -> Message:
+        # Add a Message
+        if hasattr(self, "graph"):
+            session_id = self.graph.session_id
+        elif hasattr(self, "_session_id"):
+            session_id = self._session_id
+        else:
+            session_id = None
+        model_message = Message(
+            text=stream,
+            sender=MESSAGE_SENDER_AI,
+            sender_name="AI",
+            properties={"icon": self.icon, "state": "partial"},
+            session_id=session_id,
+        )
+        model_message.properties.source = self._build_source(self._id, self.display_name, self)
+        return await self.send_message(model_message)
+
+    @staticmethod
+    async def _record_chunks(stream, chunks: list[str]):
+        async for chunk in stream:
+            text = content_text(chunk.content if hasattr(chunk, "content") else chunk)
+            if text:
+                chunks.append(text)
+            yield chunk
+
+    async def _get_response_cache_key(self, model, messages: list[BaseMessage], prompt=None) -> str | None:
+        """Return the response cache key for this call, or None when the response cache does not apply."""
+        graph = self.graph if self._vertex is not None else None
+        enabled = getattr(self, "cache_response", False) or bool(graph and graph.context.get("llm_response_cache"))
+        # Bound tools and output parsers change what a call returns, so only plain model calls are cached.
+        if not enabled or not isinstance(model, BaseLanguageModel):
+            return None
+        if getattr(self, "output_parser", None) is not None:
+            return None
+        if prompt is not None:
+            try:
+                messages = prompt.format_messages()
+            except Exception as e:  # noqa: BLE001
+                logger.debug(f"Not caching the response of {self.display_name}: {e}")
+                return None
+        if not messages:
+            return None
+        # Answers are never shared between users, and the credentials are part of the key as well
+        user_id = getattr(self, "_user_id", None) or (graph.user_id if graph else None)
+        return await get_llm_response_cache().make_key(
+            graph.flow_id if graph else None, model, messages, user_id=str(user_id) if user_id else None
+        )
+
+    async def _replay_cached_response(self, cached: dict, *, stream: bool) -> Message:
+        """Return a cached answer, streaming its recorded chunks to the chat when the call would have streamed."""
+        self.status = cached["text"]
+        if stream and self.is_connected_to_chat_output():
+            return await self._send_streamed_message(get_llm_response_cache().replay(cached))
+        return Message(text=cached["text"])
+
     @abstractmethod
     def build_model(self) -> LanguageModel:  # type: ignore[type-var]
         """Implement this method to build the model."""
@@ -0,0 +1,334 @@
+"""Exact-match response cache for language model components.
+
+``set_langchain_cache`` installs one process-wide LangChain cache that every model shares, that cannot be
+scoped to a flow and that is skipped entirely by ``astream``. This cache sits in front of the model call in
+``LCModelComponent`` instead. Entries are keyed by the flow, the user running it, the model's credentials,
+the model's LangChain ``llm_string`` (class and every parameter that affects the answer) and the normalized
+prompt, so an answer is only reused for the same user and model configuration asked the same thing. Each entry
+keeps the streamed chunks next to the full text, so a cached answer can be replayed to the playground token by
+token.
+
+Entries live either in an in-process LRU (``"memory"``) or in the configured cache service (``"service"``:
+memory, disk or Redis), and expire after a TTL in both cases. With ``"service"``, invalidation is recorded in
+the cache service too, so it reaches every worker. Hits, misses and the model latency saved by hits are
+counted and exposed through ``stats()``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Literal
+
+import orjson
+from langchain_core.messages import AIMessageChunk
+from pydantic import SecretStr
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Sequence
+
+    from langchain_core.language_models import BaseLanguageModel
+    from langchain_core.messages import BaseMessage
+
+CACHE_VERSION = 2
+KEY_PREFIX = "llm_response:"
+GENERATION_KEY = KEY_PREFIX + "generation"
+DEFAULT_TTL_SECONDS = 3600.0
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_ENTRY_SIZE = 1024 * 1024
+
+
+def normalize_content(content: Any) -> Any:
+    """Normalize message content so whitespace-only differences map to the same key."""
+    if isinstance(content, str):
+        lines = content.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+        return "\n".join(line.rstrip() for line in lines).strip()
+    if isinstance(content, list):
+        return [normalize_content(part) for part in content]
+    if isinstance(content, dict):
+        return {key: normalize_content(value) for key, value in content.items()}
+    return content
+
+
+def content_text(content: Any) -> str:
+    """Return the text of message content, which is either a string or a list of content blocks."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        parts = []
+        for part in content:
+            if isinstance(part, str):
+                parts.append(part)
+            elif isinstance(part, dict) and isinstance(part.get("text"), str):
+                parts.append(part["text"])
+        return "".join(parts)
+    return ""
+
+
+def credential_fingerprint(model: BaseLanguageModel) -> str:
+    """Hash the model's secrets (API keys, tokens), which ``llm_string`` leaves out or masks."""
+    secret_names = set(getattr(model, "lc_secrets", None) or {})
+    secrets = []
+    for name, value in sorted(vars(model).items()):
+        if name in secret_names or isinstance(value, SecretStr):
+            secret = value.get_secret_value() if isinstance(value, SecretStr) else value
+            secrets.append([name, str(secret)])
+    return hashlib.sha256(orjson.dumps(secrets)).hexdigest()
+
+
+def model_fingerprint(model: BaseLanguageModel) -> str:
+    """Describe the model class and every parameter that affects its output."""
+    get_llm_string = getattr(model, "_get_llm_string", None)
+    if callable(get_llm_string):
+        try:
+            return get_llm_string()
+        except Exception as e:  # noqa: BLE001
+            logger.debug(f"Could not serialize {type(model).__name__} for the response cache: {e}")
+    params = getattr(model, "_identifying_params", {}) or {}
+    return orjson.dumps(
+        [type(model).__module__, type(model).__qualname__, params],
+        option=orjson.OPT_SORT_KEYS,
+        default=repr,
+    ).decode()
+
+
+class LLMResponseCache:
+    """TTL-bounded cache of model answers, keyed per flow, user, credentials, model and prompt.
+
+    ``backend="memory"`` keeps at most ``max_entries`` answers in an LRU owned by this process;
+    ``backend="service"`` stores them in the cache service so they are shared by every worker, and each worker
+    deletes the oldest of the answers it stored once it has stored more than ``max_entries``. Answers larger
+    than ``max_entry_size`` bytes are never stored.
+    """
+
+    def __init__(
+        self,
+        backend: Literal["memory", "service"] = "memory",
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_entry_size: int = DEFAULT_MAX_ENTRY_SIZE,
+    ) -> None:
+        if backend not in {"memory", "service"}:
+            msg = f"Unknown LLM response cache backend: {backend}"
+            raise ValueError(msg)
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.max_entry_size = max_entry_size
+        self._entries: OrderedDict[str, tuple[str, dict[str, Any]]] = OrderedDict()
+        # Keys this worker stored in the cache service, oldest first
+        self._service_keys: OrderedDict[str, None] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.saved_latency = 0.0
+
+    async def make_key(
+        self,
+        flow_id: str | None,
+        model: BaseLanguageModel,
+        messages: Sequence[BaseMessage],
+        *,
+        user_id: str | None = None,
+    ) -> str:
+        """Return the cache key for ``user_id`` sending ``messages`` to ``model`` within ``flow_id``."""
+        scope = str(flow_id or "")
+        payload = [
+            CACHE_VERSION,
+            scope,
+            str(user_id or ""),
+            await self._generations(scope),
+            credential_fingerprint(model),
+            model_fingerprint(model),
+            [
+                [message.type, getattr(message, "name", None), normalize_content(message.content)]
+                for message in messages
+            ],
+        ]
+        digest = hashlib.sha256(orjson.dumps(payload, option=orjson.OPT_SORT_KEYS, default=repr)).hexdigest()
+        return f"{scope}:{digest}"
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached entry for ``key``, or ``None`` on a miss or an expired entry."""
+        entry = await self._read(key)
+        if isinstance(entry, dict) and entry.get("expires_at", 0) < time.time():
+            await self._delete(key)
+            entry = None
+        with self._lock:
+            if not isinstance(entry, dict):
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.saved_latency += float(entry.get("latency", 0.0))
+        return entry
+
+    async def set(self, key: str, text: str, *, chunks: list[str] | None = None, latency: float = 0.0) -> bool:
+        """Store an answer; returns ``False`` when it is too large to cache."""
+        chunks = chunks or [text]
+        if len(text.encode()) > self.max_entry_size:
+            return False
+        now = time.time()
+        entry = {
+            "text": text,
+            "chunks": chunks,
+            "latency": latency,
+            "created_at": now,
+            "expires_at": now + self.ttl_seconds,
+        }
+        await self._write(key, entry)
+        with self._lock:
+            self.stores += 1
+        return True
+
+    async def replay(self, entry: dict[str, Any]) -> AsyncIterator[AIMessageChunk]:
+        """Yield the chunks of a cached answer in the order they were originally streamed."""
+        for chunk in entry.get("chunks") or [entry["text"]]:
+            yield AIMessageChunk(content=chunk)
+
+    async def invalidate(self, flow_id: str | None = None) -> None:
+        """Forget the cached answers of one flow, or of every flow.
+
+        With the ``"service"`` backend this starts a new generation in the cache service: every worker then
+        builds keys that no earlier answer was stored under, and the old answers expire.
+        """
+        scope = None if flow_id is None else str(flow_id)
+        if self.backend == "service":
+            cache_service = _get_cache_service()
+            if cache_service is not None:
+                key = GENERATION_KEY if scope is None else f"{GENERATION_KEY}:{scope}"
+                result = cache_service.set(key, uuid.uuid4().hex)
+                if inspect.isawaitable(result):
+                    await result
+        with self._lock:
+            if scope is None:
+                self._entries.clear()
+                self._service_keys.clear()
+                return
+            for key in [key for key, (entry_scope, _) in self._entries.items() if entry_scope == scope]:
+                del self._entries[key]
+
+    async def _generations(self, scope: str) -> list[Any]:
+        if self.backend == "memory":
+            return []
+        cache_service = _get_cache_service()
+        if cache_service is None:
+            return []
+        generations = []
+        for key in (GENERATION_KEY, f"{GENERATION_KEY}:{scope}"):
+            value = cache_service.get(key)
+            value = await value if inspect.isawaitable(value) else value
+            generations.append(value if isinstance(value, str) else None)
+        return generations
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "backend": self.backend,
+                "size": len(self._entries) if self.backend == "memory" else None,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "saved_latency_seconds": round(self.saved_latency, 3),
+            }
+
+    async def _read(self, key: str) -> Any:
+        if self.backend == "memory":
+            with self._lock:
+                item = self._entries.get(key)
+                if item is None:
+                    return None
+                self._entries.move_to_end(key)
+                return item[1]
+        cache_service = _get_cache_service()
+        if cache_service is None:
+            return None
+        value = cache_service.get(KEY_PREFIX + key)
+        value = await value if inspect.isawaitable(value) else value
+        if isinstance(value, dict):
+            with self._lock:
+                if key in self._service_keys:
+                    self._service_keys.move_to_end(key)
+        return value
+
+    async def _write(self, key: str, entry: dict[str, Any]) -> None:
+        if self.backend == "memory":
+            scope = key.rpartition(":")[0]
+            with self._lock:
+                self._entries[key] = (scope, entry)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+            return
+        cache_service = _get_cache_service()
+        if cache_service is None:
+            return
+        result = cache_service.set(KEY_PREFIX + key, entry)
+        if inspect.isawaitable(result):
+            await result
+        with self._lock:
+            self._service_keys[key] = None
+            self._service_keys.move_to_end(key)
+            evicted = []
+            while len(self._service_keys) > self.max_entries:
+                evicted.append(self._service_keys.popitem(last=False)[0])
+        for evicted_key in evicted:
+            await self._delete(evicted_key)
+
+    async def _delete(self, key: str) -> None:
+        if self.backend == "memory":
+            with self._lock:
+                self._entries.pop(key, None)
+            return
+        with self._lock:
+            self._service_keys.pop(key, None)
+        cache_service = _get_cache_service()
+        if cache_service is None:
+            return
+        result = cache_service.delete(KEY_PREFIX + key)
+        if inspect.isawaitable(result):
+            await result
+
+
+def _get_cache_service():
+    from lfx.services.deps import get_service
+    from lfx.services.schema import ServiceType
+
+    return get_service(ServiceType.CACHE_SERVICE)
+
+
+_cache: LLMResponseCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_llm_response_cache() -> LLMResponseCache:
+    """Return the process-wide response cache, configured from the ``llm_response_cache_*`` settings."""
+    global _cache  # noqa: PLW0603
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                kwargs: dict[str, Any] = {}
+                try:
+                    from lfx.services.deps import get_settings_service
+
+                    settings_service = get_settings_service()
+                    if settings_service:
+                        settings = settings_service.settings
+                        kwargs = {
+                            "backend": settings.llm_response_cache_backend,
+                            "ttl_seconds": settings.llm_response_cache_ttl,
+                            "max_entries": settings.llm_response_cache_max_entries,
+                            "max_entry_size": settings.llm_response_cache_max_entry_size,
+                        }
+                except Exception as e:  # noqa: BLE001
+                    logger.debug(f"Using default LLM response cache settings: {e}")
+                _cache = LLMResponseCache(**kwargs)
+    return _cache
@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 import contextlib
 
 from lfx.base.models.anthropic_constants import ANTHROPIC_MODELS_DETAILED
+from lfx.base.models.client_pool import get_llm_client_pool
 from lfx.base.models.google_generative_ai_constants import (
     GOOGLE_GENERATIVE_AI_MODELS_DETAILED,
 )
@@ -221,9 +222,13 @@ def get_unified_models_detailed(
     ]
 
 
-def get_api_key_for_provider(user_id: UUID | str | None, provider: str, api_key: str | None = None) -> str | None:
+async def aget_api_key_for_provider(
+    user_id: UUID | str | None, provider: str, api_key: str | None = None
+) -> str | None:
     """Get API key from self.api_key or global variables.
 
+    Async callers should use this instead of ``get_api_key_for_provider`` to avoid blocking the event loop.
+
     Args:
         user_id: The user ID to look up global variables for
         provider: The provider name (e.g., "OpenAI", "Anthropic")
@@ -253,19 +258,26 @@ def get_api_key_for_provider(user_id: UUID | str | None, provider: str, api_key:
         return None
 
     # Try to get from global variables
-    async def _get_variable():
-        async with session_scope() as session:
-            variable_service = get_variable_service()
-            if variable_service is None:
-                return None
-            return await variable_service.get_variable(
-                user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
-                name=variable_name,
-                field="",
-                session=session,
-            )
+    async with session_scope() as session:
+        variable_service = get_variable_service()
+        if variable_service is None:
+            return None
+        return await variable_service.get_variable(
+            user_id=UUID(user_id) if isinstance(user_id, str) else user_id,
+            name=variable_name,
+            field="",
+            session=session,
+        )
+
 
-    return run_until_complete(_get_variable())
+def get_api_key_for_provider(user_id: UUID | str | None, provider: str, api_key: str | None = None) -> str | None:
+    """Get API key from self.api_key or global variables (sync version of ``aget_api_key_for_provider``)."""
+    # Skip the sync-to-async bridge when there is nothing to look up.
+    if api_key:
+        return api_key
+    if user_id is None or (isinstance(user_id, str) and user_id == "None"):
+        return None
+    return run_until_complete(aget_api_key_for_provider(user_id, provider, api_key))
 
 
 def validate_model_provider_key(variable_name: str, api_key: str) -> None:
@@ -963,7 +975,8 @@ def get_llm(
         kwargs[base_url_param] = ollama_base_url
 
     try:
-        return model_class(**kwargs)
+        # Reuse a pooled client for identical configurations; temperature and streaming are applied per call.
+        return get_llm_client_pool().get(model_class, kwargs, credential_params={api_key_param})
     except Exception as e:
         # If instantiation fails and it's WatsonX, provide additional context
         if provider == "IBM WatsonX" and ("url" in str(e).lower() or "project" in str(e).lower()):
@@ -0,0 +1,112 @@
+"""Batched, streaming text splitting.
+
+``TextSplitter.split_documents`` needs every input ``Document`` up front and returns every chunk at once,
+so splitting a large corpus keeps the input rows, a ``Document`` per row and all of the chunks in memory
+together, and runs on a single core. ``iter_split_chunks`` takes ``(text, metadata)`` pairs lazily, groups
+them into batches of roughly ``batch_chars`` characters and yields chunks batch by batch, in input order.
+When more than one batch is needed and the shared ``"process"`` executor pool has more than one worker,
+batches are split in worker processes through a bounded window, like page shards in
+``lfx.base.data.pdf_extract``. Only the texts are sent to workers; metadata stays in the calling process
+and is attached to every chunk of its document.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from itertools import chain
+from typing import TYPE_CHECKING, Any
+
+from langchain_text_splitters import CharacterTextSplitter
+
+from lfx.utils.executors import get_executor
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
+
+    from langchain_text_splitters import TextSplitter
+
+    from lfx.schema.dataframe import DataFrame
+
+DEFAULT_BATCH_CHARS = 4 * 1024 * 1024
+
+
+def _split_texts(
+    splitter_class: type[TextSplitter], splitter_kwargs: dict[str, Any], texts: list[str]
+) -> list[list[str]]:
+    """Split every text of a batch. Runs in a worker process."""
+    splitter = splitter_class(**splitter_kwargs)
+    return [splitter.split_text(text) for text in texts]
+
+
+def _batches(documents: Iterable[tuple[str, dict]], batch_chars: int) -> Iterator[list[tuple[str, dict]]]:
+    batch: list[tuple[str, dict]] = []
+    size = 0
+    for document in documents:
+        batch.append(document)
+        size += len(document[0])
+        if size >= batch_chars:
+            yield batch
+            batch, size = [], 0
+    if batch:
+        yield batch
+
+
+def iter_dataframe_documents(
+    dataframe: DataFrame, text_key: str, default_value: str = ""
+) -> Iterator[tuple[str, dict]]:
+    """Yield ``(text, metadata)`` for each row, like ``DataFrame.to_lc_documents`` but one row at a time."""
+    columns = list(dataframe.columns)
+    for values in dataframe.itertuples(index=False, name=None):
+        metadata = dict(zip(columns, values, strict=True))
+        text = metadata.pop(text_key, default_value)
+        yield (text if isinstance(text, str) else str(text)), metadata
+
+
+def iter_split_chunks(
+    documents: Iterable[tuple[str, dict]],
+    splitter_kwargs: dict[str, Any],
+    *,
+    splitter_class: type[TextSplitter] = CharacterTextSplitter,
+    batch_chars: int = DEFAULT_BATCH_CHARS,
+    parallel: bool = True,
+) -> Iterator[tuple[str, dict]]:
+    """Yield ``(chunk, metadata)`` for every chunk of every document, in document order.
+
+    Each chunk gets its own copy of its document's metadata, as with ``TextSplitter.split_documents``.
+    """
+    batches = _batches(documents, max(1, batch_chars))
+    first = next(batches, None)
+    if first is None:
+        return
+    second = next(batches, None)
+    pool = get_executor("process")
+
+    # A single batch, or a single worker, would only pay for pickling without splitting anything side by side.
+    if not parallel or second is None or pool.max_workers < 2:  # noqa: PLR2004
+        splitter = splitter_class(**splitter_kwargs)
+        for batch in chain([first], [second] if second else [], batches):
+            for text, metadata in batch:
+                for chunk in splitter.split_text(text):
+                    yield chunk, dict(metadata)
+        return
+
+    remaining = chain([first, second], batches)
+    # Keep every worker busy plus one batch queued behind each, without buffering the whole corpus.
+    window = pool.max_workers * 2
+    pending: deque[tuple[list[dict], Future[list[list[str]]]]] = deque()
+    try:
+        while True:
+            while len(pending) < window and (batch := next(remaining, None)) is not None:
+                texts = [text for text, _ in batch]
+                future = pool.executor.submit(_split_texts, splitter_class, splitter_kwargs, texts)
+                pending.append(([metadata for _, metadata in batch], future))
+            if not pending:
+                return
+            metadatas, future = pending.popleft()
+            for chunks, metadata in zip(future.result(), metadatas, strict=True):
+                for chunk in chunks:
+                    yield chunk, dict(metadata)
+    finally:
+        for _, future in pending:
+            future.cancel()
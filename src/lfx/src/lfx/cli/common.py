@@ -14,7 +14,6 @@ import sys
 import tempfile
 import uuid
 import zipfile
-from io import StringIO
 from pathlib import Path
 from shutil import which
 from typing import TYPE_CHECKING
@@ -29,6 +28,7 @@ from lfx.cli.script_loader import (
     load_graph_from_script,
 )
 from lfx.load import load_flow_from_json
+from lfx.log.logger import capture_output
 from lfx.schema.schema import InputValueRequest
 
 if TYPE_CHECKING:
@@ -293,12 +293,16 @@ def prepare_graph(graph, verbose_print):
         raise typer.Exit(1) from e
 
 
-async def execute_graph_with_capture(graph, input_value: str | None):
+async def execute_graph_with_capture(graph, input_value: str | None, *, max_output_chars: int | None = None):
     """Execute a graph and capture output.
 
+    Output is captured per request with ``lfx.log.logger.capture_output``, so concurrent executions on the
+    same event loop each get only their own prints and log events.
+
     Args:
         graph: Graph object to execute
         input_value: Input value to pass to the graph
+        max_output_chars: Cap on the captured output; defaults to ``LANGFLOW_OUTPUT_CAPTURE_MAX_CHARS`` or 1 MiB
 
     Returns:
         Tuple of (results, captured_logs)
@@ -309,34 +313,18 @@ async def execute_graph_with_capture(graph, input_value: str | None):
     # Create input request
     inputs = InputValueRequest(input_value=input_value) if input_value else None
 
-    # Capture output during execution
-    captured_stdout = StringIO()
-    captured_stderr = StringIO()
-
-    # Redirect stdout and stderr during graph execution
-    original_stdout = sys.stdout
-    original_stderr = sys.stderr
-
-    try:
-        sys.stdout = captured_stdout
-        sys.stderr = captured_stderr
-        results = [result async for result in graph.async_start(inputs)]
-    except Exception as exc:
-        # Capture any error output that was written to stderr
-        error_output = captured_stderr.getvalue()
-        if error_output:
-            # Add error output to the exception for better debugging
-            exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
-        raise
-    finally:
-        # Restore original stdout/stderr
-        sys.stdout = original_stdout
-        sys.stderr = original_stderr
-
-    # Get captured logs
-    captured_logs = captured_stdout.getvalue() + captured_stderr.getvalue()
-
-    return results, captured_logs
+    with capture_output(max_output_chars) as captured:
+        try:
+            results = [result async for result in graph.async_start(inputs)]
+        except Exception as exc:
+            # Capture any error output that was written to stderr
+            error_output = captured.stderr
+            if error_output:
+                # Add error output to the exception for better debugging
+                exc.args = (f"{exc.args[0] if exc.args else str(exc)}\n\nCaptured stderr:\n{error_output}",)
+            raise
+
+    return results, captured.getvalue()
 
 
 def extract_result_data(results, captured_logs: str) -> dict:
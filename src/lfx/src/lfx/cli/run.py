@@ -8,6 +8,7 @@ import typer
 from asyncer import syncify
 
 from lfx.run.base import RunError, run_flow
+from lfx.run.batch import run_flow_batch
 
 # Verbosity level constants
 VERBOSITY_DETAILED = 2
@@ -102,6 +103,32 @@ async def run(
         show_default=True,
         help="Include detailed timing information in output",
     ),
+    batch: Path | None = typer.Option(
+        None,
+        "--batch",
+        help="JSONL file with one input per line; runs the graph once per input and writes JSONL results",
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="File to write batch results to (default: stdout)",
+    ),
+    concurrency: int = typer.Option(
+        4,
+        "--concurrency",
+        min=1,
+        help="Number of batch inputs to run at the same time",
+    ),
+    ordered: bool = typer.Option(
+        default=True,
+        help="Write batch results in input order (--ordered) or as they complete (--no-ordered)",
+    ),
+    resume: bool = typer.Option(
+        default=False,
+        show_default=True,
+        help="Skip batch inputs already written to --output and append the rest",
+    ),
 ) -> None:
     """Execute a Langflow graph script or JSON flow and return the result.
 
@@ -121,11 +148,42 @@ async def run(
         stdin: Read JSON flow content from stdin
         check_variables: Check global variables for environment compatibility
         timing: Include detailed timing information in output
+        batch: JSONL file of inputs to run the graph on, loading it only once
+        output: File to write batch results to
+        concurrency: Number of batch inputs to run at the same time
+        ordered: Write batch results in input order rather than as they complete
+        resume: Skip batch inputs already written to the output file
     """
     # Determine verbosity for output formatting
     verbosity = 3 if verbose_full else (2 if verbose_detailed else (1 if verbose else 0))
 
     try:
+        # Direct calls that leave out --batch get the typer.Option default rather than None
+        if isinstance(batch, Path):
+            if input_value or input_value_option:
+                msg = "An input value cannot be combined with --batch"
+                raise RunError(msg, None)
+            summary = await run_flow_batch(
+                script_path,
+                batch,
+                output,
+                concurrency=concurrency,
+                ordered=ordered,
+                resume=resume,
+                output_format=output_format,
+                flow_json=flow_json,
+                stdin=bool(stdin),
+                check_variables=check_variables,
+                verbose=verbose,
+                verbose_detailed=verbose_detailed,
+                verbose_full=verbose_full,
+            )
+            # Results go to stdout, so the summary goes to stderr
+            typer.echo(json.dumps({"summary": summary.as_dict()}), err=True)
+            if summary.failed:
+                raise typer.Exit(1)
+            return
+
         result = await run_flow(
             script_path=script_path,
             input_value=input_value,
@@ -27,8 +27,10 @@ from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader, APIKeyQuery
 from pydantic import BaseModel, Field
 
+from lfx.base.data.docling_pool import get_docling_pool_metrics
 from lfx.cli.common import execute_graph_with_capture, extract_result_data, get_api_key
 from lfx.log.logger import logger
+from lfx.utils.executors import get_executor_metrics
 
 if TYPE_CHECKING:
     from collections.abc import AsyncGenerator, Callable
@@ -393,6 +395,16 @@ def create_multi_serve_app(
     async def global_health():
         return {"status": "healthy", "flow_count": len(graphs)}
 
+    @app.get("/metrics/executors", tags=["info"], summary="Executor pool metrics")
+    async def executor_metrics():
+        """Return queue depth, activity and wait-time metrics for each executor pool."""
+        return get_executor_metrics()
+
+    @app.get("/metrics/docling", tags=["info"], summary="Docling worker pool metrics")
+    async def docling_metrics():
+        """Return worker, queue and throughput metrics for the Docling worker pool, or null before it starts."""
+        return get_docling_pool_metrics()
+
     # ------------------------------------------------------------------
     # Per-flow routers
     # ------------------------------------------------------------------
@@ -494,7 +506,7 @@ def create_multi_serve_app(
 
                 main_task = asyncio.create_task(
                     run_flow_generator_for_serve(
-                        graph=graph,
+                        graph=deepcopy(graph),
                         input_request=request,
                         flow_id=flow_id,
                         event_manager=event_manager,
@@ -1,4 +1,6 @@
+import asyncio
 import json
+import math
 import re
 import tempfile
 from datetime import datetime, timezone
@@ -16,8 +18,10 @@ from lfx.custom.custom_component.component import Component
 from lfx.inputs.inputs import TabInput
 from lfx.io import (
     BoolInput,
+    DataFrameInput,
     DataInput,
     DropdownInput,
+    FloatInput,
     IntInput,
     MessageTextInput,
     MultilineInput,
@@ -25,8 +29,10 @@ from lfx.io import (
     TableInput,
 )
 from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
 from lfx.schema.dotdict import dotdict
 from lfx.utils.component_utils import set_current_fields, set_field_advanced, set_field_display
+from lfx.utils.http_client_pool import HostRateLimiter, get_http_client
 from lfx.utils.ssrf_protection import SSRFProtectionError, validate_url_for_ssrf
 
 # Define fields for each mode
@@ -172,10 +178,34 @@ class APIRequestComponent(Component):
             ),
             advanced=True,
         ),
+        DataFrameInput(
+            name="batch_requests",
+            display_name="Batch Requests",
+            info=(
+                "A table of requests to send with the Batch Responses output. Requires a 'url' column; "
+                "optional 'method', 'headers' and 'body' columns override the component settings per row."
+            ),
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrent Requests",
+            value=10,
+            info="Maximum number of batch requests in flight at once.",
+            advanced=True,
+        ),
+        FloatInput(
+            name="requests_per_second_per_host",
+            display_name="Requests per Second per Host",
+            value=0.0,
+            info="Maximum batch request rate to any single host. Use 0 for no limit.",
+            advanced=True,
+        ),
     ]
 
     outputs = [
         Output(display_name="API Response", name="data", method="make_api_request"),
+        Output(display_name="Batch Responses", name="batch_results", method="make_batch_requests"),
     ]
 
     def _parse_json_value(self, value: Any) -> Any:
@@ -419,30 +449,8 @@ class APIRequestComponent(Component):
             return {item["key"]: item["value"] for item in headers if self._is_valid_key_value_item(item)}
         return {}
 
-    async def make_api_request(self) -> Data:
-        """Make HTTP request with optimized parameter handling."""
-        method = self.method
-        url = self.url_input.strip() if isinstance(self.url_input, str) else ""
-        headers = self.headers or {}
-        body = self.body or {}
-        timeout = self.timeout
-        follow_redirects = self.follow_redirects
-        save_to_file = self.save_to_file
-        include_httpx_metadata = self.include_httpx_metadata
-
-        # Security warning when redirects are enabled
-        if follow_redirects:
-            self.log(
-                "Security Warning: HTTP redirects are enabled. This may allow SSRF bypass attacks "
-                "where a public URL redirects to internal resources (e.g., cloud metadata endpoints). "
-                "Only enable this if you trust the target server."
-            )
-
-        # if self.mode == "cURL" and self.curl_input:
-        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
-        #     # After parsing curl, get the normalized URL
-        #     url = self._build_config["url_input"]["value"]
-
+    def _prepare_url(self, url: str, query_params: dict) -> str:
+        """Normalize and validate a URL, then append query parameters."""
         # Normalize URL before validation
         url = self._normalize_url(url)
 
@@ -460,32 +468,119 @@ class APIRequestComponent(Component):
             msg = f"SSRF Protection: {e}"
             raise ValueError(msg) from e
 
-        # Process query parameters
+        return self.add_query_params(url, query_params)
+
+    def _get_query_params(self) -> dict:
         if isinstance(self.query_params, str):
-            query_params = dict(parse_qsl(self.query_params))
-        else:
-            query_params = self.query_params.data if self.query_params else {}
+            return dict(parse_qsl(self.query_params))
+        return self.query_params.data if self.query_params else {}
+
+    def _warn_on_redirects(self) -> None:
+        if self.follow_redirects:
+            self.log(
+                "Security Warning: HTTP redirects are enabled. This may allow SSRF bypass attacks "
+                "where a public URL redirects to internal resources (e.g., cloud metadata endpoints). "
+                "Only enable this if you trust the target server."
+            )
+
+    async def make_api_request(self) -> Data:
+        """Make HTTP request with optimized parameter handling."""
+        method = self.method
+        url = self.url_input.strip() if isinstance(self.url_input, str) else ""
+        headers = self.headers or {}
+        body = self.body or {}
+        timeout = self.timeout
+        follow_redirects = self.follow_redirects
+        save_to_file = self.save_to_file
+        include_httpx_metadata = self.include_httpx_metadata
+
+        # Security warning when redirects are enabled
+        self._warn_on_redirects()
+
+        # if self.mode == "cURL" and self.curl_input:
+        #     self._build_config = self.parse_curl(self.curl_input, dotdict())
+        #     # After parsing curl, get the normalized URL
+        #     url = self._build_config["url_input"]["value"]
+
+        url = self._prepare_url(url, self._get_query_params())
 
         # Process headers and body
         headers = self._process_headers(headers)
         body = self._process_body(body)
-        url = self.add_query_params(url, query_params)
-
-        async with httpx.AsyncClient() as client:
-            result = await self.make_request(
-                client,
-                method,
-                url,
-                headers,
-                body,
-                timeout,
-                follow_redirects=follow_redirects,
-                save_to_file=save_to_file,
-                include_httpx_metadata=include_httpx_metadata,
-            )
+
+        # Pooled clients keep connections alive across calls, e.g. when this component runs inside a Loop.
+        client = get_http_client(follow_redirects=follow_redirects, timeout=timeout)
+        result = await self.make_request(
+            client,
+            method,
+            url,
+            headers,
+            body,
+            timeout,
+            follow_redirects=follow_redirects,
+            save_to_file=save_to_file,
+            include_httpx_metadata=include_httpx_metadata,
+        )
         self.status = result
         return result
 
+    async def make_batch_requests(self) -> DataFrame:
+        """Send one request per row of the Batch Requests table and return the responses in row order.
+
+        Requests run concurrently up to Max Concurrent Requests, and each host is limited to
+        Requests per Second per Host. Failed requests produce a row with an ``error`` column instead of
+        aborting the batch.
+        """
+        if self.batch_requests is None or self.batch_requests.empty:
+            msg = "Batch Requests must be a DataFrame with at least one row."
+            raise ValueError(msg)
+        if "url" not in self.batch_requests.columns:
+            msg = "Batch Requests must have a 'url' column."
+            raise ValueError(msg)
+
+        self._warn_on_redirects()
+        query_params = self._get_query_params()
+        default_headers = self._process_headers(self.headers or {})
+        default_body = self._process_body(self.body or {})
+        client = get_http_client(follow_redirects=self.follow_redirects, timeout=self.timeout)
+        semaphore = asyncio.Semaphore(max(1, self.max_concurrency or 1))
+        rate_limiter = HostRateLimiter(self.requests_per_second_per_host or 0.0)
+
+        async def send(row: dict) -> dict:
+            raw_url = row.get("url")
+            try:
+                url = self._prepare_url(str(raw_url) if raw_url is not None else "", query_params)
+            except ValueError as e:
+                return {"source": raw_url, "status_code": None, "error": str(e)}
+            headers = {**default_headers, **self._process_headers(self._parse_json_value(row.get("headers")))}
+            body = self._process_body(row["body"]) if row.get("body") is not None else default_body
+            method = row.get("method") or self.method
+            async with semaphore:
+                await rate_limiter.acquire(url)
+                try:
+                    result = await self.make_request(
+                        client,
+                        method,
+                        url,
+                        headers,
+                        body,
+                        self.timeout,
+                        follow_redirects=self.follow_redirects,
+                        include_httpx_metadata=self.include_httpx_metadata,
+                    )
+                except ValueError as e:
+                    return {"source": url, "status_code": None, "error": str(e)}
+            return result.data
+
+        # Drop empty cells so missing optional columns fall back to the component settings.
+        rows = [
+            {key: value for key, value in row.items() if not (isinstance(value, float) and math.isnan(value))}
+            for row in self.batch_requests.to_dict(orient="records")
+        ]
+        results = await asyncio.gather(*(send(row) for row in rows))
+        self.status = f"Sent {len(results)} requests"
+        return DataFrame(results)
+
     def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None) -> dotdict:
         """Update the build config based on the selected mode."""
         if field_name != "mode":
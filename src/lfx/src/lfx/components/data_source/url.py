@@ -1,10 +1,13 @@
 import importlib
 import re
+from collections.abc import AsyncIterator
+from typing import NamedTuple
 
 import requests
 from bs4 import BeautifulSoup
 from langchain_community.document_loaders import RecursiveUrlLoader
 
+from lfx.base.data.url_crawler import DEFAULT_MAX_CONCURRENCY, DEFAULT_MAX_PER_HOST, AsyncUrlCrawler, HTTPResponseCache
 from lfx.custom.custom_component.component import Component
 from lfx.field_typing.range_spec import RangeSpec
 from lfx.helpers.data import safe_convert
@@ -12,6 +15,8 @@ from lfx.io import BoolInput, DropdownInput, IntInput, MessageTextInput, Output,
 from lfx.log.logger import logger
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
+from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import run_in_executor
 from lfx.utils.request_utils import get_user_agent
 
 # Constants
@@ -35,6 +40,12 @@ else:
     USER_AGENT = "lfx"
 
 
+class _PageChunk(NamedTuple):
+    """A streamed piece of a chat message, shaped like the chunks of a model stream."""
+
+    content: str
+
+
 class URLComponent(Component):
     """A component that loads and parses content from web pages recursively.
 
@@ -98,7 +109,7 @@ class URLComponent(Component):
             display_name="Use Async",
             info=(
                 "If enabled, uses asynchronous loading which can be significantly faster "
-                "but might use more system resources."
+                "but might use more system resources. Concurrent fetching is configured separately."
             ),
             value=True,
             required=False,
@@ -174,6 +185,45 @@ class URLComponent(Component):
             required=False,
             advanced=True,
         ),
+        BoolInput(
+            name="concurrent_fetching",
+            display_name="Concurrent Fetching",
+            info=(
+                "If enabled, fetches pages concurrently over a shared connection pool instead of one URL at a time. "
+                "Pages are returned in the order they finish loading, and Raw Content connected to a Chat Output "
+                "streams each page to the chat as it arrives."
+            ),
+            value=False,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrent Requests",
+            info="Maximum number of requests in flight at once when concurrent fetching is enabled.",
+            value=DEFAULT_MAX_CONCURRENCY,
+            required=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_requests_per_host",
+            display_name="Max Requests per Host",
+            info="Maximum number of requests in flight to a single host when concurrent fetching is enabled.",
+            value=DEFAULT_MAX_PER_HOST,
+            required=False,
+            advanced=True,
+        ),
+        BoolInput(
+            name="use_http_cache",
+            display_name="Use HTTP Cache",
+            info=(
+                "If enabled with concurrent fetching, stores pages that have an ETag or Last-Modified header on disk "
+                "and revalidates them with conditional requests, so unchanged pages are not downloaded again."
+            ),
+            value=True,
+            required=False,
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -225,7 +275,7 @@ class URLComponent(Component):
             RecursiveUrlLoader: Configured loader instance
         """
         headers_dict = {header["key"]: header["value"] for header in self.headers if header["value"] is not None}
-        extractor = (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
+        extractor = self._get_extractor()
 
         return RecursiveUrlLoader(
             url=url,
@@ -243,7 +293,88 @@ class URLComponent(Component):
             link_regex=None,  # Allow customization of link filtering
         )
 
-    def fetch_url_contents(self) -> list[dict]:
+    def _get_extractor(self):
+        return (lambda x: x) if self.format == "HTML" else (lambda x: BeautifulSoup(x, "lxml").get_text())
+
+    def _create_crawler(self) -> AsyncUrlCrawler:
+        """Creates an AsyncUrlCrawler instance with the configured settings."""
+        headers_dict = {header["key"]: header["value"] for header in self.headers if header["value"] is not None}
+        return AsyncUrlCrawler(
+            max_depth=self.max_depth,
+            prevent_outside=self.prevent_outside,
+            max_concurrency=self.max_concurrency,
+            max_per_host=self.max_requests_per_host,
+            timeout=self.timeout,
+            headers=headers_dict,
+            extractor=self._get_extractor(),
+            cache=HTTPResponseCache() if self.use_http_cache else None,
+            check_response_status=self.check_response_status,
+            continue_on_failure=self.continue_on_failure,
+            filter_text_html=self.filter_text_html,
+            autoset_encoding=self.autoset_encoding,
+        )
+
+    def _get_urls(self) -> list[str]:
+        urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
+        logger.debug(f"URLs: {urls}")
+        if not urls:
+            msg = "No valid URLs provided."
+            raise ValueError(msg)
+        return urls
+
+    async def stream_url_contents(self) -> AsyncIterator[dict]:
+        """Crawl the configured URLs concurrently and yield one row per page as soon as it is fetched.
+
+        ``fetch_content_as_message`` streams these rows to the chat; the other outputs collect them.
+        """
+        async for page in self._create_crawler().crawl(self._get_urls()):
+            yield {
+                "text": safe_convert(page.content, clean_data=True),
+                "url": page.url,
+                "title": page.title,
+                "description": page.description,
+                "content_type": page.content_type,
+                "language": page.language,
+            }
+
+    async def _collect_url_contents(self) -> list[dict]:
+        return [row async for row in self.stream_url_contents()]
+
+    def _load_url_contents(self) -> list[dict]:
+        """Load the configured URLs one at a time with RecursiveUrlLoader."""
+        all_docs = []
+        for url in self._get_urls():
+            logger.debug(f"Loading documents from {url}")
+
+            try:
+                loader = self._create_loader(url)
+                docs = loader.load()
+
+                if not docs:
+                    logger.warning(f"No documents found for {url}")
+                    continue
+
+                logger.debug(f"Found {len(docs)} documents from {url}")
+                all_docs.extend(docs)
+
+            except requests.exceptions.RequestException as e:
+                logger.exception(f"Error loading documents from {url}: {e}")
+                continue
+
+        # data = [Data(text=doc.page_content, **doc.metadata) for doc in all_docs]
+        return [
+            {
+                "text": safe_convert(doc.page_content, clean_data=True),
+                "url": doc.metadata.get("source", ""),
+                "title": doc.metadata.get("title", ""),
+                "description": doc.metadata.get("description", ""),
+                "content_type": doc.metadata.get("content_type", ""),
+                "language": doc.metadata.get("language", ""),
+            }
+            for doc in all_docs
+        ]
+
+    async def afetch_url_contents(self) -> list[dict]:
         """Load documents from the configured URLs.
 
         Returns:
@@ -253,47 +384,14 @@ class URLComponent(Component):
             ValueError: If no valid URLs are provided or if there's an error loading documents
         """
         try:
-            urls = list({self.ensure_url(url) for url in self.urls if url.strip()})
-            logger.debug(f"URLs: {urls}")
-            if not urls:
-                msg = "No valid URLs provided."
-                raise ValueError(msg)
-
-            all_docs = []
-            for url in urls:
-                logger.debug(f"Loading documents from {url}")
-
-                try:
-                    loader = self._create_loader(url)
-                    docs = loader.load()
-
-                    if not docs:
-                        logger.warning(f"No documents found for {url}")
-                        continue
-
-                    logger.debug(f"Found {len(docs)} documents from {url}")
-                    all_docs.extend(docs)
-
-                except requests.exceptions.RequestException as e:
-                    logger.exception(f"Error loading documents from {url}: {e}")
-                    continue
+            if self.concurrent_fetching:
+                data = await self._collect_url_contents()
+            else:
+                data = await run_in_executor("io", self._load_url_contents)
 
-            if not all_docs:
+            if not data:
                 msg = "No documents were successfully loaded from any URL"
                 raise ValueError(msg)
-
-            # data = [Data(text=doc.page_content, **doc.metadata) for doc in all_docs]
-            data = [
-                {
-                    "text": safe_convert(doc.page_content, clean_data=True),
-                    "url": doc.metadata.get("source", ""),
-                    "title": doc.metadata.get("title", ""),
-                    "description": doc.metadata.get("description", ""),
-                    "content_type": doc.metadata.get("content_type", ""),
-                    "language": doc.metadata.get("language", ""),
-                }
-                for doc in all_docs
-            ]
         except Exception as e:
             error_msg = e.message if hasattr(e, "message") else e
             msg = f"Error loading documents: {error_msg!s}"
@@ -301,11 +399,48 @@ class URLComponent(Component):
             raise ValueError(msg) from e
         return data
 
-    def fetch_content(self) -> DataFrame:
+    def fetch_url_contents(self) -> list[dict]:
+        """Synchronous version of `afetch_url_contents`."""
+        return run_until_complete(self.afetch_url_contents())
+
+    async def fetch_content(self) -> DataFrame:
         """Convert the documents to a DataFrame."""
-        return DataFrame(data=self.fetch_url_contents())
+        return DataFrame(data=await self.afetch_url_contents())
+
+    async def fetch_content_as_message(self) -> Message:
+        """Convert the documents to a Message.
 
-    def fetch_content_as_message(self) -> Message:
-        """Convert the documents to a Message."""
-        url_contents = self.fetch_url_contents()
+        With concurrent fetching and a connected Chat Output, the text of each page is streamed to the chat as
+        soon as the page is fetched.
+        """
+        if self.concurrent_fetching and self._vertex is not None and self.is_connected_to_chat_output():
+            return await self._stream_content_as_message()
+        url_contents = await self.afetch_url_contents()
         return Message(text="\n\n".join([x["text"] for x in url_contents]), data={"data": url_contents})
+
+    async def _stream_content_as_message(self) -> Message:
+        rows: list[dict] = []
+
+        async def page_chunks() -> AsyncIterator[_PageChunk]:
+            async for row in self.stream_url_contents():
+                yield _PageChunk(row["text"] if not rows else "\n\n" + row["text"])
+                rows.append(row)
+
+        message = Message(
+            text=page_chunks(),
+            sender_name=self.display_name,
+            properties={"icon": self.icon, "state": "partial"},
+            session_id=self.graph.session_id,
+        )
+        message.properties.source = self._build_source(self._id, self.display_name, self)
+        try:
+            message = await self.send_message(message)
+        except Exception as e:
+            msg = f"Error loading documents: {e!s}"
+            logger.exception(msg)
+            raise ValueError(msg) from e
+        if not rows:
+            msg = "Error loading documents: No documents were successfully loaded from any URL"
+            raise ValueError(msg)
+        message.data["data"] = rows
+        return message
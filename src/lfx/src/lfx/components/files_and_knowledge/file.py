@@ -10,17 +10,18 @@ Notes:
 
 from __future__ import annotations
 
+import asyncio
 import contextlib
-import json
-import subprocess
-import sys
-import textwrap
 from copy import deepcopy
 from pathlib import Path
 from tempfile import NamedTemporaryFile
 from typing import Any
 
+import anyio
+
 from lfx.base.data.base_file import BaseFileComponent
+from lfx.base.data.docling_pool import get_docling_worker_pool, run_docling_once
+from lfx.base.data.parse_cache import get_parse_cache, hash_file
 from lfx.base.data.storage_utils import parse_storage_path, read_file_bytes, validate_image_content_type
 from lfx.base.data.utils import TEXT_FILE_TYPES, parallel_load_data, parse_text_file_to_data
 from lfx.inputs import SortableListInput
@@ -31,6 +32,7 @@ from lfx.schema.dataframe import DataFrame  # noqa: TC001
 from lfx.schema.message import Message
 from lfx.services.deps import get_settings_service, get_storage_service
 from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import run_in_executor
 from lfx.utils.validate_cloud import is_astra_cloud_environment
 
 
@@ -759,37 +761,58 @@ class FileComponent(BaseFileComponent):
         content = await storage_service.get_file(flow_id, filename)
 
         suffix = Path(filename).suffix
-        with NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as tmp_file:
-            tmp_file.write(content)
-            temp_path = tmp_file.name
 
-        return temp_path, True
+        def write_temp_file() -> str:
+            with NamedTemporaryFile(mode="wb", suffix=suffix, delete=False) as tmp_file:
+                tmp_file.write(content)
+                return tmp_file.name
+
+        # Written in a thread, so a large file does not hold up other coroutines on this loop
+        return await asyncio.to_thread(write_temp_file), True
 
     def _process_docling_in_subprocess(self, file_path: str) -> Data | None:
         """Run Docling in a separate OS process and map the result to a Data object.
 
-        We avoid multiprocessing pickling by launching `python -c "<script>"` and
-        passing JSON config via stdin. The child prints a JSON result to stdout.
+        We avoid multiprocessing pickling by running a `python -c "<script>"` worker from the
+        Docling worker pool and passing JSON config via stdin. The worker prints a JSON result to stdout.
 
         For S3 storage, the file is downloaded to a temp file first.
         """
+        return run_until_complete(self._aprocess_docling_in_subprocess(file_path))
+
+    async def _aprocess_docling_files(self, file_paths: list[str]) -> list[Data | None]:
+        """Convert files concurrently, up to one per pooled Docling worker, in input order.
+
+        Conversions run in the "io" executor, so concurrent jobs bridged onto the same event loop only wait on
+        each other for free workers, not for the loop.
+        """
+        pool = get_docling_worker_pool()
+        slots = asyncio.Semaphore(pool.max_workers if pool is not None else 1)
+
+        async def convert(file_path: str) -> Data | None:
+            async with slots:
+                return await self._aprocess_docling_in_subprocess(file_path)
+
+        return list(await asyncio.gather(*(convert(file_path) for file_path in file_paths)))
+
+    async def _aprocess_docling_in_subprocess(self, file_path: str) -> Data | None:
+        """Async version of `_process_docling_in_subprocess` that does not block the event loop."""
         if not file_path:
             return None
 
         settings = get_settings_service().settings
         if settings.storage_type == "s3":
-            local_path, should_delete = run_until_complete(self._get_local_file_for_docling(file_path))
+            local_path, should_delete = await self._get_local_file_for_docling(file_path)
         else:
             local_path = file_path
             should_delete = False
 
         try:
-            return self._process_docling_subprocess_impl(local_path, file_path)
+            return await run_in_executor("io", self._process_docling_subprocess_impl, local_path, file_path)
         finally:
-            # Clean up temp file if we created one
             if should_delete:
                 with contextlib.suppress(Exception):
-                    Path(local_path).unlink()  # Ignore cleanup errors
+                    await anyio.Path(local_path).unlink()  # Ignore cleanup errors
 
     def _process_docling_subprocess_impl(self, local_file_path: str, original_file_path: str) -> Data | None:
         """Implementation of Docling subprocess processing.
@@ -812,208 +835,25 @@ class FileComponent(BaseFileComponent):
             ),
         }
 
-        # Child script for isolating the docling processing
-        child_script = textwrap.dedent(
-            r"""
-            import json, sys
-
-            def try_imports():
-                try:
-                    from docling.datamodel.base_models import ConversionStatus, InputFormat  # type: ignore
-                    from docling.document_converter import DocumentConverter  # type: ignore
-                    from docling_core.types.doc import ImageRefMode  # type: ignore
-                    return ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, "latest"
-                except Exception as e:
-                    raise e
-
-            def create_converter(strategy, input_format, DocumentConverter, pipeline, ocr_engine):
-                # --- Standard PDF/IMAGE pipeline (your existing behavior), with optional OCR ---
-                if pipeline == "standard":
-                    try:
-                        from docling.datamodel.pipeline_options import PdfPipelineOptions  # type: ignore
-                        from docling.document_converter import PdfFormatOption  # type: ignore
-
-                        pipe = PdfPipelineOptions()
-                        pipe.do_ocr = False
-
-                        if ocr_engine:
-                            try:
-                                from docling.models.factories import get_ocr_factory  # type: ignore
-                                pipe.do_ocr = True
-                                fac = get_ocr_factory(allow_external_plugins=False)
-                                pipe.ocr_options = fac.create_options(kind=ocr_engine)
-                            except Exception:
-                                # If OCR setup fails, disable it
-                                pipe.do_ocr = False
-
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(pipeline_options=pipe)
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(pipeline_options=pipe)
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception:
-                        return DocumentConverter()
-
-                # --- Vision-Language Model (VLM) pipeline ---
-                if pipeline == "vlm":
-                    try:
-                        from docling.datamodel.pipeline_options import VlmPipelineOptions
-                        from docling.datamodel.vlm_model_specs import GRANITEDOCLING_MLX, GRANITEDOCLING_TRANSFORMERS
-                        from docling.document_converter import PdfFormatOption
-                        from docling.pipeline.vlm_pipeline import VlmPipeline
-
-                        vl_pipe = VlmPipelineOptions(
-                            vlm_options=GRANITEDOCLING_TRANSFORMERS,
-                        )
-
-                        if sys.platform == "darwin":
-                            try:
-                                import mlx_vlm
-                                vl_pipe.vlm_options = GRANITEDOCLING_MLX
-                            except ImportError as e:
-                                raise e
-
-                        # VLM paths generally don't need OCR; keep OCR off by default here.
-                        fmt = {}
-                        if hasattr(input_format, "PDF"):
-                            fmt[getattr(input_format, "PDF")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-                        if hasattr(input_format, "IMAGE"):
-                            fmt[getattr(input_format, "IMAGE")] = PdfFormatOption(
-                            pipeline_cls=VlmPipeline,
-                            pipeline_options=vl_pipe
-                        )
-
-                        return DocumentConverter(format_options=fmt)
-                    except Exception as e:
-                        raise e
-
-                # --- Fallback: default converter with no special options ---
-                return DocumentConverter()
-
-            def export_markdown(document, ImageRefMode, image_mode, img_ph, pg_ph):
-                try:
-                    mode = getattr(ImageRefMode, image_mode.upper(), image_mode)
-                    return document.export_to_markdown(
-                        image_mode=mode,
-                        image_placeholder=img_ph,
-                        page_break_placeholder=pg_ph,
-                    )
-                except Exception:
-                    try:
-                        return document.export_to_text()
-                    except Exception:
-                        return str(document)
-
-            def to_rows(doc_dict):
-                rows = []
-                for t in doc_dict.get("texts", []):
-                    prov = t.get("prov") or []
-                    page_no = None
-                    if prov and isinstance(prov, list) and isinstance(prov[0], dict):
-                        page_no = prov[0].get("page_no")
-                    rows.append({
-                        "page_no": page_no,
-                        "label": t.get("label"),
-                        "text": t.get("text"),
-                        "level": t.get("level"),
-                    })
-                return rows
-
-            def main():
-                cfg = json.loads(sys.stdin.read())
-                file_path = cfg["file_path"]
-                markdown = cfg["markdown"]
-                image_mode = cfg["image_mode"]
-                img_ph = cfg["md_image_placeholder"]
-                pg_ph = cfg["md_page_break_placeholder"]
-                pipeline = cfg["pipeline"]
-                ocr_engine = cfg.get("ocr_engine")
-                meta = {"file_path": file_path}
-
-                try:
-                    ConversionStatus, InputFormat, DocumentConverter, ImageRefMode, strategy = try_imports()
-                    converter = create_converter(strategy, InputFormat, DocumentConverter, pipeline, ocr_engine)
-                    try:
-                        res = converter.convert(file_path)
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling conversion error: {e}", "meta": meta}))
-                        return
-
-                    ok = False
-                    if hasattr(res, "status"):
-                        try:
-                            ok = (res.status == ConversionStatus.SUCCESS) or (str(res.status).lower() == "success")
-                        except Exception:
-                            ok = (str(res.status).lower() == "success")
-                    if not ok and hasattr(res, "document"):
-                        ok = getattr(res, "document", None) is not None
-                    if not ok:
-                        print(json.dumps({"ok": False, "error": "Docling conversion failed", "meta": meta}))
-                        return
-
-                    doc = getattr(res, "document", None)
-                    if doc is None:
-                        print(json.dumps({"ok": False, "error": "Docling produced no document", "meta": meta}))
-                        return
-
-                    if markdown:
-                        text = export_markdown(doc, ImageRefMode, image_mode, img_ph, pg_ph)
-                        print(json.dumps({"ok": True, "mode": "markdown", "text": text, "meta": meta}))
-                        return
-
-                    # structured
-                    try:
-                        doc_dict = doc.export_to_dict()
-                    except Exception as e:
-                        print(json.dumps({"ok": False, "error": f"Docling export_to_dict failed: {e}", "meta": meta}))
-                        return
-
-                    rows = to_rows(doc_dict)
-                    print(json.dumps({"ok": True, "mode": "structured", "doc": rows, "meta": meta}))
-                except Exception as e:
-                    print(
-                        json.dumps({
-                            "ok": False,
-                            "error": f"Docling processing error: {e}",
-                            "meta": {"file_path": file_path},
-                        })
-                    )
-
-            if __name__ == "__main__":
-                main()
-            """
-        )
-
         # Validate file_path to avoid command injection or unsafe input
         if not isinstance(args["file_path"], str) or any(c in args["file_path"] for c in [";", "|", "&", "$", "`"]):
             return Data(data={"error": "Unsafe file path detected.", "file_path": args["file_path"]})
 
-        proc = subprocess.run(  # noqa: S603
-            [sys.executable, "-u", "-c", child_script],
-            input=json.dumps(args).encode("utf-8"),
-            capture_output=True,
-            check=False,
-        )
-
-        if not proc.stdout:
-            err_msg = proc.stderr.decode("utf-8", errors="replace") if proc.stderr else "no output from child process"
-            return Data(data={"error": f"Docling subprocess error: {err_msg}", "file_path": original_file_path})
-
-        try:
-            result = json.loads(proc.stdout.decode("utf-8"))
-        except Exception as e:  # noqa: BLE001
-            err_msg = proc.stderr.decode("utf-8", errors="replace")
-            return Data(
-                data={
-                    "error": f"Invalid JSON from Docling subprocess: {e}. stderr={err_msg}",
-                    "file_path": original_file_path,
-                },
-            )
+        # Identical content converted with identical options is served from the parsed document cache.
+        cache = get_parse_cache()
+        cache_key = None
+        if cache is not None:
+            with contextlib.suppress(OSError):
+                options = {key: value for key, value in args.items() if key != "file_path"}
+                cache_key = cache.make_key(hash_file(local_file_path), "docling", options)
+        result = cache.get(cache_key) if cache_key else None
+
+        if result is None:
+            # Docling runs in separate OS processes; warm pooled workers keep its models loaded between files.
+            pool = get_docling_worker_pool()
+            result = pool.convert(args) if pool is not None else run_docling_once(args)
+            if cache_key and result.get("ok"):
+                cache.set(cache_key, result)
 
         if not result.get("ok"):
             error_msg = result.get("error", "Unknown Docling error")
@@ -1115,10 +955,10 @@ class FileComponent(BaseFileComponent):
         # Advanced path: Check if ALL files are compatible with Docling
         if self.advanced_mode and docling_compatible:
             final_return: list[BaseFileComponent.BaseFile] = []
-            for file in file_list:
-                file_path = str(file.path)
-                advanced_data: Data | None = self._process_docling_in_subprocess(file_path)
-
+            file_paths = [str(file.path) for file in file_list]
+            advanced_results = run_until_complete(self._aprocess_docling_files(file_paths))
+            for file, file_path, docling_result in zip(file_list, file_paths, advanced_results, strict=True):
+                advanced_data: Data | None = docling_result
                 # Handle None case - Docling processing failed or returned None
                 if advanced_data is None:
                     error_data = Data(
@@ -6,7 +6,7 @@ from lfx.base.langchain_utilities.model import LCToolComponent
 from lfx.base.tools.flow_tool import FlowTool
 from lfx.field_typing import Tool
 from lfx.graph.graph.base import Graph
-from lfx.helpers import get_flow_inputs
+from lfx.helpers import get_flow_by_id_or_name, get_flow_inputs
 from lfx.io import BoolInput, DropdownInput, Output, StrInput
 from lfx.log.logger import logger
 from lfx.schema.data import Data
@@ -24,7 +24,7 @@ class FlowToolComponent(LCToolComponent):
     icon = "hammer"
 
     async def get_flow_names(self) -> list[str]:
-        flow_datas = await self.alist_flows()
+        flow_datas = await self.alist_flows(include_data=False)
         return [flow_data.data["name"] for flow_data in flow_datas]
 
     async def get_flow(self, flow_name: str) -> Data | None:
@@ -36,10 +36,11 @@ class FlowToolComponent(LCToolComponent):
         Returns:
             Optional[Text]: The flow record if found, None otherwise.
         """
-        flow_datas = await self.alist_flows()
+        # Find the flow among the headers, then load only its graph
+        flow_datas = await self.alist_flows(include_data=False)
         for flow_data in flow_datas:
             if flow_data.data["name"] == flow_name:
-                return flow_data
+                return await get_flow_by_id_or_name(user_id=str(self.user_id), flow_id=str(flow_data.data["id"]))
         return None
 
     @override
@@ -1,6 +1,7 @@
+from lfx.base.flow_controls.loop_body import LoopBody
 from lfx.components.processing.converter import convert_to_data
 from lfx.custom.custom_component.component import Component
-from lfx.inputs.inputs import HandleInput
+from lfx.inputs.inputs import BoolInput, DropdownInput, HandleInput, IntInput
 from lfx.schema.data import Data
 from lfx.schema.dataframe import DataFrame
 from lfx.schema.message import Message
@@ -24,6 +25,35 @@ class LoopComponent(Component):
             info="The initial DataFrame to iterate over.",
             input_types=["DataFrame"],
         ),
+        BoolInput(
+            name="parallel",
+            display_name="Parallel Map",
+            info=(
+                "Run the loop body for several items at once instead of one item per iteration. "
+                "Each item runs in an isolated copy of the components between Item and the loop input, "
+                "and results are collected in input order."
+            ),
+            value=False,
+            advanced=True,
+        ),
+        IntInput(
+            name="max_concurrency",
+            display_name="Max Concurrency",
+            info="Maximum number of items processed at the same time in parallel map mode.",
+            value=4,
+            advanced=True,
+        ),
+        DropdownInput(
+            name="error_policy",
+            display_name="On Item Error",
+            options=["Fail Fast", "Skip", "Collect"],
+            info=(
+                "Parallel map mode only. Fail Fast stops at the first failing item, Skip leaves failed items out "
+                "of the results, and Collect returns a row with the error in place of each failed item."
+            ),
+            value="Fail Fast",
+            advanced=True,
+        ),
     ]
 
     outputs = [
@@ -93,6 +123,11 @@ class LoopComponent(Component):
         self.initialize_data()
         current_item = Data(text="")
 
+        if self.parallel:
+            # The body runs from done_output; the cyclic scheduler never visits it.
+            self.stop("item")
+            return current_item
+
         if self.evaluate_stop_loop():
             self.stop("item")
         else:
@@ -120,10 +155,15 @@ class LoopComponent(Component):
             if self._id not in self.graph.run_manager.run_map[item_dependency_id]:
                 self.graph.run_manager.run_map[item_dependency_id].append(self._id)
 
-    def done_output(self) -> DataFrame:
+    async def done_output(self) -> DataFrame:
         """Trigger the done output when iteration is complete."""
         self.initialize_data()
 
+        if self.parallel:
+            self.stop("item")
+            self.start("done")
+            return DataFrame(await self.parallel_map())
+
         if self.evaluate_stop_loop():
             self.stop("item")
             self.start("done")
@@ -134,6 +174,46 @@ class LoopComponent(Component):
         self.stop("done")
         return DataFrame([])
 
+    async def parallel_map(self) -> list[Data]:
+        """Run the loop body for every item concurrently and return the results in input order."""
+        data_list = self.ctx.get(f"{self._id}_data", [])
+        body = LoopBody(self.graph, self._id)
+        total = len(data_list)
+        # Report roughly every 5% so long runs do not flood the event stream.
+        progress_step = max(1, total // 20)
+
+        def on_progress(completed: int, total: int, failed: int) -> None:
+            if completed % progress_step == 0 or completed == total:
+                self.log({"completed": completed, "total": total, "failed": failed}, name="Progress")
+
+        results = await body.map(
+            data_list,
+            max_concurrency=self.max_concurrency,
+            fail_fast=self.error_policy == "Fail Fast",
+            on_progress=on_progress,
+            event_manager=self._event_manager,
+        )
+
+        aggregated = []
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                if self.error_policy == "Collect":
+                    aggregated.append(Data(data={**data_list[index].data, "error": str(result), "index": index}))
+                continue
+            if (item := self._to_aggregated_item(result)) is not None:
+                aggregated.append(item)
+        self.update_ctx({f"{self._id}_aggregated": aggregated})
+        return aggregated
+
+    def _to_aggregated_item(self, loop_input) -> Data | None:
+        """Convert a value fed back into the loop into the Data row collected by done_output."""
+        if loop_input is None or isinstance(loop_input, str):
+            return None
+        # If the loop input is a Message, convert it to Data for consistency
+        if isinstance(loop_input, Message):
+            return self._convert_message_to_data(loop_input)
+        return loop_input
+
     def loop_variables(self):
         """Retrieve loop variables from context."""
         return (
@@ -151,13 +231,10 @@ class LoopComponent(Component):
         # Get data list and aggregated list
         data_list = self.ctx.get(f"{self._id}_data", [])
         aggregated = self.ctx.get(f"{self._id}_aggregated", [])
-        loop_input = self.item
+        loop_input = self._to_aggregated_item(self.item)
 
         # Append the current loop input to aggregated if it's not already included
-        if loop_input is not None and not isinstance(loop_input, str) and len(aggregated) <= len(data_list):
-            # If the loop input is a Message, convert it to Data for consistency
-            if isinstance(loop_input, Message):
-                loop_input = self._convert_message_to_data(loop_input)
+        if loop_input is not None and len(aggregated) <= len(data_list):
             aggregated.append(loop_input)
             self.update_ctx({f"{self._id}_aggregated": aggregated})
         return aggregated
@@ -4,7 +4,7 @@ from lfx.base.flow_processing.utils import build_data_from_result_data
 from lfx.custom.custom_component.component import Component
 from lfx.graph.graph.base import Graph
 from lfx.graph.vertex.base import Vertex
-from lfx.helpers import get_flow_inputs
+from lfx.helpers import get_flow_by_id_or_name, get_flow_inputs
 from lfx.io import DropdownInput, Output
 from lfx.log.logger import logger
 from lfx.schema.data import Data
@@ -20,14 +20,15 @@ class SubFlowComponent(Component):
     icon = "Workflow"
 
     async def get_flow_names(self) -> list[str]:
-        flow_data = await self.alist_flows()
+        flow_data = await self.alist_flows(include_data=False)
         return [flow_data.data["name"] for flow_data in flow_data]
 
     async def get_flow(self, flow_name: str) -> Data | None:
-        flow_datas = await self.alist_flows()
+        # Find the flow among the headers, then load only its graph
+        flow_datas = await self.alist_flows(include_data=False)
         for flow_data in flow_datas:
             if flow_data.data["name"] == flow_name:
-                return flow_data
+                return await get_flow_by_id_or_name(user_id=str(self.user_id), flow_id=str(flow_data.data["id"]))
         return None
 
     async def update_build_config(self, build_config: dotdict, field_value: Any, field_name: str | None = None):
@@ -153,9 +153,9 @@ class BatchRunComponent(Component):
             model_name_param = metadata.get("model_name_param", "model")
 
             # Get API key from global variables
-            from lfx.base.models.unified_models import get_api_key_for_provider
+            from lfx.base.models.unified_models import aget_api_key_for_provider
 
-            api_key = get_api_key_for_provider(self.user_id, provider, self.api_key)
+            api_key = await aget_api_key_for_provider(self.user_id, provider, self.api_key)
 
             if not api_key and provider != "Ollama":
                 msg = f"{provider} API key is required. Please configure it globally."
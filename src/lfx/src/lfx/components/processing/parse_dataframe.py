@@ -1,4 +1,5 @@
 from lfx.custom.custom_component.component import Component
+from lfx.helpers.data import format_dataframe_rows
 from lfx.io import DataFrameInput, MultilineInput, Output, StrInput
 from lfx.schema.message import Message
 
@@ -56,12 +57,8 @@ class ParseDataFrameComponent(Component):
         """
         dataframe, template, sep = self._clean_args()
 
-        lines = []
-        # For each row in the DataFrame, build a dict and format
-        for _, row in dataframe.iterrows():
-            row_dict = row.to_dict()
-            text_line = template.format(**row_dict)  # e.g. template="{text}", row_dict={"text": "Hello"}
-            lines.append(text_line)
+        # Format every row with the template, e.g. template="{text}" and row {"text": "Hello"} -> "Hello"
+        lines = format_dataframe_rows(template, dataframe)
 
         # Join all lines with the provided separator
         result_string = sep.join(lines)
@@ -1,5 +1,6 @@
 from langchain_text_splitters import CharacterTextSplitter
 
+from lfx.base.textsplitters.batched import iter_dataframe_documents, iter_split_chunks
 from lfx.custom.custom_component.component import Component
 from lfx.io import DropdownInput, HandleInput, IntInput, MessageTextInput, Output
 from lfx.schema.data import Data
@@ -14,6 +15,7 @@ class SplitTextComponent(Component):
     documentation: str = "https://docs.langflow.org/split-text"
     icon = "scissors-line-dashed"
     name = "SplitText"
+    executor_class = "cpu"
 
     inputs = [
         HandleInput(
@@ -80,10 +82,27 @@ class SplitTextComponent(Component):
             return "\t"
         return separator
 
-    def split_text_base(self):
+    def _splitter_kwargs(self) -> dict:
         separator = self._fix_separator(self.separator)
         separator = unescape_string(separator)
 
+        # Convert string 'False'/'True' to boolean
+        keep_sep = self.keep_separator
+        if isinstance(keep_sep, str):
+            if keep_sep.lower() == "false":
+                keep_sep = False
+            elif keep_sep.lower() == "true":
+                keep_sep = True
+            # 'start' and 'end' are kept as strings
+
+        return {
+            "chunk_overlap": self.chunk_overlap,
+            "chunk_size": self.chunk_size,
+            "separator": separator,
+            "keep_separator": keep_sep,
+        }
+
+    def split_text_base(self):
         if isinstance(self.data_inputs, DataFrame):
             if not len(self.data_inputs):
                 msg = "DataFrame is empty"
@@ -117,25 +136,28 @@ class SplitTextComponent(Component):
                     msg = f"Invalid input type in collection: {e}"
                     raise TypeError(msg) from e
         try:
-            # Convert string 'False'/'True' to boolean
-            keep_sep = self.keep_separator
-            if isinstance(keep_sep, str):
-                if keep_sep.lower() == "false":
-                    keep_sep = False
-                elif keep_sep.lower() == "true":
-                    keep_sep = True
-                # 'start' and 'end' are kept as strings
-
-            splitter = CharacterTextSplitter(
-                chunk_overlap=self.chunk_overlap,
-                chunk_size=self.chunk_size,
-                separator=separator,
-                keep_separator=keep_sep,
-            )
+            splitter = CharacterTextSplitter(**self._splitter_kwargs())
             return splitter.split_documents(documents)
         except Exception as e:
             msg = f"Error splitting text: {e}"
             raise TypeError(msg) from e
 
     def split_text(self) -> DataFrame:
-        return DataFrame(self._docs_to_data(self.split_text_base()))
+        if not isinstance(self.data_inputs, DataFrame):
+            return DataFrame(self._docs_to_data(self.split_text_base()))
+        if not len(self.data_inputs):
+            msg = "DataFrame is empty"
+            raise TypeError(msg)
+
+        # Rows are read and split batch by batch, and chunks go straight into the builder,
+        # so no list of Documents is ever built for the whole frame.
+        builder = DataFrame.builder()
+        documents = iter_dataframe_documents(self.data_inputs, self.text_key, self.data_inputs.default_value)
+        try:
+            for chunk, metadata in iter_split_chunks(documents, self._splitter_kwargs()):
+                metadata.setdefault("text", chunk)
+                builder.add_row(metadata)
+        except Exception as e:
+            msg = f"Error splitting text: {e}"
+            raise TypeError(msg) from e
+        return builder.build()
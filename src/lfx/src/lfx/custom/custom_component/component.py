@@ -40,6 +40,7 @@ from lfx.serialization.serialization import serialize
 from lfx.template.field.base import UNDEFINED, Input, Output
 from lfx.template.frontend_node.custom_components import ComponentFrontendNode
 from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import run_in_executor
 from lfx.utils.util import find_closest_match
 
 from .custom_component import CustomComponent
@@ -54,6 +55,7 @@ if TYPE_CHECKING:
     from lfx.inputs.inputs import InputTypes
     from lfx.schema.dataframe import DataFrame
     from lfx.schema.log import LoggableType
+    from lfx.utils.executors import ExecutorClass
 
 
 _ComponentToolkit = None
@@ -114,6 +116,12 @@ class Component(CustomComponent):
     outputs: list[Output] = []
     selected_output: str | None = None
     code_class_base_inheritance: ClassVar[str] = "Component"
+    executor_class: ClassVar[ExecutorClass] = "io"
+    """Pool used to run synchronous output methods: "io" for blocking I/O, "cpu" for CPU-bound work.
+
+    Output methods are bound to the component and cannot be sent to another process, so "process" runs
+    them in the "cpu" thread pool. Picklable helpers can still use ``run_in_executor("process", ...)``.
+    """
 
     def __init__(self, **kwargs) -> None:
         # Initialize instance-specific attributes first
@@ -1235,7 +1243,7 @@ class Component(CustomComponent):
 
         method = getattr(self, output.method)
         try:
-            result = await method() if inspect.iscoroutinefunction(method) else await asyncio.to_thread(method)
+            result = await method() if inspect.iscoroutinefunction(method) else await self._run_sync_output(method)
         except TypeError as e:
             msg = f'Error running method "{output.method}": {e}'
             raise TypeError(msg) from e
@@ -1252,6 +1260,10 @@ class Component(CustomComponent):
 
         return result
 
+    async def _run_sync_output(self, method: Callable[[], Any]) -> Any:
+        executor_class = "cpu" if self.executor_class == "process" else self.executor_class
+        return await run_in_executor(executor_class, method)
+
     async def resolve_output(self, output_name: str) -> Any:
         """Resolves and returns the value for a specified output by name.
 
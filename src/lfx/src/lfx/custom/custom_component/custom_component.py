@@ -555,10 +555,13 @@ class CustomComponent(BaseComponent):
         """DEPRECATED - This is kept for backward compatibility. Using alist_flows instead is recommended."""
         return run_until_complete(self.alist_flows())
 
-    async def alist_flows(self) -> list[Data]:
-        """List all flows for the current user."""
+    async def alist_flows(self, *, include_data: bool = True) -> list[Data]:
+        """List all flows for the current user.
+
+        With ``include_data=False`` the flow graphs are not loaded and ``data`` is None in every result.
+        """
         try:  # user id is validated in the function
-            return await list_flows(user_id=str(self.user_id))
+            return await list_flows(user_id=str(self.user_id), include_data=include_data)
         except Exception as e:
             msg = f"Error listing flows: {e}"
             raise ValueError(msg) from e
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 import inspect
+import itertools
 import json
 import time
-import uuid
 from functools import partial
 from typing import TYPE_CHECKING
 
@@ -25,10 +25,20 @@ class PartialEventCallback(Protocol):
     def __call__(self, *, data: LoggableType): ...
 
 
+def event_sequence(event_id: str | None) -> int | None:
+    """Return the sequence number of an event id created by ``EventManager.send_event``, if it has one."""
+    if not event_id:
+        return None
+    _, _, sequence = event_id.rpartition("-")
+    return int(sequence) if sequence.isdigit() else None
+
+
 class EventManager:
-    def __init__(self, queue):
+    def __init__(self, queue, *, first_sequence: int = 1):
         self.queue = queue
         self.events: dict[str, PartialEventCallback] = {}
+        # Events are numbered 1, 2, 3, ... in the order they are sent, so a client can resume after the last one it got
+        self._sequence = itertools.count(first_sequence)
 
     @staticmethod
     def _validate_callback(callback: EventCallback) -> None:
@@ -73,7 +83,7 @@ class EventManager:
             logger.debug(f"Error processing event: {event_type}")
         jsonable_data = jsonable_encoder(data)
         json_data = {"event": event_type, "data": jsonable_data}
-        event_id = f"{event_type}-{uuid.uuid4()}"
+        event_id = f"{event_type}-{next(self._sequence)}"
         str_data = json.dumps(json_data) + "\n\n"
         if self.queue:
             try:
@@ -21,6 +21,8 @@ from lfx.events.observability.lifecycle_events import observable
 from lfx.exceptions.component import ComponentBuildError
 from lfx.graph.edge.base import CycleEdge, Edge
 from lfx.graph.graph.constants import Finish, lazy_load_vertex_dict
+from lfx.graph.graph.fingerprint import is_reusable
+from lfx.graph.graph.layer_plans import layer_plan_cache, structure_key
 from lfx.graph.graph.runnable_vertices_manager import RunnableVerticesManager
 from lfx.graph.graph.schema import GraphData, GraphDump, StartConfigDict, VertexBuildResult
 from lfx.graph.graph.state_model import create_state_model_from_graph
@@ -1498,6 +1500,7 @@ class Graph:
         user_id: str | None = None,
         fallback_to_env_vars: bool = False,
         event_manager: EventManager | None = None,
+        fingerprint: str | None = None,
     ) -> VertexBuildResult:
         """Builds a vertex in the graph.
 
@@ -1510,6 +1513,9 @@ class Graph:
             user_id (Optional[str]): Optional user ID. Defaults to None.
             fallback_to_env_vars (bool): Whether to fallback to environment variables. Defaults to False.
             event_manager (Optional[EventManager]): Optional event manager. Defaults to None.
+            fingerprint (Optional[str]): The vertex's fingerprint (see ``compute_vertex_fingerprints``). When
+                given, the vertex's cached result is reused instead of building the vertex if it was built with
+                the same fingerprint.
 
         Returns:
             Tuple: A tuple containing the next runnable vertices, top level vertices, result dictionary,
@@ -1522,42 +1528,19 @@ class Graph:
         self.run_manager.add_to_vertices_being_run(vertex_id)
         try:
             params = ""
-            should_build = False
             # Loop components must always build, even when frozen,
             # because they need to iterate through their data
             is_loop_component = vertex.display_name == "Loop" or vertex.is_loop
-            if not vertex.frozen or is_loop_component:
-                should_build = True
+            if not (fingerprint and is_reusable(vertex)):
+                fingerprint = None
+            if vertex.frozen and not is_loop_component:
+                should_build = not await self._restore_cached_build(vertex, vertex.id, get_cache)
+            elif fingerprint is not None:
+                should_build = not await self._restore_cached_build(
+                    vertex, vertex.id, get_cache, fingerprint=fingerprint
+                )
             else:
-                # Check the cache for the vertex
-                if get_cache is not None:
-                    cached_result = await get_cache(key=vertex.id)
-                else:
-                    cached_result = CacheMiss()
-                if isinstance(cached_result, CacheMiss):
-                    should_build = True
-                else:
-                    try:
-                        cached_vertex_dict = cached_result["result"]
-                        # Now set update the vertex with the cached vertex
-                        vertex.built = cached_vertex_dict["built"]
-                        vertex.artifacts = cached_vertex_dict["artifacts"]
-                        vertex.built_object = cached_vertex_dict["built_object"]
-                        vertex.built_result = cached_vertex_dict["built_result"]
-                        vertex.full_data = cached_vertex_dict["full_data"]
-                        vertex.results = cached_vertex_dict["results"]
-                        try:
-                            vertex.finalize_build()
-
-                            if vertex.result is not None:
-                                vertex.result.used_frozen_result = True
-                        except Exception:  # noqa: BLE001
-                            logger.debug("Error finalizing build", exc_info=True)
-                            vertex.built = False
-                            should_build = True
-                    except KeyError:
-                        vertex.built = False
-                        should_build = True
+                should_build = True
 
             if should_build:
                 await vertex.build(
@@ -1575,6 +1558,8 @@ class Graph:
                         "built_object": vertex.built_object,
                         "built_result": vertex.built_result,
                         "full_data": vertex.full_data,
+                        # One entry per vertex: a build with another fingerprint replaces it
+                        "fingerprint": fingerprint,
                     }
 
                     await set_cache(key=vertex.id, data=vertex_dict)
@@ -1597,6 +1582,42 @@ class Graph:
             result_dict=result_dict, params=params, valid=valid, artifacts=artifacts, vertex=vertex
         )
 
+    @staticmethod
+    async def _restore_cached_build(
+        vertex: Vertex, key: str, get_cache: GetCache | None, *, fingerprint: str | None = None
+    ) -> bool:
+        """Restore the vertex from the build cached under ``key``; return whether there was one to restore.
+
+        With ``fingerprint``, only a build made with that fingerprint is restored.
+        """
+        cached_result = await get_cache(key=key) if get_cache is not None else CacheMiss()
+        if isinstance(cached_result, CacheMiss):
+            return False
+        try:
+            cached_vertex_dict = cached_result["result"]
+            if fingerprint is not None and cached_vertex_dict.get("fingerprint") != fingerprint:
+                return False
+            # Now set update the vertex with the cached vertex
+            vertex.built = cached_vertex_dict["built"]
+            vertex.artifacts = cached_vertex_dict["artifacts"]
+            vertex.built_object = cached_vertex_dict["built_object"]
+            vertex.built_result = cached_vertex_dict["built_result"]
+            vertex.full_data = cached_vertex_dict["full_data"]
+            vertex.results = cached_vertex_dict["results"]
+        except KeyError:
+            vertex.built = False
+            return False
+        try:
+            vertex.finalize_build()
+
+            if vertex.result is not None:
+                vertex.result.used_frozen_result = True
+        except Exception:  # noqa: BLE001
+            logger.debug("Error finalizing build", exc_info=True)
+            vertex.built = False
+            return False
+        return True
+
     def get_vertex_edges(
         self,
         vertex_id: str,
@@ -2120,11 +2141,11 @@ class Graph:
 
     def get_vertex_predecessors_ids(self, vertex_id: str) -> list[str]:
         """Get the predecessor IDs of a vertex."""
-        return [v.id for v in self.get_predecessors(self.get_vertex(vertex_id))]
+        return list(self.predecessor_map.get(vertex_id, []))
 
     def get_vertex_successors_ids(self, vertex_id: str) -> list[str]:
         """Get the successor IDs of a vertex."""
-        return [v.id for v in self.get_vertex(vertex_id).successors]
+        return list(self.successor_map.get(vertex_id, []))
 
     def get_vertex_input_status(self, vertex_id: str) -> bool:
         """Check if a vertex is an input vertex."""
@@ -2157,20 +2178,37 @@ class Graph:
         """Sorts the vertices in the graph."""
         self.mark_all_vertices("ACTIVE")
 
-        first_layer, remaining_layers = get_sorted_vertices(
-            vertices_ids=self.get_vertex_ids(),
-            cycle_vertices=self.cycle_vertices,
-            stop_component_id=stop_component_id,
-            start_component_id=start_component_id,
-            graph_dict=self.__to_dict(),
-            in_degree_map=self.in_degree_map,
-            successor_map=self.successor_map,
-            predecessor_map=self.predecessor_map,
-            is_input_vertex=self.get_vertex_input_status,
-            get_vertex_predecessors=self.get_vertex_predecessors_ids,
-            get_vertex_successors=self.get_vertex_successors_ids,
-            is_cyclic=self.is_cyclic,
+        vertices_ids = self.get_vertex_ids()
+        cycle_vertices = self.cycle_vertices
+        plan_key = (
+            structure_key(
+                vertices_ids,
+                self.in_degree_map,
+                self.successor_map,
+                self.predecessor_map,
+                cycle_vertices,
+                is_cyclic=self.is_cyclic,
+            ),
+            start_component_id,
+            stop_component_id,
         )
+        plan = layer_plan_cache.get(plan_key)
+        if plan is None:
+            plan = get_sorted_vertices(
+                vertices_ids=vertices_ids,
+                cycle_vertices=cycle_vertices,
+                stop_component_id=stop_component_id,
+                start_component_id=start_component_id,
+                in_degree_map=self.in_degree_map,
+                successor_map=self.successor_map,
+                predecessor_map=self.predecessor_map,
+                is_input_vertex=self.get_vertex_input_status,
+                get_vertex_predecessors=self.get_vertex_predecessors_ids,
+                get_vertex_successors=self.get_vertex_successors_ids,
+                is_cyclic=self.is_cyclic,
+            )
+            layer_plan_cache.set(plan_key, plan)
+        first_layer, remaining_layers = plan
 
         self.increment_run_count()
         self._sorted_vertices_layers = [first_layer, *remaining_layers]
@@ -2304,16 +2342,6 @@ class Graph:
             successor_map[edge.source_id].append(edge.target_id)
         return predecessor_map, successor_map
 
-    def __to_dict(self) -> dict[str, dict[str, list[str]]]:
-        """Converts the graph to a dictionary."""
-        result: dict = {}
-        for vertex in self.vertices:
-            vertex_id = vertex.id
-            sucessors = [i.id for i in self.get_all_successors(vertex)]
-            predecessors = [i.id for i in self.get_predecessors(vertex)]
-            result |= {vertex_id: {"successors": sucessors, "predecessors": predecessors}}
-        return result
-
     def raw_event_metrics(self, optional_fields: dict | None = None) -> dict:
         if optional_fields is None:
             optional_fields = {}
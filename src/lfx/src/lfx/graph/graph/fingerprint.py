@@ -0,0 +1,174 @@
+"""Fingerprints that tell whether a vertex would produce the same result as in an earlier build.
+
+A vertex's fingerprint hashes its template (the values of its inputs, and its code), the outputs it exposes,
+the edges feeding it and the fingerprints of the vertices they come from. Two builds that give a vertex the
+same fingerprint therefore run it with the same parameters on the same upstream results, so the second build
+can reuse the result of the first (see ``Graph.build_vertex``). Changing a vertex changes the fingerprint of
+that vertex and of every vertex downstream of it, and of no other.
+
+Global variables are hashed by value (see ``aget_variable_values``), so updating a variable invalidates the
+vertices that read it. Without the values, vertices that read global variables are never reused.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from collections import defaultdict
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from lfx.services.deps import get_settings_service, get_variable_service, session_scope
+from lfx.services.session import NoopSession
+
+if TYPE_CHECKING:
+    from lfx.graph.graph.base import Graph
+    from lfx.graph.vertex.base import Vertex
+
+
+def is_reusable(vertex: Vertex) -> bool:
+    """Whether a build may reuse an earlier result of the vertex instead of running it.
+
+    Inputs and outputs always run: they read the request and record the chat messages of the build. Loops
+    run on every iteration. Vertices with a session id (message history, memories) and state vertices read
+    or write state outside the graph, so their result can change while their fingerprint does not.
+    """
+    return not (
+        vertex.is_input
+        or vertex.is_output
+        or vertex.is_loop
+        or vertex.display_name == "Loop"
+        or vertex.has_session_id
+        or vertex.is_state
+    )
+
+
+def variable_names(vertex: Vertex) -> list[str]:
+    """Return the names of the global variables the vertex loads, in its fields and its table columns."""
+    names = []
+    for field in vertex.data.get("node", {}).get("template", {}).values():
+        if not isinstance(field, dict):
+            continue
+        value = field.get("value")
+        if field.get("load_from_db") and isinstance(value, str) and value:
+            names.append(value)
+        columns = [
+            column["name"]
+            for column in field.get("table_schema") or []
+            if isinstance(column, dict) and column.get("load_from_db")
+        ]
+        if columns and isinstance(value, list):
+            names.extend(
+                row[column]
+                for row in value
+                if isinstance(row, dict)
+                for column in columns
+                if isinstance(row.get(column), str) and row[column]
+            )
+    return names
+
+
+async def aget_variable_values(
+    graph: Graph, user_id: str | UUID | None, *, fallback_to_env_vars: bool = False
+) -> dict[str, Any]:
+    """Return the value of every global variable the graph's vertices load, by name.
+
+    Values resolve as they do when the vertices build: request variables in the graph's context first, then
+    the user's variables, or environment variables without a database. Variables that cannot be resolved map
+    to ``None``.
+    """
+    names = {name for vertex in graph.vertices for name in variable_names(vertex)}
+    if not names:
+        return {}
+    request_variables = (graph.context or {}).get("request_variables") or {}
+    values = {name: request_variables[name] for name in names if name in request_variables}
+    missing = names - values.keys()
+    if not missing:
+        return values
+
+    variable_service = get_variable_service()
+    settings_service = get_settings_service()
+    async with session_scope() as session:
+        use_env = (
+            variable_service is None
+            or user_id is None
+            or isinstance(session, NoopSession)
+            or bool(settings_service and settings_service.settings.use_noop_database)
+        )
+        for name in missing:
+            value = None
+            if not use_env:
+                try:
+                    value = await variable_service.get_variable(
+                        user_id=UUID(str(user_id)), name=name, field="", session=session
+                    )
+                except ValueError:
+                    value = None
+            if value is None and (use_env or fallback_to_env_vars):
+                value = os.getenv(name)
+            values[name] = value
+    return values
+
+
+def _digest(value: Any) -> str:
+    return hashlib.sha256(json.dumps(value, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def compute_vertex_fingerprints(
+    graph: Graph,
+    *,
+    inputs_dict: dict[str, Any] | None = None,
+    files: list[str] | None = None,
+    variables: dict[str, Any] | None = None,
+) -> dict[str, str | None]:
+    """Return the fingerprint of every vertex of ``graph``.
+
+    Fingerprints are scoped to the graph's flow and session, and input vertices also hash the request's
+    inputs and files. Vertices that are part of a cycle, or that depend on one, get ``None``: their results
+    must never be reused. So do vertices that load a global variable missing from ``variables`` (see
+    ``aget_variable_values``).
+    """
+    incoming = defaultdict(list)
+    for edge in graph.edges:
+        incoming[edge.target_id].append(edge)
+    cycle_vertices = graph.cycle_vertices if graph.is_cyclic else set()
+    seed = {"flow_id": graph.flow_id, "session_id": graph.session_id}
+    fingerprints: dict[str, str | None] = {}
+
+    def fingerprint(vertex_id: str) -> str | None:
+        if vertex_id in fingerprints:
+            return fingerprints[vertex_id]
+        # Set before recursing, so a cycle that cycle_vertices missed ends in None rather than recursing forever
+        fingerprints[vertex_id] = None
+        if vertex_id in cycle_vertices:
+            return None
+        vertex = graph.get_vertex(vertex_id)
+        upstream = []
+        for edge in sorted(incoming[vertex_id], key=lambda edge: (edge.source_id, edge.target_param or "")):
+            source_fingerprint = fingerprint(edge.source_id)
+            if source_fingerprint is None:
+                return None
+            source_output = getattr(edge.source_handle, "name", None)
+            upstream.append([edge.target_param, source_output, source_fingerprint])
+        names = variable_names(vertex)
+        if any(name not in (variables or {}) for name in names):
+            return None
+        node = vertex.data.get("node", {})
+        value = {
+            **seed,
+            "id": vertex_id,
+            "template": node.get("template", {}),
+            "outputs": [output.get("name") for output in node.get("outputs", []) if isinstance(output, dict)],
+            "upstream": upstream,
+            "variables": {name: _digest(variables[name]) for name in sorted(names)},
+        }
+        if vertex.is_input:
+            value["inputs"] = inputs_dict or {}
+            value["files"] = files or []
+        fingerprints[vertex_id] = _digest(value)
+        return fingerprints[vertex_id]
+
+    for vertex in graph.vertices:
+        fingerprint(vertex.id)
+    return fingerprints
@@ -0,0 +1,92 @@
+"""Process-wide cache of the layer plans computed by ``Graph.sort_vertices``.
+
+Every build of a flow constructs a new ``Graph`` and sorts it again, although the flow's structure rarely
+changes between builds. Plans are keyed by the structure the sort reads (the vertex ids in order, their
+in-degree, predecessors and successors, and the cycle vertices) together with the start and stop components,
+so any edit to the flow, or a run that trims the predecessor lists, simply misses the cache.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+DEFAULT_MAX_SIZE = 128
+
+LayerPlan = tuple[list[str], list[list[str]]]
+
+
+def structure_key(
+    vertices_ids: Sequence[str],
+    in_degree_map: Mapping[str, int],
+    successor_map: Mapping[str, list[str]],
+    predecessor_map: Mapping[str, list[str]],
+    cycle_vertices: set[str],
+    *,
+    is_cyclic: bool,
+) -> tuple:
+    """Return a hashable key covering everything the layered sort reads from the graph."""
+    return (
+        is_cyclic,
+        frozenset(cycle_vertices),
+        tuple(
+            (
+                vertex_id,
+                in_degree_map.get(vertex_id, 0),
+                tuple(predecessor_map.get(vertex_id, ())),
+                tuple(successor_map.get(vertex_id, ())),
+            )
+            for vertex_id in vertices_ids
+        ),
+    )
+
+
+class LayerPlanCache:
+    """LRU cache of ``(first_layer, remaining_layers)`` plans.
+
+    Plans are stored as tuples and handed out as fresh lists, since the graph consumes its layers while running.
+    A ``max_size`` of ``0`` disables the cache.
+    """
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple, tuple[tuple[str, ...], ...]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple) -> LayerPlan | None:
+        with self._lock:
+            layers = self._entries.get(key)
+            if layers is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return list(layers[0]), [list(layer) for layer in layers[1:]]
+
+    def set(self, key: tuple, plan: LayerPlan) -> None:
+        if self.max_size <= 0:
+            return
+        first_layer, remaining_layers = plan
+        with self._lock:
+            self._entries[key] = (tuple(first_layer), *(tuple(layer) for layer in remaining_layers))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached plan."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {"size": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+layer_plan_cache = LayerPlanCache()
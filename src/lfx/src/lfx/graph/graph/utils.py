@@ -1,6 +1,6 @@
 import copy
 from collections import defaultdict, deque
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import Any
 
 import networkx as nx
@@ -516,6 +516,20 @@ def layered_topological_sort(
             # or (is_input_vertex and is_input_vertex(vertex_id))
         )
 
+    # How many times each vertex is waiting in the queue, so membership checks do not scan the deque
+    queued: dict[str, int] = defaultdict(int)
+    for vertex_id in queue:
+        queued[vertex_id] += 1
+
+    def enqueue(vertex_id: str) -> None:
+        queue.append(vertex_id)
+        queued[vertex_id] += 1
+
+    def dequeue() -> str:
+        vertex_id = queue.popleft()
+        queued[vertex_id] -= 1
+        return vertex_id
+
     layers: list[list[str]] = []
     visited = set()
     cycle_counts = dict.fromkeys(vertices_ids, 0)
@@ -527,7 +541,7 @@ def layered_topological_sort(
         first_layer_vertices = set()
         layer_size = len(queue)
         for _ in range(layer_size):
-            vertex_id = queue.popleft()
+            vertex_id = dequeue()
             if vertex_id not in first_layer_vertices:
                 first_layer_vertices.add(vertex_id)
                 visited.add(vertex_id)
@@ -544,18 +558,18 @@ def layered_topological_sort(
 
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0:
-                    queue.append(neighbor)
+                    enqueue(neighbor)
 
                 # if > 0 it might mean not all predecessors have added to the queue
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
                         if (
-                            predecessor not in queue
+                            not queued[predecessor]
                             and predecessor not in first_layer_vertices
                             and (in_degree_map[predecessor] == 0 or predecessor in cycle_vertices)
                         ):
-                            queue.append(predecessor)
+                            enqueue(predecessor)
 
         current_layer += 1  # Next layer
 
@@ -564,7 +578,7 @@ def layered_topological_sort(
         layers.append([])  # Start a new layer
         layer_size = len(queue)
         for _ in range(layer_size):
-            vertex_id = queue.popleft()
+            vertex_id = dequeue()
             if vertex_id not in visited or (is_cyclic and cycle_counts[vertex_id] < MAX_CYCLE_APPEARANCES):
                 if vertex_id not in visited:
                     visited.add(vertex_id)
@@ -581,7 +595,7 @@ def layered_topological_sort(
 
                 in_degree_map[neighbor] -= 1  # 'remove' edge
                 if in_degree_map[neighbor] == 0 and neighbor not in visited:
-                    queue.append(neighbor)
+                    enqueue(neighbor)
                     # # If this is a cycle vertex, reset its in_degree to allow it to appear again
                     # if neighbor in cycle_vertices and neighbor in visited:
                     #     in_degree_map[neighbor] = len(predecessor_map[neighbor])
@@ -590,11 +604,11 @@ def layered_topological_sort(
                 # so we should process the neighbors predecessors
                 elif in_degree_map[neighbor] > 0:
                     for predecessor in predecessor_map[neighbor]:
-                        if predecessor not in queue and (
+                        if not queued[predecessor] and (
                             predecessor not in visited
                             or (is_cyclic and cycle_counts[predecessor] < MAX_CYCLE_APPEARANCES)
                         ):
-                            queue.append(predecessor)
+                            enqueue(predecessor)
 
         current_layer += 1  # Next layer
 
@@ -692,6 +706,8 @@ def _sort_single_layer_by_dependency(
         if vertex in dependency_cache:
             return dependency_cache[vertex]
         max_index = index_map[vertex]
+        # Seed the cache so vertices of a cycle that share a layer (a loop and its body) do not recurse forever.
+        dependency_cache[vertex] = max_index
         for successor in get_vertex_successors(vertex):
             if successor in index_map:
                 max_index = max(max_index, max_dependency_index(successor))
@@ -862,18 +878,13 @@ def get_sorted_vertices(
             get_vertex_successors=get_vertex_successors,
             graph_dict=graph_dict,
         )
-        # Then get all vertices that can reach any reachable vertex
-        connected_vertices = set()
-        for vertex in reachable_vertices:
-            connected_vertices.update(
-                filter_vertices_up_to_vertex(
-                    vertices_ids,
-                    vertex,
-                    get_vertex_predecessors=get_vertex_predecessors,
-                    get_vertex_successors=get_vertex_successors,
-                    graph_dict=graph_dict,
-                )
-            )
+        # Then get all vertices that can reach any reachable vertex, in a single walk from all of them
+        if get_vertex_predecessors is None:
+            if graph_dict is None:
+                msg = "Either get_vertex_predecessors or graph_dict must be provided"
+                raise ValueError(msg)
+            get_vertex_predecessors = _graph_dict_getter(graph_dict, "predecessors")
+        connected_vertices = _walk(set(vertices_ids), reachable_vertices, get_vertex_predecessors)
         vertices_ids = list(connected_vertices)
 
     # Get the layers
@@ -943,30 +954,16 @@ def filter_vertices_up_to_vertex(
             msg = "Either get_vertex_predecessors or graph_dict must be provided"
             raise ValueError(msg)
 
-        def get_vertex_predecessors(v):
-            return graph_dict[v]["predecessors"]
+        get_vertex_predecessors = _graph_dict_getter(graph_dict, "predecessors")
 
     # Build successor map if not provided
     if get_vertex_successors is None:
         if graph_dict is None:
             return set()
 
-        def get_vertex_successors(v):
-            return graph_dict[v]["successors"]
-
-    # Start with the target vertex
-    filtered_vertices = {vertex_id}
-    queue = deque([vertex_id])
+        get_vertex_successors = _graph_dict_getter(graph_dict, "successors")
 
-    # Process vertices in breadth-first order
-    while queue:
-        current_vertex = queue.popleft()
-        for predecessor in get_vertex_predecessors(current_vertex):
-            if predecessor in vertices_set and predecessor not in filtered_vertices:
-                filtered_vertices.add(predecessor)
-                queue.append(predecessor)
-
-    return filtered_vertices
+    return _walk(vertices_set, [vertex_id], get_vertex_predecessors)
 
 
 def filter_vertices_from_vertex(
@@ -998,27 +995,40 @@ def filter_vertices_from_vertex(
             msg = "Either get_vertex_predecessors or graph_dict must be provided"
             raise ValueError(msg)
 
-        def get_vertex_predecessors(v):
-            return graph_dict[v]["predecessors"]
+        get_vertex_predecessors = _graph_dict_getter(graph_dict, "predecessors")
 
     # Build successor map if not provided
     if get_vertex_successors is None:
         if graph_dict is None:
             return set()
 
-        def get_vertex_successors(v):
-            return graph_dict[v]["successors"]
+        get_vertex_successors = _graph_dict_getter(graph_dict, "successors")
 
-    # Start with the target vertex
-    filtered_vertices = {vertex_id}
-    queue = deque([vertex_id])
+    return _walk(vertices_set, [vertex_id], get_vertex_successors)
 
-    # Process vertices in breadth-first order
+
+def _graph_dict_getter(graph_dict: dict[str, Any], key: str) -> Callable[[str], list[str]]:
+    def get_neighbors(vertex_id: str) -> list[str]:
+        return graph_dict[vertex_id][key]
+
+    return get_neighbors
+
+
+def _walk(
+    vertices_set: set[str],
+    start_ids: Iterable[str],
+    get_neighbors: Callable[[str], list[str]],
+) -> set[str]:
+    """Returns the vertices of ``vertices_set`` reachable from any of ``start_ids``, the starts included.
+
+    A single breadth-first walk from all starts, so each vertex and edge is visited at most once.
+    """
+    filtered_vertices = {vertex_id for vertex_id in start_ids if vertex_id in vertices_set}
+    queue = deque(filtered_vertices)
     while queue:
         current_vertex = queue.popleft()
-        for successor in get_vertex_successors(current_vertex):
-            if successor in vertices_set and successor not in filtered_vertices:
-                filtered_vertices.add(successor)
-                queue.append(successor)
-
+        for neighbor in get_neighbors(current_vertex):
+            if neighbor in vertices_set and neighbor not in filtered_vertices:
+                filtered_vertices.add(neighbor)
+                queue.append(neighbor)
     return filtered_vertices
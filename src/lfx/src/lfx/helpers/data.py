@@ -1,8 +1,12 @@
+import datetime as dt
 import re
 from collections import defaultdict
+from string import Formatter
 from typing import Any
 
+import numpy as np
 import orjson
+import pandas as pd
 from fastapi.encoders import jsonable_encoder
 from langchain_core.documents import Document
 
@@ -165,3 +169,132 @@ def data_to_text(template: str, data: Data | list[Data], sep: str = "\n") -> str
     formatted_text, _ = data_to_text_list(template, data)
     sep = "\n" if sep is None else sep
     return sep.join(formatted_text)
+
+
+def _column_values(column: pd.Series, row_dtype: np.dtype) -> list:
+    """Return a column's values as ``row.to_dict()`` would produce them when iterating with ``iterrows``."""
+    # ``iterrows`` builds each row from the interleaved values of every column, so a frame with only
+    # numeric columns yields floats even for integer columns.
+    if row_dtype != np.dtype(object):
+        return column.astype(row_dtype, copy=False).tolist()
+    # Extension dtypes (nullable "string", "Int64", ...) hold pd.NA, which only the boxing below turns into None.
+    if isinstance(column.dtype, np.dtype) and (
+        column.dtype != np.dtype(object) or pd.api.types.infer_dtype(column, skipna=False) == "string"
+    ):
+        return column.tolist()
+    # Box numpy scalars, pd.NA and friends exactly like ``Series.to_dict`` does.
+    return list(pd.Series(column.to_numpy(dtype=object), dtype=object).to_dict().values())
+
+
+def _row_dtype(df: pd.DataFrame) -> np.dtype:
+    """Return the dtype of the rows ``iterrows`` yields for ``df``."""
+    if all(isinstance(dtype, np.dtype) for dtype in df.dtypes):
+        # Interleaving numpy dtypes does not depend on the values, so one row is enough.
+        return df.iloc[:1].to_numpy().dtype
+    # With extension dtypes it does: an "Int64" frame interleaves to int64, or to float64 once it holds pd.NA.
+    return df.to_numpy().dtype
+
+
+_DATETIME_LIKE = (dt.datetime, dt.timedelta, np.datetime64, np.timedelta64, pd.Period)
+
+
+def _datetime_rows(df: pd.DataFrame) -> np.ndarray:
+    """Mask of the rows ``iterrows`` may yield as datetime, timedelta or period Series.
+
+    ``Series`` infers such a dtype for an object row whose values are all missing or datetime-like, which turns
+    the row's missing values into NaT. The mask covers every such row, and possibly a few others.
+    """
+    candidates = np.ones(len(df), dtype=bool)
+    has_datetime = np.zeros(len(df), dtype=bool)
+    for name in df.columns:
+        column = df[name]
+        dtype = column.dtype
+        if dtype.kind in "mM" or isinstance(dtype, pd.DatetimeTZDtype | pd.PeriodDtype):
+            has_datetime[:] = True
+            continue
+        missing = column.isna().to_numpy(dtype=bool)
+        if not (isinstance(dtype, np.dtype) and dtype.kind in "biufc"):
+            present = np.flatnonzero(candidates & ~missing)
+            values = column.to_numpy(dtype=object)[present]
+            datetime_like = np.fromiter(
+                (value is pd.NaT or isinstance(value, _DATETIME_LIKE) for value in values),
+                dtype=bool,
+                count=len(values),
+            )
+            missing[present[datetime_like]] = True
+            has_datetime[present[datetime_like]] = True
+        candidates &= missing
+        if not candidates.any():
+            break
+    return candidates & has_datetime
+
+
+class CompiledTemplate:
+    """A ``str.format`` template parsed once into field references and rendered column by column.
+
+    ``CompiledTemplate(template).render(df)`` returns the same strings as
+    ``[template.format(**row.to_dict()) for _, row in df.iterrows()]``, including the ``KeyError`` raised
+    for a field that is not a column. Instead of building a Series per row, it extracts each referenced
+    column once and formats all rows with a single positional template. Templates that use positional
+    fields, attribute or index access, or nested format specs fall back to the row-by-row loop.
+    """
+
+    def __init__(self, template: str) -> None:
+        self.template = template
+        self.field_names: list[str] = []
+        self.is_vectorizable = True
+        positional_parts: list[str] = []
+        for literal, field_name, format_spec, conversion in Formatter().parse(template):
+            positional_parts.append(literal.replace("{", "{{").replace("}", "}}"))
+            if field_name is None:
+                continue
+            if (
+                not field_name
+                or field_name.isdigit()
+                or any(char in field_name for char in ".[")
+                or (format_spec and "{" in format_spec)
+            ):
+                self.is_vectorizable = False
+            if field_name not in self.field_names:
+                self.field_names.append(field_name)
+            index = self.field_names.index(field_name)
+            conversion_part = f"!{conversion}" if conversion else ""
+            spec_part = f":{format_spec}" if format_spec else ""
+            positional_parts.append(f"{{{index}{conversion_part}{spec_part}}}")
+        self.positional_template = "".join(positional_parts)
+
+    def _can_vectorize(self, df: pd.DataFrame) -> bool:
+        return self.is_vectorizable and df.columns.is_unique and all(isinstance(column, str) for column in df.columns)
+
+    def render(self, df: pd.DataFrame) -> list[str]:
+        """Render the template for every row of ``df``, in row order."""
+        if df.empty:
+            return []
+        if not self._can_vectorize(df):
+            return [self.template.format(**row.to_dict()) for _, row in df.iterrows()]
+
+        for field_name in self.field_names:
+            if field_name not in df.columns:
+                raise KeyError(field_name)
+        if not self.field_names:
+            return [self.positional_template.format()] * len(df)
+
+        row_dtype = _row_dtype(df)
+        columns = [_column_values(df[field_name], row_dtype) for field_name in self.field_names]
+        rows = np.flatnonzero(_datetime_rows(df)) if row_dtype == np.dtype(object) else ()
+        if not len(rows):
+            return list(map(self.positional_template.format, *columns))
+        # Build these rows the way ``iterrows`` does, letting ``Series`` infer their dtype. Rows are still rendered
+        # in order, so the first row that fails raises the same error as the row-by-row loop.
+        inferred = dict(zip(rows.tolist(), df.iloc[rows].to_numpy(), strict=True))
+        return [
+            self.template.format(**pd.Series(inferred[index], index=df.columns).to_dict())
+            if index in inferred
+            else self.positional_template.format(*values)
+            for index, values in enumerate(zip(*columns, strict=True))
+        ]
+
+
+def format_dataframe_rows(template: str, df: pd.DataFrame) -> list[str]:
+    """Format every row of ``df`` with ``template``, equivalent to ``template.format(**row)`` per row."""
+    return CompiledTemplate(template).render(df)
@@ -63,7 +63,7 @@ def get_arg_names(inputs: list[Vertex]) -> list[dict[str, str]]:
     ]
 
 
-async def list_flows(*, user_id: str | None = None) -> list[Data]:
+async def list_flows(*, user_id: str | None = None, include_data: bool = True) -> list[Data]:  # noqa: ARG001
     """List flows for a user.
 
     In lfx, this is a stub that returns an empty list since we don't have
@@ -71,6 +71,7 @@ async def list_flows(*, user_id: str | None = None) -> list[Data]:
 
     Args:
         user_id: The user ID to list flows for.
+        include_data: Whether to load each flow's graph; without it ``data`` is None.
 
     Returns:
         List of flow data objects.
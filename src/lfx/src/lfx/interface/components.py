@@ -34,8 +34,34 @@ class ComponentCache:
 
         Creates empty storage for all component types and tracking of fully loaded components.
         """
-        self.all_types_dict: dict[str, Any] | None = None
+        self._all_types_dict: dict[str, Any] | None = None
         self.fully_loaded_components: dict[str, bool] = {}
+        # Bumped on every change, so that payloads derived from the registry know when to rebuild.
+        self.version = 0
+        self._category_versions: dict[str, int] = {}
+        self._replaced_at = 0
+
+    @property
+    def all_types_dict(self) -> dict[str, Any] | None:
+        return self._all_types_dict
+
+    @all_types_dict.setter
+    def all_types_dict(self, value: dict[str, Any] | None) -> None:
+        self._all_types_dict = value
+        self.mark_changed()
+
+    def mark_changed(self, *categories: str) -> None:
+        """Record a change to the given categories, or to the whole registry when none are given."""
+        self.version += 1
+        if not categories:
+            self._category_versions.clear()
+            self._replaced_at = self.version
+        for category in categories:
+            self._category_versions[category] = self.version
+
+    def category_version(self, category: str) -> int:
+        """Return the registry version at which ``category`` last changed."""
+        return max(self._category_versions.get(category, 0), self._replaced_at)
 
 
 # Singleton instance
@@ -804,6 +830,7 @@ async def ensure_component_loaded(component_type: str, component_name: str, sett
 
             # Mark as fully loaded
             component_cache.fully_loaded_components[component_key] = True
+            component_cache.mark_changed(component_type)
             await logger.adebug(f"Component {component_type}:{component_name} fully loaded")
         else:
             await logger.awarning(f"Failed to fully load component {component_type}:{component_name}")
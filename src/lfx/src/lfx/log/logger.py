@@ -6,6 +6,9 @@ import logging.handlers
 import os
 import sys
 from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
 from threading import Lock, Semaphore
@@ -160,6 +163,140 @@ class SizedLogBuffer:
 log_buffer = SizedLogBuffer()
 
 
+# Default cap on the output captured for one request (see ``capture_output``)
+DEFAULT_CAPTURE_MAX_CHARS = 1024 * 1024
+
+
+class OutputCapture:
+    """Output produced while handling one request: printed text and log events.
+
+    At most ``max_chars`` characters are kept; the rest is counted in ``truncated`` and dropped, so a flow
+    that prints in a loop cannot grow the server's memory without bound.
+    """
+
+    def __init__(self, max_chars: int | None = None):
+        if max_chars is None:
+            env_max_chars = os.getenv("LANGFLOW_OUTPUT_CAPTURE_MAX_CHARS", "")
+            max_chars = int(env_max_chars) if env_max_chars.isdigit() else DEFAULT_CAPTURE_MAX_CHARS
+        self.max_chars = max_chars
+        self.truncated = 0
+        self._stdout: list[str] = []
+        self._stderr: list[str] = []
+        self._size = 0
+        # Threads started with asyncio.to_thread share the capture of the request that started them
+        self._lock = Lock()
+
+    def write(self, text: str, *, stderr: bool = False) -> None:
+        if not text:
+            return
+        with self._lock:
+            remaining = self.max_chars - self._size
+            if len(text) > remaining:
+                self.truncated += len(text) - max(remaining, 0)
+                text = text[: max(remaining, 0)]
+                if not text:
+                    return
+            (self._stderr if stderr else self._stdout).append(text)
+            self._size += len(text)
+
+    @property
+    def stdout(self) -> str:
+        return "".join(self._stdout)
+
+    @property
+    def stderr(self) -> str:
+        return "".join(self._stderr)
+
+    def getvalue(self) -> str:
+        """Return the captured stdout followed by the captured stderr."""
+        value = self.stdout + self.stderr
+        if self.truncated:
+            value += f"\n[{self.truncated} characters of output truncated]\n"
+        return value
+
+
+_current_capture: ContextVar[OutputCapture | None] = ContextVar("lfx_output_capture", default=None)
+
+
+class _CapturingStream:
+    """Stand-in for ``sys.stdout``/``sys.stderr`` that writes to the capture of the current context.
+
+    Code running outside of ``capture_output`` writes to the original stream.
+    """
+
+    def __init__(self, stream, *, stderr: bool):
+        self._stream = stream
+        self._stderr = stderr
+
+    def write(self, text: str) -> int:
+        capture = _current_capture.get()
+        if capture is None:
+            return self._stream.write(text)
+        capture.write(text, stderr=self._stderr)
+        return len(text)
+
+    def flush(self) -> None:
+        if _current_capture.get() is None:
+            self._stream.flush()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._stream, name)
+
+
+_capturing_lock = Lock()
+_active_captures = 0
+
+
+def _install_capturing_streams() -> None:
+    global _active_captures  # noqa: PLW0603
+    with _capturing_lock:
+        if not isinstance(sys.stdout, _CapturingStream):
+            sys.stdout = _CapturingStream(sys.stdout, stderr=False)
+        if not isinstance(sys.stderr, _CapturingStream):
+            sys.stderr = _CapturingStream(sys.stderr, stderr=True)
+        _active_captures += 1
+
+
+def _uninstall_capturing_streams() -> None:
+    global _active_captures  # noqa: PLW0603
+    with _capturing_lock:
+        _active_captures -= 1
+        if _active_captures > 0:
+            return
+        if isinstance(sys.stdout, _CapturingStream):
+            sys.stdout = sys.stdout._stream  # noqa: SLF001
+        if isinstance(sys.stderr, _CapturingStream):
+            sys.stderr = sys.stderr._stream  # noqa: SLF001
+
+
+@contextmanager
+def capture_output(max_chars: int | None = None) -> Iterator[OutputCapture]:
+    """Capture what the current context prints and logs, without affecting concurrent requests.
+
+    ``sys.stdout`` and ``sys.stderr`` are replaced, while any capture is active, by streams that look up the
+    capture in a context variable. Tasks and ``asyncio.to_thread`` calls started inside the block inherit
+    the capture; everything else keeps writing to the real streams. Log events are added by the
+    ``capture_log_event`` processor.
+    """
+    capture = OutputCapture(max_chars)
+    _install_capturing_streams()
+    token = _current_capture.set(capture)
+    try:
+        yield capture
+    finally:
+        _current_capture.reset(token)
+        _uninstall_capturing_streams()
+
+
+def capture_log_event(_logger: Any, method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
+    """Add the log event to the output captured for the current request, if any."""
+    capture = _current_capture.get()
+    if capture is not None:
+        timestamp = event_dict.get("timestamp", "")
+        capture.write(f"{timestamp} [{method_name}] {event_dict.get('event', '')}\n")
+    return event_dict
+
+
 def add_serialized(_logger: Any, _method_name: str, event_dict: dict[str, Any]) -> dict[str, Any]:
     """Add serialized version of the log entry."""
     # Only add serialized if we're in JSON mode (for log buffer)
@@ -264,6 +401,7 @@ def configure(
 
     processors.extend(
         [
+            capture_log_event,
             add_serialized,
             remove_exception_in_production,
             buffer_writer,
@@ -302,6 +440,9 @@ def configure(
     # Configure structlog
     # Default to stdout for backward compatibility, unless output_file is specified
     log_output_file = output_file if output_file is not None else sys.stdout
+    if isinstance(log_output_file, _CapturingStream):
+        # Captured requests get their log events from capture_log_event, not from the console output
+        log_output_file = log_output_file._stream  # noqa: SLF001
 
     structlog.configure(
         processors=processors,
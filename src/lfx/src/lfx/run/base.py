@@ -50,69 +50,38 @@ def output_error(error_message: str, *, verbose: bool, exception: Exception | No
     return error_response
 
 
-async def run_flow(
+def configure_run_logging(*, verbose: bool = False, verbose_detailed: bool = False, verbose_full: bool = False) -> int:
+    """Configure the logger for a run and return the verbosity level (0-3)."""
+    from lfx.log.logger import configure
+
+    if verbose_full:
+        configure(log_level="DEBUG", output_file=sys.stderr)
+        return 3
+    if verbose_detailed:
+        configure(log_level="DEBUG", output_file=sys.stderr)
+        return 2
+    if verbose:
+        configure(log_level="INFO", output_file=sys.stderr)
+        return 1
+    configure(log_level="CRITICAL", output_file=sys.stderr)
+    return 0
+
+
+async def load_graph(
     script_path: Path | None = None,
-    input_value: str | None = None,
-    input_value_option: str | None = None,
-    output_format: str = "json",
     flow_json: str | None = None,
     *,
     stdin: bool = False,
-    check_variables: bool = True,
     verbose: bool = False,
-    verbose_detailed: bool = False,
-    verbose_full: bool = False,
-    timing: bool = False,
+    verbosity: int = 0,
     global_variables: dict[str, str] | None = None,
     user_id: str | None = None,
-) -> dict:
-    """Execute a Langflow graph script or JSON flow and return the result.
-
-    This function analyzes and executes either a Python script containing a Langflow graph,
-    a JSON flow file, inline JSON, or JSON from stdin, returning the result as a dict.
-
-    Args:
-        script_path: Path to the Python script (.py) or JSON flow (.json) containing a graph
-        input_value: Input value to pass to the graph (positional argument)
-        input_value_option: Input value to pass to the graph (alternative option)
-        output_format: Format for output (json, text, message, or result)
-        flow_json: Inline JSON flow content as a string
-        stdin: Read JSON flow content from stdin
-        check_variables: Check global variables for environment compatibility
-        verbose: Show basic progress information
-        verbose_detailed: Show detailed progress and debug information
-        verbose_full: Show full debugging output including component logs
-        timing: Include detailed timing information in output
-        global_variables: Dict of global variables to inject into the graph context
-        user_id: User ID to associate with the execution
-
-    Returns:
-        dict: Result data containing the execution results, logs, and optionally timing info
+):
+    """Load the graph to run from exactly one of a script/JSON file, inline JSON or stdin.
 
     Raises:
-        RunError: If execution fails at any stage
+        RunError: If no source or several sources are given, or if the graph cannot be loaded
     """
-    # Configure logger based on verbosity level
-    from lfx.log.logger import configure
-
-    if verbose_full:
-        configure(log_level="DEBUG", output_file=sys.stderr)
-        verbosity = 3
-    elif verbose_detailed:
-        configure(log_level="DEBUG", output_file=sys.stderr)
-        verbosity = 2
-    elif verbose:
-        configure(log_level="INFO", output_file=sys.stderr)
-        verbosity = 1
-    else:
-        configure(log_level="CRITICAL", output_file=sys.stderr)
-        verbosity = 0
-
-    start_time = time.time() if timing else None
-
-    # Use either positional input_value or --input-value option
-    final_input_value = input_value or input_value_option
-
     # Validate input sources - exactly one must be provided
     input_sources = [script_path is not None, flow_json is not None, bool(stdin)]
     if sum(input_sources) != 1:
@@ -255,11 +224,15 @@ async def run_flow(
         output_error(error_msg, verbose=verbose, exception=e)
         raise RunError(error_msg, e) from e
 
-    inputs = InputValueRequest(input_value=final_input_value) if final_input_value else None
+    return graph
 
-    # Mark end of loading phase if timing
-    load_end_time = time.time() if timing else None
 
+def prepare_graph(graph, *, check_variables: bool = True, verbose: bool = False, verbosity: int = 0) -> None:
+    """Prepare a loaded graph for execution and validate its global variables.
+
+    Raises:
+        RunError: If preparation or global variable validation fails
+    """
     if verbosity > 0:
         sys.stderr.write("Preparing graph for execution...\n")
     try:
@@ -306,6 +279,97 @@ async def run_flow(
         output_error(error_msg, verbose=verbose, exception=e)
         raise RunError(error_msg, e) from e
 
+
+def format_run_result(
+    results: list, captured_logs: str, output_format: str, timing_metadata: dict | None = None
+) -> dict:
+    """Build the result of a run in the requested output format."""
+    if output_format == "json":
+        result_data = extract_structured_result(results)
+        result_data["logs"] = captured_logs
+        if timing_metadata:
+            result_data["timing"] = timing_metadata
+        return result_data
+    if output_format in {"text", "message"}:
+        result_data = extract_structured_result(results)
+        output_text = result_data.get("result", result_data.get("text", ""))
+        return {"output": str(output_text), "format": output_format}
+    if output_format == "result":
+        return {"output": extract_text_from_result(results), "format": "result"}
+    # Default case
+    result_data = extract_structured_result(results)
+    result_data["logs"] = captured_logs
+    if timing_metadata:
+        result_data["timing"] = timing_metadata
+    return result_data
+
+
+async def run_flow(
+    script_path: Path | None = None,
+    input_value: str | None = None,
+    input_value_option: str | None = None,
+    output_format: str = "json",
+    flow_json: str | None = None,
+    *,
+    stdin: bool = False,
+    check_variables: bool = True,
+    verbose: bool = False,
+    verbose_detailed: bool = False,
+    verbose_full: bool = False,
+    timing: bool = False,
+    global_variables: dict[str, str] | None = None,
+    user_id: str | None = None,
+) -> dict:
+    """Execute a Langflow graph script or JSON flow and return the result.
+
+    This function analyzes and executes either a Python script containing a Langflow graph,
+    a JSON flow file, inline JSON, or JSON from stdin, returning the result as a dict.
+
+    Args:
+        script_path: Path to the Python script (.py) or JSON flow (.json) containing a graph
+        input_value: Input value to pass to the graph (positional argument)
+        input_value_option: Input value to pass to the graph (alternative option)
+        output_format: Format for output (json, text, message, or result)
+        flow_json: Inline JSON flow content as a string
+        stdin: Read JSON flow content from stdin
+        check_variables: Check global variables for environment compatibility
+        verbose: Show basic progress information
+        verbose_detailed: Show detailed progress and debug information
+        verbose_full: Show full debugging output including component logs
+        timing: Include detailed timing information in output
+        global_variables: Dict of global variables to inject into the graph context
+        user_id: User ID to associate with the execution
+
+    Returns:
+        dict: Result data containing the execution results, logs, and optionally timing info
+
+    Raises:
+        RunError: If execution fails at any stage
+    """
+    verbosity = configure_run_logging(verbose=verbose, verbose_detailed=verbose_detailed, verbose_full=verbose_full)
+
+    start_time = time.time() if timing else None
+
+    # Use either positional input_value or --input-value option
+    final_input_value = input_value or input_value_option
+
+    graph = await load_graph(
+        script_path=script_path,
+        flow_json=flow_json,
+        stdin=stdin,
+        verbose=verbose,
+        verbosity=verbosity,
+        global_variables=global_variables,
+        user_id=user_id,
+    )
+
+    inputs = InputValueRequest(input_value=final_input_value) if final_input_value else None
+
+    # Mark end of loading phase if timing
+    load_end_time = time.time() if timing else None
+
+    prepare_graph(graph, check_variables=check_variables, verbose=verbose, verbosity=verbosity)
+
     logger.info("Executing graph...")
     execution_start_time = time.time() if timing else None
     if verbose:
@@ -451,22 +515,4 @@ async def run_flow(
             ],
         }
 
-    # Build result based on output format
-    if output_format == "json":
-        result_data = extract_structured_result(results)
-        result_data["logs"] = captured_logs
-        if timing_metadata:
-            result_data["timing"] = timing_metadata
-        return result_data
-    if output_format in {"text", "message"}:
-        result_data = extract_structured_result(results)
-        output_text = result_data.get("result", result_data.get("text", ""))
-        return {"output": str(output_text), "format": output_format}
-    if output_format == "result":
-        return {"output": extract_text_from_result(results), "format": "result"}
-    # Default case
-    result_data = extract_structured_result(results)
-    result_data["logs"] = captured_logs
-    if timing_metadata:
-        result_data["timing"] = timing_metadata
-    return result_data
+    return format_run_result(results, captured_logs, output_format, timing_metadata)
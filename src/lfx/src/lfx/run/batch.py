@@ -0,0 +1,254 @@
+"""Batch execution of one graph over many inputs.
+
+The graph is loaded and prepared once; every input then runs against its own copy of it, so runs share no
+vertex state. Results are appended to a JSONL file, one line per input, either in input order or as runs
+complete. Every line records the index of its input, which is how an interrupted batch is resumed.
+"""
+
+import asyncio
+import json
+import statistics
+import sys
+import time
+from copy import deepcopy
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO, Any
+
+from lfx.cli.common import execute_graph_with_capture
+from lfx.log.logger import logger
+from lfx.run.base import RunError, configure_run_logging, format_run_result, load_graph, prepare_graph
+
+
+@dataclass
+class BatchInput:
+    index: int
+    input_value: str | None
+    id: str | None = None
+
+
+@dataclass
+class BatchSummary:
+    total: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    skipped: int = 0
+    wall_time: float = 0.0
+    latencies: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        completed = self.succeeded + self.failed
+        latencies = sorted(self.latencies)
+        summary: dict[str, Any] = {
+            "total": self.total,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "wall_time": round(self.wall_time, 3),
+            "throughput": round(completed / self.wall_time, 3) if self.wall_time else 0.0,
+        }
+        if latencies:
+            summary["latency"] = {
+                "mean": round(statistics.fmean(latencies), 3),
+                "p50": round(_percentile(latencies, 50), 3),
+                "p95": round(_percentile(latencies, 95), 3),
+                "max": round(latencies[-1], 3),
+            }
+        return summary
+
+
+def _percentile(sorted_values: list[float], percent: float) -> float:
+    index = max(0, min(len(sorted_values) - 1, round(percent / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def read_batch_inputs(path: Path) -> list[BatchInput]:
+    """Read one input per JSONL line.
+
+    A line is either a JSON string, used as the input value, or an object with ``input_value`` and an
+    optional ``id`` that is copied to the result. Blank lines are skipped but still count for the index.
+
+    Raises:
+        RunError: If the file does not exist, or a line is not valid JSON or not a string or object
+    """
+    if not path.is_file():
+        msg = f"Batch input file '{path}' does not exist."
+        raise RunError(msg, None)
+    inputs = []
+    with path.open(encoding="utf-8") as file:
+        for index, line in enumerate(file):
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except json.JSONDecodeError as e:
+                msg = f"Invalid JSON on line {index + 1} of {path}: {e}"
+                raise RunError(msg, e) from e
+            if isinstance(value, str):
+                inputs.append(BatchInput(index=index, input_value=value))
+            elif isinstance(value, dict):
+                input_id = value.get("id")
+                inputs.append(
+                    BatchInput(
+                        index=index,
+                        input_value=value.get("input_value"),
+                        id=str(input_id) if input_id is not None else None,
+                    )
+                )
+            else:
+                msg = f"Line {index + 1} of {path} must be a JSON string or object"
+                raise RunError(msg, None)
+    return inputs
+
+
+def completed_indexes(output_path: Path) -> set[int]:
+    """Return the input indexes already written to ``output_path``, and drop a partially written last line."""
+    if not output_path.exists():
+        return set()
+    done = set()
+    content = output_path.read_bytes()
+    complete_length = content.rfind(b"\n") + 1
+    for line in content[:complete_length].splitlines():
+        try:
+            done.add(json.loads(line)["index"])
+        except (ValueError, KeyError, TypeError):
+            continue
+    if complete_length < len(content):
+        # The previous batch was interrupted while writing this line
+        with output_path.open("r+b") as file:
+            file.truncate(complete_length)
+    return done
+
+
+async def _run_one(graph, batch_input: BatchInput, output_format: str) -> dict[str, Any]:
+    start = time.perf_counter()
+    record: dict[str, Any] = {"index": batch_input.index}
+    if batch_input.id is not None:
+        record["id"] = batch_input.id
+    try:
+        results, logs = await execute_graph_with_capture(deepcopy(graph), batch_input.input_value)
+        record["result"] = format_run_result(results, logs, output_format)
+        record["success"] = record["result"].get("success", True)
+    except Exception as e:  # noqa: BLE001
+        record["success"] = False
+        record["exception_type"] = type(e).__name__
+        record["exception_message"] = str(e)
+    record["latency"] = round(time.perf_counter() - start, 3)
+    return record
+
+
+async def run_batch(
+    graph,
+    inputs: list[BatchInput],
+    output: IO[str],
+    *,
+    concurrency: int = 4,
+    ordered: bool = True,
+    output_format: str = "json",
+    skip: set[int] | None = None,
+) -> BatchSummary:
+    """Run ``graph`` once per input with at most ``concurrency`` runs at a time, writing results to ``output``.
+
+    With ``ordered`` each line is written as soon as every earlier input has been written; otherwise lines
+    are written as runs complete. Inputs whose index is in ``skip`` are not run.
+    """
+    if concurrency < 1:
+        msg = "Concurrency must be at least 1"
+        raise RunError(msg, None)
+    skip = skip or set()
+    pending = [batch_input for batch_input in inputs if batch_input.index not in skip]
+    summary = BatchSummary(total=len(inputs), skipped=len(inputs) - len(pending))
+    finished: dict[int, dict[str, Any]] = {}
+    next_to_write = 0
+    queue: asyncio.Queue[BatchInput] = asyncio.Queue()
+    for batch_input in pending:
+        queue.put_nowait(batch_input)
+
+    def write(record: dict[str, Any]) -> None:
+        output.write(json.dumps(record, default=str) + "\n")
+        output.flush()
+
+    async def worker() -> None:
+        nonlocal next_to_write
+        while not queue.empty():
+            batch_input = queue.get_nowait()
+            record = await _run_one(graph, batch_input, output_format)
+            summary.latencies.append(record["latency"])
+            if record["success"]:
+                summary.succeeded += 1
+            else:
+                summary.failed += 1
+            if not ordered:
+                write(record)
+                continue
+            finished[batch_input.index] = record
+            while next_to_write < len(pending) and pending[next_to_write].index in finished:
+                write(finished.pop(pending[next_to_write].index))
+                next_to_write += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(pending)))))
+    summary.wall_time = time.perf_counter() - start
+    return summary
+
+
+async def run_flow_batch(
+    script_path: Path | None,
+    batch_path: Path,
+    output_path: Path | None = None,
+    *,
+    concurrency: int = 4,
+    ordered: bool = True,
+    resume: bool = False,
+    output_format: str = "json",
+    flow_json: str | None = None,
+    stdin: bool = False,
+    check_variables: bool = True,
+    verbose: bool = False,
+    verbose_detailed: bool = False,
+    verbose_full: bool = False,
+    global_variables: dict[str, str] | None = None,
+    user_id: str | None = None,
+) -> BatchSummary:
+    """Load a graph once and run it for every input of a JSONL file.
+
+    Results go to ``output_path``, or to stdout when it is not given. With ``resume`` the inputs already in
+    ``output_path`` are skipped and new results are appended to it.
+
+    Raises:
+        RunError: If the inputs cannot be read or the graph cannot be loaded or prepared
+    """
+    verbosity = configure_run_logging(verbose=verbose, verbose_detailed=verbose_detailed, verbose_full=verbose_full)
+    if resume and output_path is None:
+        msg = "--resume requires --output"
+        raise RunError(msg, None)
+    inputs = read_batch_inputs(batch_path)
+    graph = await load_graph(
+        script_path=script_path,
+        flow_json=flow_json,
+        stdin=stdin,
+        verbose=verbose,
+        verbosity=verbosity,
+        global_variables=global_variables,
+        user_id=user_id,
+    )
+    prepare_graph(graph, check_variables=check_variables, verbose=verbose, verbosity=verbosity)
+
+    skip = completed_indexes(output_path) if resume and output_path is not None else set()
+    if skip:
+        logger.info(f"Resuming batch: {len(skip)} of {len(inputs)} inputs already completed")
+
+    if output_path is None:
+        return await run_batch(
+            graph, inputs, sys.stdout, concurrency=concurrency, ordered=ordered, output_format=output_format
+        )
+    with output_path.open("a" if resume else "w", encoding="utf-8") as output:
+        return await run_batch(
+            graph,
+            inputs,
+            output,
+            concurrency=concurrency,
+            ordered=ordered,
+            output_format=output_format,
+            skip=skip,
+        )
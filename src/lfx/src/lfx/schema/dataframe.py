@@ -1,5 +1,6 @@
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING, Any, cast
 
+import numpy as np
 import pandas as pd
 from langchain_core.documents import Document
 from pandas import DataFrame as pandas_DataFrame
@@ -7,6 +8,10 @@ from pandas import DataFrame as pandas_DataFrame
 from lfx.schema.data import Data
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+    import pyarrow as pa
+
     from lfx.schema.message import Message
 
 
@@ -91,8 +96,38 @@ class DataFrame(pandas_DataFrame):
     def to_data_list(self) -> list[Data]:
         """Converts the DataFrame back to a list of Data objects."""
         list_of_dicts = self.to_dict(orient="records")
-        # suggested change: [Data(**row) for row in list_of_dicts]
-        return [Data(data=row) for row in list_of_dicts]
+        # Rows are plain dicts already, so skip Pydantic validation and wrap them directly.
+        return [Data.model_construct(data=row) for row in list_of_dicts]
+
+    def iter_data(self) -> "Iterator[Data]":
+        """Lazily yields one Data object per row.
+
+        Unlike ``to_data_list`` this never materializes every row at once, which keeps memory flat when
+        a component only needs to stream over the rows.
+        """
+        columns = list(self.columns)
+        for values in self.itertuples(index=False, name=None):
+            yield Data.model_construct(data=dict(zip(columns, values, strict=True)))
+
+    @classmethod
+    def builder(cls, text_key: str = "text", default_value: str = "") -> "DataFrameBuilder":
+        """Returns a DataFrameBuilder for appending many rows and building the DataFrame once."""
+        return DataFrameBuilder(text_key=text_key, default_value=default_value)
+
+    def to_arrow(self) -> "pa.Table":
+        """Converts the DataFrame to a ``pyarrow.Table``. Requires the optional ``pyarrow`` package."""
+        pa = _import_pyarrow()
+        return pa.Table.from_pandas(self, preserve_index=False)
+
+    @classmethod
+    def from_arrow(cls, table: "pa.Table", text_key: str = "text", default_value: str = "") -> "DataFrame":
+        """Creates an Arrow-backed DataFrame from a ``pyarrow.Table``.
+
+        Columns use ``pd.ArrowDtype`` so the Arrow buffers are wrapped instead of converted to numpy or
+        Python objects.
+        """
+        _import_pyarrow()
+        return cls(table.to_pandas(types_mapper=pd.ArrowDtype), text_key=text_key, default_value=default_value)
 
     def add_row(self, data: dict | Data) -> "DataFrame":
         """Adds a single row to the dataset.
@@ -106,6 +141,8 @@ class DataFrame(pandas_DataFrame):
         Example:
             >>> dataset = DataFrame([{"name": "John"}])
             >>> dataset = dataset.add_row({"name": "Jane"})
+
+        Each call copies the whole DataFrame. To append rows in a loop use ``DataFrame.builder()``.
         """
         if isinstance(data, Data):
             data = data.data
@@ -208,3 +245,64 @@ class DataFrame(pandas_DataFrame):
         processed_df = processed_df.map(lambda x: str(x).replace("\n", "<br/>") if isinstance(x, str) else x)
         # Convert to markdown and wrap in a Message
         return Message(text=processed_df.to_markdown(index=False))
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError as e:
+        msg = "pyarrow is not installed. Please install it using `uv pip install pyarrow`."
+        raise ImportError(msg) from e
+    return pa
+
+
+class DataFrameBuilder:
+    """Append buffer that collects rows column by column and builds a DataFrame once.
+
+    ``DataFrame.add_row`` returns a new DataFrame and copies every existing row on each call. The
+    builder keeps one list per column instead, so appending is O(1) and the frame is constructed a
+    single time. The result matches ``DataFrame(rows)``: columns appear in first-seen order and missing
+    values are NaN.
+
+    Example:
+        >>> builder = DataFrame.builder()
+        >>> builder.add_row({"name": "John"})
+        >>> builder.add_rows([Data(data={"name": "Jane", "age": 30})])
+        >>> dataset = builder.build()
+    """
+
+    def __init__(self, text_key: str = "text", default_value: str = "") -> None:
+        self.text_key = text_key
+        self.default_value = default_value
+        self._columns: dict[Any, list] = {}
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def add_row(self, row: dict | Data) -> None:
+        """Appends a single row given as a dictionary or a Data object."""
+        if isinstance(row, Data):
+            row = row.data
+        for key, value in row.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[key] = [np.nan] * self._length
+            column.append(value)
+        self._length += 1
+        for column in self._columns.values():
+            if len(column) < self._length:
+                column.append(np.nan)
+
+    def add_rows(self, rows: "Iterable[dict | Data]") -> None:
+        """Appends every row from an iterable of dictionaries or Data objects."""
+        for row in rows:
+            self.add_row(row)
+
+    def build(self) -> DataFrame:
+        """Builds the DataFrame from the rows appended so far."""
+        return DataFrame(
+            pd.DataFrame(self._columns, index=pd.RangeIndex(self._length)),
+            text_key=self.text_key,
+            default_value=self.default_value,
+        )
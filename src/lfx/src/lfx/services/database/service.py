@@ -23,3 +23,12 @@ class NoopDatabaseService:
 
         async with NoopSession() as session:
             yield session
+
+    @asynccontextmanager
+    async def _with_readonly_session(self):
+        """Internal method to create a read-only session. DO NOT USE DIRECTLY.
+
+        Use the injectable_session_scope_readonly() dependency instead. There are no replicas here, so this is the same as _with_session().
+        """
+        async with self._with_session() as session:
+            yield session
@@ -184,7 +184,13 @@ async def session_scope() -> AsyncGenerator[AsyncSession, None]:
 
 
 async def injectable_session_scope_readonly():
-    async with session_scope_readonly() as session:
+    """Read-only session for API endpoints that list data. It may be served by a read replica.
+
+    A replica lags the primary by up to `database_replica_max_lag` seconds, so code that must see data written
+    moments ago (flow execution, for example) uses session_scope() or session_scope_readonly() instead.
+    """
+    db_service = get_db_service()
+    async with db_service._with_readonly_session() as session:  # noqa: SLF001
         yield session
 
 
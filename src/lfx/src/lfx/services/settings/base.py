@@ -91,6 +91,15 @@ class Settings(BaseSettings):
     """Optional namespace identifier for PostgreSQL advisory lock during migrations.
     If not provided, a hash of the database URL will be used. Useful when multiple Langflow
     instances share the same database and need coordinated migration locking."""
+    database_replica_urls: list[str] = []
+    """Database URLs of read replicas of `database_url`. When set, the read-only sessions of the API endpoints
+    that list monitor data, flows and variables are served by a healthy replica instead of the primary.
+    Accepts a comma-separated list in the environment."""
+    database_replica_max_lag: float = 1.0
+    """Maximum replication lag, in seconds, for a replica to serve reads. Replicas that lag
+    further behind (or cannot be reached) are skipped and reads fall back to the primary."""
+    database_replica_check_interval: float = 5.0
+    """Number of seconds a replica's health and lag measurement is reused before it is checked again."""
 
     mcp_server_timeout: int = 20
     """The number of seconds to wait before giving up on a lock to released or establishing a connection to the
@@ -180,6 +189,38 @@ class Settings(BaseSettings):
     redis_url: str | None = None
     redis_cache_expire: int = 3600
 
+    # Build job event streams
+    job_queue_backend: Literal["memory", "local", "redis"] = "memory"
+    """Where build job events are kept. "memory" keeps them in the worker that runs the build; "local" appends them
+    to files in `<config_dir>/job_streams`, shared by every process on this machine; "redis" appends them to Redis
+    Streams so any worker can serve `/build/{job_id}/events` and clients can resume from an offset."""
+    job_queue_redis_url: str | None = None
+    """Redis URL for build job event streams. Defaults to `redis_url`, or to `redis_host`/`redis_port`/`redis_db`."""
+    job_queue_stream_ttl: int = 3600
+    """Seconds a build job's event stream is kept after its last event."""
+    job_queue_max_lag: int = 10000
+    """Number of events readers of a streamed build may fall behind before the build's writes are held back."""
+    build_events_chunk_size: int = 65536
+    """Size, in bytes, of the writes of a streamed build's events. Small events are coalesced into one write of up
+    to this size, and larger events are split into pieces of this size."""
+    build_events_coalesce_window: float = 0.0
+    """Seconds to wait for more events before writing a streamed build's events. 0 only coalesces events that are
+    already queued; a few milliseconds trades that much latency for fewer, larger writes."""
+    build_events_reference_threshold: int = 1048576
+    """Size, in bytes, above which a build event is sent as a reference to `/build/{job_id}/events/{sequence}`
+    instead of inline, for clients that stream events with `references=true`."""
+
+    # Execution workers
+    execution_mode: Literal["inline", "worker"] = "inline"
+    """Where flow builds and webhook runs execute. "inline" runs them in the API process that received the request;
+    "worker" enqueues them for `langflow worker` processes. "worker" needs a shared `job_queue_backend` ("local" or
+    "redis"), and "local" is used when it is left at "memory"."""
+    worker_broker: Literal["local", "redis"] = "local"
+    """How runs reach execution workers. "local" spools them in `<config_dir>/runs` for workers on this machine;
+    "redis" queues them in Redis (`job_queue_redis_url`, or the `redis_*` settings)."""
+    worker_concurrency: int = 4
+    """Number of runs a `langflow worker` process executes at the same time."""
+
     # Sentry
     sentry_dsn: str | None = None
     sentry_traces_sample_rate: float | None = 1.0
@@ -234,6 +275,22 @@ class Settings(BaseSettings):
     do_not_track: bool = False
     """If set to True, Langflow will not track telemetry."""
     telemetry_base_url: str = "https://langflow.gateway.scarf.sh"
+    telemetry_queue_size: int = 1000
+    """Maximum number of telemetry events waiting to be uploaded. Events arriving while the queue is full are
+    spooled to `telemetry_spool_path` if it is set, and dropped (and counted) otherwise."""
+    telemetry_batch_size: int = 20
+    """Maximum number of telemetry events uploaded per flush interval."""
+    telemetry_flush_interval: float = 10.0
+    """Seconds between telemetry uploads. With `telemetry_batch_size` this caps the outbound telemetry rate
+    regardless of how many flows run."""
+    telemetry_sample_rates: dict[str, float] = {}
+    """Fraction of telemetry events to keep per event type, e.g. `{"run": 0.1, "playground": 0.1}`.
+    Event types that are not listed are always kept."""
+    telemetry_spool_path: str | None = None
+    """JSON Lines file for telemetry events that could not be uploaded or queued, e.g. on offline installations.
+    Spooled events are uploaded later within the same rate limit."""
+    telemetry_spool_max_events: int = 10000
+    """Maximum number of events kept in the telemetry spool."""
     transactions_storage_enabled: bool = True
     """If set to True, Langflow will track transactions between flows."""
     vertex_builds_storage_enabled: bool = True
@@ -293,6 +350,54 @@ class Settings(BaseSettings):
     """Maximum number of items to store and display in the UI. Lists longer than this
     will be truncated when displayed in the UI. Does not affect data passed between components nor outputs."""
 
+    # Executors
+    executor_io_max_workers: int = 32
+    """Maximum number of threads used to run synchronous, I/O-bound component outputs."""
+    executor_cpu_max_workers: int | None = None
+    """Maximum number of threads used to run synchronous, CPU-bound component outputs. Defaults to the CPU count."""
+    executor_process_max_workers: int | None = None
+    """Maximum number of processes in the pool for picklable CPU-bound work. Defaults to the CPU count."""
+
+    # Language model clients
+    llm_client_pool_size: int = 32
+    """Maximum number of language model clients kept for reuse by the unified model components. 0 disables pooling."""
+    llm_client_pool_ttl: float = 3600.0
+    """Seconds a pooled language model client is reused before it is recreated."""
+
+    # Language model response cache
+    llm_response_cache_backend: Literal["memory", "service"] = "memory"
+    """Where cached model answers are kept: "memory" for this process only, or "service" to share them through the
+    configured cache service (see `cache_type`)."""
+    llm_response_cache_ttl: float = 3600.0
+    """Seconds a cached model answer is reused."""
+    llm_response_cache_max_entries: int = 1000
+    """Maximum number of answers kept by the "memory" response cache backend, or stored by each worker with the
+    "service" backend."""
+    llm_response_cache_max_entry_size: int = 1024 * 1024
+    """Answers larger than this many bytes are not cached."""
+
+    # Docling
+    docling_worker_pool_size: int = 2
+    """Number of long-lived Docling worker processes used by the File component. 0 starts a new process per file."""
+    docling_worker_max_tasks: int = 50
+    """Number of files a Docling worker converts before it is replaced, to bound memory growth. 0 disables recycling."""
+    docling_task_timeout: float = 600.0
+    """Seconds a single Docling conversion may take before its worker is killed, not counting worker start-up.
+    0 disables the timeout."""
+    docling_worker_startup_timeout: float = 600.0
+    """Seconds a new Docling worker may take to import Docling and load its models. 0 disables the timeout."""
+    docling_max_queue: int = 32
+    """Maximum number of files waiting for a free Docling worker before new files are rejected."""
+    docling_queue_timeout: float = 300.0
+    """Seconds a file waits for a free Docling worker before it is rejected. 0 waits indefinitely."""
+
+    # Parsed document cache
+    parse_cache_enabled: bool = False
+    """If set to True, parsed file contents are cached in `<config_dir>/parse_cache`, keyed by content hash,
+    parser version and options."""
+    parse_cache_max_size_mb: int = 512
+    """Maximum size of the parsed document cache. The least recently used entries are evicted beyond it."""
+
     # MCP Server
     mcp_server_enabled: bool = True
     """If set to False, Langflow will not enable the MCP server."""
@@ -474,6 +579,18 @@ class Settings(BaseSettings):
 
         return str(value)
 
+    @field_validator("database_replica_urls", mode="before")
+    @classmethod
+    def validate_database_replica_urls(cls, value):
+        if isinstance(value, str):
+            value = value.split(",")
+        urls = [url.strip() for url in value or [] if url and url.strip()]
+        for url in urls:
+            if not is_valid_database_url(url):
+                msg = f"Invalid database replica URL provided: '{url}'"
+                raise ValueError(msg)
+        return urls
+
     @field_validator("database_url", mode="before")
     @classmethod
     def set_database_url(cls, value, info):
@@ -1,6 +1,14 @@
 import asyncio
+import concurrent.futures
+import contextvars
+import os
+import threading
+import time
+import traceback
 from contextlib import asynccontextmanager
 
+from lfx.log.logger import logger
+
 if hasattr(asyncio, "timeout"):
 
     @asynccontextmanager
@@ -19,16 +27,107 @@ else:
             raise TimeoutError(msg) from e
 
 
-def run_until_complete(coro):
-    try:
-        asyncio.get_running_loop()
-    except RuntimeError:
-        # If there's no event loop, create a new one and run the coroutine
-        return asyncio.run(coro)
-    # If there's already a running event loop, we can't call run_until_complete on it
-    # Instead, we need to run the coroutine in a new thread with a new event loop
-    import concurrent.futures
+class AsyncPortal:
+    """A long-lived event loop running in a daemon thread that sync code can submit coroutines to.
+
+    Bridging sync code into async code from inside a running event loop used to start a new thread and a
+    new event loop for every call. The portal keeps one loop alive instead, so loop-bound resources such as
+    pooled HTTP clients are reused across calls. The caller's context variables are propagated to the
+    coroutine.
+    """
+
+    def __init__(self, name: str = "lfx-async-portal") -> None:
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The portal's event loop, started on first use."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed() or not self._thread or not self._thread.is_alive():
+                loop = asyncio.new_event_loop()
+                started = threading.Event()
+
+                def run() -> None:
+                    asyncio.set_event_loop(loop)
+                    loop.call_soon(started.set)
+                    loop.run_forever()
+
+                self._thread = threading.Thread(target=run, name=self.name, daemon=True)
+                self._thread.start()
+                started.wait()
+                self._loop = loop
+            return self._loop
+
+    def is_portal_thread(self) -> bool:
+        return self._thread is not None and threading.current_thread() is self._thread
+
+    def submit(self, coro) -> concurrent.futures.Future:
+        """Schedule ``coro`` on the portal loop and return a future for its result."""
+        loop = self.loop
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        context = contextvars.copy_context()
+
+        def start() -> None:
+            # Tasks copy the current context when created, so create it inside the caller's context.
+            task = context.run(loop.create_task, coro)
+
+            def done(task: asyncio.Task) -> None:
+                if task.cancelled():
+                    future.cancel()
+                elif task.exception() is not None:
+                    future.set_exception(task.exception())
+                else:
+                    future.set_result(task.result())
+
+            def cancel(fut: concurrent.futures.Future) -> None:
+                if fut.cancelled():
+                    loop.call_soon_threadsafe(task.cancel)
+
+            task.add_done_callback(done)
+            future.add_done_callback(cancel)
+
+        future.set_running_or_notify_cancel()
+        loop.call_soon_threadsafe(start)
+        return future
+
+    def call(self, coro):
+        """Run ``coro`` on the portal loop and block until it finishes."""
+        future = self.submit(coro)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def shutdown(self) -> None:
+        """Stop the portal loop. A new one is started on the next call."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None and thread is not threading.current_thread():
+            thread.join()
+            loop.close()
+
+
+_portal = AsyncPortal()
+
 
+def get_async_portal() -> AsyncPortal:
+    """Return the process-wide portal used by ``run_until_complete``."""
+    return _portal
+
+
+def _bridge_debug_enabled() -> bool:
+    return os.getenv("LANGFLOW_ASYNC_BRIDGE_DEBUG", "false").lower() in {"1", "true", "yes"}
+
+
+def _run_in_new_loop(coro):
     def run_in_new_loop():
         new_loop = asyncio.new_event_loop()
         asyncio.set_event_loop(new_loop)
@@ -40,3 +139,32 @@ def run_until_complete(coro):
     with concurrent.futures.ThreadPoolExecutor() as executor:
         future = executor.submit(run_in_new_loop)
         return future.result()
+
+
+def run_until_complete(coro):
+    """Run ``coro`` to completion from sync code and return its result.
+
+    Without a running event loop this is ``asyncio.run``. Inside a running loop the coroutine is handed to
+    the shared ``AsyncPortal`` while the calling loop is blocked until it finishes, so async callers should
+    await the async API directly instead. Set ``LANGFLOW_ASYNC_BRIDGE_DEBUG=true`` to log every such
+    blocking call with its duration and call site.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        # If there's no event loop, create a new one and run the coroutine
+        return asyncio.run(coro)
+    # If there's already a running event loop, we can't call run_until_complete on it.
+    if _portal.is_portal_thread():
+        # Blocking the portal on itself would deadlock, so nested calls get a private loop.
+        return _run_in_new_loop(coro)
+    if not _bridge_debug_enabled():
+        return _portal.call(coro)
+
+    started_at = time.perf_counter()
+    try:
+        return _portal.call(coro)
+    finally:
+        duration = time.perf_counter() - started_at
+        stack = "".join(traceback.format_stack()[:-1])
+        logger.warning(f"Blocking sync-to-async bridge call held the event loop for {duration:.3f}s:\n{stack}")
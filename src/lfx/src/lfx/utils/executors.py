@@ -0,0 +1,284 @@
+"""Bounded executor pools for running blocking work off the event loop.
+
+``asyncio.to_thread`` sends every blocking call to the loop's default executor, which is shared by
+everything in the process. A single slow component can therefore starve unrelated work such as event
+delivery. This module keeps separate, bounded pools per class of work and records queue-depth and
+wait-time metrics for each of them:
+
+- ``io``: threads for blocking I/O (HTTP loaders, SDK calls, file access).
+- ``cpu``: threads for CPU-bound Python work (parsing, splitting, pandas).
+- ``process``: a process pool for picklable CPU-bound functions that should not hold the GIL. Workers are
+  spawned rather than forked: forking a process that runs an event loop and other threads can copy locks
+  held by those threads and deadlock the child.
+
+Blocking code running in a pool thread may bridge back into async code (``run_until_complete``) that submits
+more work. A worker that waits on a task queued behind other such workers would wait forever, so calls made
+from a pool thread only go to a pool with an idle worker and otherwise run in the calling thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import functools
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+from lfx.log.logger import logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+T = TypeVar("T")
+
+ExecutorClass = Literal["io", "cpu", "process"]
+EXECUTOR_CLASSES: tuple[ExecutorClass, ...] = ("io", "cpu", "process")
+
+DEFAULT_IO_MAX_WORKERS = 32
+
+_worker_thread = threading.local()
+
+
+def _mark_worker_thread() -> None:
+    _worker_thread.active = True
+
+
+def in_worker_thread() -> bool:
+    """True when called from a thread of one of the thread pools here."""
+    return getattr(_worker_thread, "active", False)
+
+
+def _timed_call(func: Callable[..., T], args: tuple, kwargs: dict) -> tuple[float, T]:
+    """Run ``func`` and return the monotonic time at which it started along with its result.
+
+    Defined at module level so it can be pickled for the process pool.
+    """
+    started_at = time.monotonic()
+    return started_at, func(*args, **kwargs)
+
+
+@dataclass
+class ExecutorMetrics:
+    """Point-in-time metrics for a single executor pool."""
+
+    name: str
+    max_workers: int
+    queue_depth: int
+    active: int
+    completed: int
+    failed: int
+    cancelled: int
+    inline: int
+    avg_wait_seconds: float
+    max_wait_seconds: float
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "inline": self.inline,
+            "avg_wait_seconds": self.avg_wait_seconds,
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+class ExecutorPool:
+    """A lazily created, bounded executor that tracks queueing and wait time.
+
+    Queue depth counts tasks that were submitted but have not started yet. Wait time is measured
+    from submission until a worker picks the task up. Calls that a pool thread ran itself because every
+    worker was busy are counted as ``inline``.
+    """
+
+    def __init__(self, name: str, max_workers: int, *, use_processes: bool = False) -> None:
+        self.name = name
+        self.max_workers = max(1, max_workers)
+        self.use_processes = use_processes
+        self._executor: Executor | None = None
+        self._lock = threading.Lock()
+        self._submitted = 0
+        self._completed = 0
+        self._failed = 0
+        self._cancelled = 0
+        self._inline = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    if self.use_processes:
+                        self._executor = ProcessPoolExecutor(
+                            max_workers=self.max_workers, mp_context=multiprocessing.get_context("spawn")
+                        )
+                    else:
+                        self._executor = ThreadPoolExecutor(
+                            max_workers=self.max_workers,
+                            thread_name_prefix=f"lfx-{self.name}",
+                            initializer=_mark_worker_thread,
+                        )
+        return self._executor
+
+    async def run(self, func: Callable[..., T], /, *args, **kwargs) -> T:
+        """Run ``func(*args, **kwargs)`` in this pool and await its result.
+
+        Thread pools propagate the caller's ``contextvars`` like ``asyncio.to_thread`` does. Process
+        pools require ``func`` and its arguments to be picklable, and ``func`` to be importable by name.
+        Called from a pool thread while every worker of a thread pool is busy, ``func`` runs in the calling
+        thread instead.
+        """
+        with self._lock:
+            inline = not self.use_processes and in_worker_thread() and self._in_flight() >= self.max_workers
+            if inline:
+                self._inline += 1
+            else:
+                self._submitted += 1
+        if inline:
+            return func(*args, **kwargs)
+
+        loop = asyncio.get_running_loop()
+        if self.use_processes:
+            call = functools.partial(_timed_call, func, args, kwargs)
+        else:
+            ctx = contextvars.copy_context()
+            call = functools.partial(ctx.run, _timed_call, func, args, kwargs)
+
+        submitted_at = time.monotonic()
+        try:
+            started_at, result = await loop.run_in_executor(self.executor, call)
+        except asyncio.CancelledError:
+            with self._lock:
+                self._cancelled += 1
+            raise
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        self._record_wait(max(0.0, started_at - submitted_at))
+        return result
+
+    def _in_flight(self) -> int:
+        return self._submitted - self._completed - self._failed - self._cancelled
+
+    def _record_wait(self, wait: float) -> None:
+        with self._lock:
+            self._completed += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+    def metrics(self) -> ExecutorMetrics:
+        with self._lock:
+            in_flight = self._in_flight()
+            queue_depth = max(0, in_flight - self.max_workers)
+            return ExecutorMetrics(
+                name=self.name,
+                max_workers=self.max_workers,
+                queue_depth=queue_depth,
+                active=in_flight - queue_depth,
+                completed=self._completed,
+                failed=self._failed,
+                cancelled=self._cancelled,
+                inline=self._inline,
+                avg_wait_seconds=self._total_wait / self._completed if self._completed else 0.0,
+                max_wait_seconds=self._max_wait,
+            )
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def _get_pool_sizes() -> dict[ExecutorClass, int]:
+    cpu_count = os.cpu_count() or 1
+    sizes: dict[ExecutorClass, int] = {
+        "io": DEFAULT_IO_MAX_WORKERS,
+        "cpu": cpu_count,
+        "process": cpu_count,
+    }
+    try:
+        from lfx.services.deps import get_settings_service
+
+        settings_service = get_settings_service()
+    except Exception:  # noqa: BLE001
+        settings_service = None
+    if settings_service is not None:
+        for executor_class in EXECUTOR_CLASSES:
+            size = getattr(settings_service.settings, f"executor_{executor_class}_max_workers", None)
+            # Anything but a positive worker count (unset, or a settings object that is not a Settings) keeps
+            # the default
+            if isinstance(size, int) and size > 0:
+                sizes[executor_class] = size
+    return sizes
+
+
+class ExecutorRegistry:
+    """Holds the process-wide executor pools, creating them on first use."""
+
+    def __init__(self) -> None:
+        self._pools: dict[str, ExecutorPool] = {}
+        self._lock = threading.Lock()
+
+    def get(self, executor_class: ExecutorClass) -> ExecutorPool:
+        if executor_class not in EXECUTOR_CLASSES:
+            msg = f"Unknown executor class '{executor_class}'. Expected one of: {', '.join(EXECUTOR_CLASSES)}"
+            raise ValueError(msg)
+        pool = self._pools.get(executor_class)
+        if pool is None:
+            with self._lock:
+                pool = self._pools.get(executor_class)
+                if pool is None:
+                    sizes = _get_pool_sizes()
+                    pool = ExecutorPool(
+                        executor_class, sizes[executor_class], use_processes=executor_class == "process"
+                    )
+                    self._pools[executor_class] = pool
+                    logger.debug(f"Created '{executor_class}' executor pool with {pool.max_workers} workers")
+        return pool
+
+    def metrics(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            pools = list(self._pools.values())
+        return {pool.name: pool.metrics().to_dict() for pool in pools}
+
+    def shutdown(self, *, wait: bool = True) -> None:
+        with self._lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.shutdown(wait=wait)
+
+
+_registry = ExecutorRegistry()
+
+
+def get_executor(executor_class: ExecutorClass = "io") -> ExecutorPool:
+    """Return the shared pool for ``executor_class``."""
+    return _registry.get(executor_class)
+
+
+async def run_in_executor(executor_class: ExecutorClass, func: Callable[..., T], /, *args, **kwargs) -> T:
+    """Run a blocking callable in the pool for ``executor_class`` and await its result."""
+    return await _registry.get(executor_class).run(func, *args, **kwargs)
+
+
+def get_executor_metrics() -> dict[str, dict[str, Any]]:
+    """Return metrics for every pool that has been used so far, keyed by pool name."""
+    return _registry.metrics()
+
+
+def shutdown_executors(*, wait: bool = True) -> None:
+    """Shut down all pools. They are recreated on next use."""
+    _registry.shutdown(wait=wait)
@@ -0,0 +1,209 @@
+"""Process-wide pool of keep-alive ``httpx.AsyncClient`` instances.
+
+Creating an ``httpx.AsyncClient`` per request throws away its connection pool, so every call pays DNS,
+TCP and TLS setup again. Components that make many requests (for example inside a Loop) should borrow a
+shared client from here instead. Clients are keyed by the options that cannot be changed per request
+(``verify``, ``proxy``, ``follow_redirects`` and a coarse timeout class) and by event loop, because an
+async connection pool cannot be shared between loops.
+
+Pooled clients are owned by the pool: callers must not close them or use them as context managers. They are
+closed when their event loop shuts down its async generators, as ``asyncio.run`` does before closing the loop.
+Because one client serves every flow and user, pooled clients never store cookies from responses; pass
+``cookies=`` or a ``Cookie`` header per request instead.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import importlib.util
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import TYPE_CHECKING
+from urllib.parse import urlparse
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator
+
+SHORT_TIMEOUT = 10.0
+DEFAULT_TIMEOUT = 30.0
+LONG_TIMEOUT = 120.0
+
+
+def get_timeout_class(timeout: float | None) -> str:
+    """Bucket a timeout into "short", "default", "long" or "none" so similar requests share a client."""
+    if timeout is None:
+        return "none"
+    if timeout <= SHORT_TIMEOUT:
+        return "short"
+    if timeout <= DEFAULT_TIMEOUT:
+        return "default"
+    return "long"
+
+
+_TIMEOUT_FOR_CLASS: dict[str, float | None] = {
+    "short": SHORT_TIMEOUT,
+    "default": DEFAULT_TIMEOUT,
+    "long": LONG_TIMEOUT,
+    "none": None,
+}
+
+
+@dataclass(frozen=True)
+class ClientKey:
+    """The client options a pooled client is keyed by."""
+
+    verify: bool = True
+    proxy: str | None = None
+    follow_redirects: bool = False
+    timeout_class: str = "default"
+
+
+class _RejectCookiesPolicy(DefaultCookiePolicy):
+    def set_ok(self, cookie, request) -> bool:  # noqa: ARG002
+        return False
+
+
+class HTTPClientPool:
+    """Hands out shared ``httpx.AsyncClient`` instances with HTTP/2 and keep-alive enabled.
+
+    The client's own timeout only acts as a default for its timeout class; pass ``timeout=`` on each
+    request for an exact value.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        http2: bool = True,
+    ) -> None:
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        # HTTP/2 needs the optional ``h2`` package (installed with ``httpx[http2]``).
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        self._clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[ClientKey, httpx.AsyncClient]] = (
+            weakref.WeakKeyDictionary()
+        )
+        # One started async generator per loop, whose ``finally`` closes the loop's clients at shutdown
+        self._closers: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncGenerator[None, None]] = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.Lock()
+
+    async def _close_at_loop_shutdown(self) -> AsyncGenerator[None, None]:
+        # Must not reference its loop: the pool keeps this generator alive for as long as the loop exists.
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._closers.pop(asyncio.get_running_loop(), None)
+            await self.aclose()
+
+    def _watch_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+        closer = self._closers[loop] = self._close_at_loop_shutdown()
+        # Advance it to its ``yield`` right away: that registers it with the running loop, which finalizes
+        # (``aclose``) every async generator it knows of in ``shutdown_asyncgens``.
+        with contextlib.suppress(StopIteration):
+            closer.asend(None).send(None)
+
+    def _create_client(self, key: ClientKey) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            verify=key.verify,
+            proxy=key.proxy,
+            follow_redirects=key.follow_redirects,
+            timeout=_TIMEOUT_FOR_CLASS[key.timeout_class],
+            limits=self.limits,
+            http2=self.http2,
+            # A shared cookie jar would leak one caller's session cookies into every other caller's requests.
+            cookies=CookieJar(policy=_RejectCookiesPolicy()),
+        )
+
+    def get_client(
+        self,
+        *,
+        verify: bool = True,
+        proxy: str | None = None,
+        follow_redirects: bool = False,
+        timeout: float | None = DEFAULT_TIMEOUT,
+    ) -> httpx.AsyncClient:
+        """Return the shared client for these options on the running event loop."""
+        loop = asyncio.get_running_loop()
+        key = ClientKey(
+            verify=verify, proxy=proxy, follow_redirects=follow_redirects, timeout_class=get_timeout_class(timeout)
+        )
+        with self._lock:
+            if loop not in self._closers:
+                self._watch_loop(loop)
+            clients = self._clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None or client.is_closed:
+                client = clients[key] = self._create_client(key)
+        return client
+
+    def stats(self) -> dict[str, int]:
+        """Return the number of event loops and clients currently held by the pool."""
+        with self._lock:
+            return {
+                "loops": len(self._clients),
+                "clients": sum(len(clients) for clients in self._clients.values()),
+            }
+
+    async def aclose(self) -> None:
+        """Close every client that belongs to the running event loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            clients = self._clients.pop(loop, {})
+        for client in clients.values():
+            await client.aclose()
+
+
+class HostRateLimiter:
+    """Spaces out requests to each host so none receives more than ``requests_per_second``.
+
+    A rate of ``0`` or less disables limiting.
+    """
+
+    def __init__(self, requests_per_second: float) -> None:
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._next_slot: dict[str, float] = {}
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, url: str) -> None:
+        if not self.interval:
+            return
+        host = urlparse(url).netloc
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_pool = HTTPClientPool()
+
+
+def get_http_client(
+    *,
+    verify: bool = True,
+    proxy: str | None = None,
+    follow_redirects: bool = False,
+    timeout: float | None = DEFAULT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """Return a shared keep-alive client from the process-wide pool. Do not close it."""
+    return _pool.get_client(verify=verify, proxy=proxy, follow_redirects=follow_redirects, timeout=timeout)
+
+
+def get_http_client_pool() -> HTTPClientPool:
+    """Return the process-wide client pool."""
+    return _pool
@@ -0,0 +1,13 @@
+from lfx.custom.custom_component.component import Component
+from lfx.io import DataFrameInput, Output
+from lfx.schema.dataframe import DataFrame
+
+
+class Collect(Component):
+    display_name = "Collect"
+    description = "Passes the rows a loop collected through."
+    inputs = [DataFrameInput(name="rows", display_name="Rows")]
+    outputs = [Output(display_name="Rows", name="out", method="build_out")]
+
+    def build_out(self) -> DataFrame:
+        return self.rows
@@ -0,0 +1,18 @@
+from lfx.custom.custom_component.component import Component
+from lfx.io import MessageTextInput, Output
+from lfx.schema.message import Message
+
+
+class MockLLM(Component):
+    display_name = "Mock LLM"
+    description = "Stands in for a language model: answers instantly with a deterministic completion."
+    inputs = [
+        MessageTextInput(name="input_value", display_name="Input", is_list=True),
+        MessageTextInput(name="system_message", display_name="System Message", value="You are a benchmark."),
+    ]
+    outputs = [Output(display_name="Response", name="text_response", method="build_response")]
+
+    def build_response(self) -> Message:
+        values = self.input_value if isinstance(self.input_value, list) else [self.input_value]
+        prompt = " ".join(value.text if isinstance(value, Message) else str(value) for value in values)
+        return Message(text=f"{len(prompt)}:{prompt[-32:]}")
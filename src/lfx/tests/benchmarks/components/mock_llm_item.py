@@ -0,0 +1,13 @@
+from lfx.custom.custom_component.component import Component
+from lfx.io import DataInput, Output
+from lfx.schema.data import Data
+
+
+class MockLLMItem(Component):
+    display_name = "Mock LLM Item"
+    description = "Loop body that answers instantly for one item."
+    inputs = [DataInput(name="item", display_name="Item")]
+    outputs = [Output(display_name="Out", name="out", method="build_out")]
+
+    def build_out(self) -> Data:
+        return Data(text=self.item.text.upper())
@@ -0,0 +1,13 @@
+from lfx.custom.custom_component.component import Component
+from lfx.io import IntInput, Output
+from lfx.schema.dataframe import DataFrame
+
+
+class Rows(Component):
+    display_name = "Rows"
+    description = "Produces N rows of text."
+    inputs = [IntInput(name="n", display_name="N", value=10)]
+    outputs = [Output(display_name="Rows", name="rows", method="build_rows")]
+
+    def build_rows(self) -> DataFrame:
+        return DataFrame([{"text": f"item {i}"} for i in range(self.n)])
@@ -0,0 +1,75 @@
+"""Fixtures and reporting for the graph engine benchmarks.
+
+The benchmarks only run when selected with ``-m benchmark``. At the end of the session the results are saved
+to ``LFX_BENCHMARK_OUTPUT`` (default ``.benchmarks/results.json``) and, when ``LFX_BENCHMARK_BASELINE`` names
+an earlier result file, compared against it: a benchmark whose median grew by more than
+``LFX_BENCHMARK_THRESHOLD`` (default 0.2, i.e. 20%) fails the session.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from tests.benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    Benchmark,
+    BenchmarkResult,
+    compare,
+    format_comparisons,
+    load_results,
+    results_document,
+    save_results,
+)
+
+BENCHMARKS_DIR = Path(__file__).parent
+RESULTS_KEY = pytest.StashKey[dict[str, BenchmarkResult]]()
+REPORT_KEY = pytest.StashKey[list[str]]()
+
+
+def pytest_collection_modifyitems(config, items):
+    selected = "benchmark" in (config.option.markexpr or "")
+    skip = pytest.mark.skip(reason="benchmarks only run with -m benchmark")
+    for item in items:
+        if BENCHMARKS_DIR not in Path(item.fspath).parents:
+            continue
+        item.add_marker(pytest.mark.benchmark)
+        if not selected:
+            item.add_marker(skip)
+
+
+@pytest.fixture
+def bench(request) -> Benchmark:
+    """Times a function and records it under the test's name (see ``Benchmark``)."""
+    results = request.config.stash.setdefault(RESULTS_KEY, {})
+    group = request.node.originalname.removeprefix("test_")
+    return Benchmark(name=request.node.name.removeprefix("test_"), group=group, results=results)
+
+
+def pytest_sessionfinish(session, exitstatus):  # noqa: ARG001
+    results = session.config.stash.get(RESULTS_KEY, {})
+    if not results:
+        return
+    output = Path(os.getenv("LFX_BENCHMARK_OUTPUT", ".benchmarks/results.json"))
+    save_results(results, output)
+    report = [f"Benchmark results saved to {output}"]
+
+    baseline_path = os.getenv("LFX_BENCHMARK_BASELINE")
+    if baseline_path:
+        threshold = float(os.getenv("LFX_BENCHMARK_THRESHOLD", str(DEFAULT_THRESHOLD)))
+        comparisons = compare(load_results(Path(baseline_path)), results_document(results), threshold)
+        report.append(f"Compared with {baseline_path} (threshold {threshold:.0%}):")
+        report.extend(format_comparisons(comparisons))
+        regressed = sum(comparison.regressed for comparison in comparisons)
+        if regressed:
+            report.append(f"{regressed} benchmark(s) regressed")
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+    session.config.stash[REPORT_KEY] = report
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):  # noqa: ARG001
+    report = config.stash.get(REPORT_KEY, [])
+    if report:
+        terminalreporter.section("benchmarks")
+        for line in report:
+            terminalreporter.write_line(line)
@@ -0,0 +1,147 @@
+"""Synthetic graphs for the graph engine benchmarks.
+
+Every graph is built from components that run offline: ``MockLLM`` stands in for a language model and answers
+instantly with a deterministic completion, so the benchmarks measure the engine rather than a provider.
+"""
+
+import json
+from collections.abc import Callable
+from copy import deepcopy
+from pathlib import Path
+
+from lfx.components.flow_controls import LoopComponent
+from lfx.components.input_output.text import TextInputComponent
+from lfx.graph import Graph
+
+from tests.benchmarks.components.collect import Collect
+from tests.benchmarks.components.mock_llm import MockLLM
+from tests.benchmarks.components.mock_llm_item import MockLLMItem
+from tests.benchmarks.components.rows import Rows
+
+STARTER_PROJECTS_PATH = Path(__file__).parent.parent / "data" / "starter_projects_1_6_0"
+
+
+def _text_input() -> TextInputComponent:
+    return TextInputComponent(_id="TextInput-0", input_value="Tell me about graphs")
+
+
+def chain(length: int = 50) -> Graph:
+    """A text input followed by ``length`` models, each reading the previous one."""
+    start = _text_input()
+    previous = MockLLM(_id="MockLLM-0")
+    previous.set(input_value=start.text_response)
+    for i in range(1, length):
+        current = MockLLM(_id=f"MockLLM-{i}")
+        current.set(input_value=previous.build_response)
+        previous = current
+    return Graph(start, previous)
+
+
+def fan_out(width: int = 200) -> Graph:
+    """A text input read by ``width`` models whose answers are merged by one more model."""
+    start = _text_input()
+    branches = []
+    for i in range(width):
+        branch = MockLLM(_id=f"MockLLM-{i}")
+        branch.set(input_value=start.text_response)
+        branches.append(branch)
+    merge = MockLLM(_id="Merge-0")
+    merge.set(input_value=[branch.build_response for branch in branches])
+    return Graph(start, merge)
+
+
+def diamond(depth: int = 25) -> Graph:
+    """``depth`` diamonds in a row: each splits into two models and merges them again."""
+    start = _text_input()
+    top = MockLLM(_id="Merge-0")
+    top.set(input_value=start.text_response)
+    for i in range(1, depth + 1):
+        left, right = MockLLM(_id=f"Left-{i}"), MockLLM(_id=f"Right-{i}")
+        left.set(input_value=top.build_response)
+        right.set(input_value=top.build_response)
+        top = MockLLM(_id=f"Merge-{i}")
+        top.set(input_value=[left.build_response, right.build_response])
+    return Graph(start, top)
+
+
+def loop(items: int = 50, *, parallel: bool = False) -> Graph:
+    """A Loop that runs a model over ``items`` rows; the only cyclic shape."""
+    rows = Rows(_id="Rows-0")
+    rows.set(n=items)
+    loop_component = LoopComponent(_id="Loop-0")
+    loop_component.set(data=rows.build_rows, parallel=parallel)
+    body = MockLLMItem(_id="MockLLMItem-0")
+    body.set(item=loop_component.item_output)
+    loop_component.set(item=body.build_out)
+    collect = Collect(_id="Collect-0")
+    collect.set(rows=loop_component.done_output)
+    return Graph(rows, collect)
+
+
+def _clone_node(node: dict, vertex_id: str) -> dict:
+    clone = deepcopy(node)
+    clone["id"] = clone["data"]["id"] = vertex_id
+    return clone
+
+
+def _clone_edge(edge: dict, source_id: str, target_id: str) -> dict:
+    clone = deepcopy(edge)
+    clone["source"] = clone["data"]["sourceHandle"]["id"] = source_id
+    clone["target"] = clone["data"]["targetHandle"]["id"] = target_id
+    return clone
+
+
+def grid_payload(layers: int = 100, width: int = 100) -> dict:
+    """Payload of ``layers`` x ``width`` models, each reading its own and its neighbour's column in the layer above.
+
+    With the defaults the graph has 10,002 vertices and 20,000 edges. Building that many components takes
+    minutes, so the nodes and edges are cloned from those of a two-model chain instead.
+    """
+    template = chain(length=2).dump()["data"]
+    nodes = {node["id"]: node for node in template["nodes"]}
+    input_edge, model_edge = sorted(template["edges"], key=lambda edge: edge["source"] != "TextInput-0")
+    model = nodes["MockLLM-0"]
+
+    payload_nodes = [nodes["TextInput-0"]]
+    payload_edges = []
+    for layer in range(layers):
+        for column in range(width):
+            vertex_id = f"MockLLM-{layer}-{column}"
+            payload_nodes.append(_clone_node(model, vertex_id))
+            if layer == 0:
+                payload_edges.append(_clone_edge(input_edge, "TextInput-0", vertex_id))
+            else:
+                payload_edges.extend(
+                    _clone_edge(model_edge, f"MockLLM-{layer - 1}-{source_column}", vertex_id)
+                    for source_column in (column, (column + 1) % width)
+                )
+    payload_nodes.append(_clone_node(model, "Merge-0"))
+    payload_edges.extend(
+        _clone_edge(model_edge, f"MockLLM-{layers - 1}-{column}", "Merge-0") for column in range(width)
+    )
+    return {"nodes": payload_nodes, "edges": payload_edges}
+
+
+SHAPES: dict[str, Callable[[], Graph]] = {
+    "chain": chain,
+    "fan_out": fan_out,
+    "diamond": diamond,
+    "loop": loop,
+}
+"""Synthetic shapes that are small enough to build, and run, in every round."""
+
+
+def shape_payload(shape: str) -> dict:
+    """Return the payload of a shape from ``SHAPES``, or of the 10,002-vertex ``grid_10k``."""
+    if shape == "grid_10k":
+        return grid_payload()
+    return SHAPES[shape]().dump()["data"]
+
+
+def starter_project_payloads() -> dict[str, dict]:
+    """Return the graph payload of every starter project, by file name."""
+    payloads = {}
+    for path in sorted(STARTER_PROJECTS_PATH.glob("*.json")):
+        flow = json.loads(path.read_text(encoding="utf-8"))
+        payloads[path.stem] = flow["data"]
+    return payloads
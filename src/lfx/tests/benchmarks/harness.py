@@ -0,0 +1,214 @@
+"""Timing, storage and baseline comparison for the graph engine benchmarks.
+
+Results are written as JSON::
+
+    {"version": 1, "created_at": ..., "machine": {...}, "benchmarks": {"<name>": {"median": ..., ...}}}
+
+and two result files are compared benchmark by benchmark on their median time. Compare two saved runs with::
+
+    python -m tests.benchmarks.harness baseline.json results.json --threshold 0.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+RESULTS_VERSION = 1
+DEFAULT_ROUNDS = 5
+DEFAULT_THRESHOLD = 0.2
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    group: str
+    times: list[float] = field(default_factory=list)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "group": self.group,
+            "rounds": len(self.times),
+            "min": min(self.times),
+            "max": max(self.times),
+            "mean": statistics.fmean(self.times),
+            "median": statistics.median(self.times),
+            "stddev": statistics.stdev(self.times) if len(self.times) > 1 else 0.0,
+        }
+
+
+@dataclass
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    threshold: float
+
+    @property
+    def change(self) -> float:
+        return self.current / self.baseline - 1 if self.baseline else 0.0
+
+    @property
+    def regressed(self) -> bool:
+        return self.change > self.threshold
+
+
+class Benchmark:
+    """Times a function over several rounds and records the result.
+
+    ``setup`` runs before every round, outside the timed region, and returns the positional arguments of the
+    timed call; use it for work the benchmark must not measure, such as building a fresh graph.
+    """
+
+    def __init__(self, name: str, group: str, results: dict[str, BenchmarkResult]):
+        self.name = name
+        self.group = group
+        self.results = results
+
+    def __call__(
+        self,
+        func: Callable[..., Any],
+        *,
+        setup: Callable[[], tuple] | None = None,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = 1,
+    ) -> Any:
+        result = None
+        times = []
+        for round_index in range(warmup + rounds):
+            args = setup() if setup is not None else ()
+            start = time.perf_counter()
+            result = func(*args)
+            elapsed = time.perf_counter() - start
+            if round_index >= warmup:
+                times.append(elapsed)
+        self._record(times)
+        return result
+
+    async def run_async(
+        self,
+        func: Callable[..., Awaitable[Any]],
+        *,
+        setup: Callable[[], tuple] | None = None,
+        rounds: int = DEFAULT_ROUNDS,
+        warmup: int = 1,
+    ) -> Any:
+        """Like calling the benchmark, for a coroutine function."""
+        result = None
+        times = []
+        for round_index in range(warmup + rounds):
+            args = setup() if setup is not None else ()
+            start = time.perf_counter()
+            result = await func(*args)
+            elapsed = time.perf_counter() - start
+            if round_index >= warmup:
+                times.append(elapsed)
+        self._record(times)
+        return result
+
+    def _record(self, times: list[float]) -> None:
+        self.results[self.name] = BenchmarkResult(name=self.name, group=self.group, times=times)
+
+
+def _commit() -> str | None:
+    try:
+        completed = subprocess.run(
+            ["git", "rev-parse", "HEAD"],  # noqa: S607
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return completed.stdout.strip()
+
+
+def results_document(results: dict[str, BenchmarkResult]) -> dict[str, Any]:
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "commit": _commit(),
+        "machine": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "system": platform.system(),
+            "machine": platform.machine(),
+            "cpu_count": os.cpu_count(),
+        },
+        "benchmarks": {name: result.as_dict() for name, result in sorted(results.items())},
+    }
+
+
+def save_results(results: dict[str, BenchmarkResult], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results_document(results), indent=2) + "\n", encoding="utf-8")
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if document.get("version") != RESULTS_VERSION:
+        msg = f"{path} has results version {document.get('version')}, expected {RESULTS_VERSION}"
+        raise ValueError(msg)
+    return document
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], threshold: float = DEFAULT_THRESHOLD
+) -> list[Comparison]:
+    """Compare the median of every benchmark present in both documents.
+
+    A benchmark regressed when its median grew by more than ``threshold`` (0.2 is 20%).
+    """
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline["benchmarks"][name]["median"],
+            current=stats["median"],
+            threshold=threshold,
+        )
+        for name, stats in current["benchmarks"].items()
+        if name in baseline["benchmarks"]
+    ]
+
+
+def format_comparisons(comparisons: list[Comparison]) -> list[str]:
+    width = max((len(comparison.name) for comparison in comparisons), default=0)
+    lines = []
+    for comparison in comparisons:
+        flag = "REGRESSED" if comparison.regressed else ""
+        lines.append(
+            f"{comparison.name:<{width}}  {comparison.baseline * 1000:>10.3f} ms -> "
+            f"{comparison.current * 1000:>10.3f} ms  {comparison.change:>+8.1%}  {flag}".rstrip()
+        )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files.")
+    parser.add_argument("baseline", type=Path)
+    parser.add_argument("current", type=Path)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    comparisons = compare(load_results(args.baseline), load_results(args.current), args.threshold)
+    for line in format_comparisons(comparisons):
+        print(line)  # noqa: T201
+    return 1 if any(comparison.regressed for comparison in comparisons) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,173 @@
+"""Benchmarks of the graph engine: loading, sorting, running, serializing and event delivery.
+
+Run with ``make benchmarks`` from ``src/lfx``, or ``pytest tests/benchmarks -m benchmark``.
+"""
+
+import asyncio
+from copy import deepcopy
+from functools import partial
+
+import pytest
+from lfx.events.event_manager import create_default_event_manager
+from lfx.graph import Graph
+from lfx.graph.graph.layer_plans import layer_plan_cache
+from lfx.graph.graph.utils import layered_topological_sort
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+from lfx.schema.message import Message
+from lfx.serialization.serialization import serialize
+
+from tests.benchmarks.graphs import SHAPES, loop, shape_payload, starter_project_payloads
+
+STRUCTURE_SHAPES = [*SHAPES, "grid_10k"]
+DAG_SHAPES = ["chain", "fan_out", "diamond"]
+# The sequential Loop intermittently collects its unresolved ``item`` output instead of the body's result once
+# earlier graphs have been garbage collected, so runs use the parallel map; sorting still covers the cycle.
+EXECUTION_SHAPES = {**{shape: SHAPES[shape] for shape in DAG_SHAPES}, "loop_parallel": partial(loop, parallel=True)}
+
+
+def _rounds(shape: str) -> dict[str, int]:
+    # A single pass over the 10k-vertex grid takes seconds to minutes
+    return {"rounds": 1, "warmup": 0} if shape == "grid_10k" else {}
+
+
+@pytest.fixture(scope="module")
+def payloads() -> dict[str, dict]:
+    return {shape: shape_payload(shape) for shape in STRUCTURE_SHAPES}
+
+
+class TestGraphStructure:
+    @pytest.mark.parametrize("shape", STRUCTURE_SHAPES)
+    def test_from_payload(self, bench, payloads, shape):
+        payload = payloads[shape]
+
+        graph = bench(Graph.from_payload, setup=lambda: (deepcopy(payload),), **_rounds(shape))
+
+        assert len(graph.vertices) == len(payload["nodes"])
+
+    @pytest.mark.parametrize("shape", STRUCTURE_SHAPES)
+    def test_sort_vertices(self, bench, payloads, shape):
+        graph = Graph.from_payload(deepcopy(payloads[shape]))
+
+        def setup() -> tuple:
+            layer_plan_cache.invalidate()
+            return ()
+
+        first_layer = bench(graph.sort_vertices, setup=setup, **_rounds(shape))
+
+        assert first_layer
+
+    @pytest.mark.parametrize("shape", STRUCTURE_SHAPES)
+    def test_sort_vertices_cached(self, bench, payloads, shape):
+        graph = Graph.from_payload(deepcopy(payloads[shape]))
+        graph.sort_vertices()
+
+        first_layer = bench(graph.sort_vertices)
+
+        assert first_layer
+
+    @pytest.mark.parametrize("shape", STRUCTURE_SHAPES)
+    def test_layered_topological_sort(self, bench, payloads, shape):
+        graph = Graph.from_payload(deepcopy(payloads[shape]))
+
+        def sort():
+            return layered_topological_sort(
+                vertices_ids=set(graph.get_vertex_ids()),
+                in_degree_map=graph.in_degree_map,
+                successor_map=graph.successor_map,
+                predecessor_map=graph.predecessor_map,
+                cycle_vertices=graph.cycle_vertices,
+                is_cyclic=graph.is_cyclic,
+            )
+
+        layers = bench(sort, **_rounds(shape))
+
+        assert layers
+
+
+class TestStarterProjects:
+    @pytest.mark.parametrize("project", list(starter_project_payloads()))
+    def test_starter_project_load(self, bench, project):
+        payload = starter_project_payloads()[project]
+        try:
+            Graph.from_payload(deepcopy(payload))
+        except ValueError as e:
+            pytest.skip(f"{project} needs components that cannot be loaded here: {e}")
+
+        def load_and_sort(payload: dict) -> Graph:
+            graph = Graph.from_payload(payload)
+            graph.sort_vertices()
+            return graph
+
+        graph = bench(load_and_sort, setup=lambda: (deepcopy(payload),))
+
+        assert graph.vertices
+
+
+class TestGraphExecution:
+    @pytest.mark.parametrize("shape", DAG_SHAPES)
+    async def test_process(self, bench, shape):
+        async def process(graph: Graph) -> Graph:
+            return await graph.process(fallback_to_env_vars=False)
+
+        graph = await bench.run_async(process, setup=lambda: (SHAPES[shape](),))
+
+        assert all(vertex.built for vertex in graph.vertices)
+
+    @pytest.mark.parametrize("shape", list(EXECUTION_SHAPES))
+    async def test_async_start(self, bench, shape):
+        async def run(graph: Graph) -> list:
+            return [result async for result in graph.async_start(max_iterations=500)]
+
+        results = await bench.run_async(run, setup=lambda: (EXECUTION_SHAPES[shape](),))
+
+        assert results
+
+    async def test_vertex_build(self, bench):
+        def setup():
+            graph = SHAPES["chain"]()
+            return (graph.get_vertex("MockLLM-0"), graph.get_vertex("TextInput-0"))
+
+        async def build(vertex, upstream):
+            await upstream.build(fallback_to_env_vars=False)
+            await vertex.build(fallback_to_env_vars=False)
+            return vertex
+
+        vertex = await bench.run_async(build, setup=setup, rounds=20)
+
+        assert vertex.built
+
+
+class TestSerialization:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            pytest.param(Message(text="x" * 10_000), id="message"),
+            pytest.param(DataFrame([{"text": f"row {i}", "index": i} for i in range(1_000)]), id="dataframe"),
+            pytest.param({f"key-{i}": Data(data={"text": "y" * 100, "i": i}) for i in range(1_000)}, id="data_dict"),
+        ],
+    )
+    def test_serialize(self, bench, value):
+        serialized = bench(serialize, setup=lambda: (value,), rounds=20)
+
+        assert serialized is not None
+
+
+class TestEventPipeline:
+    async def test_event_pipeline(self, bench):
+        vertex_event = {"build_data": {"id": "MockLLM-0", "valid": True, "data": {"results": {"text": "z" * 500}}}}
+
+        def send(manager, queue: asyncio.Queue) -> int:
+            for i in range(1_000):
+                manager.on_token(data={"chunk": f"token {i}", "id": "message"})
+            for _ in range(100):
+                manager.on_end_vertex(data=vertex_event)
+            return queue.qsize()
+
+        def setup():
+            queue: asyncio.Queue = asyncio.Queue()
+            return (create_default_event_manager(queue), queue)
+
+        sent = bench(send, setup=setup, rounds=10)
+
+        assert sent == 1_100
@@ -0,0 +1,155 @@
+"""Tests for the persistent Docling worker pool, using a stand-in worker script."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from lfx.base.data import docling_pool
+from lfx.base.data.docling_pool import DoclingWorkerPool, run_docling_once
+
+FAKE_WORKER = """
+import json, os, sys, time
+for line in sys.stdin:
+    cfg = json.loads(line)
+    if "warm_up" in cfg:
+        # Stands in for importing Docling and loading its models.
+        time.sleep(1 if cfg["warm_up"]["ocr_engine"] == "slow-start" else 0)
+        print(json.dumps({"ready": True}), flush=True)
+        continue
+    if cfg.get("crash"):
+        sys.exit(3)
+    time.sleep(cfg.get("sleep", 0))
+    print(json.dumps({"ok": True, "pid": os.getpid(), "meta": {"file_path": cfg["file_path"]}}), flush=True)
+"""
+
+
+@pytest.fixture
+def fake_worker(monkeypatch):
+    monkeypatch.setattr(docling_pool, "DOCLING_WORKER_SCRIPT", FAKE_WORKER)
+
+
+def _args(file_path="a.pdf", **kwargs):
+    return {"file_path": file_path, "pipeline": "standard", "ocr_engine": None, **kwargs}
+
+
+@pytest.mark.usefixtures("fake_worker")
+class TestDoclingWorkerPool:
+    def test_workers_stay_warm_per_config(self):
+        pool = DoclingWorkerPool(max_workers=1)
+        try:
+            first = pool.convert(_args("a.pdf"))
+            second = pool.convert(_args("b.pdf"))
+            other_config = pool.convert(_args("c.pdf", ocr_engine="easyocr"))
+
+            assert first["ok"]
+            assert second["meta"]["file_path"] == "b.pdf"
+            assert first["pid"] == second["pid"]
+            assert other_config["pid"] != first["pid"]
+            assert pool.metrics()["workers_started"] == 2
+            assert pool.metrics()["workers"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_workers_are_recycled(self):
+        pool = DoclingWorkerPool(max_workers=1, max_tasks_per_child=2)
+        try:
+            pids = [pool.convert(_args())["pid"] for _ in range(3)]
+            assert pids[0] == pids[1] != pids[2]
+        finally:
+            pool.shutdown()
+
+    def test_timeout_returns_an_error(self):
+        pool = DoclingWorkerPool(max_workers=1, task_timeout=1)
+        try:
+            timed_out = pool.convert(_args(sleep=30))
+            recovered = pool.convert(_args())
+
+            assert timed_out == {"ok": False, "error": "Docling timed out after 1 seconds"}
+            assert recovered["ok"]
+            metrics = pool.metrics()
+            assert (metrics["completed"], metrics["failed"], metrics["timeouts"]) == (1, 1, 1)
+        finally:
+            pool.shutdown()
+
+    def test_crash_returns_an_error(self):
+        pool = DoclingWorkerPool(max_workers=1)
+        try:
+            crashed = pool.convert(_args(crash=True))
+            recovered = pool.convert(_args())
+
+            assert not crashed["ok"]
+            assert "exited with code 3" in crashed["error"]
+            assert recovered["ok"]
+            metrics = pool.metrics()
+            assert (metrics["completed"], metrics["failed"], metrics["timeouts"]) == (1, 1, 0)
+        finally:
+            pool.shutdown()
+
+    def test_worker_startup_does_not_count_against_the_task_timeout(self):
+        pool = DoclingWorkerPool(max_workers=1, max_tasks_per_child=1, task_timeout=0.5)
+        try:
+            results = [pool.convert(_args(ocr_engine="slow-start")) for _ in range(2)]
+
+            assert all(result["ok"] for result in results)
+            assert results[0]["pid"] != results[1]["pid"]
+            assert pool.metrics()["timeouts"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_worker_startup_is_bounded(self):
+        pool = DoclingWorkerPool(max_workers=1, startup_timeout=0.2)
+        try:
+            result = pool.convert(_args(ocr_engine="slow-start"))
+
+            assert result == {
+                "ok": False,
+                "error": "Docling subprocess error: Docling worker did not start within 0.2 seconds",
+            }
+            assert pool.metrics()["workers"] == 0
+        finally:
+            pool.shutdown()
+
+    def test_concurrent_files_use_several_workers_and_bounded_queue(self):
+        pool = DoclingWorkerPool(max_workers=2, max_queue=0)
+        try:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                results = list(executor.map(pool.convert, [_args(str(i), sleep=0.5) for i in range(3)]))
+
+            ok = [result for result in results if result["ok"]]
+            assert len({result["pid"] for result in ok}) == 2
+            assert [result["error"] for result in results if not result["ok"]] == [
+                "Docling worker queue is full (0 files waiting)"
+            ]
+            assert pool.metrics()["rejected"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_waiting_for_a_worker_is_bounded(self):
+        pool = DoclingWorkerPool(max_workers=1, queue_timeout=0.2)
+        try:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                results = list(executor.map(pool.convert, [_args(str(i), sleep=1) for i in range(2)]))
+
+            assert sum(result["ok"] for result in results) == 1
+            assert [result["error"] for result in results if not result["ok"]] == [
+                "No Docling worker became free within 0.2 seconds"
+            ]
+            assert pool.metrics()["rejected"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_metrics_are_reported_without_starting_the_pool(self, monkeypatch):
+        monkeypatch.setattr(docling_pool, "_pool", None)
+        assert docling_pool.get_docling_pool_metrics() is None
+
+        pool = DoclingWorkerPool(max_workers=1)
+        monkeypatch.setattr(docling_pool, "_pool", pool)
+        try:
+            pool.convert(_args())
+            assert docling_pool.get_docling_pool_metrics()["completed"] == 1
+        finally:
+            pool.shutdown()
+
+    def test_run_once(self):
+        result = run_docling_once(_args())
+        assert result["ok"]
+        assert result["meta"] == {"file_path": "a.pdf"}
@@ -0,0 +1,148 @@
+"""Tests for the content-addressed parsed document cache."""
+
+import datetime as dt
+import os
+from types import SimpleNamespace
+
+import pytest
+from lfx.base.data import parse_cache, utils
+from lfx.base.data.parse_cache import ParsedDocumentCache, hash_bytes
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ParsedDocumentCache(tmp_path / "cache")
+
+
+class TestParsedDocumentCache:
+    def test_key_depends_on_content_parser_and_options(self):
+        key = ParsedDocumentCache.make_key(hash_bytes(b"a"), "text_file", {"suffix": ".txt"})
+        assert key == ParsedDocumentCache.make_key(hash_bytes(b"a"), "text_file", {"suffix": ".txt"})
+        assert key != ParsedDocumentCache.make_key(hash_bytes(b"b"), "text_file", {"suffix": ".txt"})
+        assert key != ParsedDocumentCache.make_key(hash_bytes(b"a"), "docling", {"suffix": ".txt"})
+        assert key != ParsedDocumentCache.make_key(hash_bytes(b"a"), "text_file", {"suffix": ".json"})
+
+    def test_key_depends_on_parser_version(self, monkeypatch):
+        key = ParsedDocumentCache.make_key(hash_bytes(b"a"), "docling")
+        monkeypatch.setattr(parse_cache, "parser_versions", lambda _parser: {"docling": "0.0.1"})
+
+        assert key != ParsedDocumentCache.make_key(hash_bytes(b"a"), "docling")
+
+    def test_parser_versions_cover_missing_packages(self, monkeypatch):
+        monkeypatch.setitem(parse_cache.PARSER_DISTRIBUTIONS, "test", ("lfx", "not-an-installed-package"))
+
+        versions = parse_cache.parser_versions("test")
+
+        assert versions["lfx"]
+        assert versions["not-an-installed-package"] is None
+
+    def test_get_or_parse_and_stats(self, cache):
+        calls = []
+
+        def parse():
+            calls.append(1)
+            return {"rows": [1, 2]}
+
+        assert cache.get_or_parse("k", parse) == {"rows": [1, 2]}
+        assert cache.get_or_parse("k", parse) == {"rows": [1, 2]}
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    def test_values_that_do_not_round_trip_are_not_cached(self, cache):
+        cache.set("k", {"when": dt.date(2024, 1, 1)})
+        assert cache.get("k") is None
+
+    def test_entries_are_shared_through_the_directory(self, cache):
+        cache.set("k", "text")
+        assert ParsedDocumentCache(cache.cache_dir).get("k") == "text"
+
+    def test_least_recently_used_entries_are_evicted(self, tmp_path):
+        cache = ParsedDocumentCache(tmp_path, max_bytes=250)
+        for index, key in enumerate(["old", "used", "new"]):
+            cache.set(key, "x" * 100)
+            os.utime(tmp_path / f"{key}.json", (index, index))
+        cache.get("used")
+        cache.set("newest", "x" * 100)
+
+        assert cache.get("old") is None
+        assert cache.get("used") == "x" * 100
+        assert cache.stats()["evictions"] >= 1
+        assert cache.stats()["size_bytes"] <= 250
+
+
+class TestGetParseCache:
+    @pytest.fixture(autouse=True)
+    def _reset(self, monkeypatch):
+        monkeypatch.setattr(parse_cache, "_cache", None)
+
+    def _settings(self, monkeypatch, tmp_path, enabled):
+        settings = SimpleNamespace(parse_cache_enabled=enabled, config_dir=str(tmp_path), parse_cache_max_size_mb=1)
+        monkeypatch.setattr("lfx.services.deps.get_settings_service", lambda: SimpleNamespace(settings=settings))
+
+    def test_cache_is_opt_in(self, monkeypatch, tmp_path):
+        from lfx.services.settings.base import Settings
+
+        assert Settings.model_fields["parse_cache_enabled"].default is False
+        self._settings(monkeypatch, tmp_path, enabled=False)
+        assert parse_cache.get_parse_cache() is None
+
+    def test_enabled_cache_lives_in_the_config_dir(self, monkeypatch, tmp_path):
+        self._settings(monkeypatch, tmp_path, enabled=True)
+        cache = parse_cache.get_parse_cache()
+
+        assert cache.cache_dir == tmp_path / "parse_cache"
+        assert cache.max_bytes == 1024 * 1024
+
+
+class TestParseTextFileToDataCache:
+    def test_second_parse_is_served_from_cache(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "get_parse_cache", lambda: cache)
+        parsed = []
+        original = utils._parse_file_content
+        monkeypatch.setattr(
+            utils, "_parse_file_content", lambda content, path: parsed.append(path) or original(content, path)
+        )
+        first = tmp_path / "a.json"
+        first.write_text('{"a": 1}')
+        renamed = tmp_path / "b.json"
+        renamed.write_text('{"a": 1}')
+
+        assert utils.parse_text_file_to_data(str(first), silent_errors=False).data["text"] == '{"a":1}'
+        result = utils.parse_text_file_to_data(str(renamed), silent_errors=False)
+
+        assert result.data == {"file_path": str(renamed), "text": '{"a":1}'}
+        assert parsed == [str(first)]
+
+    async def test_async_parse_uses_cache(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "get_parse_cache", lambda: cache)
+        path = tmp_path / "notes.txt"
+        path.write_text("hello")
+
+        first = await utils.parse_text_file_to_data_async(str(path), silent_errors=False)
+        second = await utils.parse_text_file_to_data_async(str(path), silent_errors=False)
+
+        assert first.data["text"] == second.data["text"] == "hello"
+        assert cache.stats()["hits"] == 1
+
+    async def test_sync_and_async_parses_share_entries(self, cache, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "get_parse_cache", lambda: cache)
+        path = tmp_path / "notes.txt"
+        path.write_bytes("caf\u00e9 ".encode("latin-1") * 50)
+
+        first = utils.parse_text_file_to_data(str(path), silent_errors=False)
+        second = await utils.parse_text_file_to_data_async(str(path), silent_errors=False)
+
+        assert second.data["text"] == first.data["text"] == utils.decode_text(path.read_bytes())
+        assert cache.stats()["hits"] == 1
+
+
+class TestDecodeText:
+    def test_non_ascii_after_sample_is_decoded(self):
+        raw = b"a" * (utils.ENCODING_SAMPLE_SIZE + 10) + "é".encode()
+        assert utils.decode_text(raw).endswith("é")
+
+    def test_falls_back_to_full_detection(self):
+        raw = b"a" * utils.ENCODING_SAMPLE_SIZE + "café crème brûlée".encode("latin-1") * 20
+        assert "café" in utils.decode_text(raw)
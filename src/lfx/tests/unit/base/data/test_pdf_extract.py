@@ -0,0 +1,107 @@
+"""Tests for page-sharded PDF text extraction."""
+
+import time
+
+import pytest
+from lfx.base.data import pdf_extract
+from lfx.base.data.pdf_extract import iter_pdf_pages, parse_pdf_bytes, parse_pdf_file
+from lfx.utils.executors import ExecutorPool
+from pypdf import PdfReader
+
+
+def _make_pdf(page_count: int, lines_per_page: int = 1) -> bytes:
+    """Build a minimal PDF whose pages contain the text ``page <n> line <m>``."""
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    page_refs = []
+    for page in range(page_count):
+        lines = b"".join(
+            b"BT /F1 8 Tf 20 %d Td (page %d line %d) Tj ET\n" % (800 - 10 * line, page, line)
+            for line in range(lines_per_page)
+        )
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(lines), lines))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(page_refs), page_count)
+
+    output = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(output))
+        output += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref_at = len(output)
+    output += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    output += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    output += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_at)
+    return bytes(output)
+
+
+def _sequential(path) -> str:
+    with path.open("rb") as f, PdfReader(f) as reader:
+        return "\n\n".join(page.extract_text() for page in reader.pages)
+
+
+@pytest.fixture
+def two_process_pool(monkeypatch):
+    """Shard across two worker processes even on single-core machines."""
+    pool = ExecutorPool("test-process", 2, use_processes=True)
+    monkeypatch.setattr(pdf_extract, "get_executor", lambda _executor_class: pool)
+    yield pool
+    pool.shutdown()
+
+
+class TestPdfExtract:
+    @pytest.mark.parametrize("page_count", [1, 5, 40])
+    def test_matches_sequential_extraction(self, tmp_path, page_count):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(_make_pdf(page_count))
+
+        assert parse_pdf_file(path) == _sequential(path)
+        assert "page 0 line 0" in parse_pdf_file(path)
+
+    @pytest.mark.usefixtures("two_process_pool")
+    def test_pages_are_streamed_in_order(self, tmp_path):
+        path = tmp_path / "doc.pdf"
+        path.write_bytes(_make_pdf(30))
+
+        pages = list(iter_pdf_pages(path, pages_per_shard=4, min_pages=2))
+
+        assert [page.strip() for page in pages] == [f"page {index} line 0" for index in range(30)]
+
+    @pytest.mark.usefixtures("two_process_pool")
+    def test_bytes_are_parsed(self):
+        content = _make_pdf(20)
+        assert parse_pdf_bytes(content) == parse_pdf_bytes(content, parallel=False)
+
+    def test_invalid_pdf_raises(self, tmp_path):
+        path = tmp_path / "empty.pdf"
+        path.write_bytes(b"")
+        with pytest.raises(Exception):  # noqa: B017, PT011
+            parse_pdf_file(path)
+
+    @pytest.mark.slow
+    def test_benchmark_large_pdf(self, tmp_path):
+        path = tmp_path / "large.pdf"
+        path.write_bytes(_make_pdf(400, lines_per_page=60))
+        parse_pdf_file(path)  # warm up the process pool
+
+        start = time.perf_counter()
+        sequential = parse_pdf_file(path, parallel=False)
+        sequential_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = parse_pdf_file(path)
+        parallel_seconds = time.perf_counter() - start
+
+        assert parallel == sequential
+        print(  # noqa: T201
+            f"\n400 pages: sequential {sequential_seconds:.2f}s, sharded {parallel_seconds:.2f}s, "
+            f"speedup {sequential_seconds / parallel_seconds:.1f}x"
+        )
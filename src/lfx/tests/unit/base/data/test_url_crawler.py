@@ -0,0 +1,148 @@
+"""Tests for the concurrent URL crawler, run against a local HTTP server."""
+
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from lfx.base.data.url_crawler import AsyncUrlCrawler, HTTPResponseCache
+
+PAGES = {
+    "/": '<html lang="en"><head><title>Home</title><meta name="description" content="Root page"></head>'
+    '<body><a href="/a">A</a><a href="/b#section">B</a><a href="https://example.com/out">Out</a></body></html>',
+    "/a": '<html><head><title>A</title></head><body><a href="/c">C</a></body></html>',
+    "/b": "<html><head><title>B</title></head><body>b</body></html>",
+    "/c": "<html><head><title>C</title></head><body>c</body></html>",
+    "/style.css": "body { color: red; }",
+}
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: "_FixtureServer"
+
+    def do_GET(self):
+        with self.server.lock:
+            self.server.requests.append(self.path)
+            self.server.in_flight += 1
+            self.server.max_in_flight = max(self.server.max_in_flight, self.server.in_flight)
+        try:
+            time.sleep(self.server.delay)
+            body = PAGES.get(self.path)
+            if body is None:
+                self.send_response(404)
+                self.end_headers()
+                return
+            etag = f'"{hash(body)}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.server.not_modified += 1
+                self.send_response(304)
+                self.end_headers()
+                return
+            content_type = "text/css" if self.path.endswith(".css") else "text/html; charset=utf-8"
+            payload = body.encode()
+            self.send_response(200)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.send_header("ETag", etag)
+            self.end_headers()
+            self.wfile.write(payload)
+        finally:
+            with self.server.lock:
+                self.server.in_flight -= 1
+
+    def log_message(self, *args):
+        pass
+
+
+class _FixtureServer(ThreadingHTTPServer):
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.lock = threading.Lock()
+        self.requests: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.not_modified = 0
+        self.delay = 0.0
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+@pytest.fixture
+def http_server():
+    server = _FixtureServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+async def _crawl(crawler, urls):
+    return [page async for page in crawler.crawl(urls)]
+
+
+class TestAsyncUrlCrawler:
+    async def test_depth_one_fetches_only_root(self, http_server):
+        pages = await _crawl(AsyncUrlCrawler(max_depth=1), [f"{http_server.base_url}/"])
+
+        assert [page.url for page in pages] == [f"{http_server.base_url}/"]
+        page = pages[0]
+        assert page.title == "Home"
+        assert page.description == "Root page"
+        assert page.language == "en"
+        assert page.content_type.startswith("text/html")
+
+    async def test_follows_links_within_root(self, http_server):
+        base = http_server.base_url
+        pages = await _crawl(AsyncUrlCrawler(max_depth=3), [f"{base}/"])
+
+        assert sorted(page.url for page in pages) == [f"{base}/", f"{base}/a", f"{base}/b", f"{base}/c"]
+        assert sorted(http_server.requests) == ["/", "/a", "/b", "/c"]
+
+    async def test_per_host_limit_is_respected(self, http_server):
+        http_server.delay = 0.05
+        base = http_server.base_url
+        urls = [f"{base}/a", f"{base}/b", f"{base}/c", f"{base}/"]
+        pages = await _crawl(AsyncUrlCrawler(max_concurrency=10, max_per_host=2), urls)
+
+        assert len(pages) == 4
+        assert http_server.max_in_flight <= 2
+
+    async def test_fetches_concurrently(self, http_server):
+        http_server.delay = 0.05
+        base = http_server.base_url
+        urls = [f"{base}/a", f"{base}/b", f"{base}/c", f"{base}/"]
+        await _crawl(AsyncUrlCrawler(max_concurrency=4, max_per_host=4), urls)
+
+        assert http_server.max_in_flight > 1
+
+    async def test_conditional_requests_use_cache(self, http_server, tmp_path):
+        cache = HTTPResponseCache(tmp_path)
+        url = f"{http_server.base_url}/b"
+
+        first = await _crawl(AsyncUrlCrawler(cache=cache), [url])
+        second = await _crawl(AsyncUrlCrawler(cache=cache), [url])
+
+        assert not first[0].from_cache
+        assert second[0].from_cache
+        assert second[0].content == first[0].content
+        assert http_server.not_modified == 1
+
+    async def test_filters_css(self, http_server):
+        pages = await _crawl(AsyncUrlCrawler(), [f"{http_server.base_url}/style.css"])
+        assert pages == []
+
+    async def test_failures_are_skipped_or_raised(self, http_server):
+        base = http_server.base_url
+        pages = await _crawl(AsyncUrlCrawler(check_response_status=True), [f"{base}/missing", f"{base}/b"])
+        assert [page.url for page in pages] == [f"{base}/b"]
+
+        crawler = AsyncUrlCrawler(check_response_status=True, continue_on_failure=False)
+        with pytest.raises(Exception, match="404"):
+            await _crawl(crawler, [f"{base}/missing"])
+
+    async def test_extractor_is_applied(self, http_server):
+        pages = await _crawl(AsyncUrlCrawler(extractor=str.upper), [f"{http_server.base_url}/b"])
+        assert "<TITLE>B</TITLE>" in pages[0].content
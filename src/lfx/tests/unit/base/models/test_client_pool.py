@@ -0,0 +1,99 @@
+"""Tests for the pooled language model clients used by get_llm."""
+
+import asyncio
+import itertools
+
+import pytest
+from lfx.base.models.client_pool import LLMClientPool
+from pydantic import BaseModel, SecretStr, model_validator
+
+_client_ids = itertools.count()
+
+
+class FakeChatModel(BaseModel):
+    model: str
+    api_key: SecretStr | None = None
+    temperature: float | None = None
+    streaming: bool = False
+    client_id: int | None = None
+
+    @model_validator(mode="after")
+    def create_client(self):
+        # Like LangChain chat models, only create an SDK client when none was passed in
+        if self.client_id is None:
+            self.client_id = next(_client_ids)
+        return self
+
+
+class ReasoningChatModel(FakeChatModel):
+    """Like reasoning models, only accepts a temperature of 1."""
+
+    @model_validator(mode="after")
+    def check_temperature(self):
+        if self.temperature not in (None, 1):
+            msg = "temperature must be 1"
+            raise ValueError(msg)
+        return self
+
+
+def _get(pool, **kwargs):
+    return pool.get(FakeChatModel, {"model": "m", "api_key": "key-1", **kwargs}, credential_params={"api_key"})
+
+
+class TestLLMClientPool:
+    def test_per_call_settings_reuse_client(self):
+        pool = LLMClientPool()
+        first = _get(pool, temperature=0.1)
+        second = _get(pool, temperature=0.9, streaming=True)
+
+        assert first.client_id == second.client_id
+        assert (first.temperature, first.streaming) == (0.1, False)
+        assert (second.temperature, second.streaming) == (0.9, True)
+        assert first is not second
+        assert pool.stats() == {"size": 1, "hits": 1, "misses": 1}
+
+    def test_rotated_credentials_get_new_client(self):
+        pool = LLMClientPool()
+        first = _get(pool)
+        rotated = _get(pool, api_key="key-2")
+
+        assert first.client_id != rotated.client_id
+        assert rotated.api_key.get_secret_value() == "key-2"
+        assert all("key-1" not in repr(key) for key in pool._entries)
+
+    def test_lru_and_ttl_eviction(self):
+        pool = LLMClientPool(max_size=1)
+        first = _get(pool, model="a")
+        _get(pool, model="b")
+        assert _get(pool, model="a").client_id != first.client_id
+
+        expiring = LLMClientPool(ttl_seconds=-1)
+        assert _get(expiring).client_id != _get(expiring).client_id
+
+    def test_disabled_pool_and_non_pydantic_classes(self):
+        assert _get(LLMClientPool(max_size=0)).client_id != _get(LLMClientPool(max_size=0)).client_id
+
+        calls = []
+        pool = LLMClientPool()
+        pool.get(lambda **kwargs: calls.append(kwargs), {"model": "m"})
+        pool.get(lambda **kwargs: calls.append(kwargs), {"model": "m"})
+        assert len(calls) == 2
+        assert pool.stats()["size"] == 0
+
+    def test_per_call_settings_are_validated(self):
+        pool = LLMClientPool()
+        kwargs = {"model": "m", "api_key": "key-1"}
+        pooled = pool.get(ReasoningChatModel, {**kwargs, "temperature": 1})
+
+        with pytest.raises(ValueError, match="temperature must be 1"):
+            pool.get(ReasoningChatModel, {**kwargs, "temperature": 0.5})
+        assert pool.get(ReasoningChatModel, kwargs).client_id == pooled.client_id
+
+    def test_clients_are_per_event_loop(self):
+        pool = LLMClientPool()
+
+        async def get():
+            return _get(pool).client_id
+
+        assert asyncio.run(get()) != asyncio.run(get())
+        assert _get(pool).client_id == _get(pool).client_id
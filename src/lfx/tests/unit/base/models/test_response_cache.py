@@ -0,0 +1,233 @@
+"""Tests for the exact-match response cache of language model components."""
+
+import asyncio
+
+import pytest
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessageChunk, HumanMessage, SystemMessage
+from lfx.base.models import model as model_module
+from lfx.base.models import response_cache
+from lfx.base.models.model import LCModelComponent
+from lfx.base.models.response_cache import KEY_PREFIX, LLMResponseCache
+from lfx.schema.message import Message
+from pydantic import SecretStr
+
+
+class CountingChatModel(FakeListChatModel):
+    calls: int = 0
+
+    async def _agenerate(self, *args, **kwargs):
+        self.calls += 1
+        return await super()._agenerate(*args, **kwargs)
+
+    async def _astream(self, *args, **kwargs):
+        self.calls += 1
+        async for chunk in super()._astream(*args, **kwargs):
+            yield chunk
+
+
+class SecretModel(FakeListChatModel):
+    api_key: SecretStr
+
+
+class BlockChatModel(CountingChatModel):
+    """Streams content blocks, the way some providers do, instead of plain strings."""
+
+    async def _astream(self, *args, **kwargs):
+        self.calls += 1
+        async for chunk in super(CountingChatModel, self)._astream(*args, **kwargs):
+            chunk.message = AIMessageChunk(content=[{"type": "text", "text": chunk.message.content}])
+            yield chunk
+
+
+class FakeModelComponent(LCModelComponent):
+    display_name = "Fake Model"
+    inputs = LCModelComponent._base_inputs
+
+    def build_model(self):
+        return self.llm
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = LLMResponseCache()
+    monkeypatch.setattr(model_module, "get_llm_response_cache", lambda: cache)
+    return cache
+
+
+def _component(llm, **kwargs):
+    component = FakeModelComponent(**{"input_value": "What is Langflow?", "cache_response": True, **kwargs})
+    component.llm = llm
+    return component
+
+
+class FakeCacheService:
+    """Stands in for the shared cache service that the ``"service"`` backend stores entries in."""
+
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def set(self, key, value):
+        self.data[key] = value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def cache_service(monkeypatch):
+    service = FakeCacheService()
+    monkeypatch.setattr(response_cache, "_get_cache_service", lambda: service)
+    return service
+
+
+class TestLLMResponseCache:
+    async def test_key_ignores_whitespace_but_not_model_or_flow(self):
+        cache = LLMResponseCache()
+        model = FakeListChatModel(responses=["a"])
+        key = await cache.make_key("flow-1", model, [SystemMessage("Be brief."), HumanMessage("Hi there\r\n")])
+
+        assert key == await cache.make_key("flow-1", model, [SystemMessage("Be brief.  "), HumanMessage("Hi there")])
+        assert key != await cache.make_key("flow-2", model, [SystemMessage("Be brief."), HumanMessage("Hi there")])
+        assert key != await cache.make_key("flow-1", model, [HumanMessage("Be brief."), HumanMessage("Hi there")])
+        other_model = FakeListChatModel(responses=["b"])
+        assert key != await cache.make_key(
+            "flow-1", other_model, [SystemMessage("Be brief."), HumanMessage("Hi there")]
+        )
+
+    async def test_key_is_scoped_to_user_and_credentials(self):
+        cache = LLMResponseCache()
+        messages = [HumanMessage("hi")]
+        model = SecretModel(responses=["a"], api_key=SecretStr("key-1"))
+        key = await cache.make_key("flow", model, messages, user_id="user-1")
+
+        assert key != await cache.make_key("flow", model, messages, user_id="user-2")
+        other_key = SecretModel(responses=["a"], api_key=SecretStr("key-2"))
+        assert key != await cache.make_key("flow", other_key, messages, user_id="user-1")
+        same_key = SecretModel(responses=["a"], api_key=SecretStr("key-1"))
+        assert key == await cache.make_key("flow", same_key, messages, user_id="user-1")
+
+    async def test_entries_expire(self):
+        cache = LLMResponseCache(ttl_seconds=0.05)
+        await cache.set("flow:k", "answer", latency=1.5)
+
+        assert (await cache.get("flow:k"))["text"] == "answer"
+        await asyncio.sleep(0.06)
+        assert await cache.get("flow:k") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["saved_latency_seconds"] == 1.5
+
+    async def test_size_caps(self):
+        cache = LLMResponseCache(max_entries=2, max_entry_size=10)
+        for key in ("f:a", "f:b", "f:c"):
+            await cache.set(key, "short")
+
+        assert await cache.set("f:d", "much too long for the cache") is False
+        assert await cache.get("f:a") is None
+        assert cache.stats()["size"] == 2
+
+    async def test_invalidate_one_flow(self):
+        cache = LLMResponseCache()
+        model = FakeListChatModel(responses=["a"])
+        messages = [HumanMessage("hi")]
+        await cache.set(await cache.make_key("flow-1", model, messages), "one")
+        await cache.set(await cache.make_key("flow-2", model, messages), "two")
+
+        await cache.invalidate("flow-1")
+
+        assert await cache.get(await cache.make_key("flow-1", model, messages)) is None
+        assert (await cache.get(await cache.make_key("flow-2", model, messages)))["text"] == "two"
+
+    @pytest.mark.usefixtures("cache_service")
+    async def test_service_invalidation_reaches_other_workers(self):
+        worker, other_worker = LLMResponseCache("service"), LLMResponseCache("service")
+        model = FakeListChatModel(responses=["a"])
+        messages = [HumanMessage("hi")]
+        await worker.set(await worker.make_key("flow-1", model, messages), "one")
+        await worker.set(await worker.make_key("flow-2", model, messages), "two")
+        assert (await other_worker.get(await other_worker.make_key("flow-1", model, messages)))["text"] == "one"
+
+        await worker.invalidate("flow-1")
+
+        assert await other_worker.get(await other_worker.make_key("flow-1", model, messages)) is None
+        assert (await other_worker.get(await other_worker.make_key("flow-2", model, messages)))["text"] == "two"
+
+        await other_worker.invalidate()
+
+        assert await worker.get(await worker.make_key("flow-2", model, messages)) is None
+
+    async def test_service_entries_are_capped(self, cache_service):
+        cache = LLMResponseCache("service", max_entries=2)
+        for key in ("f:a", "f:b", "f:c"):
+            await cache.set(key, "short")
+
+        assert await cache.get("f:a") is None
+        assert sorted(key for key in cache_service.data if key.startswith(KEY_PREFIX)) == [
+            f"{KEY_PREFIX}f:b",
+            f"{KEY_PREFIX}f:c",
+        ]
+
+
+class TestModelComponentResponseCache:
+    async def test_second_call_is_served_from_cache(self, cache):
+        llm = CountingChatModel(responses=["Langflow is a flow builder.", "something else"])
+
+        first = await _component(llm).text_response()
+        second = await _component(llm).text_response()
+
+        assert first.text == second.text == "Langflow is a flow builder."
+        assert llm.calls == 1
+        assert cache.stats()["hit_ratio"] == 0.5
+
+    async def test_disabled_by_default(self, cache):
+        llm = CountingChatModel(responses=["one", "two"])
+
+        await _component(llm, cache_response=False).text_response()
+        second = await _component(llm, cache_response=False).text_response()
+
+        assert second.text == "two"
+        assert llm.calls == 2
+        assert cache.stats()["stores"] == 0
+
+    async def test_cached_answer_streams_recorded_chunks(self, cache, monkeypatch):
+        sent = []
+
+        async def send_message(_self, message):
+            chunks = [chunk if isinstance(chunk, str) else chunk.content async for chunk in message.text]
+            sent.append(chunks)
+            return Message(text="".join(chunks))
+
+        monkeypatch.setattr(FakeModelComponent, "is_connected_to_chat_output", lambda _: True)
+        monkeypatch.setattr(FakeModelComponent, "send_message", send_message)
+        llm = CountingChatModel(responses=["abc"])
+
+        first = await _component(llm, stream=True).text_response()
+        second = await _component(llm, stream=True).text_response()
+
+        assert first.text == second.text == "abc"
+        assert llm.calls == 1
+        assert sent == [["a", "b", "c"], ["a", "b", "c"]]
+        assert cache.stats()["hits"] == 1
+
+    @pytest.mark.usefixtures("cache")
+    async def test_content_block_chunks_are_recorded(self, monkeypatch):
+        sent = []
+
+        async def send_message(_self, message):
+            chunks = [response_cache.content_text(chunk.content) async for chunk in message.text]
+            sent.append(chunks)
+            return Message(text="".join(chunks))
+
+        monkeypatch.setattr(FakeModelComponent, "is_connected_to_chat_output", lambda _: True)
+        monkeypatch.setattr(FakeModelComponent, "send_message", send_message)
+        llm = BlockChatModel(responses=["abc"])
+
+        await _component(llm, stream=True).text_response()
+        await _component(llm, stream=True).text_response()
+
+        assert llm.calls == 1
+        assert sent == [["a", "b", "c"], ["a", "b", "c"]]
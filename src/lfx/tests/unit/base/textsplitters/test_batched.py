@@ -0,0 +1,113 @@
+"""Tests for batched, streaming text splitting."""
+
+import os
+import random
+import time
+
+import pytest
+from langchain_core.documents import Document
+from langchain_text_splitters import CharacterTextSplitter
+from lfx.base.textsplitters import batched
+from lfx.base.textsplitters.batched import iter_dataframe_documents, iter_split_chunks
+from lfx.components.processing import SplitTextComponent
+from lfx.schema.dataframe import DataFrame
+from lfx.utils.executors import ExecutorPool
+
+SPLITTER_KWARGS = {"chunk_size": 200, "chunk_overlap": 40, "separator": "\n"}
+
+
+def _rows(count: int, lines: int = 30) -> list[dict]:
+    rng = random.Random(count)  # noqa: S311
+    words = ["alpha", "beta", "gamma", "delta", "epsilon"]
+    return [
+        {
+            "text": "\n".join(" ".join(rng.choice(words) for _ in range(8)) for _ in range(lines)),
+            "source": f"doc-{index}.txt",
+            "index": index,
+        }
+        for index in range(count)
+    ]
+
+
+def _split_documents(rows: list[dict]) -> list[tuple[str, dict]]:
+    documents = [
+        Document(page_content=row["text"], metadata={k: v for k, v in row.items() if k != "text"}) for row in rows
+    ]
+    return [
+        (doc.page_content, doc.metadata) for doc in CharacterTextSplitter(**SPLITTER_KWARGS).split_documents(documents)
+    ]
+
+
+@pytest.fixture
+def two_process_pool(monkeypatch):
+    """Split across two worker processes even on single-core machines."""
+    pool = ExecutorPool("test-process", 2, use_processes=True)
+    monkeypatch.setattr(batched, "get_executor", lambda _executor_class: pool)
+    yield pool
+    pool.shutdown()
+
+
+class TestIterSplitChunks:
+    @pytest.mark.parametrize("batch_chars", [1, 1000, batched.DEFAULT_BATCH_CHARS])
+    def test_matches_split_documents(self, batch_chars):
+        rows = _rows(12)
+        documents = iter_dataframe_documents(DataFrame(rows), "text")
+
+        assert list(iter_split_chunks(documents, SPLITTER_KWARGS, batch_chars=batch_chars)) == _split_documents(rows)
+
+    @pytest.mark.usefixtures("two_process_pool")
+    def test_process_pool_keeps_order_and_metadata(self):
+        rows = _rows(25)
+        documents = iter_dataframe_documents(DataFrame(rows), "text")
+
+        chunks = list(iter_split_chunks(documents, SPLITTER_KWARGS, batch_chars=2000))
+
+        assert chunks == _split_documents(rows)
+        assert [metadata["index"] for _, metadata in chunks] == sorted(metadata["index"] for _, metadata in chunks)
+
+    def test_chunks_do_not_share_metadata(self):
+        chunks = list(iter_split_chunks([("a\n" * 200, {"source": "x"})], SPLITTER_KWARGS))
+
+        assert len(chunks) > 1
+        chunks[0][1]["source"] = "changed"
+        assert chunks[1][1]["source"] == "x"
+
+    def test_empty_input(self):
+        assert list(iter_split_chunks(iter([]), SPLITTER_KWARGS)) == []
+
+    def test_component_output_matches_documents_path(self):
+        component = SplitTextComponent(
+            data_inputs=DataFrame(_rows(8)), chunk_size=200, chunk_overlap=40, separator="\\n"
+        )
+        expected = DataFrame(component._docs_to_data(component.split_text_base()))
+
+        result = component.split_text()
+
+        assert result.equals(expected)
+        assert result.columns.tolist() == ["source", "index", "text"]
+
+    @pytest.mark.slow
+    @pytest.mark.usefixtures("two_process_pool")
+    def test_benchmark_large_corpus(self):
+        # Set LFX_SPLIT_BENCHMARK_MB to run on a larger corpus, e.g. 2048 for a multi-GB run.
+        megabytes = int(os.environ.get("LFX_SPLIT_BENCHMARK_MB", "64"))
+        row = _rows(1, lines=2000)[0]
+        rows = [{**row, "index": index} for index in range(megabytes * 1024 * 1024 // len(row["text"]))]
+        dataframe = DataFrame(rows)
+        del rows
+
+        start = time.perf_counter()
+        sequential = sum(
+            1 for _ in iter_split_chunks(iter_dataframe_documents(dataframe, "text"), SPLITTER_KWARGS, parallel=False)
+        )
+        sequential_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parallel = sum(1 for _ in iter_split_chunks(iter_dataframe_documents(dataframe, "text"), SPLITTER_KWARGS))
+        parallel_seconds = time.perf_counter() - start
+
+        assert parallel == sequential
+        print(  # noqa: T201
+            f"\n{megabytes} MB: sequential {megabytes / sequential_seconds:.1f} MB/s, "
+            f"batched on 2 processes {megabytes / parallel_seconds:.1f} MB/s ({parallel} chunks)"
+        )
@@ -0,0 +1,120 @@
+"""Tests for per-request output capture in ``lfx serve``."""
+
+import asyncio
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+from lfx.cli.common import execute_graph_with_capture
+from lfx.log.logger import OutputCapture, capture_log_event, capture_output
+
+
+class _PrintingGraph:
+    """Graph stand-in that prints its marker while yielding control to other requests."""
+
+    def __init__(self, marker: str, lines: int = 20):
+        self.marker = marker
+        self.lines = lines
+
+    async def async_start(self, inputs):  # noqa: ARG002
+        for i in range(self.lines):
+            print(f"{self.marker} {i}")  # noqa: T201
+            await asyncio.sleep(0)
+        await asyncio.to_thread(print, f"{self.marker} thread", file=sys.stderr)
+        yield MagicMock(results={"text": self.marker})
+
+
+class TestOutputCapture:
+    def test_keeps_stdout_before_stderr(self):
+        capture = OutputCapture()
+        capture.write("err\n", stderr=True)
+        capture.write("out\n")
+
+        assert capture.getvalue() == "out\nerr\n"
+        assert capture.stderr == "err\n"
+
+    def test_truncates_at_max_chars(self):
+        capture = OutputCapture(max_chars=10)
+        capture.write("0123456789abc")
+        capture.write("more")
+
+        assert capture.stdout == "0123456789"
+        assert capture.truncated == 7
+        assert "[7 characters of output truncated]" in capture.getvalue()
+
+    def test_max_chars_from_environment(self, monkeypatch):
+        monkeypatch.setenv("LANGFLOW_OUTPUT_CAPTURE_MAX_CHARS", "5")
+
+        assert OutputCapture().max_chars == 5
+
+    def test_streams_are_restored(self):
+        stdout, stderr = sys.stdout, sys.stderr
+        with capture_output():
+            assert sys.stdout is not stdout
+        assert sys.stdout is stdout
+        assert sys.stderr is stderr
+
+    def test_output_outside_capture_is_not_captured(self, capsys):
+        with capture_output() as captured:
+            print("inside")  # noqa: T201
+        print("outside")  # noqa: T201
+
+        assert captured.stdout == "inside\n"
+        assert capsys.readouterr().out == "outside\n"
+
+    def test_log_events_are_captured(self):
+        with capture_output() as captured:
+            capture_log_event(None, "info", {"event": "hello", "timestamp": "now"})
+        capture_log_event(None, "info", {"event": "ignored"})
+
+        assert captured.getvalue() == "now [info] hello\n"
+
+
+class TestConcurrentCapture:
+    async def test_concurrent_executions_do_not_share_output(self):
+        requests = 200
+        graphs = [_PrintingGraph(f"flow-{i}") for i in range(requests)]
+
+        outcomes = await asyncio.gather(*(execute_graph_with_capture(graph, "input") for graph in graphs))
+
+        for graph, (results, logs) in zip(graphs, outcomes, strict=True):
+            assert results[0].results == {"text": graph.marker}
+            lines = logs.splitlines()
+            assert lines == [f"{graph.marker} {i}" for i in range(graph.lines)] + [f"{graph.marker} thread"]
+
+    async def test_each_execution_has_its_own_cap(self):
+        small, large = _PrintingGraph("small", lines=50), _PrintingGraph("large", lines=50)
+
+        (_, small_logs), (_, large_logs) = await asyncio.gather(
+            execute_graph_with_capture(small, "input", max_output_chars=20),
+            execute_graph_with_capture(large, "input"),
+        )
+
+        assert small_logs.startswith("small 0\nsmall 1\nsmal\n")
+        assert "characters of output truncated" in small_logs
+        assert large_logs.count("large") == 51
+
+    async def test_error_includes_only_own_stderr(self):
+        class FailingGraph:
+            async def async_start(self, inputs):  # noqa: ARG002
+                print("failing stderr", file=sys.stderr)  # noqa: T201
+                await asyncio.sleep(0)
+                msg = "Execution failed"
+                raise RuntimeError(msg)
+                yield
+
+        failing = execute_graph_with_capture(FailingGraph(), "input")
+        other = execute_graph_with_capture(_PrintingGraph("other"), "input")
+        outcomes = await asyncio.gather(failing, other, return_exceptions=True)
+
+        assert isinstance(outcomes[0], RuntimeError)
+        assert "failing stderr" in str(outcomes[0])
+        assert "other" not in str(outcomes[0])
+        assert "failing" not in outcomes[1][1]
+
+
+@pytest.fixture(autouse=True)
+def _no_capture_left_active():
+    yield
+    # ``lfx.log.logger`` is shadowed by the logger instance, so read the module from sys.modules
+    assert sys.modules["lfx.log.logger"]._active_captures == 0
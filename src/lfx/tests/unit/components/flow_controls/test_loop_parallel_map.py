@@ -0,0 +1,135 @@
+"""Tests for the parallel map mode of the Loop component."""
+
+import asyncio
+
+import pytest
+from lfx.components.flow_controls import LoopComponent
+from lfx.custom.custom_component.component import Component
+from lfx.graph import Graph
+from lfx.io import DataFrameInput, DataInput, IntInput, MessageTextInput, Output
+from lfx.schema.data import Data
+from lfx.schema.dataframe import DataFrame
+
+
+class Rows(Component):
+    display_name = "Rows"
+    inputs = [IntInput(name="n", display_name="N", value=5)]
+    outputs = [Output(display_name="Rows", name="rows", method="build_rows")]
+
+    def build_rows(self) -> DataFrame:
+        return DataFrame([{"text": f"t{i}", "i": i} for i in range(self.n)])
+
+
+class Suffix(Component):
+    display_name = "Suffix"
+    builds = 0
+    outputs = [Output(display_name="Suffix", name="suffix", method="build_suffix")]
+
+    def build_suffix(self) -> Data:
+        Suffix.builds += 1
+        return Data(text="!")
+
+
+class Shout(Component):
+    """Loop body that finishes later items first and tracks how many items run at once."""
+
+    display_name = "Shout"
+    running = 0
+    peak = 0
+    instances: set[int] = set()
+    inputs = [
+        DataInput(name="item", display_name="Item"),
+        DataInput(name="suffix", display_name="Suffix"),
+        MessageTextInput(name="fail_on", display_name="Fail On", value=""),
+    ]
+    outputs = [Output(display_name="Out", name="out", method="build_out")]
+
+    async def build_out(self) -> Data:
+        Shout.instances.add(id(self))
+        Shout.running += 1
+        Shout.peak = max(Shout.peak, Shout.running)
+        try:
+            await asyncio.sleep(0.01 * (10 - self.item.data["i"] % 10))
+        finally:
+            Shout.running -= 1
+        if self.item.text == self.fail_on:
+            msg = f"boom on {self.item.text}"
+            raise ValueError(msg)
+        return Data(text=self.item.text.upper() + self.suffix.text)
+
+
+class Sink(Component):
+    display_name = "Sink"
+    inputs = [DataFrameInput(name="rows", display_name="Rows")]
+    outputs = [Output(display_name="Rows", name="out", method="build_out")]
+
+    def build_out(self) -> DataFrame:
+        return self.rows
+
+
+@pytest.fixture(autouse=True)
+def _reset_counters():
+    Shout.running = Shout.peak = 0
+    Shout.instances = set()
+    Suffix.builds = 0
+
+
+def _make_graph(n: int, fail_on: str = "", **loop_kwargs):
+    rows = Rows(_id="Rows-1")
+    rows.set(n=n)
+    suffix = Suffix(_id="Suffix-1")
+    loop = LoopComponent(_id="Loop-1")
+    loop.set(data=rows.build_rows, parallel=True, **loop_kwargs)
+    body = Shout(_id="Shout-1")
+    body.set(item=loop.item_output, suffix=suffix.build_suffix, fail_on=fail_on)
+    loop.set(item=body.build_out)
+    sink = Sink(_id="Sink-1")
+    sink.set(rows=loop.done_output)
+    return Graph(start=rows, end=sink)
+
+
+async def _run(graph: Graph) -> DataFrame:
+    results = [result async for result in graph.async_start(max_iterations=50)]
+    ran = [result.vertex.id for result in results if hasattr(result, "vertex")]
+    assert "Shout-1" not in ran
+    return graph.get_vertex("Sink-1").results["out"]
+
+
+class TestLoopParallelMap:
+    async def test_results_keep_input_order(self):
+        done = await _run(_make_graph(12, max_concurrency=4))
+
+        assert list(done["text"]) == [f"T{i}!" for i in range(12)]
+        assert Shout.peak == 4
+        # Every item ran in its own component instance.
+        assert len(Shout.instances) == 12
+
+    async def test_external_inputs_are_built_once(self):
+        await _run(_make_graph(6, max_concurrency=3))
+
+        assert Suffix.builds == 1
+
+    async def test_fail_fast_raises(self):
+        with pytest.raises(Exception, match="boom on t3"):
+            await _run(_make_graph(6, fail_on="t3", max_concurrency=2))
+
+    async def test_skip_drops_failed_items(self):
+        done = await _run(_make_graph(6, fail_on="t3", max_concurrency=2, error_policy="Skip"))
+
+        assert list(done["text"]) == ["T0!", "T1!", "T2!", "T4!", "T5!"]
+
+    async def test_collect_keeps_failed_items_in_place(self):
+        done = await _run(_make_graph(6, fail_on="t3", max_concurrency=2, error_policy="Collect"))
+
+        assert len(done) == 6
+        failed = done.iloc[3]
+        assert failed["text"] == "t3"
+        assert failed["index"] == 3
+        assert "boom on t3" in failed["error"]
+
+    async def test_reports_progress(self):
+        graph = _make_graph(5, max_concurrency=2)
+        await _run(graph)
+
+        logs = graph.get_vertex("Loop-1").custom_component.get_output_logs()["done"]
+        assert logs[-1].message == {"completed": 5, "total": 5, "failed": 0}
@@ -9,6 +9,7 @@ from lfx.events.event_manager import (
     EventManager,
     create_default_event_manager,
     create_stream_tokens_event_manager,
+    event_sequence,
 )
 
 
@@ -112,6 +113,20 @@ class TestEventManager:
         assert parsed_data["event"] == "test"
         assert parsed_data["data"] == test_data
 
+    def test_send_event_numbers_events_in_order(self):
+        """Test that event ids carry increasing sequence numbers, shared by all event types."""
+        queue = asyncio.Queue()
+        manager = EventManager(queue)
+
+        for event_type in ["token", "add_message", "token"]:
+            manager.send_event(event_type=event_type, data={})
+
+        event_ids = [queue.get_nowait()[0] for _ in range(3)]
+        assert event_ids == ["token-1", "add_message-2", "token-3"]
+        assert [event_sequence(event_id) for event_id in event_ids] == [1, 2, 3]
+        assert event_sequence("end_vertex-not-a-number") is None
+        assert event_sequence(None) is None
+
     def test_send_event_without_queue(self):
         """Test sending event without queue (should not raise error)."""
         manager = EventManager(None)
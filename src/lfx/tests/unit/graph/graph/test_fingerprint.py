@@ -0,0 +1,144 @@
+from lfx.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.fingerprint import (
+    aget_variable_values,
+    compute_vertex_fingerprints,
+    is_reusable,
+    variable_names,
+)
+from lfx.services.cache.utils import CacheMiss
+
+
+def _graph(delimiter: str = " ") -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=chat_input.message_response, text2="suffix", delimiter=delimiter)
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=combine.combine_texts)
+    side = CombineTextComponent(_id="side")
+    side.set(text1="a", text2="b")
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response)
+    graph = Graph(chat_input, chat_output)
+    graph.add_component(side)
+    graph.session_id = "session"
+    return graph
+
+
+class TestComputeVertexFingerprints:
+    def test_stable_across_graphs(self):
+        assert compute_vertex_fingerprints(_graph()) == compute_vertex_fingerprints(_graph())
+
+    def test_change_invalidates_vertex_and_descendants(self):
+        before = compute_vertex_fingerprints(_graph())
+        after = compute_vertex_fingerprints(_graph(delimiter="-"))
+
+        changed = {vertex_id for vertex_id in before if before[vertex_id] != after[vertex_id]}
+        assert changed == {"combine", "text_output", "chat_output"}
+
+    def test_inputs_change_input_vertices(self):
+        before = compute_vertex_fingerprints(_graph(), inputs_dict={"input_value": "hi"})
+        after = compute_vertex_fingerprints(_graph(), inputs_dict={"input_value": "bye"})
+
+        assert before["chat_input"] != after["chat_input"]
+        assert before["combine"] != after["combine"]
+        assert before["side"] == after["side"]
+
+    def test_scoped_to_session(self):
+        other_session = _graph()
+        other_session.session_id = "other"
+
+        assert compute_vertex_fingerprints(_graph())["side"] != compute_vertex_fingerprints(other_session)["side"]
+
+    def test_inputs_and_outputs_are_not_reusable(self):
+        graph = _graph()
+
+        assert not is_reusable(graph.get_vertex("chat_input"))
+        assert not is_reusable(graph.get_vertex("chat_output"))
+        assert is_reusable(graph.get_vertex("combine"))
+
+    def test_vertices_with_a_session_id_are_not_reusable(self):
+        vertex = _graph().get_vertex("combine")
+        vertex.has_session_id = True
+
+        assert not is_reusable(vertex)
+
+    def test_hashes_global_variable_values(self):
+        graph = _graph()
+        graph.get_vertex("side").data["node"]["template"]["text2"]["load_from_db"] = True
+
+        assert variable_names(graph.get_vertex("side")) == ["b"]
+        before = compute_vertex_fingerprints(graph, variables={"b": "old"})
+        after = compute_vertex_fingerprints(graph, variables={"b": "new"})
+
+        assert before["side"] is not None
+        assert before["side"] != after["side"]
+        assert before["combine"] == after["combine"]
+
+    def test_unresolved_global_variables_are_not_reused(self):
+        graph = _graph()
+        graph.get_vertex("side").data["node"]["template"]["text2"]["load_from_db"] = True
+
+        assert compute_vertex_fingerprints(graph)["side"] is None
+
+
+async def test_variable_values_come_from_request_variables():
+    graph = _graph()
+    graph.get_vertex("side").data["node"]["template"]["text2"]["load_from_db"] = True
+    graph.context = {"request_variables": {"b": "value"}}
+
+    assert await aget_variable_values(graph, user_id=None) == {"b": "value"}
+
+
+class TestBuildVertexWithFingerprint:
+    async def test_reuses_result_with_same_fingerprint(self):
+        cache = {}
+
+        async def get_cache(key):
+            return cache.get(key, CacheMiss())
+
+        async def set_cache(key, data):
+            cache[key] = {"result": data}
+
+        first = _graph()
+        fingerprint = compute_vertex_fingerprints(first)["side"]
+        await first.build_vertex("side", get_cache=get_cache, set_cache=set_cache, fingerprint=fingerprint)
+        assert cache["side"]["result"]["fingerprint"] == fingerprint
+
+        second = _graph()
+        result = await second.build_vertex("side", get_cache=get_cache, set_cache=set_cache, fingerprint=fingerprint)
+
+        assert result.vertex.result.used_frozen_result is True
+        assert result.vertex.built_object == first.get_vertex("side").built_object
+
+    async def test_builds_without_cached_result(self):
+        cache = {}
+
+        async def get_cache(key):
+            return cache.get(key, CacheMiss())
+
+        async def set_cache(key, data):
+            cache[key] = {"result": data}
+
+        graph = _graph()
+        result = await graph.build_vertex("side", get_cache=get_cache, set_cache=set_cache, fingerprint="unseen")
+
+        assert result.vertex.result.used_frozen_result is False
+        assert set(cache) == {"side"}
+
+    async def test_new_fingerprint_replaces_the_cached_result(self):
+        cache = {}
+
+        async def get_cache(key):
+            return cache.get(key, CacheMiss())
+
+        async def set_cache(key, data):
+            cache[key] = {"result": data}
+
+        await _graph().build_vertex("side", get_cache=get_cache, set_cache=set_cache, fingerprint="first")
+        result = await _graph().build_vertex("side", get_cache=get_cache, set_cache=set_cache, fingerprint="second")
+
+        assert result.vertex.result.used_frozen_result is False
+        assert set(cache) == {"side"}
+        assert cache["side"]["result"]["fingerprint"] == "second"
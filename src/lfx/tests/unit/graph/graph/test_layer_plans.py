@@ -0,0 +1,130 @@
+import pytest
+from lfx.components.input_output import ChatInput, ChatOutput, TextOutputComponent
+from lfx.components.processing.combine_text import CombineTextComponent
+from lfx.graph import Graph
+from lfx.graph.graph.layer_plans import LayerPlanCache, layer_plan_cache
+from lfx.graph.graph.utils import get_sorted_vertices
+
+
+def _graph() -> Graph:
+    chat_input = ChatInput(_id="chat_input")
+    combine = CombineTextComponent(_id="combine")
+    combine.set(text1=chat_input.message_response, text2="suffix")
+    text_output = TextOutputComponent(_id="text_output")
+    text_output.set(input_value=combine.combine_texts)
+    chat_output = ChatOutput(_id="chat_output")
+    chat_output.set(input_value=text_output.text_response)
+    return Graph(chat_input, chat_output)
+
+
+def _uncached_plan(graph: Graph, **kwargs) -> tuple[list[str], list[list[str]]]:
+    return get_sorted_vertices(
+        vertices_ids=graph.get_vertex_ids(),
+        cycle_vertices=graph.cycle_vertices,
+        in_degree_map=graph.in_degree_map,
+        successor_map=graph.successor_map,
+        predecessor_map=graph.predecessor_map,
+        get_vertex_predecessors=graph.get_vertex_predecessors_ids,
+        get_vertex_successors=graph.get_vertex_successors_ids,
+        is_cyclic=graph.is_cyclic,
+        **kwargs,
+    )
+
+
+def _hits() -> int:
+    return layer_plan_cache.stats()["hits"]
+
+
+def _flatten(layers: list[list[str]]) -> set[str]:
+    return {vertex_id for layer in layers for vertex_id in layer}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    layer_plan_cache.invalidate()
+    yield
+    layer_plan_cache.invalidate()
+
+
+class TestLayerPlanCache:
+    def test_returns_copies(self):
+        cache = LayerPlanCache()
+        cache.set(("key",), (["a"], [["b", "c"]]))
+
+        first_layer, remaining_layers = cache.get(("key",))
+        remaining_layers.pop()
+        first_layer.append("x")
+
+        assert cache.get(("key",)) == (["a"], [["b", "c"]])
+
+    def test_evicts_least_recently_used(self):
+        cache = LayerPlanCache(max_size=2)
+        cache.set(("a",), (["a"], []))
+        cache.set(("b",), (["b"], []))
+        cache.get(("a",))
+        cache.set(("c",), (["c"], []))
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) == (["a"], [])
+
+    def test_zero_size_disables_cache(self):
+        cache = LayerPlanCache(max_size=0)
+        cache.set(("a",), (["a"], []))
+
+        assert cache.get(("a",)) is None
+
+
+class TestSortVerticesPlans:
+    def test_reuses_plan_across_graphs(self):
+        first = _graph()
+        expected = first.sort_vertices()
+        second = _graph()
+        hits = _hits()
+
+        first_layer = second.sort_vertices()
+
+        assert first_layer == expected
+        assert second.vertices_layers == first.vertices_layers
+        assert _hits() == hits + 1
+
+    def test_cached_plan_matches_uncached_sort(self):
+        _graph().sort_vertices(start_component_id="combine")
+        graph = _graph()
+        hits = _hits()
+
+        first_layer = graph.sort_vertices(start_component_id="combine")
+
+        assert _hits() == hits + 1
+        assert (first_layer, graph.vertices_layers) == _uncached_plan(graph, start_component_id="combine")
+
+    def test_start_and_stop_components_have_their_own_plans(self):
+        graph = _graph()
+
+        full = [graph.sort_vertices(), *graph.vertices_layers]
+        up_to_combine = [graph.sort_vertices(stop_component_id="combine"), *graph.vertices_layers]
+
+        assert "chat_output" in _flatten(full)
+        assert "chat_output" not in _flatten(up_to_combine)
+        assert [graph.sort_vertices(), *graph.vertices_layers] == full
+
+    def test_structure_change_misses(self):
+        _graph().sort_vertices()
+        graph = _graph()
+        graph.add_component(CombineTextComponent(_id="side"))
+        hits = _hits()
+
+        first_layer = graph.sort_vertices()
+
+        assert "side" in _flatten([first_layer, *graph.vertices_layers])
+        assert _hits() == hits
+
+    def test_running_graph_does_not_change_cached_plan(self):
+        graph = _graph()
+        graph.sort_vertices()
+        expected = [list(layer) for layer in graph.vertices_layers]
+        graph.vertices_layers[0].clear()
+
+        other = _graph()
+        other.sort_vertices()
+
+        assert other.vertices_layers == expected
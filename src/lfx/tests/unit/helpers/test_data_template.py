@@ -0,0 +1,103 @@
+"""Tests for the compiled DataFrame template renderer."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+from lfx.helpers.data import CompiledTemplate, format_dataframe_rows
+
+
+def _format_with_iterrows(template: str, df: pd.DataFrame) -> list[str]:
+    return [template.format(**row.to_dict()) for _, row in df.iterrows()]
+
+
+FRAMES = {
+    "mixed": pd.DataFrame({"a": [1, 2], "b": [1.5, 2.0], "c": [True, False], "t": ["x", "y"]}),
+    "numeric_only": pd.DataFrame({"a": [1, 2], "b": [1.5, 2.0]}),
+    "extension_dtypes": pd.DataFrame(
+        {
+            "a": pd.Series([1, None], dtype="Int64"),
+            "b": ["x", None],
+            "d": pd.to_datetime(["2020-01-01", "2021-02-03 04:05"], format="mixed"),
+        }
+    ),
+    "objects": pd.DataFrame({"a": np.array([0.1, 3.3], dtype=np.float32), "b": [{"k": 1}, [1, 2]], "my col": [1, 2]}),
+    "categorical": pd.DataFrame({"a": [np.float32(1.1), pd.NA], "b": pd.Categorical(["u", None])}),
+    "nullable_string": pd.DataFrame({"a": pd.array(["x", None], dtype="string"), "b": [1, 2]}),
+    "nullable_int_only": pd.DataFrame({"a": pd.array([1, None], dtype="Int64"), "b": pd.array([3, 4], dtype="Int64")}),
+    "missing_next_to_datetime": pd.DataFrame(
+        {"a": [1.5, np.nan], "b": ["x", None], "d": pd.to_datetime(["2020-01-01", None])}
+    ),
+}
+
+TEMPLATES = [
+    "{a} - {b}",
+    "{a!r}:{b:>6}",
+    "x{{y}}{a}",
+    "",
+    "no fields }}",
+    "{b}{a}{b}",
+    "{my col}|{a}",
+    "{d}",
+    "{a}{missing}",
+    "{0}",
+    "{a.real}",
+]
+
+
+def _outcome(render, template: str, df: pd.DataFrame):
+    """Return the rendered rows, or the type and message of the exception raised while rendering."""
+    try:
+        return render(template, df)
+    except Exception as e:
+        return type(e), str(e)
+
+
+@pytest.mark.parametrize("frame_name", list(FRAMES))
+@pytest.mark.parametrize("template", TEMPLATES)
+def test_matches_row_by_row_format(frame_name, template):
+    df = FRAMES[frame_name]
+    assert _outcome(format_dataframe_rows, template, df) == _outcome(_format_with_iterrows, template, df)
+
+
+def test_missing_key_raises_key_error():
+    df = pd.DataFrame({"name": ["Alice"]})
+    with pytest.raises(KeyError, match="age"):
+        format_dataframe_rows("{name} is {age}", df)
+
+
+def test_empty_frame_renders_nothing():
+    assert format_dataframe_rows("{missing}", pd.DataFrame({"name": []})) == []
+
+
+def test_complex_templates_are_not_vectorized():
+    assert CompiledTemplate("{name}: {score:.2f}").is_vectorizable
+    assert not CompiledTemplate("{0}").is_vectorizable
+    assert not CompiledTemplate("{name.upper}").is_vectorizable
+    assert not CompiledTemplate("{name:{width}}").is_vectorizable
+
+
+@pytest.mark.slow
+def test_benchmark_one_million_rows():
+    rows = 1_000_000
+    df = pd.DataFrame(
+        {"id": np.arange(rows), "text": ["hello world"] * rows, "score": np.random.default_rng(0).random(rows)}
+    )
+    template = "{id}: {text} ({score})"
+
+    start = time.perf_counter()
+    rendered = format_dataframe_rows(template, df)
+    compiled_seconds = time.perf_counter() - start
+
+    sample = df.iloc[:20_000]
+    start = time.perf_counter()
+    expected = _format_with_iterrows(template, sample)
+    iterrows_seconds = (time.perf_counter() - start) * rows / len(sample)
+
+    assert rendered[: len(sample)] == expected
+    print(  # noqa: T201
+        f"\n{rows:,} rows: compiled {compiled_seconds:.2f}s, iterrows (extrapolated) {iterrows_seconds:.2f}s, "
+        f"speedup {iterrows_seconds / compiled_seconds:.1f}x"
+    )
+    assert compiled_seconds < iterrows_seconds
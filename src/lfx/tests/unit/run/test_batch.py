@@ -0,0 +1,160 @@
+"""Unit tests for the run.batch module."""
+
+import asyncio
+import json
+from io import StringIO
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from lfx.run.base import RunError
+from lfx.run.batch import BatchInput, completed_indexes, read_batch_inputs, run_batch, run_flow_batch
+
+
+class EchoGraph:
+    """Graph stand-in that answers with its input; "fail" raises.
+
+    Inputs listed in ``finish_order`` each wait for the one before them to finish, so they complete in that order.
+    """
+
+    def __init__(self, finish_order=()):
+        self.runs = 0
+        self.finish_order = list(finish_order)
+        self.finished = {value: asyncio.Event() for value in self.finish_order}
+
+    def __deepcopy__(self, memo):
+        # run_batch copies the graph for every input; the copies must share the finish events.
+        return self
+
+    async def async_start(self, inputs):
+        value = inputs.input_value if inputs else ""
+        if value == "fail":
+            msg = "boom"
+            raise ValueError(msg)
+        if value in self.finished and (position := self.finish_order.index(value)):
+            await self.finished[self.finish_order[position - 1]].wait()
+        print(f"running {value}")  # noqa: T201
+        yield SimpleNamespace(
+            vertex=SimpleNamespace(id="ChatOutput-1", custom_component=SimpleNamespace(display_name="Chat Output")),
+            result_dict=SimpleNamespace(results={"message": SimpleNamespace(text=f"echo {value}")}),
+        )
+        if value in self.finished:
+            self.finished[value].set()
+
+
+def _inputs(*values):
+    return [BatchInput(index=i, input_value=value) for i, value in enumerate(values)]
+
+
+def _records(output: str):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+class TestReadBatchInputs:
+    def test_reads_strings_and_objects(self, tmp_path):
+        path = tmp_path / "inputs.jsonl"
+        path.write_text('"hello"\n\n{"input_value": "world", "id": 7}\n')
+
+        inputs = read_batch_inputs(path)
+
+        assert inputs == [
+            BatchInput(index=0, input_value="hello"),
+            BatchInput(index=2, input_value="world", id="7"),
+        ]
+
+    def test_invalid_line_raises(self, tmp_path):
+        path = tmp_path / "inputs.jsonl"
+        path.write_text('"ok"\n[1, 2]\n')
+
+        with pytest.raises(RunError, match="Line 2"):
+            read_batch_inputs(path)
+
+    def test_missing_file_raises(self, tmp_path):
+        with pytest.raises(RunError, match="does not exist"):
+            read_batch_inputs(tmp_path / "missing.jsonl")
+
+
+class TestCompletedIndexes:
+    def test_missing_output(self, tmp_path):
+        assert completed_indexes(tmp_path / "out.jsonl") == set()
+
+    def test_drops_partial_last_line(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        path.write_text('{"index": 0}\n{"index": 3}\n{"index": 4, "res')
+
+        assert completed_indexes(path) == {0, 3}
+        assert path.read_text() == '{"index": 0}\n{"index": 3}\n'
+
+
+class TestRunBatch:
+    async def test_ordered_output_follows_input_order(self):
+        output = StringIO()
+
+        graph = EchoGraph(finish_order=["dddd", "ccc", "bb", "a"])
+        summary = await run_batch(graph, _inputs("a", "bb", "ccc", "dddd"), output, concurrency=4)
+
+        records = _records(output.getvalue())
+        assert [record["index"] for record in records] == [0, 1, 2, 3]
+        assert [record["result"]["result"] for record in records] == ["echo a", "echo bb", "echo ccc", "echo dddd"]
+        assert summary.succeeded == 4
+        assert summary.as_dict()["latency"]["max"] >= summary.as_dict()["latency"]["p50"]
+
+    async def test_as_completed_output(self):
+        output = StringIO()
+
+        graph = EchoGraph(finish_order=["dddd", "ccc", "bb", "a"])
+        await run_batch(graph, _inputs("a", "bb", "ccc", "dddd"), output, concurrency=4, ordered=False)
+
+        assert [record["index"] for record in _records(output.getvalue())] == [3, 2, 1, 0]
+
+    async def test_each_run_has_its_own_logs(self):
+        output = StringIO()
+
+        await run_batch(EchoGraph(), _inputs("a", "bb"), output, concurrency=2)
+
+        logs = [record["result"]["logs"] for record in _records(output.getvalue())]
+        assert logs == ["running a\n", "running bb\n"]
+
+    async def test_failures_are_recorded(self):
+        output = StringIO()
+
+        summary = await run_batch(EchoGraph(), _inputs("a", "fail", "c"), output, concurrency=2)
+
+        records = _records(output.getvalue())
+        assert [record["success"] for record in records] == [True, False, True]
+        assert records[1]["exception_message"] == "boom"
+        assert (summary.succeeded, summary.failed) == (2, 1)
+
+    async def test_skip(self):
+        output = StringIO()
+
+        summary = await run_batch(EchoGraph(), _inputs("a", "bb", "ccc"), output, skip={0, 2})
+
+        assert [record["index"] for record in _records(output.getvalue())] == [1]
+        assert summary.skipped == 2
+
+    async def test_invalid_concurrency(self):
+        with pytest.raises(RunError, match="Concurrency"):
+            await run_batch(EchoGraph(), _inputs("a"), StringIO(), concurrency=0)
+
+
+class TestRunFlowBatch:
+    async def test_loads_graph_once_and_resumes(self, tmp_path):
+        inputs = tmp_path / "inputs.jsonl"
+        inputs.write_text('"a"\n"bb"\n"ccc"\n')
+        output = tmp_path / "out.jsonl"
+        output.write_text('{"index": 0, "success": true}\n{"index": 1, "succ')
+
+        with (
+            patch("lfx.run.batch.load_graph", return_value=EchoGraph()) as mock_load,
+            patch("lfx.run.batch.prepare_graph"),
+        ):
+            summary = await run_flow_batch(tmp_path / "flow.json", inputs, output, resume=True)
+
+        mock_load.assert_awaited_once()
+        assert [record["index"] for record in _records(output.read_text())] == [0, 1, 2]
+        assert (summary.skipped, summary.succeeded) == (1, 2)
+
+    async def test_resume_requires_output(self, tmp_path):
+        with pytest.raises(RunError, match="--resume requires --output"):
+            await run_flow_batch(tmp_path / "flow.json", tmp_path / "inputs.jsonl", resume=True)
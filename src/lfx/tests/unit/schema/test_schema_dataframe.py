@@ -71,3 +71,40 @@ class TestDataFrameSchema:
 
         non_empty_df = DataFrame({"name": ["John"], "text": ["name is John"]})
         assert bool(non_empty_df)
+
+    def test_iter_data_matches_to_data_list(self, sample_dataframe):
+        """Test that lazy row views match the eager conversion."""
+        data_frame = DataFrame(sample_dataframe)
+        lazy = list(data_frame.iter_data())
+        assert [item.data for item in lazy] == [item.data for item in data_frame.to_data_list()]
+        assert lazy[1].get_text() == "name is Jane"
+
+
+class TestDataFrameBuilder:
+    def test_build_matches_constructor(self):
+        """Test that building from appended rows matches constructing from the same rows."""
+        rows = [{"name": "John", "text": "a"}, Data(data={"name": "Jane", "age": 30}), {"text": "c"}]
+        builder = DataFrame.builder()
+        builder.add_row(rows[0])
+        builder.add_rows(rows[1:])
+
+        built = builder.build()
+        expected = DataFrame([{"name": "John", "text": "a"}, {"name": "Jane", "age": 30}, {"text": "c"}])
+        assert len(builder) == len(rows)
+        assert isinstance(built, DataFrame)
+        pd.testing.assert_frame_equal(pd.DataFrame(built), pd.DataFrame(expected))
+
+    def test_empty_builder(self):
+        """Test that an empty builder produces an empty DataFrame."""
+        built = DataFrame.builder(text_key="content").build()
+        assert built.empty
+        assert built.text_key == "content"
+
+
+class TestDataFrameArrow:
+    def test_round_trip(self, sample_dataframe):
+        """Test conversion to and from a pyarrow Table."""
+        pytest.importorskip("pyarrow")
+        table = DataFrame(sample_dataframe).to_arrow()
+        restored = DataFrame.from_arrow(table)
+        assert restored.to_data_list()[0].data == {"name": "John", "text": "name is John"}
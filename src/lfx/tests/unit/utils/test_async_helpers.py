@@ -0,0 +1,89 @@
+"""Tests for the sync-to-async bridge."""
+
+import asyncio
+import contextvars
+import threading
+
+import pytest
+from lfx.utils.async_helpers import AsyncPortal, get_async_portal, run_until_complete
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="unset")
+
+
+class TestAsyncPortal:
+    def test_reuses_one_loop_and_thread(self):
+        async def current():
+            return asyncio.get_running_loop(), threading.current_thread()
+
+        portal = AsyncPortal()
+        try:
+            first = portal.call(current())
+            second = portal.call(current())
+            assert first == second
+            assert first[1] is not threading.current_thread()
+        finally:
+            portal.shutdown()
+
+    def test_restarts_after_shutdown(self):
+        async def value():
+            return 1
+
+        portal = AsyncPortal()
+        portal.call(value())
+        portal.shutdown()
+        try:
+            assert portal.call(value()) == 1
+        finally:
+            portal.shutdown()
+
+    def test_propagates_context_and_exceptions(self):
+        async def read():
+            return request_id.get()
+
+        async def fail():
+            msg = "boom"
+            raise ValueError(msg)
+
+        portal = AsyncPortal()
+        try:
+            token = request_id.set("abc")
+            try:
+                assert portal.call(read()) == "abc"
+            finally:
+                request_id.reset(token)
+            with pytest.raises(ValueError, match="boom"):
+                portal.call(fail())
+        finally:
+            portal.shutdown()
+
+
+class TestRunUntilComplete:
+    async def test_running_loop_uses_shared_portal(self):
+        async def loop_id():
+            return id(asyncio.get_running_loop())
+
+        first = run_until_complete(loop_id())
+        second = run_until_complete(loop_id())
+        assert first == second == id(get_async_portal().loop)
+
+    async def test_nested_calls_do_not_deadlock(self):
+        async def inner():
+            return "inner"
+
+        async def outer():
+            return run_until_complete(inner())
+
+        assert run_until_complete(outer()) == "inner"
+
+    async def test_debug_mode_reports_blocking_calls(self, monkeypatch):
+        messages = []
+        monkeypatch.setenv("LANGFLOW_ASYNC_BRIDGE_DEBUG", "true")
+        monkeypatch.setattr("lfx.utils.async_helpers.logger.warning", messages.append)
+
+        async def value():
+            return 1
+
+        assert run_until_complete(value()) == 1
+        assert len(messages) == 1
+        assert "Blocking sync-to-async bridge call" in messages[0]
+        assert "test_debug_mode_reports_blocking_calls" in messages[0]
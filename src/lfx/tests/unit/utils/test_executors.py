@@ -0,0 +1,172 @@
+"""Tests for the bounded executor pools."""
+
+import asyncio
+import contextvars
+import operator
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+from lfx.utils.async_helpers import run_until_complete
+from lfx.utils.executors import DEFAULT_IO_MAX_WORKERS, ExecutorPool, ExecutorRegistry, get_executor, run_in_executor
+
+request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id", default="")
+
+
+class TestExecutorPool:
+    async def test_runs_function_in_named_thread(self):
+        pool = ExecutorPool("io", 2)
+        try:
+            name = await pool.run(lambda: threading.current_thread().name)
+        finally:
+            pool.shutdown()
+        assert name.startswith("lfx-io")
+
+    async def test_propagates_contextvars(self):
+        pool = ExecutorPool("io", 1)
+        request_id.set("abc")
+        try:
+            assert await pool.run(request_id.get) == "abc"
+        finally:
+            pool.shutdown()
+
+    async def test_metrics_track_queue_depth_and_wait(self):
+        pool = ExecutorPool("cpu", 1)
+        release = threading.Event()
+        try:
+            tasks = [asyncio.create_task(pool.run(release.wait)) for _ in range(3)]
+            await asyncio.sleep(0.05)
+            metrics = pool.metrics()
+            assert metrics.active == 1
+            assert metrics.queue_depth == 2
+            release.set()
+            await asyncio.gather(*tasks)
+        finally:
+            pool.shutdown()
+
+        metrics = pool.metrics()
+        assert metrics.completed == 3
+        assert metrics.queue_depth == 0
+        assert metrics.active == 0
+        assert metrics.max_wait_seconds > 0
+
+    async def test_failures_are_counted(self):
+        pool = ExecutorPool("io", 1)
+
+        def boom():
+            msg = "boom"
+            raise RuntimeError(msg)
+
+        try:
+            with pytest.raises(RuntimeError, match="boom"):
+                await pool.run(boom)
+        finally:
+            pool.shutdown()
+        assert pool.metrics().failed == 1
+        assert pool.metrics().active == 0
+
+    async def test_cancellations_are_counted_apart_from_failures(self):
+        pool = ExecutorPool("io", 1)
+        release = threading.Event()
+        try:
+            task = asyncio.create_task(pool.run(release.wait))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+        finally:
+            release.set()
+            pool.shutdown()
+        metrics = pool.metrics()
+        assert metrics.cancelled == 1
+        assert metrics.failed == 0
+        assert metrics.active == 0
+
+    async def test_nested_call_from_a_busy_pool_runs_in_the_calling_thread(self):
+        pool = ExecutorPool("io", 1)
+
+        def outer() -> tuple[str, str]:
+            # Blocks this pool's only worker on more work for the same pool, like run_until_complete does
+            inner = run_until_complete(pool.run(lambda: threading.current_thread().name))
+            return threading.current_thread().name, inner
+
+        try:
+            outer_thread, inner_thread = await asyncio.wait_for(pool.run(outer), timeout=5)
+        finally:
+            pool.shutdown()
+        assert inner_thread == outer_thread
+        assert pool.metrics().inline == 1
+        assert pool.metrics().completed == 1
+
+    async def test_nested_call_uses_an_idle_worker(self):
+        pool = ExecutorPool("io", 2)
+
+        def outer() -> tuple[str, str]:
+            inner = run_until_complete(pool.run(lambda: threading.current_thread().name))
+            return threading.current_thread().name, inner
+
+        try:
+            outer_thread, inner_thread = await asyncio.wait_for(pool.run(outer), timeout=5)
+        finally:
+            pool.shutdown()
+        assert inner_thread != outer_thread
+        assert pool.metrics().inline == 0
+
+    async def test_process_pool_spawns_workers(self):
+        pool = ExecutorPool("process", 1, use_processes=True)
+        try:
+            assert pool.executor._mp_context.get_start_method() == "spawn"
+        finally:
+            pool.shutdown()
+
+    async def test_process_pool_runs_picklable_function(self):
+        pool = ExecutorPool("process", 1, use_processes=True)
+        try:
+            assert await pool.run(operator.add, 2, 3) == 5
+        finally:
+            pool.shutdown()
+
+
+class TestExecutorRegistry:
+    def test_unknown_class_raises(self):
+        with pytest.raises(ValueError, match="Unknown executor class"):
+            ExecutorRegistry().get("gpu")
+
+    def test_pools_are_shared(self):
+        assert get_executor("io") is get_executor("io")
+        assert get_executor("io") is not get_executor("cpu")
+
+    def test_pool_sizes_come_from_settings(self):
+        settings_service = MagicMock()
+        settings_service.settings.executor_io_max_workers = 3
+        settings_service.settings.executor_cpu_max_workers = 0
+        registry = ExecutorRegistry()
+        with patch("lfx.services.deps.get_settings_service", return_value=settings_service):
+            assert registry.get("io").max_workers == 3
+            assert registry.get("cpu").max_workers >= 1
+            assert registry.get("process").max_workers >= 1
+        registry.shutdown()
+
+        with patch("lfx.services.deps.get_settings_service", return_value=MagicMock()):
+            assert ExecutorRegistry().get("io").max_workers == DEFAULT_IO_MAX_WORKERS
+
+    async def test_run_in_executor_uses_requested_pool(self):
+        name = await run_in_executor("cpu", lambda: threading.current_thread().name)
+        assert name.startswith("lfx-cpu")
+
+
+class TestComponentExecutorClass:
+    async def test_sync_output_runs_in_declared_pool(self):
+        from lfx.custom.custom_component.component import Component
+        from lfx.template.field.base import Output
+
+        class CpuComponent(Component):
+            executor_class = "cpu"
+            outputs = [Output(name="thread", display_name="Thread", method="thread_name")]
+
+            def thread_name(self) -> str:
+                return threading.current_thread().name
+
+        component = CpuComponent()
+        result = await component._get_output_result(component._outputs_map["thread"])
+        assert result.startswith("lfx-cpu")
@@ -0,0 +1,123 @@
+"""Tests for the shared HTTP client pool and per-host rate limiter."""
+
+import asyncio
+import gc
+import time
+
+import httpx
+from lfx.utils.http_client_pool import HostRateLimiter, HTTPClientPool, get_timeout_class
+
+
+def _with_transport(client: httpx.AsyncClient, handler) -> httpx.AsyncClient:
+    client._transport = httpx.MockTransport(handler)
+    return client
+
+
+class TestHTTPClientPool:
+    async def test_same_options_share_a_client(self):
+        pool = HTTPClientPool()
+        try:
+            first = pool.get_client(timeout=20)
+            second = pool.get_client(timeout=25)
+            assert first is second
+            assert pool.stats() == {"loops": 1, "clients": 1}
+        finally:
+            await pool.aclose()
+
+    async def test_different_options_get_different_clients(self):
+        pool = HTTPClientPool()
+        try:
+            base = pool.get_client()
+            assert pool.get_client(follow_redirects=True) is not base
+            assert pool.get_client(verify=False) is not base
+            assert pool.get_client(timeout=300) is not base
+            assert pool.stats()["clients"] == 4
+        finally:
+            await pool.aclose()
+
+    async def test_closed_client_is_replaced(self):
+        pool = HTTPClientPool()
+        try:
+            client = pool.get_client()
+            await client.aclose()
+            assert pool.get_client() is not client
+        finally:
+            await pool.aclose()
+
+    def test_clients_are_per_event_loop(self):
+        pool = HTTPClientPool()
+
+        async def get():
+            client = pool.get_client()
+            await pool.aclose()
+            return client
+
+        assert asyncio.run(get()) is not asyncio.run(get())
+
+    def test_clients_are_closed_when_their_loop_shuts_down(self):
+        pool = HTTPClientPool()
+
+        async def get():
+            return pool.get_client(), pool.get_client(follow_redirects=True)
+
+        clients = asyncio.run(get())
+
+        assert all(client.is_closed for client in clients)
+        assert pool.stats() == {"loops": 0, "clients": 0}
+
+    async def test_clients_stay_open_while_their_loop_runs(self):
+        pool = HTTPClientPool()
+        try:
+            client = pool.get_client()
+            gc.collect()
+            await asyncio.sleep(0)
+            assert not client.is_closed
+            assert pool.get_client() is client
+        finally:
+            await pool.aclose()
+
+    async def test_cookies_from_one_request_are_not_sent_on_the_next(self):
+        sent_cookies = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent_cookies.append(request.headers.get("cookie"))
+            return httpx.Response(200, headers={"set-cookie": "session=user-a; Path=/"})
+
+        pool = HTTPClientPool()
+        pool._create_client = lambda key, create=pool._create_client: _with_transport(create(key), handler)
+        client = pool.get_client()
+        try:
+            await client.get("https://example.com/login")
+            await client.get("https://example.com/data")
+            await client.get("https://example.com/data", cookies={"session": "user-b"})
+        finally:
+            await pool.aclose()
+
+        assert sent_cookies == [None, None, "session=user-b"]
+        assert not client.cookies
+
+    def test_timeout_classes(self):
+        assert get_timeout_class(None) == "none"
+        assert get_timeout_class(5) == "short"
+        assert get_timeout_class(30) == "default"
+        assert get_timeout_class(31) == "long"
+
+
+class TestHostRateLimiter:
+    async def test_spaces_requests_to_the_same_host(self):
+        limiter = HostRateLimiter(requests_per_second=20)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("https://example.com/a") for _ in range(3)))
+        assert time.monotonic() - start >= 0.09
+
+    async def test_hosts_are_limited_independently(self):
+        limiter = HostRateLimiter(requests_per_second=1)
+        start = time.monotonic()
+        await asyncio.gather(limiter.acquire("https://a.example.com"), limiter.acquire("https://b.example.com"))
+        assert time.monotonic() - start < 0.5
+
+    async def test_zero_rate_disables_limiting(self):
+        limiter = HostRateLimiter(requests_per_second=0)
+        start = time.monotonic()
+        await asyncio.gather(*(limiter.acquire("https://example.com") for _ in range(10)))
+        assert time.monotonic() - start < 0.5